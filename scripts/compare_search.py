@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Compare budgeted local search with exhaustive racing on small config spaces.
+
+For each cached benchmark deck and space size, runs FastDeckOptimizer with
+``search="racing"`` and ``search="local"`` on the same seed and reports
+games played, wall time, and the final-evaluation score of each winner.
+"""
+
+import contextlib
+import io
+import time
+
+from auto_goldfish.benchmarks import load_benchmark_decks
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.deck_config import ConfigSpace
+from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+
+
+SEED = 42
+TURNS = 10
+FINAL_SIMS = 2000
+ENABLED = {cid: c for cid, c in ALL_CANDIDATES.items() if c.default_enabled}
+SPACES = [(1, 1, 2), (2, 2, 2)]  # (max_draw, max_ramp, land_range)
+BUDGETS = [10_000, 30_000]
+
+
+def run(deck_dicts, max_draw, max_ramp, land_range, search, budget=None):
+    gf = Goldfisher(deck_dicts, turns=TURNS, sims=100, seed=SEED, record_results=None)
+    games = [0]
+    play_sample = gf.play_sample
+
+    def counted(n_games, *args, **kwargs):
+        games[0] += n_games
+        return play_sample(n_games, *args, **kwargs)
+
+    gf.play_sample = counted
+    optimizer = FastDeckOptimizer(
+        gf, ENABLED, max_draw=max_draw, max_ramp=max_ramp, land_range=land_range,
+        search=search, search_budget=budget,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.monotonic()
+        ranked = optimizer.run(final_sims=FINAL_SIMS, final_top_k=3)
+        elapsed = time.monotonic() - t0
+    best, result = ranked[0]
+    return games[0], elapsed, best.describe(), result["threshold_mana"]
+
+
+decks = load_benchmark_decks()
+if not decks:
+    raise SystemExit("No cached benchmark decks; run scripts/fetch_benchmark_decks.py first.")
+
+for name, deck_dicts in decks.items():
+    for max_draw, max_ramp, land_range in SPACES:
+        size = len(ConfigSpace(ENABLED, max_draw, max_ramp, land_range))
+        print(f"\n{name}: {size} configs (draw<={max_draw}, ramp<={max_ramp}, lands +-{land_range})")
+        rows = [("racing", None)] + [("local", b) for b in BUDGETS]
+        for search, budget in rows:
+            games, elapsed, desc, score = run(deck_dicts, max_draw, max_ramp, land_range,
+                                              search, budget)
+            label = search if budget is None else f"{search} ({budget})"
+            print(f"  {label:<15} {games:>7} games {elapsed:6.1f}s  {score:6.2f}  {desc}")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Measure how well each shuffle mode couples same-seed games across configs.
+
+For each cached benchmark deck, plays the baseline and a few one-step
+configs on the same seeds and reports the correlation and the variance of
+the per-game primary-mana difference.  Racing decisions are driven by that
+paired variance, so lower is better.
+"""
+
+import contextlib
+import io
+
+import numpy as np
+
+from auto_goldfish.benchmarks import load_benchmark_decks
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.engine.shuffle import VALID_SHUFFLE_MODES
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.deck_config import DeckConfig, apply_config
+
+
+SEED = 42
+TURNS = 10
+GAMES = 2000
+ENABLED = {cid: c for cid, c in ALL_CANDIDATES.items() if c.default_enabled}
+CONFIGS = [
+    (DeckConfig(land_delta=1), False),
+    (DeckConfig(land_delta=-1), False),
+    (DeckConfig(added_cards=("draw_2cmc_2",)), False),
+    (DeckConfig(added_cards=("ramp_2cmc_1",)), True),
+]
+
+
+def primary(gf, config, swap_mode):
+    with contextlib.redirect_stdout(io.StringIO()):
+        apply_config(gf, config, ENABLED, swap_mode)
+    return gf.sample_primary(gf.play_sample(GAMES, SEED)).astype(float)
+
+
+decks = load_benchmark_decks()
+if not decks:
+    raise SystemExit("No cached benchmark decks; run scripts/fetch_benchmark_decks.py first.")
+
+for name, deck_dicts in decks.items():
+    print(f"\n{name}")
+    for mode in VALID_SHUFFLE_MODES:
+        gf = Goldfisher(deck_dicts, turns=TURNS, sims=GAMES, seed=SEED,
+                        record_results=None, shuffle=mode)
+        base = primary(gf, DeckConfig(), False)
+        for config, swap_mode in CONFIGS:
+            values = primary(gf, config, swap_mode)
+            diff = values - base
+            label = config.describe() + (" (swap)" if swap_mode else "")
+            print(f"  {mode:<9} {label:<28} corr {np.corrcoef(values, base)[0, 1]:5.2f}"
+                  f"  var(diff) {diff.var():7.2f}")
+        gf.restore_original_decklist()
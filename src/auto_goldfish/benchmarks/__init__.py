@@ -0,0 +1,20 @@
+"""Throughput benchmarks with versioned baselines and regression gates."""
+
+from auto_goldfish.benchmarks.cases import CASES, BenchCase
+from auto_goldfish.benchmarks.runner import (
+    compare,
+    load_baseline,
+    load_benchmark_decks,
+    run_suite,
+    save_baseline,
+)
+
+__all__ = [
+    "BenchCase",
+    "CASES",
+    "compare",
+    "load_baseline",
+    "load_benchmark_decks",
+    "run_suite",
+    "save_baseline",
+]
@@ -0,0 +1,196 @@
+"""Benchmark case definitions.
+
+Each case has an untimed ``setup(deck_dicts, size)`` that returns a
+context and a timed ``run(context)`` that returns the number of work
+units done (games for engine and optimizer cases).  ``size`` scales the
+amount of work so ``--quick`` runs stay short.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+
+TURNS = 10
+SEED = 42
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    """One throughput measurement."""
+
+    name: str
+    unit: str
+    size: int
+    setup: Callable[[List[dict], int], Any]
+    run: Callable[[Any], int]
+
+
+def _noop(*_args) -> None:
+    pass
+
+
+def _goldfisher(deck_dicts: List[dict], sims: int, **kwargs) -> Goldfisher:
+    return Goldfisher(deck_dicts, turns=TURNS, sims=sims, seed=SEED, **kwargs)
+
+
+def _enabled_candidates() -> Dict[str, Any]:
+    from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+
+    return {cid: c for cid, c in ALL_CANDIDATES.items() if c.default_enabled}
+
+
+class _GameCounter:
+    """Counts games played through a goldfisher's public simulate entry points."""
+
+    def __init__(self, goldfisher: Goldfisher) -> None:
+        self.games = 0
+        single = goldfisher.simulate_single_game
+        simulate = goldfisher.simulate
+        play_sample = goldfisher.play_sample
+
+        def simulate_single_game(seed):
+            self.games += 1
+            return single(seed)
+
+        def counted_simulate(*args, **kwargs):
+            self.games += goldfisher.sims
+            return simulate(*args, **kwargs)
+
+        def counted_play_sample(n_games, *args, **kwargs):
+            self.games += n_games
+            return play_sample(n_games, *args, **kwargs)
+
+        goldfisher.simulate_single_game = simulate_single_game
+        goldfisher.simulate = counted_simulate
+        goldfisher.play_sample = counted_play_sample
+
+
+# -- simulate ---------------------------------------------------------------
+
+def _setup_simulate(deck_dicts, size):
+    return _goldfisher(deck_dicts, size)
+
+
+def _run_simulate(gf):
+    gf.simulate(progress_callback=_noop)
+    return gf.sims
+
+
+# -- simulate_single_game ---------------------------------------------------
+
+def _setup_single(deck_dicts, size):
+    return _goldfisher(deck_dicts, size, record_results=None)
+
+
+def _run_single(gf):
+    for j in range(gf.sims):
+        gf.simulate_single_game(SEED + j)
+    return gf.sims
+
+
+# -- parallel ---------------------------------------------------------------
+
+def _setup_parallel(deck_dicts, size):
+    return _goldfisher(deck_dicts, size, workers=2)
+
+
+# -- apply_config -----------------------------------------------------------
+
+def _setup_apply_config(deck_dicts, size):
+    from auto_goldfish.optimization.deck_config import enumerate_configs
+
+    candidates = _enabled_candidates()
+    configs = enumerate_configs(candidates, max_draw=1, max_ramp=1, land_range=2)
+    repeats = max(1, size // len(configs))
+    return _goldfisher(deck_dicts, 1), candidates, configs * repeats
+
+
+def _run_apply_config(ctx):
+    from auto_goldfish.optimization.deck_config import apply_config
+
+    gf, candidates, configs = ctx
+    for cfg in configs:
+        apply_config(gf, cfg, candidates)
+    gf.restore_original_decklist()
+    return len(configs)
+
+
+# -- serialization ----------------------------------------------------------
+
+def _setup_serialization(deck_dicts, size):
+    result = _goldfisher(deck_dicts, 500).simulate(progress_callback=_noop)
+    return result, size
+
+
+def _run_serialization(ctx):
+    from auto_goldfish.metrics.reporter import result_to_dict
+
+    result, n = ctx
+    for _ in range(n):
+        json.dumps(result_to_dict(result))
+    return n
+
+
+# -- optimizers -------------------------------------------------------------
+
+def _setup_racing(deck_dicts, size):
+    from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+
+    gf = _goldfisher(deck_dicts, 100, record_results=None)
+    counter = _GameCounter(gf)
+    optimizer = FastDeckOptimizer(
+        gf, _enabled_candidates(), max_draw=1, max_ramp=1, land_range=1,
+        max_sims_per_config=size, min_games=min(100, size), batch_size=50,
+    )
+    return optimizer, counter
+
+
+def _setup_local_search(deck_dicts, size):
+    from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+
+    gf = _goldfisher(deck_dicts, 100, record_results=None)
+    counter = _GameCounter(gf)
+    optimizer = FastDeckOptimizer(
+        gf, _enabled_candidates(), max_draw=2, max_ramp=2, land_range=2,
+        max_sims_per_config=size, min_games=min(100, size), batch_size=50,
+        search="local", search_budget=20 * size,
+    )
+    return optimizer, counter
+
+
+def _setup_hyperband(deck_dicts, size):
+    from auto_goldfish.optimization.optimizer import DeckOptimizer
+
+    gf = _goldfisher(deck_dicts, 100, record_results=None)
+    counter = _GameCounter(gf)
+    optimizer = DeckOptimizer(
+        gf, _enabled_candidates(), max_draw=1, max_ramp=1, land_range=1,
+        hyperband_max_sims=size,
+    )
+    return optimizer, counter
+
+
+def _run_optimizer(ctx):
+    optimizer, counter = ctx
+    counter.games = 0
+    optimizer.run(final_sims=200, final_top_k=2)
+    return counter.games
+
+
+CASES: Dict[str, BenchCase] = {
+    case.name: case
+    for case in [
+        BenchCase("simulate", "games", 1000, _setup_simulate, _run_simulate),
+        BenchCase("simulate_single_game", "games", 1000, _setup_single, _run_single),
+        BenchCase("simulate_parallel", "games", 4000, _setup_parallel, _run_simulate),
+        BenchCase("apply_config", "configs", 200, _setup_apply_config, _run_apply_config),
+        BenchCase("serialization", "results", 2000, _setup_serialization, _run_serialization),
+        BenchCase("racing", "games", 300, _setup_racing, _run_optimizer),
+        BenchCase("local_search", "games", 300, _setup_local_search, _run_optimizer),
+        BenchCase("hyperband", "games", 300, _setup_hyperband, _run_optimizer),
+    ]
+}
@@ -0,0 +1,86 @@
+"""``auto-goldfish bench`` command."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from tabulate import tabulate
+
+from auto_goldfish.benchmarks.cases import CASES
+from auto_goldfish.benchmarks.runner import (
+    compare,
+    load_baseline,
+    load_benchmark_decks,
+    run_suite,
+    save_baseline,
+)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="auto-goldfish bench",
+        description="Throughput benchmarks over the cached benchmark decks",
+    )
+    parser.add_argument("--decks", nargs="+", default=None,
+                        help="Benchmark deck names (default: all cached decks)")
+    parser.add_argument("--cases", nargs="+", default=None, choices=sorted(CASES),
+                        help="Cases to run (default: all)")
+    parser.add_argument("--cache_dir", type=str, default=None,
+                        help="Deck cache directory (default: <project>/decks)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--quick", action="store_true",
+                        help="Run each case at 20%% of its normal size")
+    parser.add_argument("--save", type=str, default=None,
+                        help="Write results to this baseline JSON file")
+    parser.add_argument("--compare", type=str, default=None,
+                        help="Baseline JSON to compare against; exits 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="Relative slowdown that counts as a regression")
+    parser.add_argument("--alpha", type=float, default=0.05,
+                        help="Significance level for the slowdown test")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = get_parser().parse_args(argv)
+
+    decks = load_benchmark_decks(args.decks, args.cache_dir)
+    if not decks:
+        print("No cached benchmark decks found; run scripts/fetch_benchmark_decks.py first.")
+        return 2
+
+    data = run_suite(
+        decks,
+        cases=args.cases,
+        repeats=args.repeats,
+        scale=0.2 if args.quick else 1.0,
+        progress=lambda deck, case: print(f"  {deck}: {case}", file=sys.stderr),
+    )
+    rows = [
+        [deck, case, f"{sorted(e['samples'])[len(e['samples']) // 2]:.1f}", e["unit"] + "/s"]
+        for deck, cases in data["results"].items()
+        for case, e in cases.items()
+    ]
+    print(tabulate(rows, headers=["Deck", "Case", "Median", "Unit"], tablefmt="simple"))
+
+    if args.save:
+        save_baseline(data, args.save)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        comparison = compare(load_baseline(args.compare), data, args.threshold, args.alpha)
+        print("\nComparison:")
+        print(tabulate(
+            [
+                [r["deck"], r["case"], f"{r['baseline']:.1f}", f"{r['current']:.1f}",
+                 f"{r['change']:+.1%}", f"{r['p_value']:.3f}",
+                 "REGRESSION" if r["regression"] else ""]
+                for r in comparison
+            ],
+            headers=["Deck", "Case", "Baseline", "Current", "Change", "p", ""],
+            tablefmt="simple",
+        ))
+        if any(r["regression"] for r in comparison):
+            return 1
+    return 0
@@ -0,0 +1,192 @@
+"""Run benchmark cases, store versioned baselines and gate regressions."""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import random
+import time
+from datetime import datetime, timezone
+from itertools import combinations
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from auto_goldfish.benchmarks.cases import CASES
+
+SCHEMA_VERSION = 1
+
+# Exact permutation tests are used up to this many splits, then sampled.
+_MAX_EXACT_SPLITS = 20000
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("auto_goldfish")
+    except Exception:
+        return "unknown"
+
+
+def load_benchmark_decks(
+    names: Optional[Sequence[str]] = None,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, List[dict]]:
+    """Load cached benchmark decks without touching the network.
+
+    Decks missing from the cache are skipped; populate it with
+    ``scripts/fetch_benchmark_decks.py``.
+    """
+    import os
+
+    from auto_goldfish.optimization.benchmark_decks import BENCHMARK_DECKS
+
+    if cache_dir is None:
+        project_root = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        )
+        cache_dir = os.path.join(project_root, "decks")
+
+    decks: Dict[str, List[dict]] = {}
+    for deck in BENCHMARK_DECKS:
+        if names and deck.name not in names:
+            continue
+        path = os.path.join(cache_dir, deck.name, f"{deck.name}.json")
+        if os.path.isfile(path):
+            with open(path) as f:
+                decks[deck.name] = json.load(f)
+    return decks
+
+
+def run_suite(
+    decks: Dict[str, List[dict]],
+    cases: Optional[Sequence[str]] = None,
+    repeats: int = 5,
+    scale: float = 1.0,
+    progress: Optional[Callable[[str, str], None]] = None,
+) -> Dict[str, Any]:
+    """Measure throughput for every (deck, case) pair.
+
+    Args:
+        decks: Deck name -> card dicts.
+        cases: Case names from ``CASES`` (default: all).
+        repeats: Timed repetitions per pair; each yields one sample.
+        scale: Multiplier on each case's work size (``--quick`` uses 0.2).
+        progress: Optional callable(deck_name, case_name).
+
+    Returns:
+        A baseline dict (see ``save_baseline``) with throughput samples in
+        units per second.
+    """
+    case_names = list(cases) if cases else list(CASES)
+    unknown = [c for c in case_names if c not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases: {unknown}. Valid: {sorted(CASES)}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for deck_name, deck_dicts in decks.items():
+        results[deck_name] = {}
+        for case_name in case_names:
+            case = CASES[case_name]
+            if progress is not None:
+                progress(deck_name, case_name)
+            ctx = case.setup(deck_dicts, max(1, int(case.size * scale)))
+            samples = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                units = case.run(ctx)
+                elapsed = time.perf_counter() - start
+                samples.append(units / elapsed if elapsed > 0 else float("inf"))
+            results[deck_name][case_name] = {"unit": case.unit, "samples": samples}
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "package_version": _package_version(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "repeats": repeats,
+        "scale": scale,
+        "results": results,
+    }
+
+
+def save_baseline(data: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(
+            f"Baseline schema {data.get('schema_version')} is not supported "
+            f"(expected {SCHEMA_VERSION}); re-record the baseline"
+        )
+    return data
+
+
+def _slowdown_pvalue(before: Sequence[float], after: Sequence[float], seed: int = 0) -> float:
+    """One-sided permutation p-value that *after* has lower mean log throughput.
+
+    Exact over all splits for small samples, Monte Carlo otherwise.
+    """
+    a = np.log(np.asarray(before, dtype=float))
+    b = np.log(np.asarray(after, dtype=float))
+    pooled = np.concatenate([a, b])
+    n_a = len(a)
+    observed = a.mean() - b.mean()
+    total = pooled.sum()
+
+    if math.comb(len(pooled), n_a) <= _MAX_EXACT_SPLITS:
+        splits = (list(idx) for idx in combinations(range(len(pooled)), n_a))
+    else:
+        rng = random.Random(seed)
+        splits = (rng.sample(range(len(pooled)), n_a) for _ in range(_MAX_EXACT_SPLITS))
+
+    hits = count = 0
+    for idx in splits:
+        sum_a = pooled[idx].sum()
+        diff = sum_a / n_a - (total - sum_a) / (len(pooled) - n_a)
+        hits += diff >= observed - 1e-12
+        count += 1
+    return hits / count
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.05,
+    alpha: float = 0.05,
+) -> List[Dict[str, Any]]:
+    """Compare throughput against a baseline.
+
+    A (deck, case) pair is flagged as a regression when the median
+    throughput dropped by more than *threshold* (relative) and the
+    permutation test on log throughput gives ``p < alpha``.  Pairs that
+    are missing from either side are skipped.
+    """
+    rows: List[Dict[str, Any]] = []
+    for deck_name, cases in current["results"].items():
+        for case_name, entry in cases.items():
+            base_entry = baseline["results"].get(deck_name, {}).get(case_name)
+            if base_entry is None:
+                continue
+            before = base_entry["samples"]
+            after = entry["samples"]
+            change = float(np.median(after) / np.median(before) - 1.0)
+            p_value = _slowdown_pvalue(before, after)
+            rows.append({
+                "deck": deck_name,
+                "case": case_name,
+                "unit": entry["unit"],
+                "baseline": float(np.median(before)),
+                "current": float(np.median(after)),
+                "change": change,
+                "p_value": p_value,
+                "regression": change < -threshold and p_value < alpha,
+            })
+    return rows
@@ -0,0 +1,139 @@
+"""LRU-capped key -> bytes backends shared by the caches and spill stores.
+
+``SampleCache``, ``CheckpointStore``, ``JobSpill`` and ``DbResultCache``
+all keep opaque encoded blobs under string keys, on disk or in a table
+of the optional database:
+
+* ``DiskBlobStore``: one ``<key><suffix>`` file per entry, replaced
+  atomically on write; file mtime is the LRU clock.
+* ``DbBlobStore``: one row per entry of a table with ``size_bytes``,
+  ``data`` and ``last_used`` columns (see ``db.persistence.evict_lru``).
+
+Errors propagate; the stores built on these log them and treat them as
+misses.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, ContextManager, Optional
+
+
+class DiskBlobStore:
+    """Blobs as files in *directory*, named ``<key><suffix>``."""
+
+    def __init__(self, directory: str, suffix: str) -> None:
+        self.directory = directory
+        self.suffix = suffix
+        os.makedirs(directory, exist_ok=True)
+        # Total size, known after the first eviction scan
+        self._size: Optional[int] = None
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{os.path.basename(key)}{self.suffix}")
+
+    def read(self, key: str) -> Optional[bytes]:
+        """The blob of *key*, marked as recently used, or ``None``."""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return data
+
+    def write(self, key: str, data: bytes) -> None:
+        path = self.path(key)
+        try:
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        if self._size is not None:
+            self._size += len(data) - replaced
+
+    def delete(self, key: str) -> None:
+        path = self.path(key)
+        try:
+            replaced = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        if self._size is not None:
+            self._size -= replaced
+
+    def evict(self, max_bytes: int) -> int:
+        """Drop least recently used blobs until under *max_bytes*; return the count."""
+        if self._size is not None and self._size <= max_bytes:
+            return 0
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(self.suffix):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            evicted += 1
+        self._size = total
+        return evicted
+
+
+class DbBlobStore:
+    """Blobs as rows of *model*, keyed by its *key_col* primary key.
+
+    Args:
+        model: ORM class with ``size_bytes``, ``data`` and ``last_used``
+            columns.
+        key_col: Its primary key column, e.g. ``ResultCacheRow.key``.
+        session_scope: Context manager factory yielding a committed
+            session (default: ``auto_goldfish.db.session.get_session``).
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        key_col: Any,
+        session_scope: Optional[Callable[[], ContextManager[Any]]] = None,
+    ) -> None:
+        self.model = model
+        self.key_col = key_col
+        if session_scope is None:
+            from auto_goldfish.db.session import get_session
+
+            session_scope = get_session
+        self.session_scope = session_scope
+
+    def read(self, key: str) -> Optional[bytes]:
+        """The blob of *key*, marked as recently used, or ``None``."""
+        from auto_goldfish.db.persistence import load_blob
+
+        with self.session_scope() as session:
+            return load_blob(session, self.model, key)
+
+    def write(self, key: str, data: bytes, **columns: Any) -> None:
+        """Insert or replace the blob of *key*; *columns* sets extra row fields."""
+        from auto_goldfish.db.persistence import save_blob
+
+        with self.session_scope() as session:
+            save_blob(session, self.model, self.key_col, key, data, **columns)
+
+    def evict(self, max_bytes: int) -> int:
+        """Drop least recently used rows until under *max_bytes*; return the count."""
+        from auto_goldfish.db.persistence import evict_lru
+
+        with self.session_scope() as session:
+            return evict_lru(session, self.model, self.key_col, max_bytes)
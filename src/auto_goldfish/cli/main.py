@@ -26,6 +26,8 @@ def get_parser() -> argparse.ArgumentParser:
         default="https://archidekt.com/decks/19226307/vrens_murine_marauders",
     )
     parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--horizons", nargs="+", type=int, default=None,
+                        help="Report several turn cutoffs from one run (overrides --turns)")
     parser.add_argument("--sims", type=int, default=10000)
     parser.add_argument("--verbose", action="store_true")
     parser.add_argument("--min_lands", type=int, default=36)
@@ -49,9 +51,123 @@ def get_parser() -> argparse.ArgumentParser:
                         help="Deprioritize ramp after this turn (0 = always play ramp)")
     parser.add_argument("--min_cost_floor", type=int, default=1, choices=[0, 1],
                         help="Minimum spell cost after reductions (0 or 1)")
+    parser.add_argument("--shuffle", type=str, default="standard",
+                        choices=["coupled", "standard"],
+                        help="Library shuffle; coupled keeps same-seed games aligned across "
+                             "land counts and configs")
+    parser.add_argument("--exact", action="store_true",
+                        help="Compute results analytically for decks without card effects")
+    parser.add_argument("--profile", action="store_true",
+                        help="Report per-phase engine timings and effect counts")
+    parser.add_argument("--optimize", action="store_true",
+                        help="Race land/candidate configs instead of sweeping land counts "
+                             "(racing rounds use --workers processes)")
+    parser.add_argument("--optimize_for", type=str, default="floor_performance",
+                        choices=["floor_performance", "mean_mana", "consistency",
+                                 "mean_mana_value", "mean_mana_total", "mean_spells_cast"],
+                        help="Target metric for --optimize")
+    parser.add_argument("--objectives", type=str, nargs="+", default=None,
+                        choices=["floor_performance", "mean_mana", "consistency",
+                                 "mean_mana_value", "mean_mana_total", "mean_spells_cast"],
+                        help="Race on several targets at once and report the Pareto front "
+                             "(overrides --optimize_for)")
+    parser.add_argument("--search", type=str, default="racing",
+                        choices=["racing", "local", "auto"],
+                        help="Config search for --optimize: race every config, run a "
+                             "budgeted local search, or pick by space size")
+    parser.add_argument("--search_budget", type=int, default=None,
+                        help="Games available to --search local/auto")
+    parser.add_argument("--time_budget", type=float, default=None,
+                        help="Wall-clock seconds for the --optimize search phase; also stops "
+                             "once the top configs are settled")
+    parser.add_argument("--max_games", type=int, default=None,
+                        help="Game budget for the --optimize search phase")
+    parser.add_argument("--sample_cache", type=str, default=None,
+                        help="Directory caching --optimize games across runs (needs --seed)")
+    parser.add_argument("--sample_cache_mb", type=float, default=512,
+                        help="Size cap of --sample_cache in MB (least recently used entries go first)")
+    parser.add_argument("--checkpoint_dir", type=str, default=None,
+                        help="Directory for --optimize checkpoints; an interrupted run "
+                             "resumes when re-run with the same arguments")
+    parser.add_argument("--checkpoint_interval", type=float, default=30.0,
+                        help="Seconds between --optimize checkpoints")
+    parser.add_argument("--card_impact", type=str, default=None, choices=["remove", "land"],
+                        help="Measure each card's paired leave-one-out impact: remove it, "
+                             "or replace it with a basic land (--sims games per card)")
+    parser.add_argument("--surrogate", type=str, default=None,
+                        help="Surrogate model file (see train-surrogate); --optimize races "
+                             "only the configs it ranks highest")
     return parser
 
 
+# Stored results needed before train-surrogate fits a model
+MIN_SURROGATE_ROWS = 10
+
+
+def train_surrogate(argv: list[str] | None = None) -> int:
+    """Fit a surrogate on the land sweeps stored in the database and save it."""
+    import os
+
+    from auto_goldfish.db.persistence import load_surrogate_training_rows
+    from auto_goldfish.db.session import get_session, init_db
+    from auto_goldfish.optimization.surrogate import (
+        SURROGATE_TARGETS,
+        calibration_report,
+        fit_surrogate,
+        training_data_from_rows,
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="auto-goldfish train-surrogate",
+        description="Train the deck-score surrogate on stored simulation results",
+    )
+    parser.add_argument("--database_url", type=str, default=os.environ.get("DATABASE_URL"),
+                        help="Database holding the results (default: DATABASE_URL)")
+    parser.add_argument("--output", type=str, default="surrogate.json",
+                        help="Model file to write; serve it with SURROGATE_MODEL=<path>")
+    parser.add_argument("--alpha", type=float, default=1.0, help="Ridge penalty")
+    parser.add_argument("--holdout", type=float, default=0.2,
+                        help="Fraction of results held out for the calibration report")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the holdout split")
+    args = parser.parse_args(argv)
+    if not args.database_url:
+        parser.error("--database_url or DATABASE_URL is required")
+
+    init_db(args.database_url)
+    with get_session() as session:
+        rows = load_surrogate_training_rows(session)
+    X, results, weights = training_data_from_rows(rows)
+    if len(X) < MIN_SURROGATE_ROWS:
+        print(f"Only {len(X)} usable stored results (need {MIN_SURROGATE_ROWS}); "
+              f"run some land sweeps first.")
+        return 1
+
+    order = np.random.RandomState(args.seed).permutation(len(X))
+    n_holdout = int(len(X) * args.holdout)
+    if n_holdout:
+        held, train = order[:n_holdout], order[n_holdout:]
+        model = fit_surrogate(X[train], [results[i] for i in train],
+                              alpha=args.alpha, weights=weights[train])
+        report = calibration_report(model, X[held], [results[i] for i in held])
+        print(f"Calibration on {n_holdout} held-out results:")
+        print(
+            tabulate(
+                [
+                    [name] + [f"{report[name][k]:.3f}"
+                              for k in ("mae", "rmse", "r_squared", "spearman", "bias")]
+                    for name in SURROGATE_TARGETS
+                ],
+                headers=["Target", "MAE", "RMSE", "R^2", "Spearman", "Bias"],
+                disable_numparse=True,
+            )
+        )
+
+    model = fit_surrogate(X, results, alpha=args.alpha, weights=weights)
+    model.save(args.output)
+    print(f"Trained on {len(X)} results; saved {args.output}")
+    return 0
+
+
 def run(config: dict) -> None:
     """Main simulation pipeline."""
     import os
@@ -60,6 +176,9 @@ def run(config: dict) -> None:
         config["workers"] = os.cpu_count() or 1
     if config.pop("mulligan", "default") == "curve_aware":
         config["mulligan_strategy"] = CurveAwareMulligan()
+    horizons = config.get("horizons")
+    if horizons:
+        config["turns"] = max(horizons)
     pp.pprint(config)
 
     if config.get("deck_url"):
@@ -68,15 +187,40 @@ def run(config: dict) -> None:
     deck_list = load_decklist(config["deck_name"])
     goldfisher = Goldfisher(deck_list, **config)
 
+    if config.get("optimize"):
+        run_optimization(config, goldfisher)
+        return
+    if config.get("card_impact"):
+        run_card_impact(config, goldfisher)
+        return
+
     min_lands = config.get("min_lands") or goldfisher.land_count
     max_lands = (config.get("max_lands") or goldfisher.land_count) + 1
 
     outcomes = []
     distribution_outcomes = []
+    horizon_outcomes = []
+    profile = None
+    if goldfisher.profile is not None:
+        from auto_goldfish.engine.profiling import EngineProfile
+
+        profile = EngineProfile()
 
     for i in tqdm(range(min_lands, max_lands), total=max_lands - min_lands):
         goldfisher.set_lands(i, cuts=config.get("cuts", []))
-        result = goldfisher.simulate()
+        if horizons:
+            horizon_results = goldfisher.simulate(horizons=horizons)
+            for h, h_result in horizon_results.items():
+                horizon_outcomes.append([
+                    i, h,
+                    f"{h_result.mean_mana:.2f}",
+                    f"{h_result.consistency:.4f}",
+                    f"{h_result.threshold_mana:.2f}",
+                    h_result.percentile_50,
+                ])
+            result = horizon_results[max(horizon_results)]
+        else:
+            result = goldfisher.simulate()
 
         # Save detailed report
         deck_dir = get_deckpath(config["deck_name"]).replace(
@@ -91,6 +235,9 @@ def run(config: dict) -> None:
         )
 
         outcomes.append(result.as_row())
+        if profile is not None:
+            profile.merge(result.profile)
+            profile.total_seconds += result.profile.get("total_seconds", 0.0)
         ds = result.distribution_stats
         distribution_outcomes.append([
             i,
@@ -143,8 +290,165 @@ def run(config: dict) -> None:
         )
     )
 
+    if horizon_outcomes:
+        print("\nTurn Horizons:")
+        print("--------------")
+        print(
+            tabulate(
+                horizon_outcomes,
+                headers=["Land Ct", "Turns", "Mana (EV)", "Consistency", "Floor Mana", "50th"],
+                tablefmt="simple",
+            )
+        )
+
+    if profile is not None:
+        print(f"\nEngine Profile ({profile.games} games, {profile.total_seconds:.2f}s):")
+        print("------------------------------")
+        print(
+            tabulate(
+                profile.as_rows(),
+                headers=["Phase", "Calls", "Seconds", "us/call", "Share"],
+                tablefmt="simple",
+            )
+        )
+        if profile.effect_calls:
+            top_effects = sorted(profile.effect_calls.items(), key=lambda kv: kv[1], reverse=True)
+            print()
+            print(tabulate(top_effects[:15], headers=["Effect", "Invocations"], tablefmt="simple"))
+
+
+def run_optimization(config: dict, goldfisher: Goldfisher) -> None:
+    """Race configs with the default-enabled candidates and print the ranking."""
+    from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+    from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+
+    candidates = {cid: c for cid, c in ALL_CANDIDATES.items() if c.default_enabled}
+    cache = None
+    if config.get("sample_cache"):
+        from auto_goldfish.optimization.sample_cache import DiskSampleCache
+
+        cache = DiskSampleCache(config["sample_cache"],
+                                int(config.get("sample_cache_mb", 512) * 1024 * 1024))
+    checkpoint = None
+    if config.get("checkpoint_dir"):
+        from auto_goldfish.optimization.checkpoint import DiskCheckpointStore
+
+        checkpoint = DiskCheckpointStore(config["checkpoint_dir"])
+    surrogate = None
+    if config.get("surrogate"):
+        from auto_goldfish.optimization.surrogate import SurrogateModel
+
+        surrogate = SurrogateModel.load(config["surrogate"])
+    land_delta_min = config["min_lands"] - goldfisher.land_count if config.get("min_lands") else None
+    land_delta_max = config["max_lands"] - goldfisher.land_count if config.get("max_lands") else None
+    optimizer = FastDeckOptimizer(
+        goldfisher,
+        candidates,
+        land_delta_min=land_delta_min,
+        land_delta_max=land_delta_max,
+        optimize_for=config.get("optimize_for", "floor_performance"),
+        workers=goldfisher.workers,
+        search=config.get("search", "racing"),
+        search_budget=config.get("search_budget"),
+        cache=cache,
+        objectives=config.get("objectives"),
+        time_budget_s=config.get("time_budget"),
+        max_games=config.get("max_games"),
+        checkpoint=checkpoint,
+        checkpoint_interval_s=config.get("checkpoint_interval", 30.0),
+        surrogate=surrogate,
+    )
+
+    def leaderboard(board: dict) -> None:
+        if board["entries"]:
+            top = board["entries"][0]
+            tqdm.write(f"[{board['elapsed_s']:.1f}s, {board['games']} games] "
+                       f"leader: {top['config']} {top['score']:.3f} "
+                       f"({top['ci'][0]:.3f}-{top['ci'][1]:.3f})")
+
+    ranked = optimizer.run(final_sims=config["sims"], leaderboard=leaderboard,
+                           leaderboard_interval_s=5.0)
+    if optimizer.resumed_from is not None:
+        state = optimizer.resumed_from
+        print(f"Resumed from a {state['phase']} checkpoint ({state['games']} games)")
+    if optimizer.stop_reason is not None:
+        print(f"Search stopped early: {optimizer.stop_reason}")
+    if optimizer.cache_stats is not None:
+        stats = optimizer.cache_stats
+        print(f"Sample cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['games_reused']} games reused, {stats['games_played']} played")
+
+    print(f"\n-----------------------------------")
+    print(
+        tabulate(
+            [
+                [cfg.describe(), f"{rd['mean_mana']:.2f}", f"{rd['consistency']:.4f}",
+                 f"{rd['threshold_mana']:.2f}"]
+                for cfg, rd in ranked
+            ],
+            headers=["Config", "Mana (EV)", "Consistency", "Floor Mana"],
+        )
+    )
+    if optimizer.objectives:
+        print("\nPareto front (difference from base deck, 95% CI):")
+        print(
+            tabulate(
+                [
+                    [cfg.describe()] + [
+                        f"{ci['diff']:+.3f} [{ci['ci'][0]:+.3f}, {ci['ci'][1]:+.3f}]"
+                        for ci in rd["opt_paired_ci"].values()
+                    ]
+                    for cfg, rd in ranked if rd["opt_pareto_front"]
+                ],
+                headers=["Config"] + list(optimizer.objectives),
+            )
+        )
+
+
+def run_card_impact(config: dict, goldfisher: Goldfisher) -> None:
+    """Print every card's paired leave-one-out impact on --optimize_for."""
+    from auto_goldfish.optimization.card_impact import card_impacts, impact_cards
+
+    cards = impact_cards(goldfisher)
+    with tqdm(total=config["sims"] * (len(cards) + 1)) as bar:
+        def progress(current: int, total: int) -> None:
+            bar.update(current - bar.n)
+
+        report = card_impacts(
+            goldfisher,
+            cards,
+            mode=config["card_impact"],
+            optimize_for=config.get("optimize_for", "floor_performance"),
+            workers=goldfisher.workers,
+            progress=progress,
+        )
+
+    print(f"\n-----------------------------------")
+    print(f"{config['deck_name']}: {report['optimize_for']} {report['baseline_score']:.3f} "
+          f"over {report['games']} games; impact of each card (95% CI)")
+    print(
+        tabulate(
+            [
+                [e["card"], f"{e['impact']:+.3f}", f"[{e['ci'][0]:+.3f}, {e['ci'][1]:+.3f}]",
+                 "*" if e["significant"] else ""]
+                for e in report["cards"]
+            ],
+            headers=["Card", "Impact", "CI", "Sig"],
+            disable_numparse=True,
+        )
+    )
+
 
 def main() -> None:
+    import sys
+
+    if sys.argv[1:2] == ["bench"]:
+        from auto_goldfish.benchmarks.cli import main as bench_main
+
+        sys.exit(bench_main(sys.argv[2:]))
+    if sys.argv[1:2] == ["train-surrogate"]:
+        sys.exit(train_surrogate(sys.argv[2:]))
+
     parser = get_parser()
     args = parser.parse_args()
     config = vars(args)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy import Float, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Float, ForeignKey, Integer, LargeBinary, String, Text, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -71,6 +71,8 @@ class SimulationRunRow(Base):
     seed: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     mulligan_strategy: Mapped[str] = mapped_column(Text, nullable=False, default="default")
     optimal_land_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Results of optimizer runs are of modified decks, not of land counts
+    optimized: Mapped[bool] = mapped_column(default=False)
     created_at: Mapped[datetime] = mapped_column(
         default=lambda: datetime.now(timezone.utc),
     )
@@ -100,6 +102,7 @@ class SimulationResultRow(Base):
     percentile_25: Mapped[float] = mapped_column(Float, nullable=False)
     percentile_50: Mapped[float] = mapped_column(Float, nullable=False)
     percentile_75: Mapped[float] = mapped_column(Float, nullable=False)
+    threshold_mana: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     __table_args__ = (
         UniqueConstraint("run_id", "land_count", name="uq_run_land"),
@@ -138,3 +141,43 @@ class CardPerformanceRow(Base):
 
     run: Mapped["SimulationRunRow"] = relationship(back_populates="card_performances")
     card: Mapped["CardRow"] = relationship()
+
+
+class SampleCacheRow(Base):
+    """Cached optimizer game samples, keyed by ``sample_cache.sample_key``."""
+
+    __tablename__ = "sample_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    n_games: Mapped[int] = mapped_column(Integer, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    last_used: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc), index=True,
+    )
+
+
+class JobResultRow(Base):
+    """Finished server-side jobs evicted from memory (``web.services.job_store``)."""
+
+    __tablename__ = "job_results"
+
+    job_id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    last_used: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc), index=True,
+    )
+
+
+class ResultCacheRow(Base):
+    """Cached simulation results, keyed by ``web.services.result_cache.result_key``."""
+
+    __tablename__ = "result_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    size_bytes: Mapped[int] = mapped_column(Integer, nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    last_used: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc), index=True,
+    )
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from .models import (
@@ -16,6 +17,7 @@ from .models import (
     DeckCardRow,
     DeckRow,
     EffectLabelRow,
+    SampleCacheRow,
     SimulationResultRow,
     SimulationRunRow,
 )
@@ -118,7 +120,14 @@ def save_simulation_run(
     config: Dict[str, Any],
     results: List[Dict[str, Any]],
 ) -> SimulationRunRow:
-    """Save a complete simulation run with results and card performance."""
+    """Save a complete simulation run with results and card performance.
+
+    Of a multi-horizon run (``config["horizons"]``) only the results of
+    the longest horizon, the run's ``turns``, are stored.
+    """
+    horizons = config.get("horizons")
+    turns = max(horizons) if horizons else config.get("turns", 10)
+    results = [r for r in results if r.get("turns", turns) == turns]
 
     # Determine optimal land count (highest consistency)
     optimal_land_count = None
@@ -129,13 +138,14 @@ def save_simulation_run(
     run = SimulationRunRow(
         job_id=job_id,
         deck_id=deck.id,
-        turns=config.get("turns", 10),
+        turns=turns,
         sims=config.get("sims", 1000),
         min_lands=config.get("min_lands", 36),
         max_lands=config.get("max_lands", 39),
         seed=config.get("seed"),
         mulligan_strategy=config.get("mulligan", "default"),
         optimal_land_count=optimal_land_count,
+        optimized=bool(config.get("optimization_enabled")),
     )
     session.add(run)
     session.flush()
@@ -161,6 +171,7 @@ def save_simulation_run(
             percentile_25=r.get("percentile_25", 0.0),
             percentile_50=r.get("percentile_50", 0.0),
             percentile_75=r.get("percentile_75", 0.0),
+            threshold_mana=r.get("threshold_mana"),
         ))
 
     # Save card performance only at optimal land count (bottom 10 with effects)
@@ -193,6 +204,46 @@ def save_simulation_run(
     return run
 
 
+def load_surrogate_training_rows(session: Session) -> List[Dict[str, Any]]:
+    """Stored land-sweep results as training rows for ``optimization.surrogate``.
+
+    Returns one dict per result with ``deck_name``, ``turns``, ``sims``,
+    ``land_count`` and the surrogate targets.  Optimizer runs (their
+    results are of modified decks) and rows saved before
+    ``threshold_mana`` was recorded are skipped.
+    """
+    rows = session.execute(
+        select(
+            DeckRow.name,
+            SimulationRunRow.turns,
+            SimulationRunRow.sims,
+            SimulationResultRow.land_count,
+            SimulationResultRow.mean_mana,
+            SimulationResultRow.consistency,
+            SimulationResultRow.threshold_mana,
+        )
+        .join(SimulationRunRow, SimulationResultRow.run_id == SimulationRunRow.id)
+        .join(DeckRow, SimulationRunRow.deck_id == DeckRow.id)
+        .where(
+            SimulationRunRow.optimized.is_(False),
+            SimulationResultRow.threshold_mana.is_not(None),
+        )
+        .order_by(SimulationResultRow.id)
+    ).all()
+    return [
+        {
+            "deck_name": name,
+            "turns": turns,
+            "sims": sims,
+            "land_count": land_count,
+            "mean_mana": mean_mana,
+            "consistency": consistency,
+            "threshold_mana": threshold_mana,
+        }
+        for name, turns, sims, land_count, mean_mana, consistency, threshold_mana in rows
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Convenience wrappers (handle session internally)
 # ---------------------------------------------------------------------------
@@ -291,6 +342,58 @@ def get_annotation_stats(
     return stats
 
 
+# ---------------------------------------------------------------------------
+# LRU blob tables (see ``auto_goldfish.blob_store``)
+# ---------------------------------------------------------------------------
+
+def load_blob(session: Session, model: Any, key: str) -> Optional[bytes]:
+    """Return the ``data`` of the *model* row *key* and mark it as used."""
+    row = session.get(model, key)
+    if row is None:
+        return None
+    row.last_used = datetime.now(timezone.utc)
+    return row.data
+
+
+def save_blob(
+    session: Session, model: Any, key_col: Any, key: str, data: bytes, **columns: Any,
+) -> None:
+    """Insert or replace the *model* row *key*, setting any extra *columns*."""
+    row = session.get(model, key)
+    if row is None:
+        session.add(model(**{key_col.key: key}, size_bytes=len(data), data=data, **columns))
+        return
+    for name, value in columns.items():
+        setattr(row, name, value)
+    row.size_bytes = len(data)
+    row.data = data
+    row.last_used = datetime.now(timezone.utc)
+
+
+def evict_lru(session: Session, model: Any, key_col: Any, max_bytes: int) -> int:
+    """Delete least recently used *model* rows until they fit *max_bytes*."""
+    session.flush()
+    total = session.scalar(select(func.coalesce(func.sum(model.size_bytes), 0)))
+    if total <= max_bytes:
+        return 0
+    victims = []
+    rows = session.execute(select(key_col, model.size_bytes).order_by(model.last_used))
+    for key, size in rows:
+        if total <= max_bytes:
+            break
+        victims.append(key)
+        total -= size
+    session.execute(delete(model).where(key_col.in_(victims)))
+    return len(victims)
+
+
+def save_sample_cache_entry(session: Session, key: str, data: bytes, n_games: int) -> None:
+    """Insert or grow the sample cache entry for *key*; never replaces a longer sample."""
+    row = session.get(SampleCacheRow, key)
+    if row is None or row.n_games < n_games:
+        save_blob(session, SampleCacheRow, SampleCacheRow.key, key, data, n_games=n_games)
+
+
 def persist_completed_job(job: Any) -> None:
     """Persist a completed SimJob to the database.
 
@@ -27,15 +27,31 @@ def init_db(database_url: str) -> None:
     logger.info("Database initialized: %s", database_url.split("@")[-1] if "@" in database_url else "(local)")
 
 
+# (table, column, DDL type) added to tables created by older versions
+_ADDED_COLUMNS = (
+    ("card_annotations", "session_id", "TEXT"),
+    ("simulation_runs", "optimized", "BOOLEAN DEFAULT FALSE"),
+    ("simulation_results", "threshold_mana", "FLOAT"),
+)
+
+
 def _migrate(engine) -> None:
     """Add columns that create_all won't add to existing tables."""
     insp = inspect(engine)
-    if "card_annotations" in insp.get_table_names():
-        cols = {c["name"] for c in insp.get_columns("card_annotations")}
-        if "session_id" not in cols:
+    tables = set(insp.get_table_names())
+    for table, column, ddl in _ADDED_COLUMNS:
+        if table not in tables:
+            continue
+        cols = {c["name"] for c in insp.get_columns(table)}
+        if column not in cols:
             with engine.begin() as conn:
-                conn.execute(text("ALTER TABLE card_annotations ADD COLUMN session_id TEXT"))
-            logger.info("Migrated card_annotations: added session_id column")
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+            logger.info("Migrated %s: added %s column", table, column)
+
+
+def is_initialized() -> bool:
+    """Whether ``init_db()`` has configured a database."""
+    return _SessionFactory is not None
 
 
 @contextmanager
@@ -0,0 +1,86 @@
+"""Cooperative cancellation of simulations.
+
+A ``CancelToken`` is created by whoever may want to stop a run (a web
+job, a Pyodide worker) and passed down to ``Goldfisher.simulate`` or an
+optimizer.  In-process game loops check it before every game, so a
+cancelled run stops within one game.  Parallel runs wait on their
+worker futures with ``wait_or_cancel``: on cancellation pending futures
+are dropped and the worker processes are terminated (``stop_executor``)
+instead of finishing their batches.
+
+A cancelled run raises ``SimulationCancelled``; partial results are
+discarded.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import FIRST_EXCEPTION, wait
+from typing import Callable, List, Optional
+
+# Seconds between cancellation checks while waiting on worker processes
+POLL_INTERVAL_S = 0.05
+
+
+class SimulationCancelled(Exception):
+    """Raised when a run notices that its ``CancelToken`` was cancelled."""
+
+
+class CancelToken:
+    """Thread-safe cancellation flag.
+
+    Args:
+        poll: Optional ``callable() -> bool`` consulted as well, for
+            sources that cannot call ``cancel()`` themselves (e.g. a flag
+            in shared memory written by a browser's main thread).
+    """
+
+    def __init__(self, poll: Optional[Callable[[], bool]] = None) -> None:
+        self._event = threading.Event()
+        self._poll = poll
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._event.is_set() and self._poll is not None and self._poll():
+            self._event.set()
+        return self._event.is_set()
+
+    def check(self) -> None:
+        """Raise ``SimulationCancelled`` if the token was cancelled."""
+        if self.cancelled:
+            raise SimulationCancelled("Simulation cancelled")
+
+
+def stop_executor(executor) -> None:
+    """Drop the pending work of a ``ProcessPoolExecutor`` and kill its workers."""
+    terminate = getattr(executor, "terminate_workers", None)  # Python 3.14+
+    if terminate is not None:
+        terminate()
+        return
+    # shutdown() forgets the worker processes, so collect them first
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def wait_or_cancel(futures: List, executor, cancel: Optional[CancelToken]) -> None:
+    """Block until all *futures* are done, or stop *executor* on cancellation.
+
+    Raises ``SimulationCancelled`` after stopping the executor; worker
+    errors surface as usual through ``future.result()``.
+    """
+    if cancel is None:
+        wait(futures)
+        return
+    pending = set(futures)
+    while pending:
+        if cancel.cancelled:
+            stop_executor(executor)
+            raise SimulationCancelled("Simulation cancelled")
+        done, pending = wait(pending, timeout=POLL_INTERVAL_S, return_when=FIRST_EXCEPTION)
+        if any(f.exception() is not None for f in done if not f.cancelled()):
+            return
@@ -0,0 +1,498 @@
+"""Exact goldfish evaluation for decks without card effects.
+
+When no card carries a registered effect (and no spell is flagged as ramp
+or draw), a game depends only on how many lands and which spell costs are
+drawn each turn.  ``evaluate_exact`` propagates the exact probability of
+every reachable (lands, hand, cast) state through the mulligan and each
+turn, drawing from the remaining deck composition (multivariate
+hypergeometric), and replays the engine's own spell ordering and
+``select_cards_to_play`` on each state.
+
+The result has no sampling noise, so it serves both as a fast path for
+vanilla decks (``Goldfisher(..., exact=True)``) and as an oracle for the
+sampled engine in tests.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from math import comb
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from auto_goldfish.engine.goldfisher import SimulationResult, _has_effects
+from auto_goldfish.engine.mana_efficiency import select_cards_to_play
+from auto_goldfish.engine.mulligan import CurveAwareMulligan, DefaultMulligan
+from auto_goldfish.models.game_state import GameState
+
+if TYPE_CHECKING:
+    from auto_goldfish.engine.goldfisher import Goldfisher
+    from auto_goldfish.models.card import Card
+
+# Mulligan strategies whose keep decision depends only on the land count
+# of the opening hand once no card is flagged as ramp.
+_SUPPORTED_MULLIGANS = (DefaultMulligan, CurveAwareMulligan)
+
+_CON_THRESHOLD = 0.25
+
+
+def supports_exact(goldfisher: Goldfisher) -> bool:
+    """Return True if ``evaluate_exact`` reproduces *goldfisher*'s games.
+
+    Requires every card to be effectless and unflagged (no ramp/draw),
+    every land to be an untapped non-spell land, and a built-in mulligan
+    strategy.
+    """
+    if type(goldfisher.mulligan_strategy) not in _SUPPORTED_MULLIGANS:
+        return False
+    for card in (*goldfisher.decklist, *goldfisher.commanders):
+        if _has_effects(card) or card.ramp or card.draw:
+            return False
+        if card.land and (card.spell or card.tapped):
+            return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Distribution helpers
+# ---------------------------------------------------------------------------
+
+def _tail_mean(values: np.ndarray, probs: np.ndarray, fraction: float) -> float:
+    """Mean of the lowest *fraction* of probability mass."""
+    remaining = fraction
+    total = 0.0
+    for v, p in zip(values, probs):
+        take = min(p, remaining)
+        total += take * v
+        remaining -= take
+        if remaining <= 1e-12:
+            break
+    return total / fraction
+
+
+@dataclass
+class ExactResult:
+    """Exact outcome distribution of a goldfish run.
+
+    ``values``/``probs`` give the distribution of total mana spent over
+    ``turns`` turns; ``mana_by_turn[t]`` is the expected cumulative mana
+    spent after turn ``t + 1``.
+    """
+
+    land_count: int
+    turns: int
+    values: np.ndarray
+    probs: np.ndarray
+    mana_by_turn: List[float] = field(default_factory=list)
+    mean_hand_sum: float = 0.0
+    mean_lands: float = 0.0
+    mean_mulls: float = 0.0
+    mean_draws: float = 0.0
+    mean_spells_cast: float = 0.0
+    mean_bad_turns: float = 0.0
+    mean_mid_turns: float = 0.0
+    n_states: int = 0
+
+    @property
+    def mean_mana(self) -> float:
+        return float(np.dot(self.values, self.probs))
+
+    def percentile(self, q: float) -> float:
+        """Smallest value whose cumulative probability reaches *q* percent."""
+        cdf = np.cumsum(self.probs)
+        idx = int(np.searchsorted(cdf, q / 100 - 1e-12))
+        return float(self.values[min(idx, len(self.values) - 1)])
+
+    @property
+    def threshold_mana(self) -> float:
+        """Mean of the bottom 25% of games."""
+        return _tail_mean(self.values, self.probs, _CON_THRESHOLD)
+
+    @property
+    def ceiling_mana(self) -> float:
+        """Mean of the top 25% of games."""
+        return _tail_mean(self.values[::-1], self.probs[::-1], _CON_THRESHOLD)
+
+    @property
+    def consistency(self) -> float:
+        """Left-tail ratio: mean(bottom 25%) / mean(all)."""
+        mean = self.mean_mana
+        return 1.0 if mean == 0 else self.threshold_mana / mean
+
+    def _prob_at_least(self, threshold: float) -> float:
+        return float(self.probs[self.values >= threshold].sum())
+
+    def _prob_at_most(self, threshold: float) -> float:
+        return float(self.probs[self.values <= threshold].sum())
+
+    def to_simulation_result(self) -> SimulationResult:
+        """Express the exact distribution as a ``SimulationResult``.
+
+        All confidence intervals collapse to zero width.  Per-card
+        performance, game records and replays are sampling artefacts and
+        are left empty.
+        """
+        mean = self.mean_mana
+        threshold = self.threshold_mana
+        ceiling = self.ceiling_mana
+        consistency = self.consistency
+        median = self.percentile(50)
+        distribution_stats = {
+            "top_centile": self._prob_at_least(self.percentile(99)),
+            "top_decile": self._prob_at_least(self.percentile(90)),
+            "top_quartile": self._prob_at_least(self.percentile(75)),
+            "top_half": self._prob_at_least(median),
+            "low_half": 1.0 - self._prob_at_least(median),
+            "low_quartile": self._prob_at_most(self.percentile(25)),
+            "low_decile": self._prob_at_most(self.percentile(10)),
+            "low_centile": self._prob_at_most(self.percentile(1)),
+        }
+
+        def _breakdown(total: float) -> Dict[str, float]:
+            return {"value": total, "draw": 0.0, "ramp": 0.0, "vd": total, "all": total}
+
+        return SimulationResult(
+            land_count=self.land_count,
+            turns=self.turns,
+            mean_mana=mean,
+            mean_mana_value=mean,
+            mean_mana_total=mean,
+            mean_hand_sum=self.mean_hand_sum,
+            consistency=consistency,
+            mean_bad_turns=self.mean_bad_turns,
+            mean_mid_turns=self.mean_mid_turns,
+            mean_lands=self.mean_lands,
+            mean_mulls=self.mean_mulls,
+            mean_draws=self.mean_draws,
+            mean_spells_cast=self.mean_spells_cast,
+            percentile_25=self.percentile(25),
+            percentile_50=median,
+            percentile_75=self.percentile(75),
+            threshold_percent=_CON_THRESHOLD,
+            threshold_mana=threshold,
+            ceiling_mana=ceiling,
+            quartile_mana={
+                "bottom_25": _breakdown(threshold),
+                "mean": _breakdown(mean),
+                "top_25": _breakdown(ceiling),
+            },
+            con_threshold=_CON_THRESHOLD,
+            distribution_stats=distribution_stats,
+            ci_mean_mana=(mean, mean),
+            ci_consistency=(consistency, consistency),
+            ci_mean_bad_turns=(self.mean_bad_turns, self.mean_bad_turns),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Deck model and state propagation
+# ---------------------------------------------------------------------------
+
+class _DeckModel:
+    """Effectless deck reduced to a land count plus non-land card classes.
+
+    Non-land cards are grouped by (spell, cmc, priority), which is
+    everything the spell ordering and cost calculation can observe once
+    ramp/draw flags are ruled out.  One representative ``Card`` per class
+    is fed to the engine's own sort and selection routines.
+    """
+
+    def __init__(self, goldfisher: Goldfisher) -> None:
+        self.goldfisher = goldfisher
+        self.cost_state = GameState()
+        self.cost_state.min_cost_floor = goldfisher.min_cost_floor
+
+        classes: Dict[tuple, int] = {}
+        self.cards: List[Card] = []
+        counts: List[int] = []
+        self.n_lands = 0
+        for card in goldfisher.decklist:
+            if card.land:
+                self.n_lands += 1
+                continue
+            key = (card.spell, card.cmc, card.priority)
+            if key not in classes:
+                classes[key] = len(self.cards)
+                self.cards.append(card)
+                counts.append(0)
+            counts[classes[key]] += 1
+        self.counts = tuple(counts)
+        self.n_cards = len(goldfisher.decklist)
+        self.costs = tuple(
+            c.get_current_cost(self.cost_state) if c.spell else -1 for c in self.cards
+        )
+        self.commanders = list(goldfisher.commanders)
+        self.commander_costs = tuple(
+            c.get_current_cost(self.cost_state) for c in self.commanders
+        )
+        self._slot = {id(c): ("hand", i) for i, c in enumerate(self.cards)}
+        self._slot.update({id(c): ("cmd", i) for i, c in enumerate(self.commanders)})
+        self._memo: Dict[tuple, tuple] = {}
+
+    def opening_hands(self, size: int) -> Iterator[Tuple[float, int, Tuple[int, ...]]]:
+        """Yield (probability, lands, class_counts) for every *size*-card hand."""
+        total = comb(self.n_cards, size)
+        pools = (self.n_lands, *self.counts)
+
+        def _rec(i: int, left: int, ways: int, picked: list) -> Iterator:
+            if i == len(pools) - 1:
+                if left <= pools[i]:
+                    yield ways * comb(pools[i], left), picked + [left]
+                return
+            for k in range(min(left, pools[i]) + 1):
+                yield from _rec(i + 1, left - k, ways * comb(pools[i], k), picked + [k])
+
+        if size > self.n_cards:
+            return
+        for ways, picked in _rec(0, size, 1, []):
+            yield ways / total, picked[0], tuple(picked[1:])
+
+    def play(
+        self, mana: int, hand: Tuple[int, ...], cmd: Tuple[int, ...],
+    ) -> tuple:
+        """Replay ``_play_spells`` for one (canonical) hand; memoized.
+
+        Returns (cast_counts, commanders_cast, spells_played, mana_spent).
+        """
+        key = (mana, hand, cmd)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        gf = self.goldfisher
+        hand_left = list(hand)
+        cmd_left = list(cmd)
+        cast = [0] * len(hand)
+        cmd_cast = [0] * len(cmd)
+        spells = 0
+        spent = 0
+        while True:
+            playables: list = []
+            for i, n in enumerate(hand_left):
+                if n and self.costs[i] != -1 and self.costs[i] <= mana:
+                    playables.extend([self.cards[i]] * n)
+            for i, avail in enumerate(cmd_left):
+                card = self.commanders[i]
+                if avail and card.spell and self.commander_costs[i] <= mana:
+                    playables.append(card)
+            if not playables:
+                break
+            if gf._spell_sort_key is not None:
+                playables = sorted(playables, key=gf._spell_sort_key)
+            else:
+                playables = sorted(playables)
+            selected = select_cards_to_play(
+                gf.mana_efficiency, playables, mana, self.cost_state,
+            )
+            if not selected:
+                break
+            for card in selected:
+                zone, i = self._slot[id(card)]
+                if zone == "hand":
+                    hand_left[i] -= 1
+                    cast[i] += 1
+                    cost = self.costs[i]
+                else:
+                    cmd_left[i] = 0
+                    cmd_cast[i] = 1
+                    cost = self.commander_costs[i]
+                mana -= cost
+                spent += cost
+                spells += 1
+
+        result = (tuple(cast), tuple(cmd_cast), spells, spent)
+        self._memo[key] = result
+        return result
+
+
+def _row_codes(rows: np.ndarray, bounds: np.ndarray) -> np.ndarray | None:
+    """Encode each row as one int64 (mixed radix), or None if it may overflow.
+
+    *bounds* holds the largest value each column can take.
+    """
+    radices = [int(b) + 1 for b in bounds]
+    weights = []
+    scale = 1
+    for r in reversed(radices):
+        weights.append(scale)
+        scale *= r
+    if scale >= 2**63:
+        return None
+    return rows.astype(np.int64) @ np.array(weights[::-1], dtype=np.int64)
+
+
+def _unique_rows(rows: np.ndarray, bounds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (first index of each distinct row, inverse) for *rows*.
+
+    Sorting packed int64 codes is far faster than ``np.unique(axis=0)``;
+    the latter is only used when the codes would overflow.
+    """
+    codes = _row_codes(rows, bounds)
+    if codes is None:
+        _, index, inverse = np.unique(rows, axis=0, return_index=True, return_inverse=True)
+    else:
+        _, index, inverse = np.unique(codes, return_index=True, return_inverse=True)
+    return index, inverse.reshape(-1)
+
+
+def evaluate_exact(goldfisher: Goldfisher) -> ExactResult:
+    """Compute the exact outcome distribution for *goldfisher*'s deck.
+
+    States are rows of an integer matrix laid out as ``[lands_in_play,
+    lands_in_hand, hand counts..., cast counts..., commanders
+    available...]``; each turn expands every row by its possible draws,
+    applies the land drop and the (memoized) spell selection, and merges
+    identical rows.
+
+    Raises:
+        ValueError: If the deck or play settings are outside what the
+            exact model covers (see ``supports_exact``).
+    """
+    if not supports_exact(goldfisher):
+        raise ValueError(
+            "Exact evaluation requires an effectless deck with untapped "
+            "basic lands and a built-in mulligan strategy"
+        )
+    model = _DeckModel(goldfisher)
+    n_classes = len(model.counts)
+    n_cmd = len(model.commanders)
+    hand_cols = slice(2, 2 + n_classes)
+    cast_cols = slice(2 + n_classes, 2 + 2 * n_classes)
+    cmd_cols = slice(2 + 2 * n_classes, 2 + 2 * n_classes + n_cmd)
+    counts = np.array(model.counts, dtype=np.int64)
+    max_drawn = 7 + goldfisher.turns
+    land_bound = min(model.n_lands, max_drawn)
+    class_bounds = np.minimum(counts, max_drawn)
+    bounds = np.concatenate([
+        [land_bound, land_bound], class_bounds, class_bounds, np.ones(n_cmd, dtype=np.int64),
+    ])
+    key_cols = np.r_[0, np.arange(2, 2 + n_classes), cmd_cols.start + np.arange(n_cmd)]
+    castable = np.array([c != -1 for c in model.costs], dtype=bool)
+    costs = np.array([max(c, 0) for c in model.costs], dtype=np.int64)
+    safe_costs = np.maximum(costs, 1)
+    cmd_castable = np.array([c.spell for c in model.commanders], dtype=bool)
+    cmd_costs = np.array(model.commander_costs, dtype=np.int64)
+
+    # Mulligans: keep a 7-card hand with 3-4 lands, take one free 7-card
+    # mulligan, then keep any 6-card hand.
+    opening: Dict[tuple, float] = defaultdict(float)
+    p_keep = sum(p for p, lands, _ in model.opening_hands(7) if 3 <= lands <= 4)
+    p_mull = 1.0 - p_keep
+    for p, lands, hand in model.opening_hands(7):
+        if 3 <= lands <= 4:
+            opening[(lands, hand)] += p * (1.0 + p_mull)
+    if p_mull > 0:
+        for p, lands, hand in model.opening_hands(6):
+            opening[(lands, hand)] += p * p_mull * p_mull
+    mean_mulls = p_keep * p_mull + 2 * p_mull * p_mull
+    mean_draws = 7 * (1.0 - p_mull * p_mull) + 6 * p_mull * p_mull + goldfisher.turns
+
+    width = 2 + 2 * n_classes + n_cmd
+    states = np.zeros((len(opening), width), dtype=np.int16)
+    probs = np.empty(len(opening))
+    for row, ((lands, hand), p) in enumerate(opening.items()):
+        states[row, 1] = lands
+        states[row, hand_cols] = hand
+        states[row, cmd_cols] = 1
+        probs[row] = p
+
+    mana_by_turn: List[float] = []
+    hand_sum = bad_turns = mid_turns = 0.0
+    n_states = len(states)
+
+    for turn in range(goldfisher.turns):
+        # Draw step: one branch per card class left in the deck.
+        land_left = model.n_lands - states[:, 0].astype(np.int64) - states[:, 1]
+        class_left = counts - states[:, hand_cols] - states[:, cast_cols]
+        deck_left = land_left + class_left.sum(axis=1)
+
+        parts: List[np.ndarray] = []
+        part_probs: List[np.ndarray] = []
+        part_deck: List[np.ndarray] = []
+        empty = deck_left == 0
+        if empty.any():
+            parts.append(states[empty])
+            part_probs.append(probs[empty])
+            part_deck.append(np.zeros(int(empty.sum()), dtype=np.int64))
+        branches = [(1, land_left)] + [(2 + i, class_left[:, i]) for i in range(n_classes)]
+        for col, left in branches:
+            mask = left > 0
+            if not mask.any():
+                continue
+            drawn = states[mask]
+            drawn[:, col] += 1
+            parts.append(drawn)
+            part_probs.append(probs[mask] * left[mask] / deck_left[mask])
+            part_deck.append(deck_left[mask] - 1)
+        states = np.concatenate(parts)
+        probs = np.concatenate(part_probs)
+        deck_after = np.concatenate(part_deck)
+
+        # Land drop, then spell selection for each distinct (mana, hand, commanders).
+        has_land = states[:, 1] > 0
+        states[has_land, 0] += 1
+        states[has_land, 1] -= 1
+        # Cards that cost more than the available mana never enter the
+        # playable set, so they are dropped from the memo key; under greedy
+        # selection at most ``mana // cost`` copies of a class can be cast.
+        mana = states[:, :1].astype(np.int64)
+        affordable = castable & (costs <= mana)
+        key_hand = np.where(affordable, states[:, hand_cols], 0)
+        if goldfisher.mana_efficiency == "greedy":
+            key_hand = np.where(
+                costs > 0, np.minimum(key_hand, mana // safe_costs), key_hand,
+            )
+        key_cmd = np.where(cmd_castable & (cmd_costs <= mana), states[:, cmd_cols], 0)
+        keys = np.concatenate([mana, key_hand, key_cmd], axis=1)
+        index, inverse = _unique_rows(keys, bounds[key_cols])
+        plays = [
+            model.play(k[0], tuple(k[1:1 + n_classes]), tuple(k[1 + n_classes:]))
+            for k in keys[index].tolist()
+        ]
+        n_unique = len(plays)
+        cast_delta = np.array([r[0] for r in plays], dtype=np.int16).reshape(n_unique, n_classes)
+        cmd_cast = np.array([r[1] for r in plays], dtype=np.int16).reshape(n_unique, n_cmd)
+        spells = np.array([r[2] for r in plays])[inverse]
+        spent = np.array([r[3] for r in plays])[inverse]
+
+        cast_delta = cast_delta[inverse]
+        states[:, hand_cols] -= cast_delta
+        states[:, cast_cols] += cast_delta
+        states[:, cmd_cols] -= cmd_cast[inverse]
+
+        hand_size = states[:, 1] + states[:, hand_cols].sum(axis=1)
+        hand_sum += float(probs @ np.minimum(hand_size, 7))
+        live = deck_after > 0
+        bad_turns += float(probs[(spells == 0) & live].sum())
+        mid_turns += float(probs[(spells < 2) & live & (spent < turn + 1)].sum())
+
+        index, inverse = _unique_rows(states, bounds)
+        probs = np.bincount(inverse, weights=probs, minlength=len(index))
+        states = states[index]
+        n_states = max(n_states, len(states))
+        total_spent = states[:, cast_cols] @ costs + (1 - states[:, cmd_cols]) @ cmd_costs
+        mana_by_turn.append(float(probs @ total_spent))
+
+    total_spent = states[:, cast_cols] @ costs + (1 - states[:, cmd_cols]) @ cmd_costs
+    outcome = np.bincount(total_spent, weights=probs)
+    values = np.flatnonzero(outcome)
+    dist = outcome[values] / outcome.sum()
+    spells_cast = states[:, cast_cols].sum(axis=1) + (1 - states[:, cmd_cols]).sum(axis=1)
+
+    return ExactResult(
+        land_count=goldfisher.land_count,
+        turns=goldfisher.turns,
+        values=values.astype(float),
+        probs=dist,
+        mana_by_turn=mana_by_turn,
+        mean_hand_sum=hand_sum,
+        mean_lands=float(probs @ states[:, 0]),
+        mean_mulls=mean_mulls,
+        mean_draws=mean_draws,
+        mean_spells_cast=float(probs @ spells_cast),
+        mean_bad_turns=bad_turns,
+        mean_mid_turns=mid_turns,
+        n_states=n_states,
+    )
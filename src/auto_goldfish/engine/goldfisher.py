@@ -6,14 +6,17 @@ No CLI code here -- returns structured ``SimulationResult``.
 
 from __future__ import annotations
 
+import multiprocessing
 import os
 import random
+import time
 from collections import defaultdict
 try:
     from concurrent.futures import ProcessPoolExecutor
 except ImportError:
     ProcessPoolExecutor = None  # type: ignore[misc,assignment]
 
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -30,9 +33,11 @@ except ImportError:
 from auto_goldfish.effects.card_database import DEFAULT_REGISTRY
 from auto_goldfish.effects.registry import CardEffects, EffectRegistry
 from auto_goldfish.effects.types import CastTriggerEffect, ManaFunctionEffect, OnPlayEffect, PerTurnEffect
+from auto_goldfish.engine.cancellation import CancelToken, wait_or_cancel
 from auto_goldfish.engine.mana import land_mana, mana_rocks
 from auto_goldfish.engine.mana_efficiency import VALID_MANA_EFFICIENCY_MODES, select_cards_to_play
 from auto_goldfish.engine.mulligan import DefaultMulligan, MulliganStrategy
+from auto_goldfish.engine.shuffle import VALID_SHUFFLE_MODES, coupled_order, slot_hashes
 from auto_goldfish.engine.spell_priority import VALID_SPELL_PRIORITIES, get_spell_sort_key
 from auto_goldfish.models.card import Card
 from auto_goldfish.models.game_state import GameState
@@ -50,6 +55,7 @@ class SimulationResult:
     """
 
     land_count: int = 0
+    turns: int = 0
     mean_mana: float = 0.0
     mean_mana_value: float = 0.0
     mean_mana_draw: float = 0.0
@@ -75,6 +81,7 @@ class SimulationResult:
     card_performance: Dict[str, Any] = field(default_factory=dict)
     game_records: Dict[str, Dict[str, list]] = field(default_factory=dict)
     replay_data: Dict[str, Any] = field(default_factory=dict)
+    profile: Dict[str, Any] = field(default_factory=dict)
 
     # 95% CI half-widths (z * std / sqrt(n))
     ci_mana_value: float = 0.0
@@ -110,6 +117,63 @@ class SimulationResult:
         ]
 
 
+# Per-game scalar stats stored in ``GameSample.stats`` (column order).
+SAMPLE_STAT_KEYS = (
+    "mana_spent", "mana_value", "mana_draw", "mana_ramp", "hand_sum", "mulls",
+    "lands_played", "cards_drawn", "spells_cast", "bad_turns", "mid_turns",
+)
+
+
+@dataclass
+class GameSample:
+    """Compact per-game data for a block of consecutively seeded games.
+
+    Returned by ``Goldfisher.play_sample()``.  Row ``j`` is game
+    ``game_offset + j`` of the seed stream, so blocks for the same deck
+    concatenate into one longer sample; ``Goldfisher.result_from_sample()``
+    turns a sample into a full ``SimulationResult``.
+    """
+
+    # (n_games, len(SAMPLE_STAT_KEYS)) int32
+    stats: np.ndarray
+    # (n_games, deck size) bool: spell k was drawn in game j
+    drawn: np.ndarray
+    # (row, raw replay tuple) pairs, see ``Goldfisher._run_raw_batch``
+    replays: List[Tuple[int, tuple]] = field(default_factory=list)
+
+    @property
+    def n_games(self) -> int:
+        return self.stats.shape[0]
+
+    def column(self, key: str) -> np.ndarray:
+        return self.stats[:, SAMPLE_STAT_KEYS.index(key)]
+
+    def head(self, n_games: int) -> "GameSample":
+        """The first *n_games* games (replays of later games are dropped)."""
+        if n_games >= self.n_games:
+            return self
+        return GameSample(
+            self.stats[:n_games], self.drawn[:n_games],
+            [(row, r) for row, r in self.replays if row < n_games],
+        )
+
+    @classmethod
+    def concat(cls, samples: List["GameSample"]) -> "GameSample":
+        """Join consecutive blocks into one sample."""
+        if len(samples) == 1:
+            return samples[0]
+        replays = []
+        offset = 0
+        for sample in samples:
+            replays.extend((offset + row, r) for row, r in sample.replays)
+            offset += sample.n_games
+        return cls(
+            np.concatenate([s.stats for s in samples]),
+            np.concatenate([s.drawn for s in samples]),
+            replays,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Module-level helpers (used by effects via import)
 # ---------------------------------------------------------------------------
@@ -176,6 +240,47 @@ def _card_to_dict(card: Card) -> dict:
 
 _REPLAY_CAP_PER_WORKER = 15
 
+# Per-turn cumulative counters recorded when ``simulate(horizons=...)`` is used.
+# Each is stored as an int16 ``(n_games, max_turns)`` array; column ``t`` holds
+# the running total after turn ``t + 1``.
+_TURN_STAT_KEYS = (
+    "mana_value", "mana_draw", "mana_ramp", "hand_sum", "lands_played",
+    "spells_cast", "bad_turns", "mid_turns", "cards_drawn",
+)
+
+
+def _new_turn_stats(n_games: int, n_turns: int) -> dict[str, np.ndarray]:
+    """Allocate per-turn cumulative stat arrays plus per-game mulligan counts."""
+    stats = {k: np.zeros((n_games, n_turns), dtype=np.int16) for k in _TURN_STAT_KEYS}
+    stats["mulls"] = np.zeros(n_games, dtype=np.int16)
+    return stats
+
+
+def _record_turn_stats(
+    turn_stats: dict[str, np.ndarray],
+    j: int,
+    i: int,
+    mana_value: int,
+    mana_draw: int,
+    mana_ramp: int,
+    hand_sum: int,
+    lands_played: int,
+    spells_cast: int,
+    bad_turns: int,
+    mid_turns: int,
+    cards_drawn: int,
+) -> None:
+    """Store running totals for game *j* after turn *i* (0-based)."""
+    turn_stats["mana_value"][j, i] = mana_value
+    turn_stats["mana_draw"][j, i] = mana_draw
+    turn_stats["mana_ramp"][j, i] = mana_ramp
+    turn_stats["hand_sum"][j, i] = hand_sum
+    turn_stats["lands_played"][j, i] = lands_played
+    turn_stats["spells_cast"][j, i] = spells_cast
+    turn_stats["bad_turns"][j, i] = bad_turns
+    turn_stats["mid_turns"][j, i] = mid_turns
+    turn_stats["cards_drawn"][j, i] = cards_drawn
+
 
 def _worker_run_batch(
     deck_dicts: list[dict],
@@ -185,17 +290,12 @@ def _worker_run_batch(
     game_offset: int,
     capture_replays: bool = False,
     extra_config: dict | None = None,
+    record_turns: bool = False,
 ) -> dict:
     """Top-level function for ProcessPoolExecutor workers.
 
-    Creates a fresh Goldfisher and runs ``n_games`` simulations.
-    Returns raw per-game stats as lists.
-
-    When *capture_replays* is ``True`` the worker records unclassified
-    turn-by-turn snapshots for a sample of games (up to
-    ``_REPLAY_CAP_PER_WORKER``).  Classification into quartile buckets
-    happens later in ``_run_parallel`` once the full mana distribution
-    is available.
+    Creates a fresh Goldfisher and runs ``n_games`` simulations via
+    ``Goldfisher._run_raw_batch``.  Returns raw per-game stats as lists.
     """
     extra_config = extra_config or {}
     gf = Goldfisher(
@@ -203,163 +303,25 @@ def _worker_run_batch(
         record_results=None, seed=base_seed,
         **extra_config,
     )
-    # Adjust seed offset so each batch uses the correct per-game seeds
-    mana_spent = []
-    mana_value = []
-    mana_draw = []
-    mana_ramp = []
-    hand_sum = []
-    mulls = []
-    lands_played = []
-    cards_drawn = []
-    spells_cast = []
-    bad_turns = []
-    mid_turns = []
-    card_cast_turns: list[list] = [[] for _ in gf.decklist]
-    played_cards_per_game: list[set] = []
-    drawn_cards_per_game: list[set] = []
-
-    # Unclassified replay snapshots: list of (total_mana, replay_dict)
-    raw_replays: list[tuple[int, dict]] = []
-    # Start capturing after the first 10% of games to get some variance
-    replay_start = max(int(n_games * 0.1), 1)
-
-    for j in range(n_games):
-        global_j = game_offset + j
-        if base_seed is not None:
-            random.seed(base_seed + global_j)
-        state = gf._reset()
-        mulligans = gf._mulligan(state)
-
-        total_mana_spent = 0
-        game_mana_value = 0
-        game_mana_draw = 0
-        game_mana_ramp = 0
-        game_hand_sum = 0
-        game_lands = 0
-        game_bad = 0
-        game_mid = 0
-        game_spells_cast = 0
-
-        # Decide whether to capture this game's replay
-        _capture_this = (
-            capture_replays
-            and j >= replay_start
-            and len(raw_replays) < _REPLAY_CAP_PER_WORKER
-        )
-        turn_snapshots: list[dict] = []
-        starting_hand_names: list[str] = []
-        if _capture_this:
-            starting_hand_names = [gf.decklist[idx].name for idx in state.hand]
-
-        for i in range(turns):
-            turn_mana_value = 0
-            turn_mana_draw = 0
-            turn_mana_ramp = 0
-            spells_played = 0
+    result = gf._run_raw_batch(n_games, base_seed, game_offset, capture_replays, record_turns)
+    if gf.profile is not None:
+        result["profile"] = gf.profile.to_dict()
+    return result
 
-            if _capture_this:
-                hand_before = [gf.decklist[idx].name for idx in state.hand]
 
-            played = gf._take_turn(state)
-            for card in played:
-                if card.land:
-                    game_lands += 1
-                if card.spell:
-                    spells_played += 1
-                    cost = card.mana_spent_when_played
-                    if card.draw:
-                        turn_mana_draw += cost
-                    elif card.ramp:
-                        turn_mana_ramp += cost
-                    else:
-                        turn_mana_value += cost
-            turn_mana = turn_mana_value + turn_mana_draw
-            game_mana_value += turn_mana_value
-            game_mana_draw += turn_mana_draw
-            game_mana_ramp += turn_mana_ramp
-            game_hand_sum += min(len(state.hand), 7)
-            game_spells_cast += spells_played
-            if spells_played == 0 and state.deck:
-                game_bad += 1
-            if spells_played < 2 and state.deck and turn_mana < i + 1:
-                game_mid += 1
-            total_mana_spent += turn_mana
+def pool_context(in_process: bool):
+    """Start method for a worker pool (``mp_context`` argument).
 
-            if _capture_this:
-                turn_snapshots.append({
-                    "turn": i + 1,
-                    "hand_before_draw": hand_before,
-                    "played": [
-                        {
-                            "name": c.name,
-                            "cost": c.cost,
-                            "mana_spent": c.mana_spent_when_played,
-                            "is_land": c.land,
-                        }
-                        for c in played
-                    ],
-                    "mana_spent_this_turn": turn_mana,
-                    "total_mana_production": gf._get_mana(state),
-                    "hand_after": [gf.decklist[idx].name for idx in state.hand],
-                    "battlefield": [gf.decklist[idx].name for idx in state.battlefield],
-                    "lands": [gf.decklist[idx].name for idx in state.lands],
-                    "graveyard": [gf.decklist[idx].name for idx in state.yard],
-                })
-
-        mana_spent.append(total_mana_spent)
-        mana_value.append(game_mana_value)
-        mana_draw.append(game_mana_draw)
-        mana_ramp.append(game_mana_ramp)
-        hand_sum.append(game_hand_sum)
-        lands_played.append(game_lands)
-        mulls.append(mulligans)
-        cards_drawn.append(state.draws)
-        spells_cast.append(game_spells_cast)
-        bad_turns.append(game_bad)
-        mid_turns.append(game_mid)
-
-        game_played = set()
-        for k, turn in enumerate(state.card_cast_turn):
-            if turn is not None and not gf.decklist[k].land:
-                card_cast_turns[k].append(turn)
-                if gf.decklist[k].spell:
-                    game_played.add(k)
-        played_cards_per_game.append(game_played)
-
-        # Cards drawn = all cards not still in deck or command zone
-        deck_set = set(state.deck) | set(state.command_zone)
-        game_drawn = {k for k in range(len(gf.decklist))
-                      if k not in deck_set and gf.decklist[k].spell and not gf.decklist[k].land}
-        drawn_cards_per_game.append(game_drawn)
-
-        if _capture_this:
-            raw_replays.append((game_mana_value, game_mana_draw, game_mana_ramp, total_mana_spent, {
-                "total_mana": total_mana_spent,
-                "mulligans": mulligans,
-                "starting_hand": starting_hand_names,
-                "turns": turn_snapshots,
-            }))
-
-    result: dict = {
-        "mana_spent": mana_spent,
-        "mana_value": mana_value,
-        "mana_draw": mana_draw,
-        "mana_ramp": mana_ramp,
-        "hand_sum": hand_sum,
-        "mulls": mulls,
-        "lands_played": lands_played,
-        "cards_drawn": cards_drawn,
-        "spells_cast": spells_cast,
-        "bad_turns": bad_turns,
-        "mid_turns": mid_turns,
-        "card_cast_turns": card_cast_turns,
-        "played_cards_per_game": played_cards_per_game,
-        "drawn_cards_per_game": drawn_cards_per_game,
-    }
-    if capture_replays:
-        result["raw_replays"] = raw_replays
-    return result
+    ``in_process=False`` means a thread of a multi-threaded process (the
+    web server) drives the pool, and forking such a process can copy
+    locks held by other threads.  Those pools start their workers from a
+    forkserver (or spawn them where forkserver is unavailable); other
+    pools keep the platform default.
+    """
+    if in_process:
+        return None
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
 
 
 # ---------------------------------------------------------------------------
@@ -383,8 +345,22 @@ class Goldfisher:
         Card effects registry. Uses DEFAULT_REGISTRY if not provided.
     mulligan_strategy : MulliganStrategy, optional
         Mulligan strategy. Uses DefaultMulligan if not provided.
+    profile : bool
+        Record per-phase timings and effect counts (see
+        ``engine.profiling``).  Results are attached to
+        ``SimulationResult.profile``.  Off by default and free when off.
+    workers : int
+        Processes that play the games.
+    in_process : bool
+        With ``workers == 1``, play in the calling thread.  ``False`` uses
+        a one-process pool instead, so a thread that drives several
+        simulations at once does not hold the GIL while games play.
     """
 
+    # Indirections so ``engine.profiling.instrument`` can wrap them per instance.
+    _draw_card = staticmethod(_draw)
+    _select_cards = staticmethod(select_cards_to_play)
+
     def __init__(
         self,
         decklist_dicts: list[dict],
@@ -402,30 +378,28 @@ class Goldfisher:
         mana_efficiency: str = "greedy",
         ramp_cutoff_turn: int = 0,
         min_cost_floor: int = 1,
+        exact: bool = False,
+        profile: bool = False,
+        shuffle: str = "standard",
+        in_process: bool = True,
         **kwargs,
     ):
         if mana_mode not in ("value", "value_draw", "total"):
             raise ValueError(f"Invalid mana_mode: {mana_mode!r}. Must be 'value', 'value_draw', or 'total'.")
+        if shuffle not in VALID_SHUFFLE_MODES:
+            raise ValueError(f"Invalid shuffle: {shuffle!r}. Must be one of {VALID_SHUFFLE_MODES}")
         self.mana_mode = mana_mode
-        if spell_priority not in VALID_SPELL_PRIORITIES:
-            raise ValueError(
-                f"Invalid spell_priority: {spell_priority!r}. "
-                f"Must be one of {VALID_SPELL_PRIORITIES}"
-            )
-        self.spell_priority = spell_priority
-        self._spell_sort_key = get_spell_sort_key(spell_priority)
-        if mana_efficiency not in VALID_MANA_EFFICIENCY_MODES:
-            raise ValueError(
-                f"Invalid mana_efficiency: {mana_efficiency!r}. "
-                f"Must be one of {VALID_MANA_EFFICIENCY_MODES}"
-            )
-        self.mana_efficiency = mana_efficiency
-        if ramp_cutoff_turn < 0:
-            raise ValueError(f"ramp_cutoff_turn must be >= 0, got {ramp_cutoff_turn}")
-        self.ramp_cutoff_turn = ramp_cutoff_turn
+        self.shuffle = shuffle
+        self._slot_cache: tuple | None = None
+        self.set_play_settings(
+            spell_priority=spell_priority,
+            mana_efficiency=mana_efficiency,
+            ramp_cutoff_turn=ramp_cutoff_turn,
+        )
         if min_cost_floor not in (0, 1):
             raise ValueError(f"min_cost_floor must be 0 or 1, got {min_cost_floor}")
         self.min_cost_floor = min_cost_floor
+        self.exact = exact
         self.registry = registry or DEFAULT_REGISTRY
         self.mulligan_strategy = mulligan_strategy or DefaultMulligan()
         self.turns = turns
@@ -433,6 +407,8 @@ class Goldfisher:
         self.verbose = verbose
         self.seed = seed
         self.workers = workers
+        self.in_process = in_process
+        self._shared_pool = None
         self._should_log = verbose or record_results is not None
 
         # Separate commanders from the decklist
@@ -477,6 +453,46 @@ class Goldfisher:
         elif record_results == "centile":
             self.record_centile = True
 
+        self.profile = None
+        if profile:
+            from auto_goldfish.engine.profiling import EngineProfile, instrument
+
+            self.profile = EngineProfile()
+            instrument(self, self.profile)
+
+    def set_play_settings(
+        self,
+        spell_priority: str | None = None,
+        mana_efficiency: str | None = None,
+        ramp_cutoff_turn: int | None = None,
+        mulligan_strategy: MulliganStrategy | None = None,
+    ) -> None:
+        """Switch the play policy without rebuilding the decklist.
+
+        Arguments left as ``None`` keep their current value.
+        """
+        if spell_priority is not None:
+            if spell_priority not in VALID_SPELL_PRIORITIES:
+                raise ValueError(
+                    f"Invalid spell_priority: {spell_priority!r}. "
+                    f"Must be one of {VALID_SPELL_PRIORITIES}"
+                )
+            self.spell_priority = spell_priority
+            self._spell_sort_key = get_spell_sort_key(spell_priority)
+        if mana_efficiency is not None:
+            if mana_efficiency not in VALID_MANA_EFFICIENCY_MODES:
+                raise ValueError(
+                    f"Invalid mana_efficiency: {mana_efficiency!r}. "
+                    f"Must be one of {VALID_MANA_EFFICIENCY_MODES}"
+                )
+            self.mana_efficiency = mana_efficiency
+        if ramp_cutoff_turn is not None:
+            if ramp_cutoff_turn < 0:
+                raise ValueError(f"ramp_cutoff_turn must be >= 0, got {ramp_cutoff_turn}")
+            self.ramp_cutoff_turn = ramp_cutoff_turn
+        if mulligan_strategy is not None:
+            self.mulligan_strategy = mulligan_strategy
+
     def _make_card(self, card_dict: dict, index: int) -> Card:
         """Create a Card from a raw dict, applying registry effects."""
         # Clean up dict for Card dataclass
@@ -545,13 +561,29 @@ class Goldfisher:
             card.zone = state.deck
             state.deck.append(card.index)
 
-        random.shuffle(state.deck)
+        self._shuffle_library(state.deck)
 
         # Default mana functions
         state.mana_functions = [land_mana, mana_rocks]
 
         return state
 
+    def _shuffle_library(self, deck: list[int]) -> None:
+        """Shuffle *deck*, which holds every decklist index, in place.
+
+        See ``engine.shuffle`` for the ``coupled`` and ``standard`` modes.
+        """
+        if self.shuffle == "standard":
+            random.shuffle(deck)
+            return
+        # Slot hashes depend only on the decklist; config swaps replace
+        # the list and apply_config appends to it
+        cached = self._slot_cache
+        if cached is None or cached[0] is not self.decklist or len(cached[1]) != len(deck):
+            cached = (self.decklist, slot_hashes(self.decklist))
+            self._slot_cache = cached
+        deck[:] = coupled_order(cached[1])
+
     def _mulligan(self, state: GameState) -> int:
         """Execute mulligan logic. Returns the number of mulligans taken."""
         mulligans = -1
@@ -589,7 +621,7 @@ class Goldfisher:
             for card in self.decklist:
                 card.zone = state.deck
                 state.deck.append(card.index)
-            random.shuffle(state.deck)
+            self._shuffle_library(state.deck)
 
             if state.should_log:
                 if mulligans == -1:
@@ -747,7 +779,7 @@ class Goldfisher:
 
         playables = self._get_playables(state, mana_available)
         while playables:
-            selected = select_cards_to_play(
+            selected = self._select_cards(
                 self.mana_efficiency, playables, mana_available, state,
             )
             if not selected:
@@ -781,7 +813,7 @@ class Goldfisher:
         state.played_land_this_turn = 0
         state.untapped_land_this_turn = 0
         state.tapped_creatures_this_turn = 0
-        _draw(state)
+        self._draw_card(state)
 
         # Per-turn effects
         for card, eff in state.per_turn_effects:
@@ -857,6 +889,27 @@ class Goldfisher:
         self.deckdict = {c.name: c for c in self.decklist}
         self.land_count = self._original_land_count
 
+    def _bootstrap_consistency_ci(self, primary_list: list, cutoff: int) -> Tuple[float, float]:
+        """95% bootstrap CI for the left-tail consistency ratio."""
+        n = len(primary_list)
+        n_boot = min(1000, n)
+        boot_consistencies = []
+        mana_arr = np.array(primary_list)
+        boot_rng = np.random.RandomState(self.seed if self.seed is not None else 42)
+        for _ in range(n_boot):
+            boot_sample = boot_rng.choice(mana_arr, size=n, replace=True)
+            boot_sorted = np.sort(boot_sample)
+            boot_tail = float(np.mean(boot_sorted[:cutoff]))
+            boot_overall = float(np.mean(boot_sample))
+            if boot_overall == 0:
+                boot_consistencies.append(1.0)
+            else:
+                boot_consistencies.append(boot_tail / boot_overall)
+        return (
+            float(np.percentile(boot_consistencies, 2.5)),
+            float(np.percentile(boot_consistencies, 97.5)),
+        )
+
     def _compute_distribution_stats(self, mana_spent_list: list) -> Dict[str, float]:
         """Compute distribution bucket fractions from raw mana data.
 
@@ -985,18 +1038,264 @@ class Goldfisher:
             "mana_efficiency": self.mana_efficiency,
             "ramp_cutoff_turn": self.ramp_cutoff_turn,
             "min_cost_floor": self.min_cost_floor,
+            "shuffle": self.shuffle,
+        }
+
+    def _run_raw_batch(
+        self,
+        n_games: int,
+        base_seed: int | None,
+        game_offset: int = 0,
+        capture_replays: bool = False,
+        record_turns: bool = False,
+        cancel: CancelToken | None = None,
+    ) -> dict:
+        """Play games ``game_offset .. game_offset + n_games - 1`` and return raw stats.
+
+        Game ``j`` is seeded with ``base_seed + j`` (unseeded when
+        *base_seed* is ``None``), matching ``simulate()``, so blocks played
+        separately concatenate into the same games as one long run.
+
+        When *record_turns* is ``True`` the result also carries a
+        ``turn_stats`` dict of per-turn cumulative arrays (see
+        ``_new_turn_stats``) used for multi-horizon results.
+
+        When *capture_replays* is ``True`` turn-by-turn snapshots are
+        recorded for a sample of games (up to ``_REPLAY_CAP_PER_WORKER``)
+        along with their block-relative indices in ``replay_games``.
+        Classification into quartile buckets happens later (see
+        ``_classify_replays``) once the full mana distribution is available.
+
+        *cancel* is checked before every game.
+        """
+        mana_spent = []
+        mana_value = []
+        mana_draw = []
+        mana_ramp = []
+        hand_sum = []
+        mulls = []
+        lands_played = []
+        cards_drawn = []
+        spells_cast = []
+        bad_turns = []
+        mid_turns = []
+        card_cast_turns: list[list] = [[] for _ in self.decklist]
+        played_cards_per_game: list[set] = []
+        drawn_cards_per_game: list[set] = []
+
+        # Unclassified replay snapshots: list of (total_mana, replay_dict)
+        raw_replays: list[tuple[int, dict]] = []
+        replay_games: list[int] = []
+        # Start capturing after the first 10% of games to get some variance
+        replay_start = max(int(n_games * 0.1), 1)
+        turn_stats = _new_turn_stats(n_games, self.turns) if record_turns else None
+
+        # Per-game card bookkeeping only looks at non-land (spell) slots
+        nonland_idx = [k for k, c in enumerate(self.decklist) if not c.land]
+        spell_idx = [k for k in nonland_idx if self.decklist[k].spell]
+        spell_idx_set = set(spell_idx)
+
+        for j in range(n_games):
+            if cancel is not None:
+                cancel.check()
+            global_j = game_offset + j
+            if base_seed is not None:
+                random.seed(base_seed + global_j)
+            state = self._reset()
+            mulligans = self._mulligan(state)
+
+            total_mana_spent = 0
+            game_mana_value = 0
+            game_mana_draw = 0
+            game_mana_ramp = 0
+            game_hand_sum = 0
+            game_lands = 0
+            game_bad = 0
+            game_mid = 0
+            game_spells_cast = 0
+
+            # Decide whether to capture this game's replay
+            _capture_this = (
+                capture_replays
+                and j >= replay_start
+                and len(raw_replays) < _REPLAY_CAP_PER_WORKER
+            )
+            turn_snapshots: list[dict] = []
+            starting_hand_names: list[str] = []
+            if _capture_this:
+                starting_hand_names = [self.decklist[idx].name for idx in state.hand]
+
+            for i in range(self.turns):
+                turn_mana_value = 0
+                turn_mana_draw = 0
+                turn_mana_ramp = 0
+                spells_played = 0
+
+                if _capture_this:
+                    hand_before = [self.decklist[idx].name for idx in state.hand]
+
+                played = self._take_turn(state)
+                for card in played:
+                    if card.land:
+                        game_lands += 1
+                    if card.spell:
+                        spells_played += 1
+                        cost = card.mana_spent_when_played
+                        if card.draw:
+                            turn_mana_draw += cost
+                        elif card.ramp:
+                            turn_mana_ramp += cost
+                        else:
+                            turn_mana_value += cost
+                turn_mana = turn_mana_value + turn_mana_draw
+                game_mana_value += turn_mana_value
+                game_mana_draw += turn_mana_draw
+                game_mana_ramp += turn_mana_ramp
+                game_hand_sum += min(len(state.hand), 7)
+                game_spells_cast += spells_played
+                if spells_played == 0 and state.deck:
+                    game_bad += 1
+                if spells_played < 2 and state.deck and turn_mana < i + 1:
+                    game_mid += 1
+                total_mana_spent += turn_mana
+                if turn_stats is not None:
+                    _record_turn_stats(
+                        turn_stats, j, i, game_mana_value, game_mana_draw,
+                        game_mana_ramp, game_hand_sum, game_lands, game_spells_cast,
+                        game_bad, game_mid, state.draws,
+                    )
+
+                if _capture_this:
+                    turn_snapshots.append({
+                        "turn": i + 1,
+                        "hand_before_draw": hand_before,
+                        "played": [
+                            {
+                                "name": c.name,
+                                "cost": c.cost,
+                                "mana_spent": c.mana_spent_when_played,
+                                "is_land": c.land,
+                            }
+                            for c in played
+                        ],
+                        "mana_spent_this_turn": turn_mana,
+                        "total_mana_production": self._get_mana(state),
+                        "hand_after": [self.decklist[idx].name for idx in state.hand],
+                        "battlefield": [self.decklist[idx].name for idx in state.battlefield],
+                        "lands": [self.decklist[idx].name for idx in state.lands],
+                        "graveyard": [self.decklist[idx].name for idx in state.yard],
+                    })
+
+            mana_spent.append(total_mana_spent)
+            mana_value.append(game_mana_value)
+            mana_draw.append(game_mana_draw)
+            mana_ramp.append(game_mana_ramp)
+            hand_sum.append(game_hand_sum)
+            lands_played.append(game_lands)
+            mulls.append(mulligans)
+            if turn_stats is not None:
+                turn_stats["mulls"][j] = mulligans
+            cards_drawn.append(state.draws)
+            spells_cast.append(game_spells_cast)
+            bad_turns.append(game_bad)
+            mid_turns.append(game_mid)
+
+            game_played = set()
+            cast_turn = state.card_cast_turn
+            for k in nonland_idx:
+                turn = cast_turn[k]
+                if turn is not None:
+                    card_cast_turns[k].append(turn)
+                    if k in spell_idx_set:
+                        game_played.add(k)
+            played_cards_per_game.append(game_played)
+
+            # Cards drawn = all spell cards not still in deck or command zone
+            deck_set = set(state.deck)
+            deck_set.update(state.command_zone)
+            drawn_cards_per_game.append({k for k in spell_idx if k not in deck_set})
+
+            if _capture_this:
+                replay_games.append(j)
+                raw_replays.append((game_mana_value, game_mana_draw, game_mana_ramp, total_mana_spent, {
+                    "total_mana": total_mana_spent,
+                    "mulligans": mulligans,
+                    "starting_hand": starting_hand_names,
+                    "turns": turn_snapshots,
+                }))
+
+        result: dict = {
+            "mana_spent": mana_spent,
+            "mana_value": mana_value,
+            "mana_draw": mana_draw,
+            "mana_ramp": mana_ramp,
+            "hand_sum": hand_sum,
+            "mulls": mulls,
+            "lands_played": lands_played,
+            "cards_drawn": cards_drawn,
+            "spells_cast": spells_cast,
+            "bad_turns": bad_turns,
+            "mid_turns": mid_turns,
+            "card_cast_turns": card_cast_turns,
+            "played_cards_per_game": played_cards_per_game,
+            "drawn_cards_per_game": drawn_cards_per_game,
         }
+        if capture_replays:
+            result["raw_replays"] = raw_replays
+            result["replay_games"] = replay_games
+        if turn_stats is not None:
+            result["turn_stats"] = turn_stats
+        return result
+
+    def _use_pool(self) -> bool:
+        return ProcessPoolExecutor is not None and (self.workers > 1 or not self.in_process)
+
+    @contextmanager
+    def shared_pool(self):
+        """Reuse one worker pool for every ``simulate()`` inside the block.
+
+        Without it each parallel ``simulate()`` starts (and tears down) a
+        pool of its own.  A no-op when simulations play in-process.
+        """
+        if not self._use_pool() or self._shared_pool is not None:
+            yield
+            return
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=pool_context(self.in_process),
+        )
+        self._shared_pool = executor
+        try:
+            yield
+        finally:
+            self._shared_pool = None
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _pool(self, num_workers: int):
+        if self._shared_pool is not None:
+            return nullcontext(self._shared_pool)
+        return ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=pool_context(self.in_process),
+        )
 
-    def _run_parallel(self) -> dict:
-        """Run simulations across multiple worker processes."""
+    def _run_parallel(self, record_turns: bool = False, cancel: CancelToken | None = None) -> dict:
+        """Run simulations across multiple worker processes.
+
+        On cancellation the worker processes are terminated rather than
+        left to finish their batches.
+        """
         deck_dicts = self._get_deck_dicts()
         extra_config = self._get_worker_config()
+        extra_config["mana_mode"] = self.mana_mode
+        extra_config["registry"] = self.registry
+        extra_config["mulligan_strategy"] = self.mulligan_strategy
+        if self.profile is not None:
+            extra_config["profile"] = True
         num_workers = min(self.workers, self.sims)
         batch_size = self.sims // num_workers
         remainder = self.sims % num_workers
 
         futures = []
-        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        with self._pool(num_workers) as executor:
             offset = 0
             for w in range(num_workers):
                 n = batch_size + (1 if w < remainder else 0)
@@ -1006,9 +1305,11 @@ class Goldfisher:
                         deck_dicts, self.turns, n, self.seed, offset,
                         capture_replays=True,
                         extra_config=extra_config,
+                        record_turns=record_turns,
                     )
                 )
                 offset += n
+            wait_or_cancel(futures, executor, cancel)
 
         # Merge results from all workers
         merged = {
@@ -1032,18 +1333,29 @@ class Goldfisher:
             merged["played_cards_per_game"].extend(batch["played_cards_per_game"])
             merged["drawn_cards_per_game"].extend(batch["drawn_cards_per_game"])
             all_raw_replays.extend(batch.get("raw_replays", []))
+            if self.profile is not None and "profile" in batch:
+                self.profile.merge(batch["profile"])
 
         merged["card_cast_turns"] = card_cast_turns
+        if record_turns:
+            batches = [future.result()["turn_stats"] for future in futures]
+            merged["turn_stats"] = {
+                k: np.concatenate([b[k] for b in batches]) for k in batches[0]
+            }
+
+        merged["replay_data"] = self._classify_replays(all_raw_replays, merged)
+        return merged
 
-        # Classify pooled replays using the primary mana distribution
+    def _classify_replays(self, raw_replays: list, raw: dict) -> dict[str, list]:
+        """Bucket replay snapshots into top/mid/low by the primary mana quartiles of *raw*."""
         replay_buckets: dict[str, list] = {"top": [], "mid": [], "low": []}
-        if all_raw_replays and merged["mana_value"]:
-            primary_merged = self._get_primary_mana(
-                merged["mana_value"], merged["mana_draw"], merged["mana_ramp"], merged["mana_spent"],
+        if raw_replays and raw["mana_value"]:
+            primary = self._get_primary_mana(
+                raw["mana_value"], raw["mana_draw"], raw["mana_ramp"], raw["mana_spent"],
             )
-            top_threshold = float(np.percentile(primary_merged, 75))
-            low_threshold = float(np.percentile(primary_merged, 25))
-            for mana_val, mana_drw, mana_rmp, mana_spt, replay in all_raw_replays:
+            top_threshold = float(np.percentile(primary, 75))
+            low_threshold = float(np.percentile(primary, 25))
+            for mana_val, mana_drw, mana_rmp, mana_spt, replay in raw_replays:
                 if self.mana_mode == "value":
                     primary_val = mana_val
                 elif self.mana_mode == "value_draw":
@@ -1059,8 +1371,7 @@ class Goldfisher:
                 else:
                     if len(replay_buckets["mid"]) < 10:
                         replay_buckets["mid"].append(replay)
-        merged["replay_data"] = replay_buckets
-        return merged
+        return replay_buckets
 
     def _get_primary_mana(self, mana_value, mana_draw, mana_ramp, mana_spent=None):
         """Return the mana list selected by ``self.mana_mode``."""
@@ -1071,8 +1382,12 @@ class Goldfisher:
         else:  # "total"
             return [v + d + r for v, d, r in zip(mana_value, mana_draw, mana_ramp)]
 
-    def _simulate_from_raw(self, raw: dict) -> SimulationResult:
-        """Compute summary stats from raw per-game data (used by parallel path)."""
+    def _simulate_from_raw(self, raw: dict, turns: int | None = None) -> SimulationResult:
+        """Compute summary stats from raw per-game data (used by parallel path).
+
+        *turns* overrides the horizon reported on the result (defaults to
+        ``self.turns``); used when deriving shorter-horizon results.
+        """
 
         mana_spent_list = raw["mana_spent"]
         mana_value_list = raw["mana_value"]
@@ -1173,23 +1488,7 @@ class Goldfisher:
         ci_mean_bad_turns = (mean_bad_turns - z * bad_se, mean_bad_turns + z * bad_se)
 
         # Bootstrap CI for consistency (left-tail ratio)
-        n_boot = min(1000, n)
-        boot_consistencies = []
-        mana_arr = np.array(primary_list)
-        boot_rng = np.random.RandomState(self.seed if self.seed is not None else 42)
-        for _ in range(n_boot):
-            boot_sample = boot_rng.choice(mana_arr, size=n, replace=True)
-            boot_sorted = np.sort(boot_sample)
-            boot_tail = float(np.mean(boot_sorted[:cutoff]))
-            boot_overall = float(np.mean(boot_sample))
-            if boot_overall == 0:
-                boot_consistencies.append(1.0)
-            else:
-                boot_consistencies.append(boot_tail / boot_overall)
-        ci_consistency = (
-            float(np.percentile(boot_consistencies, 2.5)),
-            float(np.percentile(boot_consistencies, 97.5)),
-        )
+        ci_consistency = self._bootstrap_consistency_ci(primary_list, cutoff)
 
         # Compute distribution stats (same calibration approach as sequential path)
         distribution_stats = self._compute_distribution_stats(primary_list)
@@ -1205,6 +1504,7 @@ class Goldfisher:
 
         return SimulationResult(
             land_count=self.land_count,
+            turns=self.turns if turns is None else turns,
             mean_mana=mean_mana,
             mean_mana_value=mean_mana_value,
             mean_mana_draw=mean_mana_draw,
@@ -1239,15 +1539,111 @@ class Goldfisher:
             replay_data=replay_data,
         )
 
-    def simulate(self, progress_callback=None) -> SimulationResult:
+    def simulate(
+        self,
+        progress_callback=None,
+        horizons: list[int] | None = None,
+        cancel: CancelToken | None = None,
+    ):
         """Run all simulations and return a ``SimulationResult``.
 
         Args:
             progress_callback: Optional callable(current, total) for progress updates.
+            horizons: Optional list of turn counts.  When given, games are
+                played once up to ``max(horizons)`` turns and a
+                ``dict[int, SimulationResult]`` keyed by horizon is returned
+                instead of a single result.  Shorter horizons are exact
+                prefixes of the same games; game records, replays and card
+                performance are only attached to the longest horizon.
+            cancel: Optional ``CancelToken``.  Checked before every game
+                (and while waiting on worker processes, which are
+                terminated on cancellation); a cancelled run raises
+                ``SimulationCancelled``.
+
+        When the goldfisher was built with ``exact=True`` and the deck has
+        no card effects (see ``engine.exact.supports_exact``), the result is
+        computed analytically instead of sampled: it has no sampling noise,
+        zero-width CIs, and no game records, replays or card performance.
+
+        When the goldfisher was built with ``profile=True``, the result's
+        ``profile`` field holds this run's ``EngineProfile.to_dict()``
+        (attached to the longest horizon when *horizons* is given).
+        """
+        if self.profile is None:
+            return self._simulate_dispatch(progress_callback, horizons, cancel)
+
+        self.profile.reset()
+        start = time.perf_counter()
+        result = self._simulate_dispatch(progress_callback, horizons, cancel)
+        self.profile.total_seconds = time.perf_counter() - start
+        target = result[max(result)] if isinstance(result, dict) else result
+        target.profile = self.profile.to_dict()
+        return result
+
+    def _simulate_dispatch(
+        self,
+        progress_callback=None,
+        horizons: list[int] | None = None,
+        cancel: CancelToken | None = None,
+    ):
+        if self.exact and horizons is None:
+            from auto_goldfish.engine.exact import evaluate_exact, supports_exact
+
+            if supports_exact(self):
+                return evaluate_exact(self).to_simulation_result()
+        if horizons is not None:
+            return self._simulate_horizons(horizons, progress_callback, cancel)
+        if self._use_pool():
+            return self._simulate_from_raw(self._run_parallel(cancel=cancel))
+        return self._simulate_sequential(progress_callback, cancel=cancel)
+
+    def _simulate_horizons(
+        self, horizons: list[int], progress_callback=None, cancel: CancelToken | None = None,
+    ) -> Dict[int, SimulationResult]:
+        """Run one pass to ``max(horizons)`` turns and split results per horizon."""
+        horizons = sorted(set(int(h) for h in horizons))
+        if not horizons or horizons[0] < 1:
+            raise ValueError(f"horizons must be positive turn counts, got {horizons}")
+
+        original_turns = self.turns
+        self.turns = horizons[-1]
+        try:
+            if self._use_pool():
+                raw = self._run_parallel(record_turns=True, cancel=cancel)
+                full = self._simulate_from_raw(raw)
+                turn_stats = raw["turn_stats"]
+            else:
+                turn_stats = _new_turn_stats(self.sims, self.turns)
+                full = self._simulate_sequential(
+                    progress_callback, turn_stats=turn_stats, cancel=cancel,
+                )
+        finally:
+            self.turns = original_turns
+
+        results: Dict[int, SimulationResult] = {}
+        for h in horizons[:-1]:
+            results[h] = self._simulate_from_raw(self._horizon_raw(turn_stats, h), turns=h)
+        results[horizons[-1]] = full
+        return results
+
+    @staticmethod
+    def _horizon_raw(turn_stats: dict[str, np.ndarray], horizon: int) -> dict:
+        """Slice per-turn cumulative arrays into a raw per-game dict at *horizon*."""
+        col = horizon - 1
+        raw = {k: turn_stats[k][:, col].astype(np.int64) for k in _TURN_STAT_KEYS}
+        raw["mana_spent"] = raw["mana_value"] + raw["mana_draw"]
+        raw["mulls"] = turn_stats["mulls"].astype(np.int64)
+        return raw
+
+    def _simulate_sequential(
+        self, progress_callback=None, turn_stats=None, cancel: CancelToken | None = None,
+    ) -> SimulationResult:
+        """Single-process simulation loop behind ``simulate()``.
+
+        When *turn_stats* (from ``_new_turn_stats``) is given, per-turn
+        cumulative counters are written into it for every game.  *cancel*
+        is checked before every game.
         """
-        if self.workers > 1 and ProcessPoolExecutor is not None:
-            return self._simulate_from_raw(self._run_parallel())
-
         sample_games = max(self.sims / 10, 100)
         top_centile_threshold = None
         game_records: dict[str, dict[str, list]] = {
@@ -1282,6 +1678,8 @@ class Goldfisher:
             game_iter = tqdm(game_iter, leave=False)
 
         for j in game_iter:
+            if cancel is not None:
+                cancel.check()
             if progress_callback is not None:
                 progress_callback(j, self.sims)
             if self.seed is not None:
@@ -1345,6 +1743,12 @@ class Goldfisher:
                 if spells_played < 2 and state.deck and mana_spent < i + 1:
                     mid_turns += 1
                 total_mana_spent += mana_spent
+                if turn_stats is not None:
+                    _record_turn_stats(
+                        turn_stats, j, i, game_mana_value, game_mana_draw,
+                        game_mana_ramp, game_hand_sum, lands_played,
+                        total_spells_cast, bad_turns, mid_turns, state.draws,
+                    )
 
                 if _capture_replay:
                     turn_snapshots.append({
@@ -1382,6 +1786,8 @@ class Goldfisher:
             hand_sum_list.append(game_hand_sum)
             lands_played_list.append(lands_played)
             mulls_list.append(mulligans)
+            if turn_stats is not None:
+                turn_stats["mulls"][j] = mulligans
             cards_drawn_list.append(state.draws)
             spells_cast_list.append(total_spells_cast)
             bad_turns_list.append(bad_turns)
@@ -1581,23 +1987,7 @@ class Goldfisher:
         ci_mean_bad_turns = (mean_bad_turns - z * bad_se, mean_bad_turns + z * bad_se)
 
         # Bootstrap CI for consistency (left-tail ratio)
-        n_boot = min(1000, n)
-        boot_consistencies = []
-        mana_arr = np.array(primary_list)
-        boot_rng = np.random.RandomState(self.seed if self.seed is not None else 42)
-        for _ in range(n_boot):
-            boot_sample = boot_rng.choice(mana_arr, size=n, replace=True)
-            boot_sorted = np.sort(boot_sample)
-            boot_tail = float(np.mean(boot_sorted[:cutoff]))
-            boot_overall = float(np.mean(boot_sample))
-            if boot_overall == 0:
-                boot_consistencies.append(1.0)
-            else:
-                boot_consistencies.append(boot_tail / boot_overall)
-        ci_consistency = (
-            float(np.percentile(boot_consistencies, 2.5)),
-            float(np.percentile(boot_consistencies, 97.5)),
-        )
+        ci_consistency = self._bootstrap_consistency_ci(primary_list, cutoff)
 
         distribution_stats = self._compute_distribution_stats(primary_list)
         card_performance = self._compute_card_performance(
@@ -1606,6 +1996,7 @@ class Goldfisher:
 
         return SimulationResult(
             land_count=self.land_count,
+            turns=self.turns,
             mean_mana=mean_mana,
             mean_mana_value=mean_mana_value,
             mean_mana_draw=mean_mana_draw,
@@ -1680,3 +2071,51 @@ class Goldfisher:
             return float(game_mana_value + game_mana_draw)
         else:
             return float(game_mana_value + game_mana_draw + game_mana_ramp)
+
+    def play_sample(
+        self,
+        n_games: int,
+        base_seed: int | None,
+        game_offset: int = 0,
+        capture_replays: bool = False,
+        cancel: CancelToken | None = None,
+    ) -> GameSample:
+        """Play games ``game_offset .. game_offset + n_games - 1`` into a ``GameSample``.
+
+        Uses the same per-game seeds as ``simulate()`` with
+        ``seed=base_seed``, so a sample can be extended later with only the
+        missing games (``game_offset=sample.n_games``) and concatenated.
+        """
+        raw = self._run_raw_batch(n_games, base_seed, game_offset, capture_replays, cancel=cancel)
+        stats = np.array([raw[k] for k in SAMPLE_STAT_KEYS], dtype=np.int32).reshape(
+            len(SAMPLE_STAT_KEYS), n_games,
+        ).T
+        drawn = np.zeros((n_games, len(self.decklist)), dtype=bool)
+        for j, cards in enumerate(raw["drawn_cards_per_game"]):
+            drawn[j, list(cards)] = True
+        replays = list(zip(raw.get("replay_games", []), raw.get("raw_replays", [])))
+        return GameSample(stats, drawn, replays)
+
+    def sample_primary(self, sample: GameSample) -> np.ndarray:
+        """Per-game primary mana (see ``mana_mode``) of *sample*, as floats."""
+        if self.mana_mode == "value":
+            primary = sample.column("mana_value")
+        elif self.mana_mode == "value_draw":
+            primary = sample.column("mana_spent")
+        else:
+            primary = sample.column("mana_value") + sample.column("mana_draw") + sample.column("mana_ramp")
+        return primary.astype(float)
+
+    def result_from_sample(self, sample: GameSample) -> SimulationResult:
+        """Build a full ``SimulationResult`` from *sample* for the current deck.
+
+        The result has the shape of a parallel ``simulate()`` result:
+        ``replay_data`` is built from the replays carried by *sample* and
+        ``game_records`` stays empty (per-game logs are only kept by the
+        sequential path).  ``result_to_dict`` exports neither difference,
+        so result dicts match those of ``simulate()``.
+        """
+        raw: dict = {k: sample.stats[:, i].tolist() for i, k in enumerate(SAMPLE_STAT_KEYS)}
+        raw["drawn_cards_per_game"] = [set(np.flatnonzero(row).tolist()) for row in sample.drawn]
+        raw["replay_data"] = self._classify_replays([r for _, r in sample.replays], raw)
+        return self._simulate_from_raw(raw)
@@ -15,6 +15,9 @@ if TYPE_CHECKING:
     from auto_goldfish.models.game_state import GameState
 
 
+VALID_MULLIGAN_STRATEGIES = ("default", "curve_aware")
+
+
 class MulliganStrategy(Protocol):
     """Protocol for pluggable mulligan strategies."""
 
@@ -72,3 +75,15 @@ class CurveAwareMulligan:
             return True
 
         return False
+
+
+def get_mulligan_strategy(name: str) -> MulliganStrategy:
+    """Return a new mulligan strategy instance for a config name."""
+    if name == "default":
+        return DefaultMulligan()
+    elif name == "curve_aware":
+        return CurveAwareMulligan()
+    raise ValueError(
+        f"Invalid mulligan: {name!r}. "
+        f"Must be one of {VALID_MULLIGAN_STRATEGIES}"
+    )
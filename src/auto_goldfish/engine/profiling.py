@@ -0,0 +1,153 @@
+"""Opt-in hot-path instrumentation for the goldfish engine.
+
+``instrument()`` shadows a handful of ``Goldfisher`` methods with
+instance attributes that time each call and count effect dispatch by
+effect class.  Nothing in the engine checks for profiling, so an
+uninstrumented goldfisher runs exactly the same code as before.
+
+Phases (nested phases are not double counted -- none of the wrapped
+methods call each other):
+
+- ``reset``: building the initial ``GameState`` (includes one shuffle)
+- ``mulligan``: shuffles, opening draws and keep decisions
+- ``draw``: the per-turn draw step
+- ``playables``: ``_get_playables`` (cost checks and priority sort)
+- ``select``: ``select_cards_to_play``
+- ``play_card``: ``_play_card`` including effect dispatch
+- ``bootstrap``: the consistency bootstrap CI
+- ``distribution_stats`` / ``card_performance``: post-run statistics
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Dict, List
+
+# phase name -> Goldfisher attribute
+PROFILED_PHASES = {
+    "reset": "_reset",
+    "mulligan": "_mulligan",
+    "draw": "_draw_card",
+    "playables": "_get_playables",
+    "select": "_select_cards",
+    "play_card": "_play_card",
+    "bootstrap": "_bootstrap_consistency_ci",
+    "distribution_stats": "_compute_distribution_stats",
+    "card_performance": "_compute_card_performance",
+}
+
+
+@dataclass
+class EngineProfile:
+    """Accumulated per-phase timings, call counts and effect counts."""
+
+    timings: Dict[str, float] = field(default_factory=dict)
+    calls: Dict[str, int] = field(default_factory=dict)
+    effect_calls: Dict[str, int] = field(default_factory=dict)
+    total_seconds: float = 0.0
+
+    @property
+    def games(self) -> int:
+        return self.calls.get("reset", 0)
+
+    def reset(self) -> None:
+        self.timings.clear()
+        self.calls.clear()
+        self.effect_calls.clear()
+        self.total_seconds = 0.0
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        """Add the counters from another profile's ``to_dict()``."""
+        for name, value in other.get("timings", {}).items():
+            self.timings[name] = self.timings.get(name, 0.0) + value
+        for name, value in other.get("calls", {}).items():
+            self.calls[name] = self.calls.get(name, 0) + value
+        for name, value in other.get("effect_calls", {}).items():
+            self.effect_calls[name] = self.effect_calls.get(name, 0) + value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "games": self.games,
+            "total_seconds": self.total_seconds,
+            "timings": dict(self.timings),
+            "calls": dict(self.calls),
+            "effect_calls": dict(sorted(
+                self.effect_calls.items(), key=lambda kv: kv[1], reverse=True,
+            )),
+        }
+
+    def as_rows(self) -> List[list]:
+        """Flat rows for tabulate: phase, calls, seconds, us/call, share."""
+        total = self.total_seconds or sum(self.timings.values()) or 1.0
+        rows = []
+        for name in PROFILED_PHASES:
+            if name not in self.calls:
+                continue
+            seconds = self.timings.get(name, 0.0)
+            calls = self.calls[name]
+            rows.append([
+                name, calls, f"{seconds:.3f}",
+                f"{1e6 * seconds / calls:.1f}" if calls else "-",
+                f"{100 * seconds / total:.1f}%",
+            ])
+        return rows
+
+
+def _timed(profile: EngineProfile, phase: str, func):
+    timings = profile.timings
+    calls = profile.calls
+    clock = time.perf_counter
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings[phase] = timings.get(phase, 0.0) + clock() - start
+            calls[phase] = calls.get(phase, 0) + 1
+
+    return wrapper
+
+
+def instrument(goldfisher, profile: EngineProfile) -> None:
+    """Attach timing and effect-counting wrappers to *goldfisher*."""
+    counts = Counter()
+
+    for phase, attr in PROFILED_PHASES.items():
+        setattr(goldfisher, attr, _timed(profile, phase, getattr(goldfisher, attr)))
+
+    timed_play_card = goldfisher._play_card
+    take_turn = goldfisher._take_turn
+    play_land = goldfisher._play_land
+
+    def _play_card(card, state):
+        for _, eff in state.cast_triggers:
+            counts[type(eff).__name__] += 1
+        effects = card._cached_effects
+        if effects:
+            for eff in effects.on_play:
+                counts[type(eff).__name__] += 1
+        return timed_play_card(card, state)
+
+    def _take_turn(state):
+        for _, eff in state.per_turn_effects:
+            counts[type(eff).__name__] += 1
+        return take_turn(state)
+
+    def _play_land(state):
+        played = play_land(state)
+        for land in played:
+            if land._cached_effects:
+                for eff in land._cached_effects.on_play:
+                    counts[type(eff).__name__] += 1
+        return played
+
+    goldfisher._play_card = _play_card
+    goldfisher._take_turn = _take_turn
+    goldfisher._play_land = _play_land
+    # Counter is a dict subclass; share it so to_dict() sees live counts.
+    profile.effect_calls = counts
@@ -0,0 +1,302 @@
+"""Scenario matrix runner for comparing play policies on shared seeds.
+
+Runs every combination of algorithm settings (spell priority, mana
+efficiency, mulligan strategy, ramp cutoff) against one compiled deck.
+Every scenario plays the *same* per-game seeds, so differences between
+scenarios are paired and their confidence intervals are far tighter
+than those of independent ``Goldfisher.simulate()`` runs.
+"""
+
+from __future__ import annotations
+
+import random as _stdlib_random
+from dataclasses import asdict, dataclass
+from itertools import product
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None  # type: ignore[misc,assignment]
+
+import numpy as np
+
+from auto_goldfish.engine.goldfisher import Goldfisher, pool_context
+from auto_goldfish.engine.mulligan import get_mulligan_strategy
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One combination of play-policy settings."""
+
+    spell_priority: str = "priority_then_cmc"
+    mana_efficiency: str = "greedy"
+    mulligan: str = "default"
+    ramp_cutoff_turn: int = 0
+
+    def describe(self) -> str:
+        """Compact label like ``ramp_first/greedy/default/cutoff=0``."""
+        return (
+            f"{self.spell_priority}/{self.mana_efficiency}/"
+            f"{self.mulligan}/cutoff={self.ramp_cutoff_turn}"
+        )
+
+
+def enumerate_scenarios(
+    spell_priorities: Sequence[str] = ("priority_then_cmc",),
+    mana_efficiencies: Sequence[str] = ("greedy",),
+    mulligans: Sequence[str] = ("default",),
+    ramp_cutoff_turns: Sequence[int] = (0,),
+) -> List[Scenario]:
+    """Build the full cross product of the given settings."""
+    return [
+        Scenario(sp, me, mull, cutoff)
+        for sp, me, mull, cutoff in product(
+            spell_priorities, mana_efficiencies, mulligans, ramp_cutoff_turns,
+        )
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Paired statistics
+# ---------------------------------------------------------------------------
+
+def _tail_mean(values: np.ndarray, fraction: float = 0.25) -> np.ndarray:
+    """Mean of the lowest *fraction* of games along the last axis."""
+    n = values.shape[-1]
+    cutoff = max(1, int(n * fraction))
+    return np.sort(values, axis=-1)[..., :cutoff].mean(axis=-1)
+
+
+def _consistency(values: np.ndarray) -> np.ndarray:
+    """Left-tail ratio along the last axis (1.0 when the mean is zero)."""
+    means = values.mean(axis=-1)
+    tails = _tail_mean(values)
+    safe = np.where(means == 0, 1.0, means)
+    return np.where(means == 0, 1.0, tails / safe)
+
+
+@dataclass
+class ScenarioMatrixResult:
+    """Per-game primary mana for every scenario, plus paired comparisons.
+
+    ``values[i, j]`` is the primary mana of game ``j`` under
+    ``scenarios[i]``; column ``j`` always used the same seed.
+    """
+
+    scenarios: List[Scenario]
+    values: np.ndarray
+    baseline_index: int = 0
+    confidence: float = 0.95
+    n_bootstrap: int = 500
+    seed: int = 42
+
+    def table(self) -> List[Dict[str, Any]]:
+        """Comparison rows with paired-difference CIs against the baseline.
+
+        Mean differences use a normal CI on the per-game paired
+        differences; floor (bottom-25% mean) and consistency differences
+        use a paired bootstrap that resamples the same games for both
+        scenarios.
+        """
+        n_games = self.values.shape[1]
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        lo_pct = 100 * (1 - self.confidence) / 2
+        hi_pct = 100 - lo_pct
+
+        rng = np.random.RandomState(self.seed)
+        boot_idx = rng.randint(0, n_games, size=(self.n_bootstrap, n_games))
+        base = self.values[self.baseline_index]
+        base_boot = base[boot_idx]
+        base_floor_boot = _tail_mean(base_boot)
+        base_con_boot = _consistency(base_boot)
+
+        rows: List[Dict[str, Any]] = []
+        for i, scenario in enumerate(self.scenarios):
+            row_values = self.values[i]
+            diffs = row_values - base
+            mean = float(row_values.mean())
+            mean_half = z * float(row_values.std(ddof=1)) / np.sqrt(n_games)
+            diff_half = z * float(diffs.std(ddof=1)) / np.sqrt(n_games)
+
+            boot = row_values[boot_idx]
+            floor_diff_boot = _tail_mean(boot) - base_floor_boot
+            con_diff_boot = _consistency(boot) - base_con_boot
+
+            rows.append({
+                "scenario": scenario.describe(),
+                **asdict(scenario),
+                "baseline": i == self.baseline_index,
+                "n_games": n_games,
+                "mean": mean,
+                "mean_ci": [mean - mean_half, mean + mean_half],
+                "floor": float(_tail_mean(row_values)),
+                "consistency": float(_consistency(row_values)),
+                "diff_mean": float(diffs.mean()),
+                "diff_mean_ci": [float(diffs.mean()) - diff_half, float(diffs.mean()) + diff_half],
+                "diff_floor": float(_tail_mean(row_values) - _tail_mean(base)),
+                "diff_floor_ci": [
+                    float(np.percentile(floor_diff_boot, lo_pct)),
+                    float(np.percentile(floor_diff_boot, hi_pct)),
+                ],
+                "diff_consistency": float(_consistency(row_values) - _consistency(base)),
+                "diff_consistency_ci": [
+                    float(np.percentile(con_diff_boot, lo_pct)),
+                    float(np.percentile(con_diff_boot, hi_pct)),
+                ],
+            })
+        return rows
+
+    def as_rows(self) -> List[list]:
+        """Flat rows for tabulate, best mean first."""
+        rows = sorted(self.table(), key=lambda r: r["mean"], reverse=True)
+        return [
+            [
+                r["scenario"] + (" (base)" if r["baseline"] else ""),
+                f"{r['mean']:.2f}",
+                f"{r['diff_mean']:+.2f} [{r['diff_mean_ci'][0]:+.2f}, {r['diff_mean_ci'][1]:+.2f}]",
+                f"{r['floor']:.2f}",
+                f"{r['diff_floor']:+.2f} [{r['diff_floor_ci'][0]:+.2f}, {r['diff_floor_ci'][1]:+.2f}]",
+                f"{r['consistency']:.4f}",
+            ]
+            for r in rows
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Runners
+# ---------------------------------------------------------------------------
+
+def _apply_scenario(goldfisher: Goldfisher, scenario: Scenario) -> None:
+    goldfisher.set_play_settings(
+        spell_priority=scenario.spell_priority,
+        mana_efficiency=scenario.mana_efficiency,
+        ramp_cutoff_turn=scenario.ramp_cutoff_turn,
+        mulligan_strategy=get_mulligan_strategy(scenario.mulligan),
+    )
+
+
+def _run_scenarios(
+    goldfisher: Goldfisher,
+    scenarios: List[Scenario],
+    seeds: List[int],
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> np.ndarray:
+    """Play every scenario on *seeds* with one compiled deck."""
+    values = np.empty((len(scenarios), len(seeds)), dtype=float)
+    for s_idx, scenario in enumerate(scenarios):
+        _apply_scenario(goldfisher, scenario)
+        for g, seed in enumerate(seeds):
+            values[s_idx, g] = goldfisher.simulate_single_game(seed)
+        if progress_callback is not None:
+            progress_callback(s_idx + 1, len(scenarios))
+    return values
+
+
+def _worker_run_scenarios(
+    deck_dicts: list[dict],
+    turns: int,
+    seeds: List[int],
+    scenarios: List[Scenario],
+    extra_config: dict,
+) -> np.ndarray:
+    """Top-level function for ProcessPoolExecutor workers.
+
+    Compiles the deck once and plays every scenario on this seed batch.
+    """
+    gf = Goldfisher(
+        deck_dicts, turns=turns, sims=len(seeds), record_results=None,
+        **extra_config,
+    )
+    return _run_scenarios(gf, scenarios, seeds)
+
+
+def run_scenario_matrix(
+    goldfisher: Goldfisher,
+    scenarios: List[Scenario],
+    sims: Optional[int] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    baseline: Optional[Scenario] = None,
+    confidence: float = 0.95,
+    n_bootstrap: int = 500,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> ScenarioMatrixResult:
+    """Run every scenario on the same seeds and compare them to a baseline.
+
+    Args:
+        goldfisher: Compiled deck to evaluate.  Its play settings are
+            restored after the run.
+        scenarios: Settings combinations (see ``enumerate_scenarios``).
+        sims: Games per scenario (defaults to ``goldfisher.sims``).
+        seed: Base seed; game ``j`` uses ``seed + j`` in every scenario,
+            matching ``Goldfisher.simulate()``.  Defaults to
+            ``goldfisher.seed`` or a random seed.
+        workers: Process count (defaults to ``goldfisher.workers``).  Each
+            worker compiles the deck once and runs all scenarios on its
+            own contiguous block of seeds.
+        baseline: Scenario to compare against (defaults to the first).
+        confidence: Two-sided confidence level for all intervals.
+        n_bootstrap: Paired bootstrap resamples for floor/consistency CIs.
+        progress_callback: Optional callable(current, total).
+
+    Returns:
+        A ``ScenarioMatrixResult``; call ``.table()`` for comparison rows.
+    """
+    scenarios = list(dict.fromkeys(scenarios))
+    if not scenarios:
+        raise ValueError("scenarios must not be empty")
+    if baseline is None:
+        baseline = scenarios[0]
+    elif baseline not in scenarios:
+        scenarios.insert(0, baseline)
+    baseline_index = scenarios.index(baseline)
+
+    sims = sims if sims is not None else goldfisher.sims
+    if seed is None:
+        seed = goldfisher.seed if goldfisher.seed is not None else _stdlib_random.randrange(2**31)
+    seeds = [seed + j for j in range(sims)]
+    workers = workers if workers is not None else goldfisher.workers
+
+    if workers > 1 and ProcessPoolExecutor is not None:
+        deck_dicts = goldfisher._get_deck_dicts()
+        extra_config = dict(goldfisher._get_worker_config())
+        extra_config["mana_mode"] = goldfisher.mana_mode
+        extra_config["registry"] = goldfisher.registry
+        num_workers = min(workers, sims)
+        bounds = np.linspace(0, sims, num_workers + 1).astype(int)
+        with ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=pool_context(goldfisher.in_process),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _worker_run_scenarios, deck_dicts, goldfisher.turns,
+                    seeds[bounds[w]:bounds[w + 1]], scenarios, extra_config,
+                )
+                for w in range(num_workers)
+            ]
+            batches = []
+            for done, future in enumerate(futures, 1):
+                batches.append(future.result())
+                if progress_callback is not None:
+                    progress_callback(done, num_workers)
+        values = np.concatenate(batches, axis=1)
+    else:
+        saved = (
+            goldfisher.spell_priority, goldfisher.mana_efficiency,
+            goldfisher.ramp_cutoff_turn, goldfisher.mulligan_strategy,
+        )
+        try:
+            values = _run_scenarios(goldfisher, scenarios, seeds, progress_callback)
+        finally:
+            goldfisher.set_play_settings(*saved)
+
+    return ScenarioMatrixResult(
+        scenarios=scenarios,
+        values=values,
+        baseline_index=baseline_index,
+        confidence=confidence,
+        n_bootstrap=n_bootstrap,
+        seed=seed,
+    )
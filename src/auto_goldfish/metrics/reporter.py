@@ -108,6 +108,7 @@ def result_to_dict(result: SimulationResult) -> Dict[str, Any]:
     """Convert SimulationResult to a JSON-serializable dict."""
     return {
         "land_count": result.land_count,
+        "turns": result.turns,
         "mean_mana": result.mean_mana,
         "mean_mana_value": result.mean_mana_value,
         "mean_mana_draw": result.mean_mana_draw,
@@ -0,0 +1,201 @@
+"""Search budgets and interim leaderboards for anytime optimization.
+
+Both optimizers spend most of their time in the search phase (racing,
+local search or Hyperband).  ``AnytimeControl`` bounds that phase by
+wall-clock time and/or games played and hands interim leaderboards to a
+callback, so a UI can show the current standings and let the user stop
+early.  The final evaluation of the chosen configs always runs.
+
+A leaderboard is a dict::
+
+    {
+        "phase": "racing",        # or "local_search", "hyperband"
+        "elapsed_s": 12.3,        # since the search started
+        "games": 45000,           # games played by the search so far
+        "settled": False,         # the top-k set is statistically settled
+        "entries": [              # best first
+            {"rank": 1, "config": "+1 land", "land_delta": 1,
+             "added_cards": [...], "cuts": [], "score": 23.4, "ci": [23.1, 23.7],
+             "games": 300},
+            ...
+        ],
+    }
+
+``ci`` is a two-sided ``confidence`` interval of the config's own score
+(not of a paired difference).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from auto_goldfish.optimization.deck_config import DeckConfig
+from auto_goldfish.optimization.samples import objective_score, z_value
+
+LeaderboardCallback = Callable[[Dict[str, Any]], Optional[bool]]
+
+# Configs listed on an interim leaderboard
+LEADERBOARD_SIZE = 10
+
+
+def score_interval(
+    values: np.ndarray,
+    optimize_for: str,
+    confidence: float = 0.95,
+    n_bootstrap: int = 200,
+) -> Tuple[float, float, float]:
+    """``(score, lower, upper)`` of the *optimize_for* score of per-game *values*.
+
+    Mean targets use the normal approximation; the tail targets
+    (``floor_performance``, ``consistency``) a percentile bootstrap.
+    """
+    n = len(values)
+    score = objective_score(values, optimize_for) if n else 0.0
+    if n < 2:
+        return score, score, score
+    if optimize_for not in ("floor_performance", "consistency"):
+        z = z_value(confidence)
+        half = z * float(values.std(ddof=1)) / np.sqrt(n)
+        return score, score - half, score + half
+    rng = np.random.RandomState(0)
+    boot = np.array([
+        objective_score(values[idx], optimize_for)
+        for idx in rng.randint(0, n, size=(n_bootstrap, n))
+    ])
+    tail = 100 * (1 - confidence) / 2
+    lo, hi = np.percentile(boot, [tail, 100 - tail])
+    return score, float(lo), float(hi)
+
+
+def leaderboard_entries(
+    rows: Sequence[Tuple[DeckConfig, np.ndarray]],
+    optimize_for: str,
+    confidence: float = 0.95,
+    size: int = LEADERBOARD_SIZE,
+    extra: Optional[Sequence[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """Ranked entries for the best *size* of ``(config, per-game values)`` *rows*.
+
+    *extra* holds optional per-row fields merged into each entry.
+    """
+    scored = []
+    for i, (config, values) in enumerate(rows):
+        score, lo, hi = score_interval(values, optimize_for, confidence)
+        scored.append((score, lo, hi, config, len(values), i))
+    scored.sort(key=lambda s: s[0], reverse=True)
+    entries = []
+    for rank, (score, lo, hi, config, n_games, i) in enumerate(scored[:size], 1):
+        entry = {
+            "rank": rank,
+            "config": config.describe(),
+            "land_delta": config.land_delta,
+            "added_cards": list(config.added_cards),
+            "cuts": list(config.cuts),
+            "score": score,
+            "ci": [lo, hi],
+            "games": n_games,
+        }
+        if extra is not None:
+            entry.update(extra[i])
+        entries.append(entry)
+    return entries
+
+
+class AnytimeControl:
+    """Budget and leaderboard throttle for one optimizer run.
+
+    Args:
+        time_budget_s: Wall-clock seconds the search phase may take
+            (``None`` for no limit).
+        max_games: Games the search phase may play (``None`` for no
+            limit).
+        leaderboard: Optional ``callback(board)``; returning ``True``
+            stops the search after the current step.
+        interval_s: Minimum seconds between leaderboards (forced ones,
+            like the last leaderboard of a phase, are always sent).
+        resumed_s: Search time already spent by the run this one resumes
+            (see ``checkpoint``); it counts against *time_budget_s*.
+
+    Attributes:
+        games: Games the search has played so far.
+        stop_reason: ``None`` while running, else why the search stopped
+            early: ``"time_budget"``, ``"max_games"``, ``"settled"`` or
+            ``"stopped"`` (by the callback).
+    """
+
+    def __init__(
+        self,
+        time_budget_s: Optional[float] = None,
+        max_games: Optional[int] = None,
+        leaderboard: Optional[LeaderboardCallback] = None,
+        interval_s: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        resumed_s: float = 0.0,
+    ) -> None:
+        self.time_budget_s = time_budget_s
+        self.max_games = max_games
+        self.leaderboard = leaderboard
+        self.interval_s = interval_s
+        self._clock = clock
+        self._start = clock() - resumed_s
+        self._last_emit: Optional[float] = None
+        self.games = 0
+        self.stop_reason: Optional[str] = None
+
+    @property
+    def budgeted(self) -> bool:
+        """True when a time or game budget is set (anytime mode)."""
+        return self.time_budget_s is not None or self.max_games is not None
+
+    @property
+    def elapsed_s(self) -> float:
+        return self._clock() - self._start
+
+    def spend(self, n_games: int) -> None:
+        self.games += n_games
+
+    def stop(self, reason: str) -> None:
+        if self.stop_reason is None:
+            self.stop_reason = reason
+
+    def exhausted(self) -> bool:
+        """True once the search should stop (budget spent or stop requested)."""
+        if self.stop_reason is None:
+            if self.max_games is not None and self.games >= self.max_games:
+                self.stop("max_games")
+            elif self.time_budget_s is not None and self.elapsed_s >= self.time_budget_s:
+                self.stop("time_budget")
+        return self.stop_reason is not None
+
+    def due(self) -> bool:
+        """True when a callback is set and the last leaderboard is old enough."""
+        if self.leaderboard is None:
+            return False
+        return self._last_emit is None or self._clock() - self._last_emit >= self.interval_s
+
+    def emit(
+        self,
+        phase: str,
+        entries: Callable[[], List[Dict[str, Any]]],
+        settled: bool = False,
+    ) -> None:
+        """Send a leaderboard to the callback (no-op without one).
+
+        *entries* builds the ranked entries; it is only called when a
+        callback is set.
+        """
+        if self.leaderboard is None:
+            return
+        self._last_emit = self._clock()
+        board = {
+            "phase": phase,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "games": self.games,
+            "settled": settled,
+            "entries": entries(),
+        }
+        if self.leaderboard(board):
+            self.stop("stopped")
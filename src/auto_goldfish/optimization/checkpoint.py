@@ -0,0 +1,284 @@
+"""Checkpoint and resume for long optimization runs.
+
+Both optimizers are deterministic given their settings and the CRN base
+seed: each search step reads a fixed prefix of every config's seed
+stream, and the Hyperband and local-search RNGs are seeded up front.  A
+checkpoint therefore does not pickle loop state.  It records the run's
+identity (``run_key``), its base seed and the games played so far (a
+``SampleStore.snapshot()``).  Resuming replays the search over those
+games: the replay takes the same decisions (active set, rounds,
+brackets, RNG draws) without playing them again, so the resumed run
+returns the ranking an uninterrupted run would have and only plays the
+games that were never checkpointed.  Budgets carry over too: games are
+charged as requested and the saved elapsed time counts against a time
+budget.
+
+A checkpoint also records where it was taken (``phase`` plus fields
+such as ``round`` and ``active``) so a UI can say what it resumes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from auto_goldfish.blob_store import DiskBlobStore
+from auto_goldfish.optimization.deck_config import DeckConfig
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+# Seconds between periodic checkpoints
+DEFAULT_INTERVAL_S = 30.0
+
+# Per config: (n_games, encode_sample bytes), as in SampleStore.snapshot()
+Snapshot = Dict[DeckConfig, Tuple[int, bytes]]
+
+
+def run_key(goldfisher, settings: Dict[str, Any]) -> str:
+    """Content hash of the deck in *goldfisher*, its seed and the optimizer *settings*.
+
+    Two runs with the same key make the same decisions, so one can resume
+    the other.  A ``None`` seed is part of the key; the checkpoint then
+    supplies the base seed the first run drew.
+    """
+    from auto_goldfish.optimization.sample_cache import sample_key
+
+    payload = {
+        "version": CHECKPOINT_VERSION,
+        "deck": sample_key(goldfisher, goldfisher.seed),
+        "settings": settings,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def encode_checkpoint(state: Dict[str, Any], samples: Snapshot) -> bytes:
+    """``.npz`` bytes of a checkpoint *state* dict and its *samples*."""
+    configs = list(samples)
+    arrays = {
+        "state": np.array(json.dumps(state)),
+        "configs": np.array(json.dumps([
+            [cfg.land_delta, list(cfg.added_cards), samples[cfg][0], list(cfg.cuts)]
+            for cfg in configs
+        ])),
+    }
+    for i, cfg in enumerate(configs):
+        arrays[f"sample_{i}"] = np.frombuffer(samples[cfg][1], dtype=np.uint8)
+    buf = io.BytesIO()
+    np.savez(buf, **arrays)
+    return buf.getvalue()
+
+
+def decode_checkpoint(data: bytes) -> Tuple[Dict[str, Any], Snapshot]:
+    with np.load(io.BytesIO(data)) as z:
+        state = json.loads(str(z["state"]))
+        samples = {
+            # Swap-mode cuts were added after the first checkpoints were written
+            DeckConfig(land_delta, tuple(added), tuple(cuts[0]) if cuts else ()):
+                (n_games, z[f"sample_{i}"].tobytes())
+            for i, (land_delta, added, n_games, *cuts) in enumerate(json.loads(str(z["configs"])))
+        }
+    return state, samples
+
+
+class CheckpointStore(ABC):
+    """Where checkpoints live, one per run key.
+
+    Backends implement ``_read`` (``None`` when there is no checkpoint),
+    ``_write`` and ``_delete``.  Backend errors are logged and treated as
+    a missing checkpoint, so a broken store never fails a run.
+    """
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, Any], Snapshot]]:
+        """The ``(state, samples)`` saved for run *key*, or ``None``."""
+        try:
+            data = self._read(key)
+            if data is None:
+                return None
+            state, samples = decode_checkpoint(data)
+        except Exception:
+            logger.exception("Checkpoint read failed for %s", key)
+            return None
+        if state.get("version") != CHECKPOINT_VERSION or state.get("run_key") != key:
+            return None
+        return state, samples
+
+    def save(self, key: str, state: Dict[str, Any], samples: Snapshot) -> None:
+        try:
+            self._write(key, encode_checkpoint(state, samples))
+        except Exception:
+            logger.exception("Checkpoint write failed for %s", key)
+
+    def clear(self, key: str) -> None:
+        """Forget the checkpoint of run *key* (after it completed)."""
+        try:
+            self._delete(key)
+        except Exception:
+            logger.exception("Checkpoint delete failed for %s", key)
+
+    # -- Backend hooks --
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[bytes]:
+        """The checkpoint bytes of run *key*, or ``None``."""
+
+    @abstractmethod
+    def _write(self, key: str, data: bytes) -> None:
+        """Replace the checkpoint of run *key* with *data*."""
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        """Drop the checkpoint of run *key*, if any."""
+
+
+class DiskCheckpointStore(CheckpointStore):
+    """One ``<key>.ckpt`` file per run, replaced atomically on every save."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._blobs = DiskBlobStore(directory, ".ckpt")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        return self._blobs.read(key)
+
+    def _write(self, key: str, data: bytes) -> None:
+        self._blobs.write(key, data)
+
+    def _delete(self, key: str) -> None:
+        self._blobs.delete(key)
+
+
+class CallbackCheckpointStore(CheckpointStore):
+    """Checkpoints handed to a callback, e.g. for a browser to keep in IndexedDB.
+
+    Args:
+        saved: Bytes of the last checkpoint the callback received (for
+            any run; ``load`` ignores one whose key does not match).
+        on_save: ``callback(key, data)`` called with each checkpoint's
+            bytes, and with ``data=None`` once the run completed.
+    """
+
+    def __init__(
+        self,
+        saved: Optional[bytes] = None,
+        on_save: Optional[Callable[[str, Optional[bytes]], None]] = None,
+    ) -> None:
+        self.saved = saved
+        self.on_save = on_save
+
+    def _read(self, key: str) -> Optional[bytes]:
+        return self.saved
+
+    def _write(self, key: str, data: bytes) -> None:
+        self.saved = data
+        if self.on_save is not None:
+            self.on_save(key, data)
+
+    def _delete(self, key: str) -> None:
+        self.saved = None
+        if self.on_save is not None:
+            self.on_save(key, None)
+
+
+class Checkpointer:
+    """Periodic checkpoints of one optimizer run.
+
+    Args:
+        store: Where checkpoints go (``None`` disables checkpointing; every
+            method is then a no-op).
+        key: ``run_key`` of the run.
+        interval_s: Minimum seconds between periodic checkpoints.
+        clock: Time source (for tests).
+
+    Attributes:
+        resumed_from: State of the checkpoint the run resumed from, else
+            ``None``.  Holds ``phase``, ``progress``, ``games`` and
+            ``elapsed_s`` as saved.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CheckpointStore] = None,
+        key: str = "",
+        interval_s: float = DEFAULT_INTERVAL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.store = store
+        self.key = key
+        self.interval_s = interval_s
+        self._clock = clock
+        self._last_save = clock()
+        self._where: Tuple[str, Dict[str, Any]] = ("search", {})
+        self.resumed_from: Optional[Dict[str, Any]] = None
+
+    def resume(self, samples) -> Optional[Dict[str, Any]]:
+        """Restore a saved checkpoint into *samples* (a ``SampleStore``).
+
+        Sets the store's base seed to the checkpoint's, so call this
+        before anything reads it.  Returns the saved state, or ``None``
+        when there is nothing to resume.
+        """
+        if self.store is None:
+            return None
+        loaded = self.store.load(self.key)
+        if loaded is None:
+            return None
+        state, snapshot = loaded
+        samples.base_seed = state["base_seed"]
+        samples.restore(snapshot)
+        self.resumed_from = state
+        logger.info("Resuming run %s from %s checkpoint (%d games)",
+                    self.key[:12], state["phase"], state["games"])
+        return state
+
+    def due(self) -> bool:
+        return self.store is not None and self._clock() - self._last_save >= self.interval_s
+
+    def save(self, samples, anytime, phase: Optional[str] = None, **progress: Any) -> None:
+        """Checkpoint *samples* (a ``SampleStore``) now.
+
+        *phase* and *progress* fields describe where the run is; without a
+        phase the last one passed to ``maybe_save`` is recorded.
+        """
+        if self.store is None:
+            return
+        if phase is not None:
+            self._where = (phase, progress)
+        self._last_save = self._clock()
+        phase, progress = self._where
+        try:
+            state = {
+                "version": CHECKPOINT_VERSION,
+                "run_key": self.key,
+                "base_seed": samples.base_seed,
+                "phase": phase,
+                "progress": progress,
+                "games": samples.games_requested,
+                "elapsed_s": round(anytime.elapsed_s, 3),
+                "saved_at": time.time(),
+            }
+            snapshot = samples.snapshot()
+        except Exception:
+            logger.exception("Checkpoint snapshot failed for %s", self.key)
+            return
+        self.store.save(self.key, state, snapshot)
+
+    def maybe_save(self, samples, anytime, phase: str, **progress: Any) -> None:
+        """``save`` when the last checkpoint is older than ``interval_s``."""
+        self._where = (phase, progress)
+        if self.due():
+            self.save(samples, anytime)
+
+    def finish(self) -> None:
+        """Drop the checkpoint of a completed run."""
+        if self.store is not None:
+            self.store.clear(self.key)
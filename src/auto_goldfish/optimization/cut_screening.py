@@ -0,0 +1,105 @@
+"""Cut screening for swap mode.
+
+In swap mode every added candidate replaces a card of the base deck.
+Choosing those cuts is a second search: a deck has dozens of spells and
+a config adding two cards could drop any pair of them.  Cut selection
+therefore runs in two stages.
+
+Stage one screens every cut candidate (each nonland, non-commander
+spell) from a single baseline sample.  A card's *impact* is the mean
+per-game value of the games in which it was drawn minus the mean of the
+games in which it was not, the natural experiment behind
+``Goldfisher._compute_card_performance``.  A card whose games are no
+better when it shows up costs little to cut.  All candidates share the
+same games, so screening plays nothing beyond the baseline sample that
+racing needs anyway.
+
+Stage two keeps the few best cut sets of each size (``best_cut_sets``)
+and races them jointly with the additions (``FastDeckOptimizer`` with
+``cut_sets``), so the screen only has to rank cuts roughly; racing
+settles the rest under CRN.
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# Games a card must be drawn in (and missing from) to be screened
+MIN_GROUP_GAMES = 20
+
+
+@dataclass(frozen=True)
+class ScreenedCut:
+    """Screening statistics of one cut candidate."""
+
+    name: str
+    # Mean value with the card drawn minus without (lower is a better cut)
+    impact: float
+    drawn_pct: float
+
+    def to_dict(self) -> dict:
+        return {
+            "card": self.name,
+            "impact": round(self.impact, 4),
+            "drawn_pct": round(self.drawn_pct, 4),
+        }
+
+
+def screen_cuts(
+    goldfisher,
+    drawn: np.ndarray,
+    values: np.ndarray,
+    min_group: int = MIN_GROUP_GAMES,
+) -> List[ScreenedCut]:
+    """Cut candidates of the deck in *goldfisher*, best cut first.
+
+    Args:
+        goldfisher: Goldfisher holding the deck the games were played
+            with; column ``k`` of *drawn* is ``goldfisher.decklist[k]``.
+        drawn: (n_games, deck size) bool, as in ``GameSample.drawn``.
+        values: Per-game values of the same games (e.g. primary mana).
+        min_group: Cards drawn in fewer games, or missing from fewer
+            games, are not screened.
+    """
+    values = np.asarray(values, dtype=float)
+    n_games = len(values)
+    counts = drawn.sum(axis=0)
+    sums_with = values @ drawn
+    total = float(values.sum())
+
+    screened = []
+    for k, card in enumerate(goldfisher.decklist):
+        if card.land or card.commander:
+            continue
+        n_with = int(counts[k])
+        n_without = n_games - n_with
+        if n_with < min_group or n_without < min_group:
+            continue
+        mean_with = sums_with[k] / n_with
+        mean_without = (total - sums_with[k]) / n_without
+        screened.append(ScreenedCut(card.name, float(mean_with - mean_without), n_with / n_games))
+    screened.sort(key=lambda c: c.impact)
+    return screened
+
+
+def best_cut_sets(
+    screened: Sequence[ScreenedCut], size: int, n_sets: int,
+) -> List[Tuple[str, ...]]:
+    """The *n_sets* cut sets of *size* cards with the lowest summed impact.
+
+    Best set first; each set is a sorted tuple of card names.  Only the
+    ``size + n_sets - 1`` best screened cards can appear in such a set,
+    so only their combinations are scored.
+    """
+    if size <= 0 or n_sets <= 0:
+        return []
+    pool = list(screened[:size + n_sets - 1])
+    scored = sorted(
+        (sum(c.impact for c in combo), tuple(sorted(c.name for c in combo)))
+        for combo in itertools.combinations(pool, size)
+    )
+    return [names for _, names in scored[:n_sets]]
@@ -1,13 +1,15 @@
 """Deck configuration for optimization.
 
 A DeckConfig represents a set of modifications to a base deck:
-land count changes and added generic draw/ramp cards.
+land count changes, added generic draw/ramp cards and, in swap mode,
+the cards they replace.
 """
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from auto_goldfish.optimization.candidate_cards import (
     ALL_CANDIDATES,
@@ -21,11 +23,14 @@ class DeckConfig:
 
     land_delta: int = 0
     added_cards: tuple[str, ...] = ()  # Candidate IDs
+    # Card names removed from the base deck (sorted); in swap mode an empty
+    # tuple cuts no-effect spells instead
+    cuts: tuple[str, ...] = ()
 
     def describe(self) -> str:
         """Human-readable compact description of changes vs base deck.
 
-        Format: Draw2(mv2), Ramp+1(mv2), +1 land
+        Format: Draw2(mv2), Ramp+1(mv2), +1 land, cut Card Name
         """
         parts: list[str] = []
         if self.land_delta > 0:
@@ -40,6 +45,8 @@ class DeckConfig:
             else:
                 parts.append(card_id)
 
+        parts.extend(f"cut {name}" for name in self.cuts)
+
         return ", ".join(parts) if parts else "Base deck (no changes)"
 
     @property
@@ -57,6 +64,115 @@ class DeckConfig:
         )
 
 
+def _combos(ids: List[str], max_picks: int) -> Iterator[tuple[str, ...]]:
+    """Multisets of 0..max_picks ids (combinations with replacement)."""
+    from itertools import combinations_with_replacement
+
+    yield ()
+    for k in range(1, max_picks + 1):
+        yield from combinations_with_replacement(ids, k)
+
+
+def _n_combos(n_ids: int, max_picks: int) -> int:
+    if n_ids == 0:
+        return 1
+    return sum(math.comb(n_ids + k - 1, k) for k in range(max_picks + 1))
+
+
+class ConfigSpace:
+    """Lazy view of every config ``enumerate_configs`` would return.
+
+    Iterating yields configs in the same order without materializing the
+    cross product; ``len()`` is computed combinatorially, so very large
+    spaces can be sized, sampled and walked (``neighbors``) cheaply.
+    """
+
+    def __init__(
+        self,
+        enabled_candidates: Dict[str, CandidateCard],
+        max_draw: int = 2,
+        max_ramp: int = 2,
+        land_range: int = 2,
+        land_delta_min: Optional[int] = None,
+        land_delta_max: Optional[int] = None,
+    ) -> None:
+        self.draw_ids = sorted(
+            cid for cid, c in enabled_candidates.items() if c.card_type == "draw"
+        )
+        self.ramp_ids = sorted(
+            cid for cid, c in enabled_candidates.items() if c.card_type == "ramp"
+        )
+        self.max_draw = max_draw if self.draw_ids else 0
+        self.max_ramp = max_ramp if self.ramp_ids else 0
+        self.land_lo = land_delta_min if land_delta_min is not None else -land_range
+        self.land_hi = land_delta_max if land_delta_max is not None else land_range
+
+    def __len__(self) -> int:
+        n_lands = max(0, self.land_hi - self.land_lo + 1)
+        return (n_lands * _n_combos(len(self.draw_ids), self.max_draw)
+                * _n_combos(len(self.ramp_ids), self.max_ramp))
+
+    def __iter__(self) -> Iterator[DeckConfig]:
+        for land_delta in range(self.land_lo, self.land_hi + 1):
+            for draw_cards in _combos(self.draw_ids, self.max_draw):
+                for ramp_cards in _combos(self.ramp_ids, self.max_ramp):
+                    yield DeckConfig(
+                        land_delta=land_delta,
+                        added_cards=tuple(sorted(draw_cards + ramp_cards)),
+                    )
+
+    def __contains__(self, config: object) -> bool:
+        if not isinstance(config, DeckConfig):
+            return False
+        draw, ramp = self._split(config)
+        return (
+            self.land_lo <= config.land_delta <= self.land_hi
+            and len(draw) + len(ramp) == len(config.added_cards)
+            and len(draw) <= self.max_draw
+            and len(ramp) <= self.max_ramp
+        )
+
+    def random_config(self, rng) -> DeckConfig:
+        """A random config: uniform land delta and pick counts, then uniform cards."""
+        draw = [rng.choice(self.draw_ids) for _ in range(rng.randint(0, self.max_draw))]
+        ramp = [rng.choice(self.ramp_ids) for _ in range(rng.randint(0, self.max_ramp))]
+        return DeckConfig(
+            land_delta=rng.randint(self.land_lo, self.land_hi),
+            added_cards=tuple(sorted(draw + ramp)),
+        )
+
+    def neighbors(self, config: DeckConfig) -> List[DeckConfig]:
+        """Configs one edit away: +/-1 land, or add, remove or replace one card."""
+        draw, ramp = self._split(config)
+        out: Dict[DeckConfig, None] = {}
+        for delta in (config.land_delta - 1, config.land_delta + 1):
+            if self.land_lo <= delta <= self.land_hi:
+                out[DeckConfig(delta, config.added_cards)] = None
+
+        for ids, picks, other, limit in (
+            (self.draw_ids, draw, ramp, self.max_draw),
+            (self.ramp_ids, ramp, draw, self.max_ramp),
+        ):
+            edits: List[List[str]] = []
+            if len(picks) < limit:
+                edits.extend(picks + [cid] for cid in ids)
+            for i in range(len(picks)):
+                rest = picks[:i] + picks[i + 1:]
+                edits.append(rest)
+                edits.extend(rest + [cid] for cid in ids if cid != picks[i])
+            for edit in edits:
+                out[DeckConfig(config.land_delta, tuple(sorted(edit + other)))] = None
+
+        out.pop(config, None)
+        return list(out)
+
+    def _split(self, config: DeckConfig) -> tuple[List[str], List[str]]:
+        draw_set, ramp_set = set(self.draw_ids), set(self.ramp_ids)
+        draw = [cid for cid in config.added_cards if cid in draw_set]
+        ramp = [cid for cid in config.added_cards if cid in ramp_set]
+        return draw, ramp
+
+
 def enumerate_configs(
     enabled_candidates: Dict[str, CandidateCard],
     max_draw: int = 2,
@@ -74,40 +190,16 @@ def enumerate_configs(
     - 0..max_ramp ramp candidates (combinations with replacement)
 
     Returns a list of unique DeckConfig instances including the base config.
+    Use ``ConfigSpace`` directly for spaces too large to materialize.
     """
-    from itertools import combinations_with_replacement
-
-    draw_ids = sorted(
-        cid for cid, c in enabled_candidates.items() if c.card_type == "draw"
-    )
-    ramp_ids = sorted(
-        cid for cid, c in enabled_candidates.items() if c.card_type == "ramp"
-    )
-
-    # Generate all draw combinations (0 to max_draw picks)
-    draw_combos: list[tuple[str, ...]] = [()]
-    for k in range(1, max_draw + 1):
-        draw_combos.extend(combinations_with_replacement(draw_ids, k))
-
-    # Generate all ramp combinations (0 to max_ramp picks)
-    ramp_combos: list[tuple[str, ...]] = [()]
-    for k in range(1, max_ramp + 1):
-        ramp_combos.extend(combinations_with_replacement(ramp_ids, k))
-
-    lo = land_delta_min if land_delta_min is not None else -land_range
-    hi = land_delta_max if land_delta_max is not None else land_range
-
-    configs: list[DeckConfig] = []
-    for land_delta in range(lo, hi + 1):
-        for draw_cards in draw_combos:
-            for ramp_cards in ramp_combos:
-                added = tuple(sorted(draw_cards + ramp_cards))
-                configs.append(DeckConfig(
-                    land_delta=land_delta,
-                    added_cards=added,
-                ))
-
-    return configs
+    return list(ConfigSpace(
+        enabled_candidates,
+        max_draw=max_draw,
+        max_ramp=max_ramp,
+        land_range=land_range,
+        land_delta_min=land_delta_min,
+        land_delta_max=land_delta_max,
+    ))
 
 
 def apply_config(
@@ -119,9 +211,10 @@ def apply_config(
     """Apply a DeckConfig to a Goldfisher instance, mutating its decklist.
 
     1. Reset to original decklist
-    2. Apply land delta
+    2. Apply land delta and remove ``config.cuts``
     3. Inject synthetic candidate cards (with registry entries)
-    4. If swap_mode, remove no-effect spells to maintain deck size
+    4. If swap_mode and there are no explicit cuts, remove no-effect
+       spells to maintain deck size
     """
     from auto_goldfish.effects.json_loader import build_overridden_registry
 
@@ -133,6 +226,9 @@ def apply_config(
         target_lands = goldfisher.land_count + config.land_delta
         goldfisher.set_lands(target_lands)
 
+    if config.cuts:
+        _remove_cards(goldfisher, config.cuts)
+
     if not config.added_cards:
         return
 
@@ -153,8 +249,8 @@ def apply_config(
     # Update registry
     goldfisher.registry = build_overridden_registry(goldfisher.registry, overrides)
 
-    # If swap mode, find no-effect spells to remove
-    if swap_mode:
+    # If swap mode without explicit cuts, find no-effect spells to remove
+    if swap_mode and not config.cuts:
         _remove_no_effect_spells(goldfisher, len(cards_to_add))
 
     # Append synthetic cards to the decklist
@@ -165,24 +261,38 @@ def apply_config(
         goldfisher.deckdict[card.name] = card
 
 
-def _remove_no_effect_spells(goldfisher, count: int) -> None:
-    """Remove up to `count` no-effect spells from the decklist.
+def no_effect_cuts(goldfisher, count: int) -> List[str]:
+    """Names of the `count` spells swap mode cuts by default.
 
     Prefers highest-CMC spells with no registered effects.
     """
-    removable: list[tuple[int, int]] = []  # (index_in_decklist, cmc)
-    for i, card in enumerate(goldfisher.decklist):
+    removable: list[tuple[str, int]] = []  # (name, cmc)
+    for card in goldfisher.decklist:
         if card.land or card.commander:
             continue
         effects = goldfisher.registry.get(card.name)
         if effects is not None:
             continue
-        removable.append((i, card.cmc))
+        removable.append((card.name, card.cmc))
 
     # Sort by CMC descending — remove expensive no-ops first
     removable.sort(key=lambda x: -x[1])
+    return [name for name, _ in removable[:count]]
+
 
-    indices_to_remove = {idx for idx, _ in removable[:count]}
+def _remove_no_effect_spells(goldfisher, count: int) -> None:
+    """Remove up to `count` no-effect spells from the decklist."""
+    _remove_cards(goldfisher, no_effect_cuts(goldfisher, count))
+
+
+def _remove_cards(goldfisher, names) -> None:
+    """Remove one copy of each card in *names* from the decklist."""
+    remaining = list(names)
+    indices_to_remove = set()
+    for i, card in enumerate(goldfisher.decklist):
+        if card.name in remaining and not card.land and not card.commander:
+            remaining.remove(card.name)
+            indices_to_remove.add(i)
     if not indices_to_remove:
         return
 
@@ -12,13 +12,84 @@ Compared to Hyperband, this approach:
 
 from __future__ import annotations
 
-import random as _stdlib_random
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+from auto_goldfish.engine.cancellation import CancelToken
+from auto_goldfish.optimization.anytime import (
+    LEADERBOARD_SIZE,
+    AnytimeControl,
+    LeaderboardCallback,
+    leaderboard_entries,
+)
 from auto_goldfish.optimization.candidate_cards import CandidateCard
-from auto_goldfish.optimization.deck_config import DeckConfig, apply_config, enumerate_configs
+from auto_goldfish.optimization.checkpoint import (
+    DEFAULT_INTERVAL_S,
+    Checkpointer,
+    CheckpointStore,
+    run_key,
+)
+from auto_goldfish.optimization.deck_config import ConfigSpace, DeckConfig, apply_config
+from auto_goldfish.optimization.local_search import VALID_SEARCH_STRATEGIES, LocalSearch
+from auto_goldfish.optimization.pareto import (
+    confidently_dominated,
+    paired_ci,
+    pareto_front,
+    select,
+)
+from auto_goldfish.optimization.sample_cache import SampleCache
+from auto_goldfish.optimization.samples import (
+    VALID_OPTIMIZE_TARGETS,
+    SampleStore,
+    consistency_score,
+    objective_score,
+    objective_values,
+    z_value,
+)
+
+
+class _RaceState:
+    """Racing buffers: per-config games plus running moments.
+
+    ``values`` is preallocated as (n_configs, max_games); row ``i`` belongs
+    to ``configs[i]`` for the whole race.  ``active`` holds the row indices
+    still racing (ascending) and is compacted as configs are eliminated.
+    ``cross`` holds each row's dot product with the ``best`` row's games,
+    updated incrementally while the best stays the same.
+    """
+
+    def __init__(self, n_configs: int, max_games: int) -> None:
+        self.values = np.empty((n_configs, max_games), dtype=float)
+        self.games = np.zeros(n_configs, dtype=int)
+        self.n_games = 0
+        self.active = np.arange(n_configs)
+        self.sums = np.zeros(n_configs)
+        self.sumsq = np.zeros(n_configs)
+        self.cross = np.zeros(n_configs)
+        self.best = -1
+
+    def append(self, batch: np.ndarray) -> None:
+        """Store one (len(active), batch_size) block of results."""
+        rows = self.active
+        start, end = self.n_games, self.n_games + batch.shape[1]
+        self.values[rows, start:end] = batch
+        self.sums[rows] += batch.sum(axis=1)
+        self.sumsq[rows] += np.einsum("ij,ij->i", batch, batch)
+        if self.best >= 0:
+            self.cross[rows] += batch @ self.values[self.best, start:end]
+        self.games[rows] = end
+        self.n_games = end
+
+    def set_best(self, row: int) -> None:
+        """Make *row* the reference for ``cross`` (recomputed only on change)."""
+        if row != self.best:
+            n = self.n_games
+            self.cross[self.active] = self.values[self.active, :n] @ self.values[row, :n]
+            self.best = row
+
+    def compact(self, keep: np.ndarray) -> None:
+        self.active = self.active[keep]
 
 
 class FastDeckOptimizer:
@@ -64,6 +135,65 @@ class FastDeckOptimizer:
         max_sims_per_config: Direct override for max games per config.
             When ``hyperband_max_sims`` is also provided, this is ignored.
         n_bootstrap: Number of bootstrap resamples for elimination tests.
+        surrogate: Optional trained ``SurrogateModel``.  When set, configs
+            are pre-screened by predicted score before racing.
+        surrogate_keep: Fraction of configs kept by the surrogate
+            pre-screen (never fewer than ``final_top_k``; the baseline is
+            always kept).
+        workers: Processes used for racing rounds and the final
+            evaluation.  Each worker compiles the deck variants it is sent
+            and returns per-game samples for a block of seeds; elimination
+            stays in this process, so results do not depend on the worker
+            count.
+        bootstrap_memory_mb: Upper bound on scratch memory for the
+            consistency bootstrap; configs are resampled in chunks that
+            fit.  Decisions do not depend on this value.
+        search: Phase 1 strategy, one of ``VALID_SEARCH_STRATEGIES``:
+            ``"racing"`` races every config, ``"local"`` runs a budgeted
+            ``LocalSearch`` over the lazy config space, and ``"auto"``
+            races when the space fits in ``search_budget`` at
+            ``min_games`` per config and searches otherwise.
+        search_budget: Games available to local search (default: 50
+            configs' worth of ``max_sims_per_config``).
+        cache: Optional ``SampleCache`` shared across runs; racing and
+            the final phase only play games the cache is missing.
+            Metrics of the last run are left in ``cache_stats``.
+        objectives: Two or more targets from ``VALID_OPTIMIZE_TARGETS``
+            for multi-objective racing.  Every config keeps one shared
+            CRN sample scored on all of them; a config is eliminated only
+            when another beats it with confidence on every objective, and
+            ``run()`` returns the Pareto front (thinned to ``final_top_k``
+            by crowding distance) with paired CIs against the baseline.
+            The first objective replaces ``optimize_for`` for ordering and
+            feature analysis.  Requires ``search="racing"``.
+        time_budget_s: Wall-clock budget of phase 1 (anytime mode).
+            Racing, Pareto racing and local search stop at the first
+            round boundary past it and keep their current leaders.
+        max_games: Game budget of phase 1 (anytime mode).
+        In anytime mode single-objective racing also stops as soon as the
+        top-k set is settled: every other active config is worse than the
+        k-th best with confidence.  ``stop_reason`` records why phase 1
+        ended early (see ``AnytimeControl``).  The final evaluation always
+        runs.
+        checkpoint: Optional ``CheckpointStore``.  ``run()`` saves the
+            search every ``checkpoint_interval_s`` seconds, before the
+            final evaluation and when interrupted, and resumes from the
+            checkpoint of an earlier run with the same deck, seed and
+            settings (see ``checkpoint``), returning the same ranking as
+            an uninterrupted run.  ``resumed_from`` holds the state it
+            resumed from.
+        checkpoint_interval_s: Minimum seconds between checkpoints.
+        cut_sets: In swap mode, cut sets raced per addition config
+            (racing only; 0 keeps the no-effect heuristic).  Every spell
+            of the deck is screened from one baseline sample (see
+            ``cut_screening``) and each config adding cards is raced with
+            the ``cut_sets`` best-screened cut sets of its size plus the
+            heuristic cuts.  Screening statistics are left in
+            ``cut_screening`` and attached to the first result dict.
+        cancel: Optional ``CancelToken``.  ``run()`` raises
+            ``SimulationCancelled`` within one game (or one poll of the
+            worker pool, whose processes are terminated) of it being
+            cancelled, saving a checkpoint first when checkpointing.
     """
 
     # Fidelity tier thresholds
@@ -87,7 +217,40 @@ class FastDeckOptimizer:
         min_games: int = 150,
         max_sims_per_config: int = 500,
         n_bootstrap: int = 200,
+        surrogate=None,
+        surrogate_keep: float = 0.5,
+        workers: int = 1,
+        bootstrap_memory_mb: float = 64.0,
+        search: str = "racing",
+        search_budget: Optional[int] = None,
+        cache: Optional[SampleCache] = None,
+        objectives: Optional[Sequence[str]] = None,
+        time_budget_s: Optional[float] = None,
+        max_games: Optional[int] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_interval_s: float = DEFAULT_INTERVAL_S,
+        cut_sets: int = 0,
+        cancel: Optional[CancelToken] = None,
     ) -> None:
+        if search not in VALID_SEARCH_STRATEGIES:
+            raise ValueError(
+                f"Invalid search: {search!r}. Must be one of {VALID_SEARCH_STRATEGIES}."
+            )
+        if objectives is not None:
+            objectives = tuple(objectives)
+            for objective in objectives:
+                if objective not in VALID_OPTIMIZE_TARGETS:
+                    raise ValueError(
+                        f"Invalid objective: {objective!r}. "
+                        f"Must be one of {VALID_OPTIMIZE_TARGETS}."
+                    )
+            if len(set(objectives)) < 2 or len(set(objectives)) != len(objectives):
+                raise ValueError("objectives needs two or more distinct targets.")
+            if search != "racing":
+                raise ValueError("objectives requires search='racing'.")
+            optimize_for = objectives[0]
+        if cut_sets < 0:
+            raise ValueError(f"cut_sets must be >= 0, got {cut_sets}.")
         self.goldfisher = goldfisher
         self.candidates = candidates
         self.swap_mode = swap_mode
@@ -101,6 +264,25 @@ class FastDeckOptimizer:
         self.confidence = confidence
         self.min_games = min_games
         self.n_bootstrap = n_bootstrap
+        self.surrogate = surrogate
+        self.surrogate_keep = surrogate_keep
+        self.workers = workers
+        self.bootstrap_memory_mb = bootstrap_memory_mb
+        self.search = search
+        self.cache = cache
+        self.cache_stats: Optional[Dict[str, Any]] = None
+        self.objectives = objectives
+        self.time_budget_s = time_budget_s
+        self.max_games = max_games
+        self.stop_reason: Optional[str] = None
+        self._anytime = AnytimeControl()
+        self.checkpoint = checkpoint
+        self.checkpoint_interval_s = checkpoint_interval_s
+        self.resumed_from: Optional[Dict[str, Any]] = None
+        self._checkpoints = Checkpointer()
+        self.cancel = cancel
+        self.cut_sets = cut_sets
+        self.cut_screening: Optional[List[dict]] = None
 
         # Map UI fidelity (hyperband_max_sims) to racing budget
         if hyperband_max_sims is not None:
@@ -110,12 +292,16 @@ class FastDeckOptimizer:
                 self.max_sims_per_config = self._BALANCED_MAX_SIMS
         else:
             self.max_sims_per_config = max_sims_per_config
+        self.search_budget = (
+            search_budget if search_budget is not None else 50 * self.max_sims_per_config
+        )
 
         # Populated during run(): race scores for all evaluated configs,
         # in the same (config, score, n_sims) format as Hyperband's
         # all_round_scores, enabling feature analysis and regression.
         self.all_round_scores: List[Tuple[DeckConfig, float, int]] = []
         self.feature_analysis: Optional[dict] = None
+        self.surrogate_scores: Dict[DeckConfig, float] = {}
 
     def run(
         self,
@@ -124,6 +310,8 @@ class FastDeckOptimizer:
         include_hyperband: bool = False,
         enum_progress: Optional[Callable[[int, int], None]] = None,
         eval_progress: Optional[Callable[[int, int], None]] = None,
+        leaderboard: Optional[LeaderboardCallback] = None,
+        leaderboard_interval_s: float = 1.0,
     ) -> List[Tuple[DeckConfig, Any]]:
         """Run optimization and return ranked (config, result_dict) pairs.
 
@@ -133,10 +321,19 @@ class FastDeckOptimizer:
         Phase 2 (Regression analysis): Fit a regression model on racing
         scores for interpretability (recommendations, marginal impact).
         Unlike hyperband, regression configs are *not* added to the eval
-        pool because racing survivors are empirically better.
+        pool because racing survivors are empirically better, so nothing
+        needs a refit between rounds and no ``RegressionTracker`` is fed
+        while racing.
+
+        Phase 3 (Final evaluation): Extend the racing samples of the
+        survivors and baseline to ``final_sims`` games on the same seeds
+        and report full results from the combined games.
 
-        Phase 3 (Final evaluation): Re-evaluate racing survivors and
-        baseline with full simulations.
+        With ``objectives``, phase 1 is Pareto racing and every result
+        dict also carries ``opt_objectives`` (score per objective),
+        ``opt_pareto_front`` and ``opt_paired_ci`` (per objective, the
+        difference from the baseline with its ``confidence`` interval).
+        Front members come first, ordered by the first objective.
 
         The first result dict includes a ``feature_analysis`` key with
         recommendations, marginal impact, and regression details.
@@ -148,15 +345,32 @@ class FastDeckOptimizer:
                 DeckOptimizer but ignored (racing does not use hyperband).
             enum_progress: Optional callable(current, total) for racing phase.
             eval_progress: Optional callable(current, total) for final eval.
+            leaderboard: Optional callable(board) receiving interim phase 1
+                leaderboards with CIs (see ``anytime``) at most every
+                ``leaderboard_interval_s`` seconds, plus one when phase 1
+                ends.  Returning ``True`` stops phase 1 early.
+            leaderboard_interval_s: Minimum seconds between leaderboards.
 
         Returns:
             List of (DeckConfig, result_dict) sorted best-first.
         """
-        original_sims = self.goldfisher.sims
-
-        # Phase 1: Flat racing elimination over all configs
+        # Phase 1: Flat racing elimination over all configs, or a
+        # budgeted local search when the space is too large to race
         self.all_round_scores = []
-        all_configs = enumerate_configs(
+        self.cut_screening = None
+        store = self._make_sample_store()
+        self._checkpoints = Checkpointer(
+            self.checkpoint,
+            run_key(self.goldfisher, self._run_settings(final_sims, final_top_k))
+            if self.checkpoint is not None else "",
+            self.checkpoint_interval_s,
+        )
+        self.resumed_from = self._checkpoints.resume(store)
+        self._anytime = AnytimeControl(
+            self.time_budget_s, self.max_games, leaderboard, leaderboard_interval_s,
+            resumed_s=self.resumed_from["elapsed_s"] if self.resumed_from else 0.0,
+        )
+        space = ConfigSpace(
             self.candidates,
             max_draw=self.max_draw,
             max_ramp=self.max_ramp,
@@ -164,52 +378,70 @@ class FastDeckOptimizer:
             land_delta_min=self.land_delta_min,
             land_delta_max=self.land_delta_max,
         )
-        top_configs = self._race(all_configs, top_k=final_top_k, progress=enum_progress)
-
-        # Phase 2: Regression analysis for interpretability
-        # Racing survivors are used as eval candidates (not regression picks,
-        # since racing finds better candidates than regression prediction).
-        # The regression model is still fitted to produce recommendations.
-        from auto_goldfish.optimization.feature_analysis import (
-            analyze_optimization,
-        )
-
-        self.feature_analysis = analyze_optimization(
-            self.all_round_scores, self.optimize_for,
-        )
-
-        # Build evaluation pool: racing survivors + baseline
-        baseline = DeckConfig()
-        eval_pool: list[DeckConfig] = []
-        seen: set[DeckConfig] = set()
-
-        for cfg in top_configs:
-            if cfg not in seen:
-                eval_pool.append(cfg)
-                seen.add(cfg)
-
-        if baseline not in seen:
-            eval_pool.append(baseline)
-            seen.add(baseline)
-
-        # Phase 3: Full evaluation of combined pool
-        self.goldfisher.sims = final_sims
-        from auto_goldfish.metrics.reporter import result_to_dict
-
-        results: list[tuple[DeckConfig, Any]] = []
-        for j, config in enumerate(eval_pool):
-            apply_config(self.goldfisher, config, self.candidates, self.swap_mode)
-            result = self.goldfisher.simulate()
-            result_dict = result_to_dict(result)
-            results.append((config, result_dict))
-
-            if eval_progress is not None:
-                eval_progress(j + 1, len(eval_pool))
+        completed = False
+        try:
+            if self._use_local_search(space):
+                top_configs = self._local_search(space, final_top_k, store, enum_progress)
+            else:
+                all_configs = list(space)
+                if self.swap_mode and self.cut_sets:
+                    all_configs = self._expand_cuts(all_configs, store, final_sims)
+                if self.surrogate is not None:
+                    all_configs = self._prescreen(all_configs, top_k=final_top_k)
+                if self.objectives:
+                    top_configs = self._pareto_race(all_configs, final_top_k, enum_progress, store)
+                else:
+                    top_configs = self._race(all_configs, top_k=final_top_k,
+                                             progress=enum_progress, store=store)
+
+            # Phase 2: Regression analysis for interpretability
+            # Racing survivors are used as eval candidates (not regression picks,
+            # since racing finds better candidates than regression prediction).
+            # The regression model is still fitted to produce recommendations.
+            from auto_goldfish.optimization.feature_analysis import (
+                analyze_optimization,
+            )
 
-        self.goldfisher.sims = original_sims
+            self.feature_analysis = analyze_optimization(
+                self.all_round_scores, self.optimize_for,
+            )
 
-        # Sort final results by target metric
-        results.sort(key=lambda r: self._extract_score_from_dict(r[1]), reverse=True)
+            # Build evaluation pool: racing survivors + baseline
+            baseline = DeckConfig()
+            eval_pool: list[DeckConfig] = []
+            seen: set[DeckConfig] = set()
+
+            for cfg in top_configs:
+                if cfg not in seen:
+                    eval_pool.append(cfg)
+                    seen.add(cfg)
+
+            if baseline not in seen:
+                eval_pool.append(baseline)
+                seen.add(baseline)
+
+            # Phase 3: Full evaluation of combined pool
+            self._checkpoints.save(store, self._anytime, "final", pool=len(eval_pool))
+            results = self._final_evaluation(store, eval_pool, final_sims, eval_progress)
+            if self.objectives:
+                self._annotate_pareto(store, results, final_sims)
+            completed = True
+        finally:
+            if completed:
+                self._checkpoints.finish()
+            else:
+                self._checkpoints.save(store, self._anytime)
+            store.close()
+            self.cache_stats = store.cache_stats()
+            self.stop_reason = self._anytime.stop_reason
+
+        # Sort final results by target metric (Pareto front first)
+        if self.objectives:
+            first = self.objectives[0]
+            results.sort(key=lambda r: (not r[1]["opt_pareto_front"],
+                                        -r[1]["opt_objectives"][first]))
+        else:
+            results.sort(key=lambda r: self._extract_score_from_dict(r[1]), reverse=True)
 
         # Find baseline rank before cutting
         baseline_rank = None
@@ -232,153 +464,587 @@ class FastDeckOptimizer:
         # Attach feature analysis to the top-ranked result
         if self.feature_analysis and results:
             results[0][1]["feature_analysis"] = self.feature_analysis
+        if self.cut_screening is not None and results:
+            results[0][1]["cut_screening"] = self.cut_screening
 
         return results
 
     # -- Racing internals --
 
+    def _use_local_search(self, space: ConfigSpace) -> bool:
+        if self.search == "auto":
+            return len(space) * self.min_games > self.search_budget
+        return self.search == "local"
+
+    def _local_search(
+        self,
+        space: ConfigSpace,
+        top_k: int,
+        store: SampleStore,
+        progress: Optional[Callable[[int, int], None]],
+    ) -> List[DeckConfig]:
+        """Budgeted CRN local search; fills ``all_round_scores`` like racing.
+
+        Configs are ranked with the racing score (``_compute_score`` of
+        primary mana), so both strategies optimize the same quantity.
+        """
+        def score(config: DeckConfig, n_games: int) -> float:
+            sample = store.sample(config).head(n_games)
+            return self._compute_score(self.goldfisher.sample_primary(sample))
+
+        anytime = self._anytime
+        budget = self.search_budget
+        if anytime.max_games is not None:
+            budget = min(budget, anytime.max_games)
+
+        def should_stop() -> bool:
+            anytime.games = search.games_played
+            if anytime.due():
+                anytime.emit("local_search", lambda: self._local_search_entries(store, search))
+            self._checkpoints.maybe_save(store, anytime, "local_search", level=search.level)
+            return anytime.exhausted()
+
+        search = LocalSearch(
+            store, space, self.optimize_for,
+            budget=budget,
+            batch_size=self.batch_size,
+            max_games=self.max_sims_per_config,
+            seed=store.base_seed,
+            score=score,
+            should_stop=should_stop,
+        )
+        try:
+            top = search.run(top_k, progress)
+        finally:
+            self.goldfisher.restore_original_decklist()
+        anytime.games = search.games_played
+        # The search budget is capped at max_games; record it if that bit
+        anytime.exhausted()
+        anytime.emit("local_search", lambda: self._local_search_entries(store, search))
+        self.all_round_scores.extend(search.round_scores)
+        return top
+
+    def _local_search_entries(self, store: SampleStore, search: LocalSearch) -> List[dict]:
+        return leaderboard_entries(
+            [
+                (cfg, self.goldfisher.sample_primary(store.sample(cfg).head(search.level)))
+                for cfg in search.leaders(LEADERBOARD_SIZE)
+            ],
+            self._race_objective(),
+            self.confidence,
+        )
+
+    def _expand_cuts(
+        self, configs: List[DeckConfig], store: SampleStore, final_sims: int,
+    ) -> List[DeckConfig]:
+        """Pair every config that adds cards with its candidate cut sets.
+
+        Stage one of cut selection: the baseline plays its first games
+        (which racing and the final evaluation reuse) and every spell is
+        screened from them.  Each config adding ``n`` cards is replaced
+        by one config per best-screened cut set of size ``n``, plus the
+        heuristic cuts (``cuts=()``) unless a screened set matches them.
+        """
+        from auto_goldfish.optimization.cut_screening import best_cut_sets, screen_cuts
+        from auto_goldfish.optimization.deck_config import no_effect_cuts
+
+        baseline = DeckConfig()
+        n_games = max(self.min_games, min(final_sims, self.max_sims_per_config))
+        store.extend([baseline], n_games)
+        sample = store.sample(baseline).head(n_games)
+        screened = screen_cuts(self.goldfisher, sample.drawn, self.goldfisher.sample_primary(sample))
+        self.cut_screening = [c.to_dict() for c in screened]
+
+        sets: Dict[int, List[Tuple[str, ...]]] = {}
+        expanded: List[DeckConfig] = []
+        for cfg in configs:
+            size = len([cid for cid in cfg.added_cards if cid in self.candidates])
+            if not size:
+                expanded.append(cfg)
+                continue
+            if size not in sets:
+                heuristic = tuple(sorted(no_effect_cuts(self.goldfisher, size)))
+                sets[size] = [cuts for cuts in best_cut_sets(screened, size, self.cut_sets)
+                              if cuts != heuristic]
+            expanded.append(cfg)
+            expanded.extend(
+                DeckConfig(cfg.land_delta, cfg.added_cards, cuts) for cuts in sets[size]
+            )
+        return expanded
+
+    def _prescreen(self, configs: List[DeckConfig], top_k: int) -> List[DeckConfig]:
+        """Keep the configs the surrogate ranks highest, plus the baseline."""
+        from auto_goldfish.optimization.surrogate import SURROGATE_TARGETS, deck_features
+
+        keep = max(top_k, int(np.ceil(len(configs) * self.surrogate_keep)))
+        if keep >= len(configs):
+            return list(configs)
+
+        target = {
+            "consistency": "consistency",
+            "floor_performance": "threshold_mana",
+        }.get(self.optimize_for, "mean_mana")
+        features = []
+        for cfg in configs:
+            apply_config(self.goldfisher, cfg, self.candidates, self.swap_mode)
+            features.append(deck_features(self.goldfisher))
+        self.goldfisher.restore_original_decklist()
+
+        predicted = self.surrogate.predict(np.array(features))[:, SURROGATE_TARGETS.index(target)]
+        self.surrogate_scores = {cfg: float(p) for cfg, p in zip(configs, predicted)}
+        best = sorted(np.argsort(-predicted, kind="stable")[:keep])
+        kept = [configs[i] for i in best]
+
+        baseline = DeckConfig()
+        if baseline in configs and baseline not in kept:
+            kept.append(baseline)
+        return kept
+
     def _race(
         self,
         configs: List[DeckConfig],
         top_k: int,
         progress: Optional[Callable[[int, int], None]],
+        store: Optional[SampleStore] = None,
     ) -> List[DeckConfig]:
         """Sequential elimination with CRN pairing.
 
         All active configs are evaluated on the same batch of seeds each
         round. After accumulating enough games (>= min_games), configs
         that are statistically worse than the current best are eliminated.
+
+        Games are played into *store* (a private one when omitted); the
+        samples of eliminated configs other than the baseline are
+        discarded, so survivors and the baseline keep theirs for the final
+        evaluation.
         """
         if len(configs) <= top_k:
             return list(configs)
 
-        base_seed = self.goldfisher.seed if self.goldfisher.seed is not None else _stdlib_random.randrange(2**31)
+        own_store = store is None
+        if own_store:
+            store = self._make_sample_store()
+        anytime = self._anytime
         max_rounds = self.max_sims_per_config // self.batch_size
 
         # Estimate total budget for progress reporting
         total_budget_est = len(configs) * self.max_sims_per_config
         done_sims = 0
 
-        # Per-config accumulated mana values as numpy arrays
-        # Use a list-of-lists during accumulation, convert to arrays for elimination
-        mana_lists: dict[DeckConfig, list[float]] = {cfg: [] for cfg in configs}
-        active = set(configs)
-
-        for round_idx in range(max_rounds):
-            if len(active) <= top_k:
-                break
-
-            # Generate seeds for this batch (same for all configs = CRN)
-            batch_start = base_seed + round_idx * self.batch_size
-            seeds = [batch_start + j for j in range(self.batch_size)]
-
-            # Evaluate all active configs on this batch
-            for cfg in list(active):
-                apply_config(self.goldfisher, cfg, self.candidates, self.swap_mode)
-                batch_values = [
-                    self.goldfisher.simulate_single_game(s) for s in seeds
-                ]
-                mana_lists[cfg].extend(batch_values)
-                done_sims += self.batch_size
-
-            if progress is not None:
-                progress(done_sims, total_budget_est)
-
-            # Only start eliminating after min_games
-            n_games = (round_idx + 1) * self.batch_size
-            if n_games < self.min_games:
-                continue
+        state = _RaceState(len(configs), max_rounds * self.batch_size)
+        baseline = DeckConfig()
 
-            # Compute scores and eliminate
-            active = self._eliminate_round(mana_lists, active, top_k)
+        try:
+            for round_idx in range(max_rounds):
+                if len(state.active) <= top_k:
+                    break
+
+                # Every active config plays the next batch of the shared
+                # seed stream (same seeds for all configs = CRN)
+                round_configs = [configs[row] for row in state.active]
+                start = round_idx * self.batch_size
+                stop = start + self.batch_size
+                store.extend(round_configs, stop)
+                state.append(np.array([
+                    self.goldfisher.sample_primary(store.rows(cfg, start, stop))
+                    for cfg in round_configs
+                ]))
+                done_sims += self.batch_size * len(round_configs)
+
+                if progress is not None:
+                    progress(done_sims, total_budget_est)
+
+                anytime.spend(self.batch_size * len(round_configs))
+
+                # Only start eliminating after min_games
+                settled = False
+                if state.n_games >= self.min_games:
+                    # Compute scores and eliminate
+                    before = state.active
+                    self._eliminate_round(state, top_k)
+                    for row in np.setdiff1d(before, state.active):
+                        if configs[row] != baseline:
+                            store.discard(configs[row])
+                    settled = anytime.budgeted and self._top_k_settled(state, top_k)
+
+                if anytime.due():
+                    anytime.emit("racing", lambda: self._race_entries(configs, state), settled)
+                self._checkpoints.maybe_save(store, anytime, "racing", round=round_idx + 1,
+                                             active=len(state.active))
+                if settled:
+                    anytime.stop("settled")
+                if anytime.exhausted():
+                    break
+            anytime.emit("racing", lambda: self._race_entries(configs, state),
+                         anytime.stop_reason == "settled")
+        finally:
+            if own_store:
+                store.close()
+            self.goldfisher.restore_original_decklist()
 
         # Collect scores for all evaluated configs (active + eliminated)
         # in the same format as Hyperband's all_round_scores for regression
-        for cfg, values in mana_lists.items():
-            if values:
-                score = self._compute_score(np.array(values))
-                self.all_round_scores.append((cfg, score, len(values)))
+        final_scores = np.zeros(len(configs))
+        for row, cfg in enumerate(configs):
+            n = int(state.games[row])
+            if n:
+                final_scores[row] = self._compute_score(state.values[row, :n])
+                self.all_round_scores.append((cfg, float(final_scores[row]), n))
 
         # Return top_k by final score
-        final_scores = {
-            cfg: self._compute_score(np.array(mana_lists[cfg])) for cfg in active
-        }
-        ranked = sorted(active, key=lambda c: final_scores[c], reverse=True)
+        ranked = sorted(state.active, key=lambda row: final_scores[row], reverse=True)
 
         # Report final progress
         if progress is not None:
             progress(done_sims, done_sims)
 
-        return ranked[:top_k]
+        return [configs[row] for row in ranked[:top_k]]
 
-    def _eliminate_round(
+    def _pareto_race(
         self,
-        mana_lists: dict[DeckConfig, list[float]],
-        active: set[DeckConfig],
+        configs: List[DeckConfig],
         top_k: int,
-    ) -> set[DeckConfig]:
-        """Vectorized paired bootstrap elimination against the current best.
+        progress: Optional[Callable[[int, int], None]],
+        store: SampleStore,
+    ) -> List[DeckConfig]:
+        """Sequential elimination with CRN pairing on every objective.
 
-        For mean-based metrics, uses a faster t-test instead of bootstrap.
-        For consistency, uses vectorized bootstrap over all candidates at once.
+        Rounds, budget and sample handling match ``_race``, but each
+        config's games are scored on all ``objectives`` and elimination
+        uses ``_pareto_eliminate``.  Survivors are ranked by Pareto layer
+        and crowding distance of their racing scores.
         """
-        active_list = list(active)
+        if len(configs) <= top_k:
+            return list(configs)
 
-        # Build matrix: (n_configs, n_games)
-        n_games = len(mana_lists[active_list[0]])
-        mana_matrix = np.array([mana_lists[cfg] for cfg in active_list])
+        objectives = self.objectives
+        anytime = self._anytime
+        max_rounds = self.max_sims_per_config // self.batch_size
+        total_budget_est = len(configs) * self.max_sims_per_config
+        done_sims = 0
 
-        # Compute current scores
+        values = np.empty((len(objectives), len(configs), max_rounds * self.batch_size))
+        games = np.zeros(len(configs), dtype=int)
+        active = np.arange(len(configs))
+        baseline = DeckConfig()
+
+        try:
+            for round_idx in range(max_rounds):
+                if len(active) <= top_k:
+                    break
+
+                round_configs = [configs[row] for row in active]
+                start = round_idx * self.batch_size
+                stop = start + self.batch_size
+                store.extend(round_configs, stop)
+                for row, cfg in zip(active, round_configs):
+                    block = store.rows(cfg, start, stop)
+                    for k, objective in enumerate(objectives):
+                        values[k, row, start:stop] = objective_values(
+                            self.goldfisher, block, objective,
+                        )
+                games[active] = stop
+                done_sims += self.batch_size * len(round_configs)
+                anytime.spend(self.batch_size * len(round_configs))
+
+                if progress is not None:
+                    progress(done_sims, total_budget_est)
+
+                if stop >= self.min_games:
+                    keep = self._pareto_eliminate(values[:, active, :stop], top_k)
+                    for row in active[~keep]:
+                        if configs[row] != baseline:
+                            store.discard(configs[row])
+                    active = active[keep]
+
+                if anytime.due():
+                    anytime.emit("racing", lambda: self._pareto_entries(configs, values, active, stop))
+                self._checkpoints.maybe_save(store, anytime, "racing", round=round_idx + 1,
+                                             active=len(active))
+                if anytime.exhausted():
+                    break
+            n_played = int(games.max())
+            anytime.emit("racing", lambda: self._pareto_entries(configs, values, active, n_played))
+        finally:
+            self.goldfisher.restore_original_decklist()
+
+        scores = np.zeros((len(configs), len(objectives)))
+        for row, cfg in enumerate(configs):
+            n = int(games[row])
+            if n:
+                scores[row] = [
+                    objective_score(values[k, row, :n], objective)
+                    for k, objective in enumerate(objectives)
+                ]
+                self.all_round_scores.append((cfg, float(scores[row, 0]), n))
+
+        if progress is not None:
+            progress(done_sims, done_sims)
+
+        return [configs[active[i]] for i in select(scores[active], top_k)]
+
+    def _pareto_entries(
+        self, configs: List[DeckConfig], values: np.ndarray, active: np.ndarray, n_games: int,
+    ) -> List[dict]:
+        """Leaderboard of the active configs, ranked by the first objective."""
+        return leaderboard_entries(
+            [(configs[row], values[0, row, :n_games]) for row in active],
+            self.objectives[0], self.confidence,
+            extra=[
+                {"objectives": {
+                    objective: objective_score(values[k, row, :n_games], objective)
+                    for k, objective in enumerate(self.objectives)
+                }}
+                for row in active
+            ],
+        )
+
+    def _pareto_eliminate(self, values: np.ndarray, top_k: int) -> np.ndarray:
+        """Keep-mask over the configs in *values* (objectives, configs, games).
+
+        A config is dropped when a member of the current empirical front
+        beats it with confidence on every objective, using paired
+        bootstrap resamples shared by all configs and objectives.  When
+        that would leave fewer than ``top_k``, the dropped configs ranked
+        highest by Pareto layer and crowding are kept.
+        """
         scores = np.array([
-            self._compute_score(mana_matrix[i]) for i in range(len(active_list))
+            [objective_score(values[k, i], objective) for k, objective in enumerate(self.objectives)]
+            for i in range(values.shape[1])
         ])
+        boot = self._bootstrap_objectives(values)
+        dominated = confidently_dominated(boot, np.flatnonzero(pareto_front(scores)), self.confidence)
+
+        removed = np.flatnonzero(dominated)
+        max_removals = len(scores) - top_k
+        if len(removed) > max_removals:
+            ranked = select(scores[removed], len(removed))
+            removed = removed[ranked[len(removed) - max_removals:]]
+        keep = np.ones(len(scores), dtype=bool)
+        keep[removed] = False
+        return keep
+
+    def _bootstrap_objectives(self, values: np.ndarray) -> np.ndarray:
+        """Bootstrap statistics (objectives, configs, n_bootstrap) of *values*.
+
+        Every config and objective uses the same resamples, so differences
+        between configs are paired.
+        """
+        n_games = values.shape[2]
+        rng = np.random.RandomState(42)
+        boot_idx = rng.randint(0, n_games, size=(self.n_bootstrap, n_games))
+        counts = self._bootstrap_counts(boot_idx, n_games)
+        stats = []
+        for k, objective in enumerate(self.objectives):
+            if objective in ("floor_performance", "consistency"):
+                tail_means, overall_means = self._bootstrap_tail(values[k], boot_idx)
+                if objective == "consistency":
+                    tail_means = tail_means / np.maximum(overall_means, 1e-10)
+                stats.append(tail_means)
+            else:
+                stats.append(values[k] @ counts.T / n_games)
+        return np.stack(stats)
+
+    def _annotate_pareto(
+        self,
+        store: SampleStore,
+        results: List[Tuple[DeckConfig, dict]],
+        final_sims: int,
+    ) -> None:
+        """Add objective scores, front membership and paired CIs to *results*."""
+        objectives = self.objectives
+        samples = [store.sample(cfg).head(final_sims) for cfg, _ in results]
+        values = np.array([
+            [objective_values(self.goldfisher, sample, objective) for sample in samples]
+            for objective in objectives
+        ])
+        scores = np.array([
+            [objective_score(values[k, i], objective) for k, objective in enumerate(objectives)]
+            for i in range(len(results))
+        ])
+        front = pareto_front(scores)
+        boot = self._bootstrap_objectives(values)
+        base = next(i for i, (cfg, _) in enumerate(results) if cfg == DeckConfig())
+
+        for i, (_, result_dict) in enumerate(results):
+            result_dict["opt_objectives"] = {
+                objective: float(scores[i, k]) for k, objective in enumerate(objectives)
+            }
+            result_dict["opt_pareto_front"] = bool(front[i])
+            result_dict["opt_paired_ci"] = {
+                objective: {
+                    "diff": float(scores[i, k] - scores[base, k]),
+                    "ci": list(paired_ci(boot[k, i], boot[k, base], self.confidence)),
+                }
+                for k, objective in enumerate(objectives)
+            }
+
+    def _race_objective(self) -> str:
+        """Objective whose score racing ranks on (primary mana mean or consistency)."""
+        return "consistency" if self.optimize_for == "consistency" else "mean_mana"
+
+    def _race_entries(self, configs: List[DeckConfig], state: "_RaceState") -> List[dict]:
+        """Leaderboard of the configs still racing."""
+        rows = state.active
+        n = state.n_games
+        if self.optimize_for != "consistency":
+            scores = state.sums[rows] / max(n, 1)
+        else:
+            scores = np.array([self._compute_consistency(state.values[r, :n]) for r in rows])
+        shown = rows[np.argsort(-scores, kind="stable")[:LEADERBOARD_SIZE]]
+        return leaderboard_entries(
+            [(configs[row], state.values[row, :n]) for row in shown],
+            self._race_objective(), self.confidence,
+        )
+
+    def _top_k_settled(self, state: "_RaceState", top_k: int) -> bool:
+        """True when every active config outside the top *top_k* is
+        confidently worse than the k-th best (LUCB-style stopping rule)."""
+        rows = state.active
+        if len(rows) <= top_k:
+            return True
+        n = state.n_games
+        matrix = state.values[rows, :n]
+        if self.optimize_for != "consistency":
+            scores = state.sums[rows] / n
+        else:
+            scores = np.array([self._compute_consistency(r) for r in matrix])
+        order = np.argsort(-scores, kind="stable")
+        kth = int(order[top_k - 1])
+        if self.optimize_for != "consistency":
+            dominated = self._ttest_from_moments(
+                state.sums[rows], state.sumsq[rows], matrix @ matrix[kth], kth, n,
+            )
+        else:
+            dominated = self._bootstrap_elimination_vectorized(matrix, kth, n)
+        return bool(dominated[order[top_k:]].all())
+
+    def _final_evaluation(
+        self,
+        store: SampleStore,
+        eval_pool: List[DeckConfig],
+        final_sims: int,
+        progress: Optional[Callable[[int, int], None]],
+    ) -> List[Tuple[DeckConfig, dict]]:
+        """Result dicts for *eval_pool* at *final_sims* games.
+
+        Each config's racing sample is extended with only the games it is
+        missing from the shared seed stream (in parallel when ``workers``
+        > 1), so survivors and the baseline are compared on the same games.
+        """
+        from auto_goldfish.metrics.reporter import result_to_dict
+
+        results: List[Tuple[DeckConfig, dict]] = []
+        try:
+            store.extend(eval_pool, final_sims, capture_replays=True)
+            for j, config in enumerate(eval_pool):
+                results.append((config, result_to_dict(store.result(config, final_sims))))
+                if progress is not None:
+                    progress(j + 1, len(eval_pool))
+        finally:
+            self.goldfisher.restore_original_decklist()
+        return results
+
+    def _make_sample_store(self) -> SampleStore:
+        return SampleStore(self.goldfisher, self.candidates, self.swap_mode,
+                           workers=self.workers, cache=self.cache,
+                           snapshots=self.checkpoint is not None, cancel=self.cancel)
+
+    def _run_settings(self, final_sims: int, final_top_k: int) -> Dict[str, Any]:
+        """Everything besides the deck and seed that a run's decisions depend on."""
+        return {
+            "optimizer": "racing",
+            "candidates": {cid: repr(c) for cid, c in sorted(self.candidates.items())},
+            "swap_mode": self.swap_mode,
+            "max_draw": self.max_draw,
+            "max_ramp": self.max_ramp,
+            "land_range": self.land_range,
+            "land_delta_min": self.land_delta_min,
+            "land_delta_max": self.land_delta_max,
+            "optimize_for": self.optimize_for,
+            "objectives": self.objectives,
+            "batch_size": self.batch_size,
+            "confidence": self.confidence,
+            "min_games": self.min_games,
+            "max_sims_per_config": self.max_sims_per_config,
+            "n_bootstrap": self.n_bootstrap,
+            "surrogate": self.surrogate.to_dict() if self.surrogate is not None else None,
+            "surrogate_keep": self.surrogate_keep,
+            "search": self.search,
+            "search_budget": self.search_budget,
+            "time_budget_s": self.time_budget_s,
+            "max_games": self.max_games,
+            "final_sims": final_sims,
+            "final_top_k": final_top_k,
+            "cut_sets": self.cut_sets,
+        }
+
+    def _eliminate_round(self, state: "_RaceState", top_k: int) -> None:
+        """Eliminate configs that are statistically worse than the current best.
+
+        For mean-based metrics, uses a paired t-test computed from the
+        running moments in *state*, so the cost is O(active configs).
+        For consistency, uses vectorized bootstrap over all candidates at once.
+        """
+        rows = state.active
+        n_games = state.n_games
+
+        # Compute current scores
+        if self.optimize_for != "consistency":
+            scores = state.sums[rows] / n_games
+        else:
+            mana_matrix = state.values[rows, :n_games]
+            scores = np.array([self._compute_consistency(r) for r in mana_matrix])
         best_idx = int(np.argmax(scores))
-        best_cfg = active_list[best_idx]
 
         if self.optimize_for != "consistency":
             # Fast path: paired t-test for mean-based metrics
-            dominated = self._ttest_elimination(mana_matrix, best_idx)
+            state.set_best(rows[best_idx])
+            dominated = self._ttest_from_moments(
+                state.sums[rows], state.sumsq[rows], state.cross[rows], best_idx, n_games,
+            )
         else:
             # Vectorized bootstrap for consistency
             dominated = self._bootstrap_elimination_vectorized(
                 mana_matrix, best_idx, n_games
             )
-
-        to_remove: set[DeckConfig] = set()
-        for i, cfg in enumerate(active_list):
-            if i != best_idx and dominated[i]:
-                to_remove.add(cfg)
+        dominated[best_idx] = False
 
         # Don't eliminate below top_k
-        max_removals = len(active) - top_k
-        if len(to_remove) > max_removals:
-            removable = sorted(to_remove, key=lambda c: scores[active_list.index(c)])
-            to_remove = set(removable[:max_removals])
-
-        return active - to_remove
-
-    def _ttest_elimination(
-        self, mana_matrix: np.ndarray, best_idx: int
+        removed = np.flatnonzero(dominated)
+        max_removals = len(rows) - top_k
+        if len(removed) > max_removals:
+            removed = removed[np.argsort(scores[removed], kind="stable")[:max_removals]]
+        keep = np.ones(len(rows), dtype=bool)
+        keep[removed] = False
+        state.compact(keep)
+
+    def _ttest_from_moments(
+        self,
+        sums: np.ndarray,
+        sumsq: np.ndarray,
+        cross: np.ndarray,
+        best_idx: int,
+        n_games: int,
     ) -> np.ndarray:
-        """Paired t-test elimination for mean-based metrics.
+        """One-sided paired t-test of each config against ``best_idx``.
 
-        Much faster than bootstrap. Returns boolean array where True = dominated.
+        Uses per-config sums, sums of squares and cross products with the
+        best config's games, so paired differences never need to be
+        materialized.
         """
-        n_configs, n_games = mana_matrix.shape
-        best_row = mana_matrix[best_idx]
-
         # Paired differences: cfg - best (positive means cfg is better)
-        diffs = mana_matrix - best_row[np.newaxis, :]  # (n_configs, n_games)
-        means = diffs.mean(axis=1)
-        stds = diffs.std(axis=1, ddof=1)
+        diff_sums = sums - sums[best_idx]
+        diff_sumsq = sumsq - 2 * cross + sumsq[best_idx]
+        means = diff_sums / n_games
+        variances = (n_games * diff_sumsq - diff_sums ** 2) / (n_games * (n_games - 1))
+        stds = np.sqrt(np.maximum(variances, 0.0))
         stds = np.maximum(stds, 1e-10)  # avoid division by zero
 
         # One-sided t-test: upper CI for (cfg - best)
         se = stds / np.sqrt(n_games)
         # Use z-approximation (n_games >= 40)
-        z = {0.90: 1.282, 0.95: 1.645, 0.99: 2.326}.get(
-            self.confidence, 1.645
-        )
+        z = z_value(self.confidence, two_sided=False)
         upper_ci = means + z * se
 
         dominated = upper_ci < 0
@@ -388,31 +1054,17 @@ class FastDeckOptimizer:
     def _bootstrap_elimination_vectorized(
         self, mana_matrix: np.ndarray, best_idx: int, n_games: int
     ) -> np.ndarray:
-        """Vectorized paired bootstrap for consistency metric.
+        """Paired bootstrap for consistency metric.
 
-        Bootstraps all configs simultaneously using numpy broadcasting.
-        Returns boolean array where True = dominated.
+        All configs share the same bootstrap resamples.  Returns boolean
+        array where True = dominated.
         """
-        n_configs = mana_matrix.shape[0]
         n_boot = self.n_bootstrap
         rng = np.random.RandomState(42)
 
         # Generate bootstrap indices: (n_boot, n_games)
         boot_idx = rng.randint(0, n_games, size=(n_boot, n_games))
-
-        # Resample all configs: (n_configs, n_boot, n_games)
-        boot_samples = mana_matrix[:, boot_idx]
-
-        # Compute consistency for each bootstrap sample
-        # Sort along game axis
-        boot_sorted = np.sort(boot_samples, axis=2)
-        cutoff = max(1, int(n_games * 0.25))
-        tail_means = boot_sorted[:, :, :cutoff].mean(axis=2)  # (n_configs, n_boot)
-        overall_means = boot_samples.mean(axis=2)  # (n_configs, n_boot)
-
-        # Avoid division by zero
-        safe_means = np.maximum(overall_means, 1e-10)
-        boot_consistency = tail_means / safe_means  # (n_configs, n_boot)
+        boot_consistency = self._bootstrap_consistency(mana_matrix, boot_idx)
 
         # Paired differences vs best
         best_consistency = boot_consistency[best_idx]  # (n_boot,)
@@ -426,6 +1078,76 @@ class FastDeckOptimizer:
         dominated[best_idx] = False
         return dominated
 
+    def _bootstrap_consistency(
+        self, mana_matrix: np.ndarray, boot_idx: np.ndarray
+    ) -> np.ndarray:
+        """Consistency of every bootstrap resample; returns (n_configs, n_boot).
+
+        Instead of materializing and sorting ``mana_matrix[:, boot_idx]``,
+        each resample is represented by how many times it draws each game.
+        Walking a config's games in sorted order, the bottom-``cutoff``
+        sum is a prefix of the multiplicity-weighted values.  Configs are
+        processed in chunks so peak memory stays under
+        ``bootstrap_memory_mb``.  For integer-valued games every sum is
+        exact, so results match the sort-based computation bit for bit.
+        """
+        tail_means, overall_means = self._bootstrap_tail(mana_matrix, boot_idx)
+        # Avoid division by zero
+        return tail_means / np.maximum(overall_means, 1e-10)
+
+    @staticmethod
+    def _bootstrap_counts(boot_idx: np.ndarray, n_games: int) -> np.ndarray:
+        """``counts[b, g]``: times resample ``b`` draws game ``g``."""
+        n_boot = boot_idx.shape[0]
+        offsets = (np.arange(n_boot) * n_games)[:, np.newaxis]
+        return np.bincount(
+            (boot_idx + offsets).ravel(), minlength=n_boot * n_games,
+        ).reshape(n_boot, n_games)
+
+    def _bootstrap_tail(
+        self, mana_matrix: np.ndarray, boot_idx: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Left-tail means and overall means of every resample, each (n_configs, n_boot).
+
+        See ``_bootstrap_consistency`` for the method.
+        """
+        n_configs, n_games = mana_matrix.shape
+        n_boot = boot_idx.shape[0]
+        cutoff = max(1, int(n_games * 0.25))
+        counts = self._bootstrap_counts(boot_idx, n_games)
+
+        # Two (n_boot, chunk, n_games) 8-byte working arrays plus headroom
+        per_config = 3 * 8 * n_boot * n_games
+        chunk = max(1, int(self.bootstrap_memory_mb * 2**20 // per_config))
+
+        tail_result = np.empty((n_configs, n_boot))
+        mean_result = np.empty((n_configs, n_boot))
+        b_idx = np.arange(n_boot)[:, np.newaxis]
+        for lo in range(0, n_configs, chunk):
+            block = mana_matrix[lo:lo + chunk]
+            c_idx = np.arange(len(block))[np.newaxis, :]
+            order = np.argsort(block, axis=1, kind="stable")
+            sorted_vals = np.take_along_axis(block, order, axis=1)  # (c, n_games)
+
+            # Running draw counts and running sums along each config's sorted games
+            cum_counts = counts[:, order]  # (n_boot, c, n_games)
+            cum_sums = cum_counts * sorted_vals[np.newaxis]
+            np.cumsum(cum_counts, axis=2, out=cum_counts)
+            np.cumsum(cum_sums, axis=2, out=cum_sums)
+
+            # First sorted position where the resample reaches `cutoff` draws
+            k = (cum_counts < cutoff).sum(axis=2)  # (n_boot, c)
+            prev = np.maximum(k - 1, 0)
+            has_prev = k > 0
+            prev_counts = np.where(has_prev, cum_counts[b_idx, c_idx, prev], 0)
+            prev_sums = np.where(has_prev, cum_sums[b_idx, c_idx, prev], 0.0)
+            del cum_counts, cum_sums
+            tail_sums = prev_sums + (cutoff - prev_counts) * sorted_vals[c_idx, k]
+
+            tail_result[lo:lo + chunk] = tail_sums.T / cutoff  # (c, n_boot)
+            mean_result[lo:lo + chunk] = (block @ counts.T) / n_games
+        return tail_result, mean_result
+
     # -- Scoring --
 
     def _compute_score(self, mana_values) -> float:
@@ -445,16 +1167,7 @@ class FastDeckOptimizer:
 
         Matches the computation in metrics.definitions.consistency().
         """
-        n = len(mana_values)
-        if n == 0:
-            return 1.0
-        sorted_vals = np.sort(mana_values)
-        cutoff = max(1, int(n * threshold))
-        tail_mean = float(sorted_vals[:cutoff].mean())
-        overall_mean = float(mana_values.mean())
-        if overall_mean == 0:
-            return 1.0
-        return tail_mean / overall_mean
+        return consistency_score(np.asarray(mana_values, dtype=float), threshold)
 
     def _extract_score_from_dict(self, result_dict: dict) -> float:
         """Extract score from a result_to_dict output."""
@@ -7,12 +7,17 @@ Produces:
   1. Marginal impact rankings per feature
   2. OLS/WLS regression with standardized beta coefficients
   3. Synthesized plain-English recommendations
+
+Configs are encoded straight into integer feature rows by a
+``FeatureEncoder`` that caches each config's row.  ``RegressionTracker``
+keeps the WLS normal equations up to date as scores arrive (one rank-one
+update per observation), so an optimizer can refit after every round.
 """
 
 from __future__ import annotations
 
 from collections import Counter, defaultdict
-from typing import Any, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -43,6 +48,60 @@ def extract_features(config: DeckConfig) -> dict[str, int]:
     return features
 
 
+class FeatureEncoder:
+    """Integer feature rows of DeckConfigs, with a cached config -> row index.
+
+    Columns are ``feature_names``, the sorted keys ``extract_features``
+    produces.  Each config is encoded once; its row stays in the encoder
+    under ``index[config]``.
+    """
+
+    def __init__(self) -> None:
+        enabled = {cid: c for cid, c in ALL_CANDIDATES.items() if c.default_enabled}
+        self.feature_names: list[str] = sorted(
+            ["land_delta"] + [f"count_{c.compact_label}" for c in enabled.values()]
+        )
+        self._land_col = self.feature_names.index("land_delta")
+        self._card_cols = {
+            cid: self.feature_names.index(f"count_{c.compact_label}")
+            for cid, c in enabled.items()
+        }
+        self.index: Dict[DeckConfig, int] = {}
+        # Encoded rows; capacity doubles as configs arrive
+        self._rows = np.zeros((64, len(self.feature_names)), dtype=np.int64)
+
+    def rows(self, configs: Iterable[DeckConfig]) -> np.ndarray:
+        """Row indices of *configs*, encoding the ones not seen yet."""
+        configs = list(configs)
+        new = [cfg for cfg in dict.fromkeys(configs) if cfg not in self.index]
+        if new:
+            block = np.zeros((len(new), len(self.feature_names)), dtype=np.int64)
+            block[:, self._land_col] = [cfg.land_delta for cfg in new]
+            hits = [
+                (i, self._card_cols[cid])
+                for i, cfg in enumerate(new)
+                for cid in cfg.added_cards if cid in self._card_cols
+            ]
+            if hits:
+                rows, cols = zip(*hits)
+                np.add.at(block, (np.array(rows), np.array(cols)), 1)
+            start = len(self.index)
+            if start + len(new) > len(self._rows):
+                grown = np.zeros((max(2 * len(self._rows), start + len(new)),
+                                  len(self.feature_names)), dtype=np.int64)
+                grown[:start] = self._rows[:start]
+                self._rows = grown
+            self._rows[start:start + len(new)] = block
+            self.index.update((cfg, start + i) for i, cfg in enumerate(new))
+        return np.fromiter((self.index[cfg] for cfg in configs), dtype=np.int64,
+                           count=len(configs))
+
+    def matrix(self, configs: Iterable[DeckConfig]) -> np.ndarray:
+        """(n_configs, n_features) int matrix of *configs*."""
+        rows = self.rows(configs)
+        return self._rows[rows]
+
+
 def configs_to_feature_matrix(
     configs: list[DeckConfig],
 ) -> tuple[np.ndarray, list[str], list[dict[str, int]]]:
@@ -50,13 +109,11 @@ def configs_to_feature_matrix(
 
     Returns (X, feature_names, raw_feature_dicts).
     """
-    feature_dicts = [extract_features(c) for c in configs]
-    feature_names = sorted(feature_dicts[0].keys())
-    X = np.array(
-        [[fd[name] for name in feature_names] for fd in feature_dicts],
-        dtype=float,
-    )
-    return X, feature_names, feature_dicts
+    encoder = FeatureEncoder()
+    X = encoder.matrix(configs)
+    feature_names = encoder.feature_names
+    feature_dicts = [dict(zip(feature_names, row)) for row in X.tolist()]
+    return X.astype(float), feature_names, feature_dicts
 
 
 # ── Aggregate Hyperband scores ─────────────────────────────────────────
@@ -171,10 +228,10 @@ def fit_ols(
     X: np.ndarray,
     y: np.ndarray,
     weights: np.ndarray | None = None,
-) -> tuple[np.ndarray, float, float]:
+) -> tuple[np.ndarray, float, float, np.ndarray]:
     """Fit (weighted) least squares regression: y = X @ beta + intercept.
 
-    Returns (coefficients, intercept, r_squared).
+    Returns (coefficients, intercept, r_squared, std_errors).
     """
     n = X.shape[0]
     X_with_intercept = np.column_stack([np.ones(n), X])
@@ -216,6 +273,111 @@ def fit_ols(
     return coefficients, intercept, r_squared, std_errors
 
 
+class IncrementalWLS:
+    """Weighted least squares kept as normal equations.
+
+    Holds ``X'WX``, ``X'Wy`` and ``y'Wy`` (with an intercept column), so
+    adding or removing one observation is a rank-one update and a refit
+    solves a (features + 1)-square system regardless of how many
+    observations there are.  ``fit`` matches ``fit_ols`` on the same data
+    up to rounding.
+    """
+
+    def __init__(self, n_features: int) -> None:
+        p = n_features + 1
+        self.xtx = np.zeros((p, p))
+        self.xty = np.zeros(p)
+        self.yty = 0.0
+        self.n = 0
+
+    def add(self, x: np.ndarray, y: float, weight: float = 1.0) -> None:
+        self._update(x, y, weight, 1)
+
+    def remove(self, x: np.ndarray, y: float, weight: float = 1.0) -> None:
+        """Take back an observation passed to ``add``."""
+        self._update(x, y, weight, -1)
+
+    def _update(self, x: np.ndarray, y: float, weight: float, sign: int) -> None:
+        xi = np.empty(len(self.xty))
+        xi[0] = 1.0
+        xi[1:] = x
+        w = sign * weight
+        self.xtx += w * np.outer(xi, xi)
+        self.xty += (w * y) * xi
+        self.yty += w * y * y
+        self.n += sign
+
+    def fit(self) -> tuple[np.ndarray, float, float, np.ndarray]:
+        """Returns (coefficients, intercept, r_squared, std_errors) like ``fit_ols``."""
+        # Minimum-norm solution, as lstsq gives for rank-deficient X
+        beta = np.linalg.lstsq(self.xtx, self.xty, rcond=None)[0]
+        ss_res = max(self.yty - 2 * beta @ self.xty + beta @ self.xtx @ beta, 0.0)
+        sum_w, sum_wy = self.xtx[0, 0], self.xty[0]
+        ss_tot = self.yty - sum_wy ** 2 / sum_w if sum_w > 0 else 0.0
+        r_squared = 1.0 - ss_res / ss_tot if ss_tot > 1e-12 * max(self.yty, 1.0) else 0.0
+
+        dof = max(self.n - len(beta), 1)
+        try:
+            cov = np.linalg.inv(self.xtx) * (ss_res / dof)
+            std_errors = np.sqrt(np.maximum(np.diag(cov)[1:], 0.0))
+        except np.linalg.LinAlgError:
+            std_errors = np.full(len(beta) - 1, np.inf)
+        return beta[1:], float(beta[0]), float(r_squared), std_errors
+
+
+class RegressionTracker:
+    """WLS model of ``(config, score, n_sims)`` observations, refit incrementally.
+
+    Observations are aggregated per config as in
+    ``aggregate_hyperband_scores`` (sim-weighted mean score, weight
+    ``sqrt(total sims)``).  A new observation swaps its config's row in
+    the normal equations (a rank-one downdate and update), so ``fit``
+    after every Hyperband rung costs a small solve instead of a refit over
+    all data.
+
+    ``DeckOptimizer`` feeds it while Hyperband runs and predicts its
+    regression picks from it.  Racing (``FastDeckOptimizer``) does not:
+    it scores every config directly on the shared games and never picks
+    configs by regression, so its single end-of-race analysis fits
+    ``all_round_scores`` once.
+    """
+
+    def __init__(self, encoder: Optional[FeatureEncoder] = None) -> None:
+        self.encoder = encoder or FeatureEncoder()
+        self.wls = IncrementalWLS(len(self.encoder.feature_names))
+        # Per config: (sum of score * n_sims, total sims)
+        self._totals: Dict[DeckConfig, Tuple[float, int]] = {}
+
+    @property
+    def feature_names(self) -> list[str]:
+        return self.encoder.feature_names
+
+    @property
+    def n_configs(self) -> int:
+        return len(self._totals)
+
+    def observe(self, config: DeckConfig, score: float, n_sims: int) -> None:
+        x = self.encoder.matrix([config])[0]
+        total, sims = self._totals.get(config, (0.0, 0))
+        if sims:
+            self.wls.remove(x, total / sims, np.sqrt(sims))
+        total, sims = total + score * n_sims, sims + n_sims
+        self._totals[config] = (total, sims)
+        self.wls.add(x, total / sims, np.sqrt(sims))
+
+    def observe_many(self, round_scores: Iterable[Tuple[DeckConfig, float, int]]) -> None:
+        for config, score, n_sims in round_scores:
+            self.observe(config, score, n_sims)
+
+    def fit(self) -> tuple[np.ndarray, float, float, np.ndarray]:
+        """Current (coefficients, intercept, r_squared, std_errors)."""
+        return self.wls.fit()
+
+    def predict(self, configs: Iterable[DeckConfig]) -> np.ndarray:
+        coeffs, intercept, _, _ = self.fit()
+        return self.encoder.matrix(configs) @ coeffs + intercept
+
+
 def regression_analysis(
     X: np.ndarray,
     scores: np.ndarray,
@@ -483,6 +645,7 @@ def predict_top_configs(
     all_round_scores: List[Tuple[DeckConfig, float, int]],
     all_configs: List[DeckConfig],
     top_k: int = 5,
+    tracker: Optional[RegressionTracker] = None,
 ) -> tuple[List[DeckConfig], dict[str, Any]]:
     """Use regression on Hyperband data to predict the best configs.
 
@@ -494,6 +657,9 @@ def predict_top_configs(
         all_round_scores: List of (config, score, n_sims) from Hyperband.
         all_configs: Full list of enumerated configs to predict over.
         top_k: Number of top configs to return.
+        tracker: A ``RegressionTracker`` that already observed
+            *all_round_scores* (e.g. fed while Hyperband ran); built from
+            them when omitted.
 
     Returns:
         (top_configs, regression_info) where regression_info contains
@@ -502,19 +668,13 @@ def predict_top_configs(
     if len(all_round_scores) < 3:
         return all_configs[:top_k], {}
 
-    configs, scores, weights = aggregate_hyperband_scores(all_round_scores)
-    X_train, feature_names, _ = configs_to_feature_matrix(configs)
-
-    # Fit WLS on Hyperband data
-    coeffs, intercept, r_sq, _std_errors = fit_ols(X_train, scores, weights)
+    if tracker is None:
+        tracker = RegressionTracker()
+        tracker.observe_many(all_round_scores)
 
-    # Predict scores for ALL configs
-    all_feature_dicts = [extract_features(c) for c in all_configs]
-    X_all = np.array(
-        [[fd[name] for name in feature_names] for fd in all_feature_dicts],
-        dtype=float,
-    )
-    predicted = X_all @ coeffs + intercept
+    # Fit WLS on Hyperband data and predict scores for ALL configs
+    coeffs, intercept, r_sq, _std_errors = tracker.fit()
+    predicted = tracker.encoder.matrix(all_configs) @ coeffs + intercept
 
     # Select top-k by predicted score
     top_indices = np.argsort(predicted)[::-1][:top_k]
@@ -523,7 +683,7 @@ def predict_top_configs(
     reg_info = {
         "coefficients": coeffs,
         "intercept": intercept,
-        "feature_names": feature_names,
+        "feature_names": tracker.feature_names,
         "r_squared": r_sq,
     }
 
@@ -0,0 +1,157 @@
+"""Budgeted CRN local search over a lazy config space.
+
+Racing simulates every enumerated config, which stops scaling once custom
+candidates and larger ``max_draw``/``max_ramp`` blow up the cross
+product.  ``LocalSearch`` instead walks ``ConfigSpace.neighbors`` from
+the baseline and a few random starts:
+
+1. Every config is scored on the first ``level`` games of the shared
+   seed stream (CRN), so scores at one level are paired comparisons.
+2. Each step evaluates the unvisited neighbors of the ``beam_width``
+   best configs at the current level.
+3. When a step finds nothing better (or the beam has no unvisited
+   neighbors), the level doubles and only the leading configs are
+   extended -- the rest are rejected, as in successive rejects.
+
+The search stops when the game budget is spent, the beam is a local
+optimum at ``max_games``, or ``should_stop`` says so.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from auto_goldfish.optimization.deck_config import ConfigSpace, DeckConfig
+from auto_goldfish.optimization.samples import SampleStore
+
+VALID_SEARCH_STRATEGIES = ("racing", "local", "auto")
+
+
+class LocalSearch:
+    """Beam local search with doubling fidelity on a CRN ``SampleStore``.
+
+    Args:
+        store: Sample store shared with the final evaluation.
+        space: Config space to search.
+        optimize_for: Target metric (see ``samples.score_sample``).
+        budget: Games the search may play.  A step never starts a level
+            it cannot afford, so the total overshoots by at most one
+            evaluation.
+        batch_size: Games per config at the first level.
+        max_games: Highest level (games per config).
+        beam_width: Configs whose neighborhoods are expanded each step.
+        n_starts: Random configs evaluated alongside the baseline.
+        seed: Seed for the random starts.
+        score: Optional ``score(config, n_games)`` used to rank configs
+            instead of ``store.score`` for *optimize_for* (e.g. a
+            lower-variance proxy of the target).
+        should_stop: Optional callable checked before every step; the
+            search returns its current leaders once it returns ``True``.
+
+    Attributes:
+        games_played: Games the search has charged to its budget (see
+            ``SampleStore.games_requested``; cached games count too).
+        level: Games per config behind the current scores.
+    """
+
+    def __init__(
+        self,
+        store: SampleStore,
+        space: ConfigSpace,
+        optimize_for: str,
+        budget: int,
+        batch_size: int = 50,
+        max_games: int = 500,
+        beam_width: int = 3,
+        n_starts: int = 4,
+        seed: Optional[int] = None,
+        score: Optional[Callable[[DeckConfig, int], float]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        self.store = store
+        self.space = space
+        self.optimize_for = optimize_for
+        self.budget = budget
+        self.batch_size = batch_size
+        self.max_games = max(max_games, batch_size)
+        self.beam_width = beam_width
+        self.n_starts = n_starts
+        self.rng = random.Random(seed)
+        self.score = score or (lambda cfg, n: store.score(cfg, n, optimize_for))
+        self.should_stop = should_stop or (lambda: False)
+
+        self.games_played = 0
+        self.level = batch_size
+        # (config, score, n_games) for every evaluation, like racing's
+        # all_round_scores.
+        self.round_scores: List[Tuple[DeckConfig, float, int]] = []
+        self._scores: Dict[DeckConfig, float] = {}
+        self._visited: set[DeckConfig] = set()
+
+    def run(
+        self,
+        top_k: int,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[DeckConfig]:
+        """Search and return the *top_k* configs at the highest level reached."""
+        level = self.level = self.batch_size
+        starts = [DeckConfig()]
+        for _ in range(self.n_starts):
+            starts.append(self.space.random_config(self.rng))
+        self._evaluate([c for c in dict.fromkeys(starts) if c in self.space], level)
+
+        while self.games_played < self.budget and not self.should_stop():
+            beam = self._ranked()[:self.beam_width]
+            frontier = [
+                n for cfg in beam for n in self.space.neighbors(cfg) if n not in self._visited
+            ]
+            frontier = list(dict.fromkeys(frontier))
+            if frontier:
+                affordable = max(1, (self.budget - self.games_played) // level)
+                self._evaluate(frontier[:affordable], level)
+                if self._ranked()[:self.beam_width] != beam:
+                    self._report(progress)
+                    continue
+
+            if level >= self.max_games:
+                if not frontier:
+                    break
+                continue
+            # No improvement at this level: double it for the leaders only
+            next_level = min(level * 2, self.max_games)
+            leaders = self._ranked()[:max(self.beam_width, top_k) * 2]
+            cost = sum(max(0, next_level - self.store.requested(c)) for c in leaders)
+            if self.games_played + cost > self.budget:
+                break
+            level = self.level = next_level
+            for cfg in self._scores:
+                if cfg not in leaders and cfg != DeckConfig():
+                    self.store.discard(cfg)
+            self._scores = {}
+            self._evaluate(leaders, level)
+            self._report(progress)
+
+        self._report(progress, done=True)
+        return self._ranked()[:top_k]
+
+    def leaders(self, n: int) -> List[DeckConfig]:
+        """The *n* best configs at the current level."""
+        return self._ranked()[:n]
+
+    def _ranked(self) -> List[DeckConfig]:
+        return sorted(self._scores, key=lambda c: self._scores[c], reverse=True)
+
+    def _evaluate(self, configs: List[DeckConfig], level: int) -> None:
+        before = self.store.games_requested
+        self.store.extend(configs, level)
+        self.games_played += self.store.games_requested - before
+        for cfg in configs:
+            score = self.score(cfg, level)
+            self._scores[cfg] = score
+            self._visited.add(cfg)
+            self.round_scores.append((cfg, score, level))
+
+    def _report(self, progress, done: bool = False) -> None:
+        if progress is not None:
+            progress(self.games_played, self.games_played if done else self.budget)
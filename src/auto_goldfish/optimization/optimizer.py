@@ -14,8 +14,25 @@ import math
 import random
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from auto_goldfish.engine.cancellation import CancelToken
+from auto_goldfish.engine.goldfisher import GameSample
+from auto_goldfish.optimization.anytime import (
+    LEADERBOARD_SIZE,
+    AnytimeControl,
+    LeaderboardCallback,
+    leaderboard_entries,
+)
 from auto_goldfish.optimization.candidate_cards import CandidateCard
-from auto_goldfish.optimization.deck_config import DeckConfig, apply_config, enumerate_configs
+from auto_goldfish.optimization.checkpoint import (
+    DEFAULT_INTERVAL_S,
+    Checkpointer,
+    CheckpointStore,
+    run_key,
+)
+from auto_goldfish.optimization.deck_config import DeckConfig, enumerate_configs
+from auto_goldfish.optimization.feature_analysis import RegressionTracker
+from auto_goldfish.optimization.sample_cache import SampleCache
+from auto_goldfish.optimization.samples import SampleStore, objective_values, score_sample
 
 
 class DeckOptimizer:
@@ -56,6 +73,31 @@ class DeckOptimizer:
             final evaluation. If None, uses final_top_k from run().
             Over-selecting (e.g. 10-15) and re-ranking with final_sims
             can improve quality at modest extra cost.
+        workers: Processes used to play games.  Results do not depend on
+            the worker count.
+        cache: Optional ``SampleCache`` shared across runs; configs whose
+            games are cached are only extended.  Metrics of the last run
+            are left in ``cache_stats``.
+        time_budget_s: Wall-clock budget of the Hyperband phase (anytime
+            mode).  Hyperband stops after the round that crosses it and
+            keeps the survivors found so far; ``stop_reason`` records it.
+        max_games: Game budget of the Hyperband phase (anytime mode).
+        checkpoint: Optional ``CheckpointStore``.  ``run()`` saves its
+            games every ``checkpoint_interval_s`` seconds, before the final
+            evaluation and when interrupted, and resumes an earlier run
+            with the same deck, seed and settings by replaying Hyperband
+            over them (see ``checkpoint``).  ``resumed_from`` holds the
+            state it resumed from.
+        checkpoint_interval_s: Minimum seconds between checkpoints.
+        cancel: Optional ``CancelToken``.  ``run()`` raises
+            ``SimulationCancelled`` within one game (or one poll of the
+            worker pool, whose processes are terminated) of it being
+            cancelled, saving a checkpoint first when checkpointing.
+
+    Every config is played on the same seed stream (game ``j`` uses
+    ``goldfisher.seed + j``, or a random base seed when that is ``None``)
+    and its games are kept, so later rounds, brackets and the final
+    evaluation only play the games a config is still missing.
     """
 
     def __init__(
@@ -73,6 +115,13 @@ class DeckOptimizer:
         eta: int = 3,
         hyperband_min_sims: int = 20,
         hyperband_top_k: Optional[int] = None,
+        workers: int = 1,
+        cache: Optional[SampleCache] = None,
+        time_budget_s: Optional[float] = None,
+        max_games: Optional[int] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_interval_s: float = DEFAULT_INTERVAL_S,
+        cancel: Optional[CancelToken] = None,
     ) -> None:
         self.goldfisher = goldfisher
         self.candidates = candidates
@@ -87,10 +136,27 @@ class DeckOptimizer:
         self.ETA = eta
         self.HYPERBAND_MIN_SIMS = hyperband_min_sims
         self.hyperband_top_k = hyperband_top_k
+        self.workers = workers
+        self.cache = cache
+        self.cache_stats: Optional[Dict[str, Any]] = None
+        self._samples: Optional[SampleStore] = None
+        self.time_budget_s = time_budget_s
+        self.max_games = max_games
+        self.stop_reason: Optional[str] = None
+        self._anytime = AnytimeControl()
+        self.checkpoint = checkpoint
+        self.checkpoint_interval_s = checkpoint_interval_s
+        self.resumed_from: Optional[Dict[str, Any]] = None
+        self._checkpoints = Checkpointer()
+        self.cancel = cancel
+        # Best-fidelity (score, n_sims) per config, for interim leaderboards
+        self._board: Dict[DeckConfig, Tuple[float, int]] = {}
 
         # Populated during run(): every (config, score, n_sims) from all
         # Hyperband rounds across all brackets.
         self.all_round_scores: List[Tuple[DeckConfig, float, int]] = []
+        # WLS model of all_round_scores, updated as each rung is scored
+        self.regression = RegressionTracker()
 
     def run(
         self,
@@ -99,6 +165,8 @@ class DeckOptimizer:
         include_hyperband: bool = False,
         enum_progress: Optional[Callable[[int, int], None]] = None,
         eval_progress: Optional[Callable[[int, int], None]] = None,
+        leaderboard: Optional[LeaderboardCallback] = None,
+        leaderboard_interval_s: float = 1.0,
     ) -> List[Tuple[DeckConfig, Any]]:
         """Run optimization and return ranked (config, result_dict) pairs.
 
@@ -108,9 +176,10 @@ class DeckOptimizer:
         Phase 2 (Regression selection): Fit a WLS regression model on
         Hyperband data and predict the best configs from the full space.
 
-        Phase 3 (Final evaluation): Run full simulations on the combined
-        pool of regression-predicted configs, top hyperband survivors, and
-        the no-changes baseline. Returns the top ``final_top_k`` results.
+        Phase 3 (Final evaluation): Extend the games of the combined pool
+        of regression-predicted configs, top hyperband survivors, and the
+        no-changes baseline to ``final_sims`` and report full results.
+        Returns the top ``final_top_k`` results.
 
         The first result dict includes a ``feature_analysis`` key with
         recommendations, marginal impact, and regression details.
@@ -121,6 +190,10 @@ class DeckOptimizer:
             enum_progress: Optional callable(current, total) for enumeration.
                 Current/total are measured in total simulations run.
             eval_progress: Optional callable(current, total) for evaluation.
+            leaderboard: Optional callable(board) receiving interim
+                Hyperband leaderboards (see ``anytime``); returning
+                ``True`` stops Hyperband after the current round.
+            leaderboard_interval_s: Minimum seconds between leaderboards.
 
         Returns:
             List of (DeckConfig, result_dict) sorted best-first.
@@ -134,74 +207,90 @@ class DeckOptimizer:
             land_delta_max=self.land_delta_max,
         )
 
-        original_sims = self.goldfisher.sims
-
-        # Phase 1: Hyperband exploration (collects all_round_scores)
-        self.all_round_scores = []
-        hb_top_k = self.hyperband_top_k if self.hyperband_top_k is not None else final_top_k
-        hyperband_survivors = self._hyperband_select(configs, hb_top_k, enum_progress)
-
-        # Phase 2: Use regression to pick the best configs from the
-        # full config space, based on Hyperband round data
-        from auto_goldfish.optimization.feature_analysis import (
-            analyze_optimization,
-            predict_top_configs,
+        self._samples = SampleStore(
+            self.goldfisher, self.candidates, self.swap_mode,
+            workers=self.workers, cache=self.cache,
+            snapshots=self.checkpoint is not None, cancel=self.cancel,
         )
-
-        regression_configs, _ = predict_top_configs(
-            self.all_round_scores, configs, top_k=final_top_k,
-        )
-
-        # Run feature analysis for UI display
-        self.feature_analysis = analyze_optimization(
-            self.all_round_scores, self.optimize_for,
+        self._checkpoints = Checkpointer(
+            self.checkpoint,
+            run_key(self.goldfisher, self._run_settings(final_sims, final_top_k, include_hyperband))
+            if self.checkpoint is not None else "",
+            self.checkpoint_interval_s,
         )
-
-        # Build combined evaluation pool:
-        # - regression-predicted configs (tagged "regression")
-        # - top 4 hyperband survivors (tagged "hyperband") — only if include_hyperband
-        # - no-changes baseline (tagged "baseline")
-        # Source tags are only set when include_hyperband is True.
-        baseline = DeckConfig()
-        eval_pool: list[tuple[DeckConfig, str | None]] = []
-        seen: set[DeckConfig] = set()
-
-        tag_regression = "regression" if include_hyperband else None
-        tag_hyperband = "hyperband" if include_hyperband else None
-        tag_baseline = "baseline" if include_hyperband else None
-
-        for cfg in regression_configs:
-            if cfg not in seen:
-                eval_pool.append((cfg, tag_regression))
-                seen.add(cfg)
-
-        if include_hyperband:
-            for cfg in hyperband_survivors[:4]:
+        self.resumed_from = self._checkpoints.resume(self._samples)
+        completed = False
+        try:
+            # Phase 1: Hyperband exploration (collects all_round_scores)
+            self.all_round_scores = []
+            self.regression = RegressionTracker()
+            self._board = {}
+            self._anytime = AnytimeControl(
+                self.time_budget_s, self.max_games, leaderboard, leaderboard_interval_s,
+                resumed_s=self.resumed_from["elapsed_s"] if self.resumed_from else 0.0,
+            )
+            hb_top_k = self.hyperband_top_k if self.hyperband_top_k is not None else final_top_k
+            hyperband_survivors = self._hyperband_select(configs, hb_top_k, enum_progress)
+
+            # Phase 2: Use regression to pick the best configs from the
+            # full config space, based on Hyperband round data
+            from auto_goldfish.optimization.feature_analysis import (
+                analyze_optimization,
+                predict_top_configs,
+            )
+
+            regression_configs, _ = predict_top_configs(
+                self.all_round_scores, configs, top_k=final_top_k,
+                tracker=self.regression,
+            )
+
+            # Run feature analysis for UI display
+            self.feature_analysis = analyze_optimization(
+                self.all_round_scores, self.optimize_for,
+            )
+
+            # Build combined evaluation pool:
+            # - regression-predicted configs (tagged "regression")
+            # - top 4 hyperband survivors (tagged "hyperband") — only if include_hyperband
+            # - no-changes baseline (tagged "baseline")
+            # Source tags are only set when include_hyperband is True.
+            baseline = DeckConfig()
+            eval_pool: list[tuple[DeckConfig, str | None]] = []
+            seen: set[DeckConfig] = set()
+
+            tag_regression = "regression" if include_hyperband else None
+            tag_hyperband = "hyperband" if include_hyperband else None
+            tag_baseline = "baseline" if include_hyperband else None
+
+            for cfg in regression_configs:
                 if cfg not in seen:
-                    eval_pool.append((cfg, tag_hyperband))
+                    eval_pool.append((cfg, tag_regression))
                     seen.add(cfg)
 
-        if baseline not in seen:
-            eval_pool.append((baseline, tag_baseline))
-            seen.add(baseline)
-
-        # Phase 3: Full evaluation of combined pool
-        self.goldfisher.sims = final_sims
-        from auto_goldfish.metrics.reporter import result_to_dict
-
-        results: list[tuple[DeckConfig, Any]] = []
-        for j, (config, source) in enumerate(eval_pool):
-            apply_config(self.goldfisher, config, self.candidates, self.swap_mode)
-            result = self.goldfisher.simulate()
-            result_dict = result_to_dict(result)
-            if source is not None:
-                result_dict["opt_source"] = source
-            results.append((config, result_dict))
-
-            if eval_progress is not None:
-                eval_progress(j + 1, len(eval_pool))
-
-        self.goldfisher.sims = original_sims
+            if include_hyperband:
+                for cfg in hyperband_survivors[:4]:
+                    if cfg not in seen:
+                        eval_pool.append((cfg, tag_hyperband))
+                        seen.add(cfg)
+
+            if baseline not in seen:
+                eval_pool.append((baseline, tag_baseline))
+                seen.add(baseline)
+
+            # Phase 3: Full evaluation of combined pool
+            self._checkpoints.save(self._samples, self._anytime, "final", pool=len(eval_pool))
+            results = self._final_evaluation(eval_pool, final_sims, eval_progress)
+            completed = True
+        finally:
+            if completed:
+                self._checkpoints.finish()
+            else:
+                self._checkpoints.save(self._samples, self._anytime)
+            self._samples.close()
+            self.cache_stats = self._samples.cache_stats()
+            self.stop_reason = self._anytime.stop_reason
+            self._samples = None
+            self.goldfisher.restore_original_decklist()
 
         # Sort final results by target metric
         results.sort(key=lambda r: self._extract_score_from_dict(r[1]), reverse=True)
@@ -275,6 +364,8 @@ class DeckOptimizer:
         all_survivors: dict[DeckConfig, tuple[float, int]] = {}
 
         for s_idx, bracket_plan in enumerate(brackets):
+            if self._anytime.exhausted():
+                break
             s = s_max - s_idx
 
             # Most aggressive bracket uses all configs;
@@ -288,7 +379,7 @@ class DeckOptimizer:
                 )
                 bracket_configs = rng.sample(configs, bracket_n)
 
-            survivors = self._successive_halving(bracket_configs, bracket_plan, report)
+            survivors = self._successive_halving(bracket_configs, bracket_plan, report, s_idx)
 
             # Record survivors with their final-round sim count
             r_final = bracket_plan[-1][1]
@@ -301,6 +392,7 @@ class DeckOptimizer:
                     all_survivors[cfg] = (score, r_final)
 
         self.goldfisher.sims = original_sims
+        self._anytime.emit("hyperband", self._leaderboard_entries)
 
         # Rank by (sims_used desc, score desc) to prefer high-confidence estimates
         ranked = sorted(
@@ -351,6 +443,7 @@ class DeckOptimizer:
         configs: list[DeckConfig],
         plan: list[tuple[int, int]],
         report: Callable[[int], None],
+        bracket: int = 0,
     ) -> list[tuple[DeckConfig, float]]:
         """Run one bracket of successive halving.
 
@@ -358,55 +451,127 @@ class DeckOptimizer:
             configs: Starting configurations for this bracket.
             plan: List of (expected_n, sims_per_config) per round.
             report: Callback to report sims completed for progress tracking.
+            bracket: Index of the bracket (recorded in checkpoints).
 
         Returns:
             List of (config, score) for the final survivors.
         """
         eta = self.ETA
+        anytime = self._anytime
         current = list(configs)
 
         for round_idx, (_expected_n, r_i) in enumerate(plan):
             self.goldfisher.sims = r_i
+            requested = self._samples.games_requested
+            self._samples.extend(current, r_i)
+            anytime.spend(self._samples.games_requested - requested)
 
             scored: list[tuple[DeckConfig, float]] = []
             for config in current:
                 score = self._evaluate(config)
                 scored.append((config, score))
                 self.all_round_scores.append((config, score, r_i))
+                self.regression.observe(config, score, r_i)
+                if r_i >= self._board.get(config, (0.0, 0))[1]:
+                    self._board[config] = (score, r_i)
                 report(r_i)
 
             scored.sort(key=lambda x: x[1], reverse=True)
+            if anytime.due():
+                anytime.emit("hyperband", self._leaderboard_entries)
+            self._checkpoints.maybe_save(self._samples, anytime, "hyperband", bracket=bracket,
+                                         round=round_idx + 1, active=len(current))
 
             # Keep top 1/eta fraction for next round (or as final survivors)
             keep = max(int(len(scored) / eta), 1)
-            if round_idx < len(plan) - 1:
+            if round_idx < len(plan) - 1 and not anytime.exhausted():
                 current = [cfg for cfg, _ in scored[:keep]]
             else:
                 scored = scored[:keep]
+                break
 
         return scored
 
+    def _leaderboard_entries(self) -> List[dict]:
+        """Interim leaderboard: best-fidelity score of every config seen so far."""
+        best = sorted(self._board.items(), key=lambda kv: kv[1][0], reverse=True)
+        return leaderboard_entries(
+            [
+                (cfg, objective_values(
+                    self.goldfisher, self._samples.sample(cfg).head(n), self.optimize_for,
+                ))
+                for cfg, (_, n) in best[:LEADERBOARD_SIZE]
+            ],
+            self.optimize_for,
+        )
+
+    def _run_settings(
+        self, final_sims: int, final_top_k: int, include_hyperband: bool,
+    ) -> Dict[str, Any]:
+        """Everything besides the deck and seed that a run's decisions depend on."""
+        return {
+            "optimizer": "hyperband",
+            "candidates": {cid: repr(c) for cid, c in sorted(self.candidates.items())},
+            "swap_mode": self.swap_mode,
+            "max_draw": self.max_draw,
+            "max_ramp": self.max_ramp,
+            "land_range": self.land_range,
+            "land_delta_min": self.land_delta_min,
+            "land_delta_max": self.land_delta_max,
+            "optimize_for": self.optimize_for,
+            "hyperband_max_sims": self.hyperband_max_sims,
+            "eta": self.ETA,
+            "hyperband_min_sims": self.HYPERBAND_MIN_SIMS,
+            "hyperband_top_k": self.hyperband_top_k,
+            "time_budget_s": self.time_budget_s,
+            "max_games": self.max_games,
+            "final_sims": final_sims,
+            "final_top_k": final_top_k,
+            "include_hyperband": include_hyperband,
+        }
+
     # -- Scoring --
 
+    def _final_evaluation(
+        self,
+        eval_pool: List[Tuple[DeckConfig, Optional[str]]],
+        final_sims: int,
+        progress: Optional[Callable[[int, int], None]],
+    ) -> List[Tuple[DeckConfig, dict]]:
+        """Result dicts for *eval_pool* at *final_sims* games, reusing Hyperband games."""
+        from auto_goldfish.metrics.reporter import result_to_dict
+
+        self._samples.extend([cfg for cfg, _ in eval_pool], final_sims, capture_replays=True)
+        results: List[Tuple[DeckConfig, dict]] = []
+        for j, (config, source) in enumerate(eval_pool):
+            result_dict = result_to_dict(self._samples.result(config, final_sims))
+            if source is not None:
+                result_dict["opt_source"] = source
+            results.append((config, result_dict))
+
+            if progress is not None:
+                progress(j + 1, len(eval_pool))
+        return results
+
     def _evaluate(self, config: DeckConfig) -> float:
-        """Run a quick simulation and return the target metric score."""
-        apply_config(self.goldfisher, config, self.candidates, self.swap_mode)
-        result = self.goldfisher.simulate()
-        return self._extract_score(result)
+        """Score *config* on the first ``goldfisher.sims`` games of the seed stream.
+
+        Only the target metric is computed from the per-game sample; no
+        full ``SimulationResult`` is built.
+        """
+        n_games = self.goldfisher.sims
+        self._samples.extend([config], n_games)
+        return self._samples.score(config, n_games, self.optimize_for)
 
     def _extract_score(self, result) -> float:
-        """Extract the optimization target from a SimulationResult."""
-        if self.optimize_for == "floor_performance":
-            return result.threshold_mana
-        if self.optimize_for == "consistency":
-            return result.consistency
-        if self.optimize_for == "mean_mana_value":
-            return result.mean_mana_value
-        if self.optimize_for == "mean_mana_total":
-            return result.mean_mana_total
-        if self.optimize_for == "mean_spells_cast":
-            return result.mean_spells_cast
-        return result.mean_mana
+        """The optimization target of a ``SimulationResult`` or ``GameSample``.
+
+        Samples are scored with ``score_sample``; results read the
+        matching field, as before samples were introduced.
+        """
+        if isinstance(result, GameSample):
+            return score_sample(self.goldfisher, result, self.optimize_for)
+        return self._extract_score_from_dict(vars(result))
 
     def _extract_score_from_dict(self, result_dict: dict) -> float:
         """Extract score from a result_to_dict output."""
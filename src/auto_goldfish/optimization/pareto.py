@@ -0,0 +1,113 @@
+"""Pareto dominance helpers for multi-objective racing.
+
+All scores are maximized.  ``scores`` arrays are (n_configs, n_objectives)
+point estimates; bootstrap arrays are (n_objectives, n_configs, n_boot)
+statistics of resamples shared by every config, so differences between
+two rows are paired (CRN) comparisons.
+
+Racing drops a config only when some other config beats it with
+confidence on *every* objective.  That is an intersection-union test:
+each objective is tested one-sided at the racing confidence and no
+multiplicity correction is needed, because the elimination requires all
+of them to reject.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+def dominates(a: np.ndarray, b: np.ndarray) -> bool:
+    """True when *a* is at least as good as *b* everywhere and better somewhere."""
+    return bool(np.all(a >= b) and np.any(a > b))
+
+
+def pareto_ranks(scores: np.ndarray) -> np.ndarray:
+    """Non-dominated sorting layer of every row (0 is the Pareto front)."""
+    n = len(scores)
+    # better[i, j]: row i dominates row j
+    ge = np.all(scores[:, np.newaxis, :] >= scores[np.newaxis, :, :], axis=2)
+    gt = np.any(scores[:, np.newaxis, :] > scores[np.newaxis, :, :], axis=2)
+    better = ge & gt
+    n_dominators = better.sum(axis=0)
+    ranks = np.full(n, -1, dtype=int)
+    layer = 0
+    current = np.flatnonzero(n_dominators == 0)
+    while len(current):
+        ranks[current] = layer
+        n_dominators = n_dominators - better[current].sum(axis=0)
+        n_dominators[ranks >= 0] = -1
+        current = np.flatnonzero(n_dominators == 0)
+        layer += 1
+    return ranks
+
+
+def pareto_front(scores: np.ndarray) -> np.ndarray:
+    """Boolean mask of the rows no other row dominates."""
+    return pareto_ranks(scores) == 0
+
+
+def crowding_distance(scores: np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance of each row within *scores*.
+
+    Boundary rows of every objective get ``inf`` so the extremes of a
+    front are always kept when it is thinned.
+    """
+    n, n_obj = scores.shape
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+    for k in range(n_obj):
+        order = np.argsort(scores[:, k], kind="stable")
+        column = scores[order, k]
+        span = column[-1] - column[0]
+        distance[order[0]] = distance[order[-1]] = np.inf
+        if span > 0:
+            distance[order[1:-1]] += (column[2:] - column[:-2]) / span
+    return distance
+
+
+def select(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of *k* rows by Pareto layer, then crowding distance (NSGA-II)."""
+    ranks = pareto_ranks(scores)
+    crowding = np.zeros(len(scores))
+    for layer in np.unique(ranks):
+        rows = np.flatnonzero(ranks == layer)
+        crowding[rows] = crowding_distance(scores[rows])
+    order = np.lexsort((-crowding, ranks))
+    return order[:k]
+
+
+def confidently_dominated(
+    boot: np.ndarray, refs: np.ndarray, confidence: float,
+) -> np.ndarray:
+    """Rows that some row in *refs* beats with confidence on every objective.
+
+    Row ``i`` is dominated by ``r`` when the ``confidence`` percentile of
+    the paired bootstrap differences ``boot[k, i] - boot[k, r]`` is below
+    zero for every objective ``k``.
+    """
+    n_obj, n_rows, _ = boot.shape
+    pct = 100 * confidence
+    dominated = np.zeros(n_rows, dtype=bool)
+    for r in refs:
+        worse = np.ones(n_rows, dtype=bool)
+        for k in range(n_obj):
+            upper = np.percentile(boot[k] - boot[k, r], pct, axis=1)
+            worse &= upper < 0
+        worse[r] = False
+        dominated |= worse
+    return dominated
+
+
+def paired_ci(
+    boot_a: np.ndarray, boot_b: np.ndarray, confidence: float,
+) -> Tuple[float, float]:
+    """Two-sided percentile interval of ``a - b`` from paired resamples."""
+    diffs = boot_a - boot_b
+    tail = 100 * (1 - confidence) / 2
+    lo, hi = np.percentile(diffs, [tail, 100 - tail])
+    return float(lo), float(hi)
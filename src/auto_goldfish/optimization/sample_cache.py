@@ -0,0 +1,220 @@
+"""Persistent, content-addressed cache of CRN game samples.
+
+Re-running an optimization with the same deck, effect overrides,
+candidates, engine settings and seed replays exactly the same games, so
+``SampleStore`` looks each config up here before playing and only plays
+the games the cache is missing.  Extended samples are written back when a
+config is discarded or the store closes.
+
+``sample_key`` hashes the compiled deck variant (card dicts plus the
+registry effects of every card in it), the engine settings and the base
+seed.  An entry holds the first ``n`` games of that seed stream, so a
+cached prefix serves any shorter request and seeds a longer one.
+
+Bump ``CACHE_VERSION`` whenever the engine's game outcomes change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Callable, ContextManager, Dict, Optional
+
+import numpy as np
+
+from auto_goldfish.blob_store import DbBlobStore, DiskBlobStore
+from auto_goldfish.engine.goldfisher import GameSample
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("auto_goldfish")
+    except Exception:
+        return "unknown"
+
+
+def _describe(obj: Any) -> str:
+    """Stable description of a strategy object (class plus attributes)."""
+    cls = type(obj)
+    attrs = sorted(vars(obj).items()) if hasattr(obj, "__dict__") else []
+    return f"{cls.__module__}.{cls.__qualname__}{attrs!r}"
+
+
+def sample_key(goldfisher, base_seed: int) -> str:
+    """Content hash of the deck loaded in *goldfisher*, its settings and *base_seed*.
+
+    Effects are hashed through their ``repr``; the built-in effects are
+    dataclasses, so equal effects hash equally and anything without a
+    stable ``repr`` simply never hits.
+    """
+    registry = goldfisher.registry
+    names = sorted({c.name for c in goldfisher.commanders + goldfisher.decklist})
+    payload = {
+        "version": CACHE_VERSION,
+        "package": _package_version(),
+        "deck": goldfisher._get_deck_dicts(),
+        "effects": {name: repr(registry.get(name)) for name in names},
+        "turns": goldfisher.turns,
+        "mana_mode": goldfisher.mana_mode,
+        "settings": goldfisher._get_worker_config(),
+        "mulligan": _describe(goldfisher.mulligan_strategy),
+        "seed": base_seed,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def encode_sample(sample: GameSample) -> bytes:
+    """Compressed ``.npz`` bytes of *sample* (drawn flags are bit-packed)."""
+    buf = io.BytesIO()
+    np.savez_compressed(
+        buf,
+        stats=sample.stats,
+        drawn=np.packbits(sample.drawn, axis=1),
+        width=np.array(sample.drawn.shape[1]),
+        replays=np.array(json.dumps(sample.replays)),
+    )
+    return buf.getvalue()
+
+
+def decode_sample(data: bytes) -> GameSample:
+    with np.load(io.BytesIO(data)) as z:
+        width = int(z["width"])
+        drawn = np.unpackbits(z["drawn"], axis=1, count=width).astype(bool)
+        replays = [(row, tuple(r)) for row, r in json.loads(str(z["replays"]))]
+        return GameSample(z["stats"], drawn, replays)
+
+
+class SampleCache(ABC):
+    """LRU-capped sample cache with hit/miss metrics.
+
+    Backends implement ``_read`` (returning ``None`` on a miss and marking
+    the entry as recently used), ``_write`` and ``_evict``.  Backend errors
+    are logged and treated as misses, so a broken cache never fails a run.
+
+    Args:
+        max_bytes: Size cap; least recently used entries are evicted
+            once the cache grows past it.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.games_loaded = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[GameSample]:
+        """The cached games for *key*, or ``None``."""
+        try:
+            data = self._read(key)
+            sample = decode_sample(data) if data is not None else None
+        except Exception:
+            logger.exception("Sample cache read failed for %s", key)
+            sample = None
+        if sample is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.games_loaded += sample.n_games
+        return sample
+
+    def put(self, key: str, sample: GameSample) -> None:
+        """Store *sample* as the games for *key*, then enforce the size cap."""
+        if sample.n_games == 0:
+            return
+        data = encode_sample(sample)
+        if len(data) > self.max_bytes:
+            return
+        try:
+            self._write(key, data, sample.n_games)
+            self.writes += 1
+            self.evictions += self._evict(self.max_bytes)
+        except Exception:
+            logger.exception("Sample cache write failed for %s", key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "games_loaded": self.games_loaded,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+    # -- Backend hooks --
+
+    @abstractmethod
+    def _read(self, key: str) -> Optional[bytes]:
+        """The entry for *key*, marked as recently used, or ``None``."""
+
+    @abstractmethod
+    def _write(self, key: str, data: bytes, n_games: int) -> None:
+        """Store *data*, the encoding of *n_games* games, under *key*."""
+
+    @abstractmethod
+    def _evict(self, max_bytes: int) -> int:
+        """Drop least recently used entries until under *max_bytes*; return the count."""
+
+
+class DiskSampleCache(SampleCache):
+    """One ``<key>.npz`` file per entry; file mtime is the LRU clock."""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        super().__init__(max_bytes)
+        self.directory = directory
+        self._blobs = DiskBlobStore(directory, ".npz")
+
+    def _read(self, key: str) -> Optional[bytes]:
+        return self._blobs.read(key)
+
+    def _write(self, key: str, data: bytes, n_games: int) -> None:
+        self._blobs.write(key, data)
+
+    def _evict(self, max_bytes: int) -> int:
+        return self._blobs.evict(max_bytes)
+
+
+class DbSampleCache(SampleCache):
+    """Entries in the ``sample_cache`` table of the optional database.
+
+    Args:
+        session_scope: Context manager factory yielding a committed
+            session (default: ``auto_goldfish.db.session.get_session``).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        session_scope: Optional[Callable[[], ContextManager[Any]]] = None,
+    ) -> None:
+        super().__init__(max_bytes)
+        from auto_goldfish.db.models import SampleCacheRow
+
+        self._blobs = DbBlobStore(SampleCacheRow, SampleCacheRow.key, session_scope)
+
+    def _read(self, key: str) -> Optional[bytes]:
+        return self._blobs.read(key)
+
+    def _write(self, key: str, data: bytes, n_games: int) -> None:
+        from auto_goldfish.db.persistence import save_sample_cache_entry
+
+        with self._blobs.session_scope() as session:
+            save_sample_cache_entry(session, key, data, n_games)
+
+    def _evict(self, max_bytes: int) -> int:
+        return self._blobs.evict(max_bytes)
@@ -0,0 +1,533 @@
+"""Per-config CRN game samples shared by the search and final phases.
+
+Both optimizers play every config on the same seed stream (game ``j``
+uses ``base_seed + j``).  ``SampleStore`` keeps the compact per-game
+data (``GameSample``) of each config so later phases only play the games
+a config is missing, optionally across a process pool.  With a
+``SampleCache`` (see ``sample_cache``) those games also persist across
+runs, and ``snapshot()``/``restore()`` let a checkpoint (see
+``checkpoint``) carry them into a resumed run.
+"""
+
+from __future__ import annotations
+
+import random as _stdlib_random
+from contextlib import contextmanager
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None  # type: ignore[misc,assignment]
+
+import numpy as np
+
+from auto_goldfish.engine.cancellation import CancelToken, SimulationCancelled, wait_or_cancel
+from auto_goldfish.engine.goldfisher import GameSample, pool_context
+from auto_goldfish.engine.shuffle import VALID_SHUFFLE_MODES
+from auto_goldfish.optimization.candidate_cards import CandidateCard
+from auto_goldfish.optimization.deck_config import DeckConfig, apply_config
+
+if TYPE_CHECKING:
+    from auto_goldfish.optimization.sample_cache import SampleCache
+
+# (config, game_offset, n_games) -- one block of games to play.
+_Task = Tuple[DeckConfig, int, int]
+
+# Games re-played with replay capture for a result whose stored games
+# have no replays (see ``SampleStore.result``)
+_REPLAY_GAMES = 20
+
+
+# ---------------------------------------------------------------------------
+# Compiled deck variants
+# ---------------------------------------------------------------------------
+
+def _use_variant(
+    goldfisher,
+    config: DeckConfig,
+    variants: Dict[DeckConfig, tuple],
+    candidates: Dict[str, CandidateCard],
+    swap_mode: bool,
+) -> None:
+    """Switch *goldfisher* to *config*, compiling it on first use.
+
+    ``apply_config`` rebuilds every Card; racing revisits the same configs
+    every round, so the compiled decklist is cached and swapped back in.
+    """
+    variant = variants.get(config)
+    if variant is None:
+        apply_config(goldfisher, config, candidates, swap_mode)
+        variants[config] = (
+            goldfisher.decklist, goldfisher.deckdict,
+            goldfisher.land_count, goldfisher.registry,
+        )
+    else:
+        (goldfisher.decklist, goldfisher.deckdict,
+         goldfisher.land_count, goldfisher.registry) = variant
+
+
+def _play_tasks(
+    goldfisher,
+    variants: Dict[DeckConfig, tuple],
+    candidates: Dict[str, CandidateCard],
+    swap_mode: bool,
+    base_seed: int,
+    tasks: List[_Task],
+    capture_replays: bool,
+    cancel: Optional[CancelToken] = None,
+) -> List[GameSample]:
+    samples = []
+    for cfg, offset, n in tasks:
+        _use_variant(goldfisher, cfg, variants, candidates, swap_mode)
+        samples.append(goldfisher.play_sample(n, base_seed, offset, capture_replays, cancel))
+    return samples
+
+
+# Per-process state for sample workers (set by _init_sample_worker).
+_SAMPLE_WORKER: Dict[str, Any] = {}
+
+
+def _init_sample_worker(
+    deck_dicts: list[dict],
+    turns: int,
+    extra_config: dict,
+    candidates: Dict[str, CandidateCard],
+    swap_mode: bool,
+) -> None:
+    """ProcessPoolExecutor initializer: compile the original deck once."""
+    from auto_goldfish.engine.goldfisher import Goldfisher
+
+    _SAMPLE_WORKER.clear()
+    _SAMPLE_WORKER.update(
+        goldfisher=Goldfisher(
+            deck_dicts, turns=turns, sims=1, record_results=None, **extra_config,
+        ),
+        candidates=candidates,
+        swap_mode=swap_mode,
+        variants={},
+    )
+
+
+def _worker_play_tasks(
+    tasks: List[_Task], base_seed: int, capture_replays: bool,
+) -> List[GameSample]:
+    w = _SAMPLE_WORKER
+    return _play_tasks(w["goldfisher"], w["variants"], w["candidates"], w["swap_mode"],
+                       base_seed, tasks, capture_replays)
+
+
+# ---------------------------------------------------------------------------
+# Score-only metrics
+# ---------------------------------------------------------------------------
+
+VALID_OPTIMIZE_TARGETS = (
+    "floor_performance",
+    "mean_mana",
+    "consistency",
+    "mean_mana_value",
+    "mean_mana_total",
+    "mean_spells_cast",
+)
+
+
+def z_value(confidence: float, two_sided: bool = True) -> float:
+    """Standard normal quantile of a *confidence* interval (one-sided bound if not *two_sided*)."""
+    return NormalDist().inv_cdf(0.5 + confidence / 2 if two_sided else confidence)
+
+
+def left_tail_mean(values: np.ndarray, threshold: float = 0.25) -> float:
+    """Mean of the lowest ``max(1, int(n * threshold))`` values."""
+    cutoff = max(1, int(len(values) * threshold))
+    return float(np.partition(values, cutoff - 1)[:cutoff].mean())
+
+
+def consistency_score(values: np.ndarray, threshold: float = 0.25) -> float:
+    """Left-tail ratio ``left_tail_mean / mean`` (1.0 for empty or all-zero input)."""
+    if len(values) == 0:
+        return 1.0
+    overall_mean = float(values.mean())
+    if overall_mean == 0:
+        return 1.0
+    return left_tail_mean(values, threshold) / overall_mean
+
+
+def objective_values(goldfisher, sample: GameSample, optimize_for: str) -> np.ndarray:
+    """Per-game values behind the *optimize_for* target of *sample*, as floats.
+
+    ``objective_score`` reduces them to the score: ``left_tail_mean`` for
+    ``floor_performance``, ``consistency_score`` for ``consistency`` and
+    the plain mean otherwise.
+    """
+    if optimize_for in ("floor_performance", "consistency"):
+        return goldfisher.sample_primary(sample)
+    if optimize_for == "mean_mana_value":
+        column = sample.column("mana_value")
+    elif optimize_for == "mean_mana_total":
+        column = sample.column("mana_value") + sample.column("mana_draw") + sample.column("mana_ramp")
+    elif optimize_for == "mean_spells_cast":
+        column = sample.column("spells_cast")
+    else:
+        column = sample.column("mana_spent")
+    return column.astype(float)
+
+
+def score_sample(goldfisher, sample: GameSample, optimize_for: str) -> float:
+    """The *optimize_for* target of *sample* without building a full result.
+
+    Matches the corresponding ``SimulationResult`` field of
+    ``goldfisher.result_from_sample(sample)``: ``floor_performance`` is
+    ``threshold_mana``, ``consistency`` the left-tail ratio of primary
+    mana, and the ``mean_*`` targets are per-game means.
+    """
+    if sample.n_games == 0:
+        return 0.0
+    return objective_score(objective_values(goldfisher, sample, optimize_for), optimize_for)
+
+
+def objective_score(values: np.ndarray, optimize_for: str) -> float:
+    """Reduce per-game ``objective_values`` to the *optimize_for* score."""
+    if optimize_for == "floor_performance":
+        return left_tail_mean(values)
+    if optimize_for == "consistency":
+        return consistency_score(values)
+    return float(values.mean())
+
+
+# ---------------------------------------------------------------------------
+# Sample store
+# ---------------------------------------------------------------------------
+
+class SampleStore:
+    """CRN game samples per config, extended on demand.
+
+    Args:
+        goldfisher: Goldfisher holding the original deck.  Configs are
+            swapped in while playing in-process; call
+            ``goldfisher.restore_original_decklist()`` when done.
+        candidates: Candidate cards referenced by the configs.
+        swap_mode: Passed through to ``apply_config``.
+        base_seed: Seed of game 0.  Defaults to ``goldfisher.seed`` or a
+            random seed when that is ``None``.
+        workers: Processes used to play games.  The pool is started on
+            first use and shut down by ``close()``; results do not depend
+            on the worker count.
+        cache: Optional persistent cache.  Configs are looked up on first
+            use and written back by ``discard()`` and ``close()`` when they
+            gained games.
+        snapshots: Keep a compressed copy of every config's games,
+            including discarded ones, for ``snapshot()``.
+        cancel: Optional ``CancelToken``.  ``extend()`` raises
+            ``SimulationCancelled`` once it is cancelled; in-process games
+            check it before every game, and a cancelled worker pool is
+            terminated (the next ``extend()`` starts a fresh one).
+        shuffle: Library shuffle used for the store's games (see
+            ``engine.shuffle``).  ``coupled`` keeps the games of different
+            configs aligned; *goldfisher*'s own setting is left untouched.
+        in_process: With ``workers == 1``, play in the calling thread;
+            ``False`` uses a one-process pool.  Defaults to
+            ``goldfisher.in_process``.
+
+    Attributes:
+        games_played: Games simulated by this store.
+        games_reused: Games served from *cache* instead of simulated.
+        games_restored: Games served from ``restore()`` instead of simulated.
+        games_requested: Games asked for through ``extend()``, counted per
+            config up to the largest request.  Unlike ``games_played`` it
+            does not depend on what the cache or a checkpoint held, so
+            budgets charged with it make the same decisions on every run.
+    """
+
+    def __init__(
+        self,
+        goldfisher,
+        candidates: Dict[str, CandidateCard],
+        swap_mode: bool = False,
+        base_seed: Optional[int] = None,
+        workers: int = 1,
+        cache: Optional["SampleCache"] = None,
+        snapshots: bool = False,
+        cancel: Optional[CancelToken] = None,
+        shuffle: str = "coupled",
+        in_process: Optional[bool] = None,
+    ) -> None:
+        if shuffle not in VALID_SHUFFLE_MODES:
+            raise ValueError(f"Invalid shuffle: {shuffle!r}. Must be one of {VALID_SHUFFLE_MODES}")
+        self.goldfisher = goldfisher
+        self.candidates = candidates
+        self.shuffle = shuffle
+        self.swap_mode = swap_mode
+        if base_seed is None:
+            base_seed = goldfisher.seed if goldfisher.seed is not None else _stdlib_random.randrange(2**31)
+        self.base_seed = base_seed
+        self.workers = workers
+        if in_process is None:
+            in_process = getattr(goldfisher, "in_process", True)
+        self.in_process = in_process
+        self.variants: Dict[DeckConfig, tuple] = {}
+        self._blocks: Dict[DeckConfig, List[GameSample]] = {}
+        self._executor = None
+        self.cache = cache
+        self.snapshots = snapshots
+        self.cancel = cancel
+        self.games_played = 0
+        self.games_reused = 0
+        self.games_restored = 0
+        self.games_requested = 0
+        # Per config: cache key, games the cache holds, games counted as reused
+        self._keys: Dict[DeckConfig, str] = {}
+        self._cached: Dict[DeckConfig, int] = {}
+        self._reused: Dict[DeckConfig, int] = {}
+        # Per config: largest extend() request since the last discard
+        self._requested: Dict[DeckConfig, int] = {}
+        # Per config: (n_games, encode_sample bytes) for snapshot()/restore()
+        self._encoded: Dict[DeckConfig, Tuple[int, bytes]] = {}
+
+    def games(self, config: DeckConfig) -> int:
+        """Number of games stored for *config*."""
+        return sum(b.n_games for b in self._blocks.get(config, ()))
+
+    def requested(self, config: DeckConfig) -> int:
+        """Largest game count requested for *config* since it was last discarded."""
+        return self._requested.get(config, 0)
+
+    def sample(self, config: DeckConfig) -> GameSample:
+        """All stored games of *config* as one sample."""
+        blocks = self._blocks[config]
+        if len(blocks) > 1:
+            blocks[:] = [GameSample.concat(blocks)]
+        return blocks[0]
+
+    def rows(self, config: DeckConfig, start: int, stop: int) -> GameSample:
+        """Games ``start .. stop - 1`` of *config* (without replays)."""
+        sample = self.sample(config)
+        return GameSample(sample.stats[start:stop], sample.drawn[start:stop])
+
+    def discard(self, config: DeckConfig) -> None:
+        """Free the games stored for *config* (writing them to the cache first)."""
+        self._write_back(config)
+        if self.snapshots:
+            self._encode(config)
+        self._blocks.pop(config, None)
+        self._requested.pop(config, None)
+
+    def extend(
+        self,
+        configs: List[DeckConfig],
+        n_games: int,
+        capture_replays: bool = False,
+    ) -> List[Optional[GameSample]]:
+        """Play the games each config is missing to reach *n_games*.
+
+        Returns the newly played block per config (``None`` when a config
+        already had enough games).
+        """
+        for cfg in configs:
+            requested = self._requested.get(cfg, 0)
+            if n_games > requested:
+                self.games_requested += n_games - requested
+                self._requested[cfg] = n_games
+            if cfg not in self._blocks and cfg in self._encoded:
+                from auto_goldfish.optimization.sample_cache import decode_sample
+
+                n, data = self._encoded[cfg]
+                self._blocks[cfg] = [decode_sample(data)]
+                self.games_restored += n
+        if self.cache is not None:
+            for cfg in configs:
+                self._load(cfg, n_games)
+        tasks = [(cfg, self.games(cfg), n_games - self.games(cfg)) for cfg in configs]
+        todo = [t for t in tasks if t[2] > 0]
+        played = iter(self._play(todo, capture_replays))
+        self.games_played += sum(n for _, _, n in todo)
+
+        new_blocks: List[Optional[GameSample]] = []
+        for cfg, _offset, n in tasks:
+            block = None
+            if n > 0:
+                block = next(played)
+                self._blocks.setdefault(cfg, []).append(block)
+            new_blocks.append(block)
+        return new_blocks
+
+    def result(self, config: DeckConfig, n_games: int):
+        """``SimulationResult`` for the first *n_games* stored games of *config*.
+
+        Games played without replay capture (e.g. all of them during
+        racing) carry no replays; a few of them are then re-played with
+        capture on.  Games are seeded by index, so the re-played games are
+        the stored ones.
+        """
+        _use_variant(self.goldfisher, config, self.variants, self.candidates, self.swap_mode)
+        sample = self.sample(config).head(n_games)
+        if not sample.replays and sample.n_games:
+            sample = GameSample(sample.stats, sample.drawn, self._replay(sample.n_games))
+        return self.goldfisher.result_from_sample(sample)
+
+    def _replay(self, n_games: int) -> List[Tuple[int, tuple]]:
+        """Replays of a block of the first *n_games* games of the current deck."""
+        block = min(n_games, _REPLAY_GAMES)
+        # Skip the first 10% of games, like replay capture during a run
+        offset = min(max(int(n_games * 0.1), 1), n_games - block)
+        with self._shuffled():
+            replayed = self.goldfisher.play_sample(
+                block, self.base_seed, offset, capture_replays=True, cancel=self.cancel,
+            )
+        return [(offset + row, replay) for row, replay in replayed.replays]
+
+    def score(self, config: DeckConfig, n_games: int, optimize_for: str) -> float:
+        """Score-only counterpart of ``result``; see ``score_sample``."""
+        return score_sample(self.goldfisher, self.sample(config).head(n_games), optimize_for)
+
+    def close(self) -> None:
+        """Write extended samples to the cache and stop the worker pool."""
+        for cfg in list(self._blocks):
+            self._write_back(cfg)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def snapshot(self) -> Dict[DeckConfig, Tuple[int, bytes]]:
+        """``(n_games, encode_sample bytes)`` of every config's games.
+
+        Needs ``snapshots=True`` to include discarded configs.  Configs are
+        only re-encoded when they gained games since the last snapshot.
+        """
+        for cfg in self._blocks:
+            self._encode(cfg)
+        return dict(self._encoded)
+
+    def restore(self, encoded: Dict[DeckConfig, Tuple[int, bytes]]) -> None:
+        """Serve the games of a ``snapshot()`` before playing new ones.
+
+        Configs are decoded when ``extend()`` first asks for them.
+        """
+        for cfg, entry in encoded.items():
+            if entry[0] > self._encoded.get(cfg, (0, b""))[0]:
+                self._encoded[cfg] = entry
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Cache metrics plus this store's played/reused game counts (``None`` without a cache)."""
+        if self.cache is None:
+            return None
+        return {
+            **self.cache.stats(),
+            "games_played": self.games_played,
+            "games_reused": self.games_reused,
+        }
+
+    def _encode(self, config: DeckConfig) -> None:
+        n_games = self.games(config)
+        if config in self._blocks and n_games > self._encoded.get(config, (0, b""))[0]:
+            from auto_goldfish.optimization.sample_cache import encode_sample
+
+            self._encoded[config] = (n_games, encode_sample(self.sample(config)))
+
+    # -- Persistent cache --
+
+    def _load(self, config: DeckConfig, n_games: int) -> None:
+        """Seed *config* from the cache on first use and count reused games."""
+        if config not in self._cached:
+            cached = self.cache.get(self._key(config)) if config not in self._blocks else None
+            self._cached[config] = cached.n_games if cached is not None else 0
+            if cached is not None:
+                self._blocks[config] = [cached]
+        reused = min(self._cached[config], n_games)
+        if reused > self._reused.get(config, 0):
+            self.games_reused += reused - self._reused.get(config, 0)
+            self._reused[config] = reused
+
+    def _write_back(self, config: DeckConfig) -> None:
+        if self.cache is None or config not in self._blocks:
+            return
+        if self.games(config) > self._cached.get(config, 0):
+            self.cache.put(self._key(config), self.sample(config))
+            self._cached[config] = self.games(config)
+
+    def _key(self, config: DeckConfig) -> str:
+        key = self._keys.get(config)
+        if key is None:
+            from auto_goldfish.optimization.sample_cache import sample_key
+
+            gf = self.goldfisher
+            current = (gf.decklist, gf.deckdict, gf.land_count, gf.registry)
+            _use_variant(gf, config, self.variants, self.candidates, self.swap_mode)
+            with self._shuffled():
+                key = sample_key(gf, self.base_seed)
+            (gf.decklist, gf.deckdict, gf.land_count, gf.registry) = current
+            self._keys[config] = key
+        return key
+
+    # -- Playing --
+
+    @contextmanager
+    def _shuffled(self):
+        """Switch the goldfisher to the store's shuffle for the block."""
+        gf = self.goldfisher
+        previous = gf.shuffle
+        gf.shuffle = self.shuffle
+        try:
+            yield
+        finally:
+            gf.shuffle = previous
+
+    def _play(self, tasks: List[_Task], capture_replays: bool) -> List[GameSample]:
+        if not tasks:
+            return []
+        if self.cancel is not None:
+            self.cancel.check()
+        executor = self._get_executor()
+        if executor is None:
+            with self._shuffled():
+                return _play_tasks(self.goldfisher, self.variants, self.candidates, self.swap_mode,
+                                   self.base_seed, tasks, capture_replays, self.cancel)
+
+        # Split long blocks so a handful of configs still fills the pool,
+        # then hand each worker a contiguous run of blocks.
+        parts = max(1, self.workers // len(tasks))
+        split: List[_Task] = []
+        owner: List[int] = []
+        for i, (cfg, offset, n) in enumerate(tasks):
+            bounds = np.linspace(0, n, min(parts, n) + 1).astype(int)
+            for lo, hi in zip(bounds[:-1], bounds[1:]):
+                split.append((cfg, offset + int(lo), int(hi - lo)))
+                owner.append(i)
+        n_chunks = min(len(split), self.workers)
+        chunk_bounds = np.linspace(0, len(split), n_chunks + 1).astype(int)
+        futures = [
+            executor.submit(_worker_play_tasks, split[chunk_bounds[c]:chunk_bounds[c + 1]],
+                            self.base_seed, capture_replays)
+            for c in range(n_chunks)
+        ]
+        try:
+            wait_or_cancel(futures, executor, self.cancel)
+        except SimulationCancelled:
+            self._executor = None
+            raise
+        pieces = [s for f in futures for s in f.result()]
+
+        grouped: List[List[GameSample]] = [[] for _ in tasks]
+        for i, piece in zip(owner, pieces):
+            grouped[i].append(piece)
+        return [GameSample.concat(g) for g in grouped]
+
+    def _get_executor(self):
+        if ProcessPoolExecutor is None or (self.workers <= 1 and self.in_process):
+            return None
+        if self._executor is None:
+            gf = self.goldfisher
+            gf.restore_original_decklist()
+            extra_config = dict(gf._get_worker_config())
+            extra_config["shuffle"] = self.shuffle
+            extra_config["mana_mode"] = gf.mana_mode
+            extra_config["registry"] = gf.registry
+            extra_config["mulligan_strategy"] = gf.mulligan_strategy
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=pool_context(self.in_process),
+                initializer=_init_sample_worker,
+                initargs=(gf._get_deck_dicts(), gf.turns, extra_config,
+                          self.candidates, self.swap_mode),
+            )
+        return self._executor
@@ -0,0 +1,301 @@
+"""Learned surrogate for instant deck-score estimates.
+
+A small ridge regression over a degree-2 expansion of a compact deck
+feature vector (land count, cmc histogram, ramp/draw counts from
+``CardEffects``, ...).  It is trained offline on stored simulation
+results and predicts ``mean_mana``, ``consistency`` and
+``threshold_mana`` with a handful of dot products, so it can serve
+config-page previews and pre-screen configs before racing.
+
+Training data comes from stored land-sweep results
+(``training_data_from_rows`` over ``db.persistence.
+load_surrogate_training_rows``; see ``auto-goldfish train-surrogate``)
+or from fresh simulations (``collect_training_data``).
+
+Predictions are estimates only; ``calibration_report`` measures how far
+they are from true simulations.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SURROGATE_TARGETS = ("mean_mana", "consistency", "threshold_mana")
+
+# Spell cmc histogram bins: cmc <= 1, 2, 3, 4, 5, 6, 7+
+_CMC_BINS = (1, 2, 3, 4, 5, 6)
+
+FEATURE_NAMES = (
+    "land_count",
+    "spell_count",
+    "cmc_0_1",
+    "cmc_2",
+    "cmc_3",
+    "cmc_4",
+    "cmc_5",
+    "cmc_6",
+    "cmc_7_plus",
+    "ramp_count",
+    "draw_count",
+    "mean_spell_cmc",
+    "commander_cmc",
+    "turns",
+)
+
+
+def deck_features(goldfisher) -> np.ndarray:
+    """Compact feature vector for the goldfisher's current decklist."""
+    hist = np.zeros(len(_CMC_BINS) + 1)
+    spell_cmcs: List[int] = []
+    lands = ramp = draw = 0
+    for card in goldfisher.decklist:
+        if card.land:
+            lands += 1
+            continue
+        spell_cmcs.append(card.cmc)
+        hist[int(np.searchsorted(_CMC_BINS, card.cmc))] += 1
+        if card.ramp:
+            ramp += 1
+        if card.draw:
+            draw += 1
+    return np.array([
+        lands,
+        len(spell_cmcs),
+        *hist,
+        ramp,
+        draw,
+        float(np.mean(spell_cmcs)) if spell_cmcs else 0.0,
+        sum(c.cmc for c in goldfisher.commanders),
+        goldfisher.turns,
+    ], dtype=float)
+
+
+def result_targets(result: Any) -> np.ndarray:
+    """Extract the surrogate targets from a ``SimulationResult`` or result dict."""
+    if isinstance(result, dict):
+        return np.array([float(result.get(name, 0.0)) for name in SURROGATE_TARGETS])
+    return np.array([float(getattr(result, name)) for name in SURROGATE_TARGETS])
+
+
+def _expand(Z: np.ndarray) -> np.ndarray:
+    """Degree-2 expansion: linear terms plus all pairwise products."""
+    rows, cols = np.triu_indices(Z.shape[1])
+    return np.hstack([Z, Z[:, rows] * Z[:, cols]])
+
+
+@dataclass
+class SurrogateModel:
+    """Ridge regression on standardized, degree-2 expanded deck features."""
+
+    feature_mean: np.ndarray
+    feature_scale: np.ndarray
+    coef: np.ndarray        # (n_terms, n_targets)
+    intercept: np.ndarray   # (n_targets,)
+    alpha: float = 1.0
+    n_train: int = 0
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Predict targets for a feature matrix; returns (n, n_targets)."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        Z = (X - self.feature_mean) / self.feature_scale
+        return _expand(Z) @ self.coef + self.intercept
+
+    def predict_dict(self, features: np.ndarray) -> Dict[str, float]:
+        """Predict targets for one feature vector as ``{target: value}``."""
+        row = self.predict(features)[0]
+        return {name: float(v) for name, v in zip(SURROGATE_TARGETS, row)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "feature_names": list(FEATURE_NAMES),
+            "targets": list(SURROGATE_TARGETS),
+            "feature_mean": self.feature_mean.tolist(),
+            "feature_scale": self.feature_scale.tolist(),
+            "coef": self.coef.tolist(),
+            "intercept": self.intercept.tolist(),
+            "alpha": self.alpha,
+            "n_train": self.n_train,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SurrogateModel":
+        if tuple(data.get("feature_names", ())) != FEATURE_NAMES:
+            raise ValueError("Surrogate was trained on a different feature set")
+        return cls(
+            feature_mean=np.array(data["feature_mean"], dtype=float),
+            feature_scale=np.array(data["feature_scale"], dtype=float),
+            coef=np.array(data["coef"], dtype=float),
+            intercept=np.array(data["intercept"], dtype=float),
+            alpha=float(data.get("alpha", 1.0)),
+            n_train=int(data.get("n_train", 0)),
+        )
+
+    def digest(self) -> str:
+        """Short content hash identifying the model (for cache keys)."""
+        blob = json.dumps(self.to_dict(), sort_keys=True)
+        return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "SurrogateModel":
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def fit_surrogate(
+    X: np.ndarray,
+    results: Sequence[Any],
+    alpha: float = 1.0,
+    weights: Optional[np.ndarray] = None,
+) -> SurrogateModel:
+    """Fit a surrogate on feature rows and their simulation results.
+
+    Args:
+        X: Feature matrix (n, len(FEATURE_NAMES)) from ``deck_features``.
+        results: ``SimulationResult`` objects or ``result_to_dict`` dicts.
+        alpha: Ridge penalty on the standardized expanded terms.
+        weights: Optional per-row weights (e.g. simulation counts).
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    Y = np.array([result_targets(r) for r in results])
+    if len(X) != len(Y) or len(X) == 0:
+        raise ValueError("X and results must be non-empty and the same length")
+
+    feature_mean = X.mean(axis=0)
+    feature_scale = X.std(axis=0)
+    feature_scale[feature_scale == 0] = 1.0
+    Phi = _expand((X - feature_mean) / feature_scale)
+
+    w = np.ones(len(X)) if weights is None else np.asarray(weights, dtype=float)
+    w = w / w.sum()
+    phi_mean = w @ Phi
+    y_mean = w @ Y
+    Pc = Phi - phi_mean
+    Yc = Y - y_mean
+    gram = Pc.T @ (Pc * w[:, np.newaxis]) + alpha / len(X) * np.eye(Phi.shape[1])
+    coef = np.linalg.solve(gram, Pc.T @ (Yc * w[:, np.newaxis]))
+    intercept = y_mean - phi_mean @ coef
+
+    return SurrogateModel(
+        feature_mean=feature_mean,
+        feature_scale=feature_scale,
+        coef=coef,
+        intercept=intercept,
+        alpha=alpha,
+        n_train=len(X),
+    )
+
+
+def collect_training_data(
+    goldfisher,
+    configs: Sequence[Any],
+    candidates: Dict[str, Any],
+    swap_mode: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[np.ndarray, List[Any]]:
+    """Simulate each config and return (feature matrix, results).
+
+    Mutates *goldfisher* through ``apply_config`` and restores the
+    original decklist afterwards.
+    """
+    from auto_goldfish.optimization.deck_config import apply_config
+
+    rows: List[np.ndarray] = []
+    results: List[Any] = []
+    for i, config in enumerate(configs):
+        apply_config(goldfisher, config, candidates, swap_mode)
+        rows.append(deck_features(goldfisher))
+        results.append(goldfisher.simulate(progress_callback=lambda *_: None))
+        if progress is not None:
+            progress(i + 1, len(configs))
+    goldfisher.restore_original_decklist()
+    return np.array(rows), results
+
+
+def training_data_from_rows(
+    rows: Sequence[Dict[str, Any]],
+    load_deck: Optional[Callable[[str], List[Dict[str, Any]]]] = None,
+) -> Tuple[np.ndarray, List[Dict[str, Any]], np.ndarray]:
+    """Feature matrix, results and weights for stored land-sweep results.
+
+    *rows* carry ``deck_name``, ``turns``, ``land_count``, ``sims`` and
+    the targets (see ``db.persistence.load_surrogate_training_rows``).
+    Each deck is loaded once with *load_deck* (default
+    ``decklist.loader.load_decklist``) and its features computed at every
+    stored land count with the default card effects.  Rows of decks that
+    cannot be loaded are skipped.  Weights are the games behind each row.
+    """
+    from auto_goldfish.engine.goldfisher import Goldfisher
+
+    if load_deck is None:
+        from auto_goldfish.decklist.loader import load_decklist as load_deck
+
+    goldfishers: Dict[Tuple[str, int], Any] = {}
+    features: List[np.ndarray] = []
+    results: List[Dict[str, Any]] = []
+    weights: List[float] = []
+    for row in rows:
+        key = (row["deck_name"], int(row["turns"]))
+        if key not in goldfishers:
+            try:
+                goldfishers[key] = Goldfisher(load_deck(key[0]), turns=key[1], sims=1,
+                                              record_results=None)
+            except Exception:
+                logger.warning("Skipping surrogate rows of unreadable deck %s", key[0])
+                goldfishers[key] = None
+        goldfisher = goldfishers[key]
+        if goldfisher is None:
+            continue
+        goldfisher.set_lands(int(row["land_count"]), cuts=[])
+        features.append(deck_features(goldfisher))
+        results.append(row)
+        weights.append(float(row.get("sims") or 1))
+    X = np.array(features) if features else np.zeros((0, len(FEATURE_NAMES)))
+    return X, results, np.array(weights)
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    ranks = np.empty(len(values))
+    ranks[np.argsort(values, kind="stable")] = np.arange(len(values))
+    return ranks
+
+
+def calibration_report(
+    model: SurrogateModel,
+    X: np.ndarray,
+    results: Sequence[Any],
+) -> Dict[str, Dict[str, float]]:
+    """Compare surrogate predictions against true simulation results.
+
+    Returns ``{target: {mae, rmse, r_squared, spearman, bias}}``.  The
+    Spearman rank correlation is what matters for pre-screening.
+    """
+    pred = model.predict(X)
+    true = np.array([result_targets(r) for r in results])
+    report: Dict[str, Dict[str, float]] = {}
+    for j, name in enumerate(SURROGATE_TARGETS):
+        err = pred[:, j] - true[:, j]
+        ss_tot = float(np.sum((true[:, j] - true[:, j].mean()) ** 2))
+        if len(true) > 1 and np.ptp(true[:, j]) > 0 and np.ptp(pred[:, j]) > 0:
+            spearman = float(np.corrcoef(_ranks(pred[:, j]), _ranks(true[:, j]))[0, 1])
+        else:
+            spearman = 0.0
+        report[name] = {
+            "mae": float(np.mean(np.abs(err))),
+            "rmse": float(np.sqrt(np.mean(err ** 2))),
+            "r_squared": 1.0 - float(np.sum(err ** 2)) / ss_tot if ss_tot > 0 else 0.0,
+            "spearman": spearman,
+            "bias": float(np.mean(err)),
+        }
+    return report
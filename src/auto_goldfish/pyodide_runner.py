@@ -7,11 +7,13 @@ It orchestrates a full simulation run using only sequential execution
 
 from __future__ import annotations
 
+import base64
 import json
 from typing import Any, Callable, Dict, List, Optional
 
 from auto_goldfish.effects.card_database import DEFAULT_REGISTRY
 from auto_goldfish.effects.json_loader import build_overridden_registry
+from auto_goldfish.engine.cancellation import CancelToken
 from auto_goldfish.engine.goldfisher import Goldfisher
 from auto_goldfish.engine.mulligan import CurveAwareMulligan
 from auto_goldfish.metrics.reporter import result_to_dict
@@ -21,6 +23,7 @@ def run_simulation(
     deck_json: str,
     config_json: str,
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None,
 ) -> str:
     """Entry point called from JavaScript via Pyodide.
 
@@ -35,12 +38,18 @@ def run_simulation(
             - record_results (str): Detail level - "quartile"/"decile"/"centile"
             - effect_overrides (dict): Card name -> override JSON format
             - mulligan (str): Mulligan strategy - "default"/"curve_aware"
+            - horizons (list[int]|null): Turn cutoffs to report from a single
+              run of ``max(horizons)`` turns (overrides ``turns``)
         progress_callback: Optional callable(current, total) for progress
             updates. Called during each simulation run. The total reflects
             sims * number_of_land_counts.
+        should_cancel: Optional callable() polled before every game (e.g.
+            reading a shared-memory flag set by the page); once it returns
+            True the run raises ``SimulationCancelled``.
 
     Returns:
-        JSON string of list[result_to_dict(result)] for each land count.
+        JSON string of list[result_to_dict(result)] for each land count
+        (one entry per land count and horizon when ``horizons`` is set).
     """
     deck_list: List[Dict[str, Any]] = json.loads(deck_json)
     config: Dict[str, Any] = json.loads(config_json)
@@ -53,6 +62,9 @@ def run_simulation(
     record_results = config.get("record_results", "quartile")
     effect_overrides = config.get("effect_overrides", {})
     mulligan_type = config.get("mulligan", "default")
+    horizons = config.get("horizons")
+    if horizons:
+        turns = max(horizons)
 
     # Build registry with overrides
     registry = None
@@ -95,6 +107,7 @@ def run_simulation(
 
     num_land_counts = max_lands - min_lands + 1
     results: List[Dict[str, Any]] = []
+    cancel = CancelToken(poll=should_cancel) if should_cancel is not None else None
 
     for land_idx, land_count in enumerate(range(min_lands, max_lands + 1)):
         goldfisher.set_lands(land_count, cuts=[])
@@ -110,8 +123,14 @@ def run_simulation(
                     num_land_counts * sims,
                 )
 
-        result = goldfisher.simulate(progress_callback=land_callback)
-        results.append(result_to_dict(result))
+        if horizons:
+            horizon_results = goldfisher.simulate(
+                progress_callback=land_callback, horizons=horizons, cancel=cancel,
+            )
+            results.extend(result_to_dict(r) for r in horizon_results.values())
+        else:
+            result = goldfisher.simulate(progress_callback=land_callback, cancel=cancel)
+            results.append(result_to_dict(result))
 
     return json.dumps(results)
 
@@ -121,6 +140,9 @@ def run_optimization(
     config_json: str,
     enum_callback: Optional[Callable[[int, int], None]] = None,
     eval_callback: Optional[Callable[[int, int], None]] = None,
+    leaderboard_callback: Optional[Callable[[str], Any]] = None,
+    checkpoint_callback: Optional[Callable[[str, Optional[str]], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None,
 ) -> str:
     """Run card optimization from JavaScript via Pyodide.
 
@@ -131,14 +153,40 @@ def run_optimization(
               (same as run_simulation; sims controls final evaluation count)
             - optimize_for (str): "mean_mana", "consistency", or "mean_spells_cast"
             - swap_mode (bool): Replace cards or add extra
+            - cut_sets (int): In swap mode, screened cut sets raced per
+              addition config (racing algorithm only; default 0)
             - hyperband_max_sims (int): Max sims per candidate during Hyperband selection (default sims//2)
             - enabled_candidates (list[str]): Candidate IDs that are enabled
             - custom_draw (dict|null): {cmc, amount} for custom draw candidate
             - custom_ramp (dict|null): {cmc, amount} for custom ramp candidate
             - max_draw_additions (int): Max draw cards to add (0-2)
             - max_ramp_additions (int): Max ramp cards to add (0-2)
+            - search (str): "racing", "local", or "auto" (racing algorithm only)
+            - search_budget (int|null): Games available to local search
+            - objectives (list[str]|null): Two or more optimize_for targets for
+              Pareto racing (racing algorithm only)
+            - time_budget_s (float|null): Wall-clock budget of the search phase
+            - max_games (int|null): Game budget of the search phase
+            - sample_cache_dir (str|null): Directory (e.g. an IDBFS mount) caching
+              optimizer games across runs; needs a seed to hit
+            - sample_cache_mb (float): Size cap of the sample cache (default 64)
+            - checkpoint (str|null): Base64 checkpoint last passed to
+              checkpoint_callback; the run resumes from it when it belongs
+              to the same deck, seed and settings
+            - checkpoint_interval_s (float): Seconds between checkpoints (default 30)
+            - surrogate_model (dict|null): ``SurrogateModel.to_dict()``; racing
+              only races the configs it ranks highest
         enum_callback: Optional callable(current, total) for enumeration progress.
         eval_callback: Optional callable(current, total) for evaluation progress.
+        leaderboard_callback: Optional callable(board_json) receiving interim
+            leaderboards (see ``optimization.anytime``) as JSON strings.  A
+            truthy return value stops the search phase early.
+        checkpoint_callback: Optional callable(run_key, data) receiving each
+            checkpoint as a base64 string (see ``optimization.checkpoint``),
+            and ``data=None`` once the run completed.  Enables checkpointing.
+        should_cancel: Optional callable() polled before every game; once
+            it returns True the run raises ``SimulationCancelled`` (after
+            a last checkpoint when checkpointing).
 
     Returns:
         JSON string of list[{config_description, ...result_fields}].
@@ -230,6 +278,32 @@ def run_optimization(
         land_delta_max = max_lands - goldfisher.land_count
 
     algorithm = config.get("algorithm", "racing")
+    cache = None
+    if config.get("sample_cache_dir"):
+        from auto_goldfish.optimization.sample_cache import DiskSampleCache
+
+        cache = DiskSampleCache(
+            config["sample_cache_dir"], int(config.get("sample_cache_mb", 64) * 1024 * 1024),
+        )
+
+    checkpoint = None
+    if checkpoint_callback is not None:
+        from auto_goldfish.optimization.checkpoint import CallbackCheckpointStore
+
+        def on_save(key: str, data: Optional[bytes]) -> None:
+            checkpoint_callback(key, base64.b64encode(data).decode() if data is not None else None)
+
+        saved = config.get("checkpoint")
+        checkpoint = CallbackCheckpointStore(
+            base64.b64decode(saved) if saved else None, on_save,
+        )
+    checkpoint_interval_s = config.get("checkpoint_interval_s", 30.0)
+    cancel = CancelToken(poll=should_cancel) if should_cancel is not None else None
+    surrogate = None
+    if config.get("surrogate_model"):
+        from auto_goldfish.optimization.surrogate import SurrogateModel
+
+        surrogate = SurrogateModel.from_dict(config["surrogate_model"])
 
     if algorithm == "racing":
         optimizer = FastDeckOptimizer(
@@ -242,6 +316,17 @@ def run_optimization(
             land_delta_max=land_delta_max,
             optimize_for=optimize_for,
             hyperband_max_sims=hyperband_max_sims,
+            search=config.get("search", "racing"),
+            objectives=config.get("objectives"),
+            time_budget_s=config.get("time_budget_s"),
+            max_games=config.get("max_games"),
+            search_budget=config.get("search_budget"),
+            cut_sets=config.get("cut_sets", 0),
+            cache=cache,
+            checkpoint=checkpoint,
+            checkpoint_interval_s=checkpoint_interval_s,
+            cancel=cancel,
+            surrogate=surrogate,
         )
     else:
         optimizer = DeckOptimizer(
@@ -257,14 +342,26 @@ def run_optimization(
             eta=eta,
             hyperband_min_sims=hyperband_min_sims,
             hyperband_top_k=hyperband_top_k,
+            cache=cache,
+            time_budget_s=config.get("time_budget_s"),
+            max_games=config.get("max_games"),
+            checkpoint=checkpoint,
+            checkpoint_interval_s=checkpoint_interval_s,
+            cancel=cancel,
         )
 
+    leaderboard = None
+    if leaderboard_callback is not None:
+        def leaderboard(board: Dict[str, Any]) -> bool:
+            return bool(leaderboard_callback(json.dumps(board)))
+
     ranked = optimizer.run(
         final_sims=sims,
         final_top_k=5,
         include_hyperband=include_hyperband,
         enum_progress=enum_callback,
         eval_progress=eval_callback,
+        leaderboard=leaderboard,
     )
 
     # Annotate results with config descriptions
@@ -273,6 +370,55 @@ def run_optimization(
         result_dict["opt_config"] = deck_config.describe()
         result_dict["opt_land_delta"] = deck_config.land_delta
         result_dict["opt_added_cards"] = list(deck_config.added_cards)
+        result_dict["opt_cuts"] = list(deck_config.cuts)
         output.append(result_dict)
+    if output and optimizer.cache_stats is not None:
+        output[0]["sample_cache"] = optimizer.cache_stats
+    if output and optimizer.stop_reason is not None:
+        output[0]["opt_stop_reason"] = optimizer.stop_reason
+    if output and optimizer.resumed_from is not None:
+        output[0]["opt_resumed_from"] = optimizer.resumed_from
+
+    return json.dumps(output)
+
+
+def predict_scores(deck_json: str, config_json: str, model_json: str) -> str:
+    """Instant surrogate estimates for the config page, without simulating.
+
+    Args:
+        deck_json: JSON string of deck card list.
+        config_json: JSON string with ``turns``, ``min_lands``,
+            ``max_lands`` and ``effect_overrides`` (as run_simulation).
+        model_json: JSON string of ``SurrogateModel.to_dict()``.
+
+    Returns:
+        JSON string of list[{land_count, mean_mana, consistency,
+        threshold_mana}], one entry per land count.
+    """
+    from auto_goldfish.optimization.surrogate import SurrogateModel, deck_features
+
+    deck_list: List[Dict[str, Any]] = json.loads(deck_json)
+    config: Dict[str, Any] = json.loads(config_json)
+    model = SurrogateModel.from_dict(json.loads(model_json))
+
+    registry = None
+    effect_overrides = config.get("effect_overrides", {})
+    if effect_overrides:
+        registry = build_overridden_registry(DEFAULT_REGISTRY, effect_overrides)
 
+    goldfisher = Goldfisher(
+        deck_list,
+        turns=config.get("turns", 10),
+        sims=1,
+        verbose=False,
+        registry=registry,
+    )
+    min_lands = config.get("min_lands") or goldfisher.land_count
+    max_lands = config.get("max_lands") or goldfisher.land_count
+
+    output: List[Dict[str, Any]] = []
+    for land_count in range(min_lands, max_lands + 1):
+        goldfisher.set_lands(land_count, cuts=[])
+        prediction = model.predict_dict(deck_features(goldfisher))
+        output.append({"land_count": land_count, **prediction})
     return json.dumps(output)
@@ -6,9 +6,21 @@ import glob
 import json
 import logging
 import os
+import time
 import uuid
 
-from flask import Blueprint, abort, jsonify, render_template, request, send_file
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    jsonify,
+    render_template,
+    request,
+    send_file,
+    stream_with_context,
+)
+from flask import session as flask_session
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +45,17 @@ MAX_SIMS = 10000
 MAX_TURNS = 14
 MAX_LAND_SWEEP = 10
 
+# Seconds between keep-alive messages of a job event stream
+SSE_KEEPALIVE_S = 15.0
+
+# Seconds a job event stream stays open before the server closes it and
+# the client reconnects with Last-Event-ID, so a long job does not hold
+# a worker thread for its whole run
+SSE_MAX_STREAM_S = 300.0
+
+# Reconnect delay (ms) sent to clients when a stream is closed early
+SSE_RETRY_MS = 1000
+
 bp = Blueprint("simulation", __name__, url_prefix="/sim")
 
 
@@ -324,6 +347,15 @@ def api_wheel_download(filename: str):
     return send_file(wheel_path, mimetype="application/zip")
 
 
+@bp.route("/api/surrogate")
+def api_surrogate():
+    """Return the server's surrogate model (see ``make_surrogate``) and its digest."""
+    model = _runner().surrogate
+    if model is None:
+        abort(404)
+    return jsonify({"model": model.to_dict(), "digest": model.digest()})
+
+
 @bp.route("/api/<deck_name>/results", methods=["POST"])
 def api_save_results(deck_name: str):
     """Persist client-side simulation results to the database."""
@@ -355,4 +387,218 @@ def api_save_results(deck_name: str):
     except Exception:
         logger.exception("Failed to persist client simulation results")
 
+    # Seeded runs are reproducible: cache them for api_lookup_results.
+    # The server never checked these results, so they are only served
+    # back to the session that posted them and never persisted.
+    cache = _runner().result_cache
+    if (
+        cache is not None
+        and isinstance(config, dict)
+        and isinstance(results, list)
+        and config.get("seed") is not None
+    ):
+        from auto_goldfish.web.services.result_cache import result_key
+
+        try:
+            key = result_key(load_decklist(deck_name), config, namespace=_client_namespace())
+        except Exception:
+            logger.exception("Failed to cache client simulation results")
+            key = None
+        if key is not None:
+            cache.put(key, results, persist=False)
+
     return jsonify({"ok": True})
+
+
+def _client_namespace() -> str:
+    """Result cache namespace of this browser session's client-side runs."""
+    client_id = flask_session.get("client_id")
+    if client_id is None:
+        client_id = flask_session["client_id"] = uuid.uuid4().hex
+    return f"client:{client_id}"
+
+
+@bp.route("/api/<deck_name>/results/lookup", methods=["POST"])
+def api_lookup_results(deck_name: str):
+    """Cached results of a seeded client-side run of this session with the same deck and config.
+
+    Answers 404 on a miss; the ``X-Result-Cache`` header says ``hit`` or
+    ``miss`` either way.
+    """
+    from auto_goldfish.web.services.result_cache import CACHE_HEADER, result_key
+
+    path = get_deckpath(deck_name)
+    if not os.path.isfile(path):
+        abort(404)
+
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict) or not isinstance(body.get("config", {}), dict):
+        return jsonify({"ok": False, "error": "Invalid JSON"}), 400
+
+    config = body.get("config", {})
+    cache = _runner().result_cache
+    results = None
+    if cache is not None and config.get("seed") is not None:
+        key = result_key(load_decklist(deck_name), config, namespace=_client_namespace())
+        results = cache.get(key) if key is not None else None
+    if results is None:
+        return jsonify({"ok": False, "error": "Not cached"}), 404, {CACHE_HEADER: "miss"}
+    return jsonify({"ok": True, "results": results}), 200, {CACHE_HEADER: "hit"}
+
+
+# -- Server-side jobs --
+
+def _runner():
+    """The app's ``SimulationRunner``, created on first use."""
+    runner = current_app.extensions.get("sim_runner")
+    if runner is None:
+        from auto_goldfish.web.services.simulation_runner import SimulationRunner
+
+        runner = current_app.extensions.setdefault("sim_runner", SimulationRunner())
+    return runner
+
+
+@bp.route("/api/<deck_name>/jobs", methods=["POST"])
+def api_submit_job(deck_name: str):
+    """Queue a server-side simulation job (see ``SimulationRunner.submit``).
+
+    A seeded job with cached results completes at once: 200 with
+    ``X-Result-Cache: hit`` instead of 202.
+    """
+    from auto_goldfish.web.services.job_queue import JobRejected
+    from auto_goldfish.web.services.result_cache import CACHE_HEADER
+
+    path = get_deckpath(deck_name)
+    if not os.path.isfile(path):
+        abort(404)
+
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({"ok": False, "error": "Invalid JSON"}), 400
+
+    runner = _runner()
+    try:
+        job_id = runner.submit(deck_name, body.get("config", {}), int(body.get("priority", 0)))
+    except JobRejected as e:
+        return jsonify({"ok": False, "error": str(e)}), 429
+    if runner.get_status(job_id, since=0)["cached"]:
+        return jsonify({"ok": True, "job_id": job_id, "cached": True}), 200, {CACHE_HEADER: "hit"}
+    return jsonify({"ok": True, "job_id": job_id, "cached": False}), 202, {CACHE_HEADER: "miss"}
+
+
+@bp.route("/api/jobs/stats")
+def api_job_stats():
+    """Queue and job-store metrics of the server-side runner."""
+    return jsonify(_runner().stats())
+
+
+def _since_arg():
+    """The ``since`` result index of the request (``?since=`` or ``Last-Event-ID``)."""
+    raw = request.args.get("since", request.headers.get("Last-Event-ID"))
+    if raw is None:
+        return None
+    try:
+        since = int(raw)
+    except ValueError:
+        abort(400)
+    if since < 0:
+        abort(400)
+    return since
+
+
+@bp.route("/api/jobs/<job_id>")
+def api_job_status(job_id: str):
+    """Status, progress and results of a server-side job.
+
+    ``?since=n`` returns only the results after the first *n*.
+    """
+    from auto_goldfish.web.services.result_cache import CACHE_HEADER
+
+    status = _runner().get_status(job_id, since=_since_arg())
+    if status is None:
+        abort(404)
+    return jsonify(status), 200, {CACHE_HEADER: "hit" if status["cached"] else "miss"}
+
+
+def _sse(event: str, data, event_id=None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+@bp.route("/api/jobs/<job_id>/events")
+def api_job_events(job_id: str):
+    """Server-Sent Events stream of a server-side job.
+
+    Events: ``progress`` (status, progress, queue position, ETA) on every
+    change, ``leaderboard`` when the optimizer's leaderboard changes,
+    ``result`` once per finished result (its ``id`` is the number of
+    results sent so far, so a reconnecting client resumes through
+    ``Last-Event-ID``) and a final ``done`` with the job's outcome.
+
+    Each connection holds a server thread, so a stream is closed after
+    ``SSE_MAX_STREAM_S`` seconds; EventSource then reconnects and resumes
+    from the last ``result`` it saw.
+    """
+    runner = _runner()
+    status = runner.get_status(job_id, since=_since_arg() or 0)
+    if status is None:
+        abort(404)
+
+    def stream():
+        sent = status["n_results"] - len(status["results"])
+        current = status
+        leaderboard = None
+        deadline = time.monotonic() + SSE_MAX_STREAM_S
+        while True:
+            for result in current["results"]:
+                sent += 1
+                yield _sse("result", result, sent)
+            if current["leaderboard"] is not None and current["leaderboard"] != leaderboard:
+                leaderboard = current["leaderboard"]
+                yield _sse("leaderboard", leaderboard)
+            yield _sse("progress", {
+                key: current[key]
+                for key in ("status", "progress", "total", "queue_position", "eta_s")
+            })
+            if current["status"] in ("completed", "failed", "cancelled"):
+                yield _sse("done", {
+                    key: current[key]
+                    for key in ("status", "error", "n_results", "cache_stats")
+                })
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                yield f"retry: {SSE_RETRY_MS}\n\n"
+                return
+            version = runner.wait_for_update(
+                job_id, current["version"], min(SSE_KEEPALIVE_S, remaining),
+            )
+            if version is None:
+                return
+            if version == current["version"] and current["status"] == "running":
+                yield ": keep-alive\n\n"
+                continue
+            current = runner.get_status(job_id, since=sent)
+            if current is None:
+                return
+
+    return Response(
+        stream_with_context(stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@bp.route("/api/jobs/<job_id>", methods=["DELETE"])
+@bp.route("/api/jobs/<job_id>/cancel", methods=["POST"])
+def api_cancel_job(job_id: str):
+    """Cancel a waiting or running job; finished jobs answer 409."""
+    status = _runner().cancel(job_id)
+    if status is None:
+        abort(404)
+    if status in ("completed", "failed"):
+        return jsonify({"ok": False, "status": status, "error": "Job already finished"}), 409
+    return jsonify({"ok": True, "status": status})
@@ -0,0 +1,282 @@
+"""Bounded scheduler for server-side simulation jobs.
+
+``SimulationRunner`` used to start one thread per submitted job, so a
+burst of submissions ran every job at once and each one competed for
+the same cores.  ``JobScheduler`` instead keeps a fixed number of worker
+slots fed from a priority queue:
+
+* jobs wait in order of priority (higher first), then submission order;
+* each job carries a cost estimate (``estimate_job_cost``: games x turns
+  x land counts x configs) so the scheduler can report a queue position
+  and an ETA for every waiting job;
+* admission control refuses jobs when the queue is full, and jobs above
+  ``max_cost`` are either rejected or deferred: a deferred job waits
+  behind every regular job and at most one deferred job runs at a time,
+  so a few huge jobs cannot occupy every slot.
+
+The scheduler only orders and runs jobs; what a job does is the
+*execute* callable's business.  Simulation jobs run their games in a
+process pool of their own (``Goldfisher(workers=..., in_process=False)``,
+a one-process pool when ``workers == 1``), so a slot is a thread that
+mostly waits on its processes.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# "reject": oversized jobs raise JobRejected; "defer": they queue behind
+# all regular jobs and run one at a time
+VALID_ADMISSION_POLICIES = ("reject", "defer")
+
+# Weight of the newest job in the throughput estimate
+_RATE_SMOOTHING = 0.3
+
+
+class JobRejected(ValueError):
+    """Raised when a job is refused admission to the queue."""
+
+
+def estimate_job_cost(config: Dict[str, Any]) -> int:
+    """Turn-games a job described by *config* plays, at most.
+
+    A land sweep plays ``sims`` games of ``turns`` turns per land count.
+    An optimization plays up to ``sims`` games for every config of its
+    search space (land counts x candidate additions), unless ``max_games``
+    caps it lower.  Racing usually stops far below this bound; the
+    estimate ranks jobs and sizes ETAs, it does not predict exact times.
+    """
+    horizons = config.get("horizons")
+    turns = max(horizons) if horizons else config.get("turns", 10)
+    sims = config.get("sims", 1000)
+    min_lands = config.get("min_lands")
+    max_lands = config.get("max_lands")
+    if min_lands is not None and max_lands is not None:
+        land_counts = max(max_lands - min_lands + 1, 1)
+    else:
+        land_counts = 1 if not config.get("optimization_enabled") else 5
+
+    if not config.get("optimization_enabled"):
+        return int(sims * turns * land_counts)
+
+    from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+    from auto_goldfish.optimization.deck_config import ConfigSpace
+
+    enabled = set(config.get("enabled_candidates", []))
+    candidates = {cid: c for cid, c in ALL_CANDIDATES.items() if cid in enabled}
+    n_configs = len(ConfigSpace(
+        candidates,
+        max_draw=config.get("max_draw_additions", 2),
+        max_ramp=config.get("max_ramp_additions", 2),
+        land_range=0,
+    ))
+    games = sims * land_counts * n_configs
+    if config.get("max_games"):
+        games = min(games, config["max_games"])
+    return int(games * turns)
+
+
+@dataclass(order=True)
+class _Entry:
+    deferred: bool
+    neg_priority: int
+    seq: int
+    job_id: str = field(compare=False)
+    payload: Any = field(compare=False)
+    cost: int = field(compare=False)
+
+
+class JobScheduler:
+    """Fixed pool of worker threads fed from a priority queue.
+
+    Args:
+        execute: ``callable(payload)`` run on a worker thread for each job;
+            exceptions are logged, never propagated.
+        max_workers: Jobs that run at the same time.
+        max_queued: Jobs that may wait; submissions beyond it are rejected.
+        max_cost: Cost above which admission control applies (``None``
+            admits any cost).
+        admission: One of ``VALID_ADMISSION_POLICIES``.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[Any], None],
+        max_workers: int = 2,
+        max_queued: int = 32,
+        max_cost: Optional[int] = None,
+        admission: str = "reject",
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        if max_queued < 0:
+            raise ValueError(f"max_queued must be >= 0, got {max_queued}")
+        if admission not in VALID_ADMISSION_POLICIES:
+            raise ValueError(
+                f"Invalid admission: {admission!r}. Must be one of {VALID_ADMISSION_POLICIES}."
+            )
+        self.execute = execute
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_cost = max_cost
+        self.admission = admission
+
+        self._cond = threading.Condition()
+        self._queue: List[_Entry] = []
+        # job_id -> (entry, start time)
+        self._running: Dict[str, tuple] = {}
+        self._seq = itertools.count()
+        self._threads: List[threading.Thread] = []
+        # Cost units one worker completes per second, once measured
+        self._rate: Optional[float] = None
+        # Running jobs whose run says nothing about throughput (cancelled)
+        self._unmeasured: set = set()
+        self._closed = False
+
+    def submit(self, job_id: str, payload: Any, cost: int, priority: int = 0) -> None:
+        """Queue a job.  Raises ``JobRejected`` if admission control refuses it."""
+        deferred = self.max_cost is not None and cost > self.max_cost
+        if deferred and self.admission == "reject":
+            raise JobRejected(
+                f"Job cost {cost} exceeds the limit of {self.max_cost}; "
+                "lower sims, turns or the search space."
+            )
+        with self._cond:
+            if self._closed:
+                raise JobRejected("Scheduler is shut down.")
+            if len(self._queue) >= self.max_queued:
+                raise JobRejected(
+                    f"Job queue is full ({self.max_queued} waiting); try again later."
+                )
+            heapq.heappush(
+                self._queue, _Entry(deferred, -priority, next(self._seq), job_id, payload, cost)
+            )
+            self._start_workers()
+            self._cond.notify()
+
+    def discard(self, job_id: str) -> bool:
+        """Remove a waiting job from the queue; False if it is not waiting.
+
+        A running job is left to stop on its own, but its run no longer
+        counts towards the throughput estimate.
+        """
+        with self._cond:
+            if job_id in self._running:
+                self._unmeasured.add(job_id)
+                return False
+            for i, entry in enumerate(self._queue):
+                if entry.job_id == job_id:
+                    self._queue[i] = self._queue[-1]
+                    self._queue.pop()
+                    heapq.heapify(self._queue)
+                    return True
+        return False
+
+    def position(self, job_id: str) -> Optional[int]:
+        """1-based place of a waiting job in the queue, ``None`` otherwise."""
+        with self._cond:
+            for i, entry in enumerate(sorted(self._queue), 1):
+                if entry.job_id == job_id:
+                    return i
+        return None
+
+    def eta(self, job_id: str) -> Optional[float]:
+        """Estimated seconds until *job_id* finishes.
+
+        ``None`` until a first job has completed (no throughput measured
+        yet) or when the job is neither waiting nor running.  A waiting
+        job finishes once the running jobs, the jobs ahead of it and the
+        job itself are done, spread over all workers.
+        """
+        with self._cond:
+            if self._rate is None:
+                return None
+            now = time.monotonic()
+            remaining = {
+                jid: max(entry.cost - self._rate * (now - start), 0.0)
+                for jid, (entry, start) in self._running.items()
+            }
+            if job_id in remaining:
+                return remaining[job_id] / self._rate
+            work = sum(remaining.values())
+            for entry in sorted(self._queue):
+                work += entry.cost
+                if entry.job_id == job_id:
+                    return work / (self._rate * self.max_workers)
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the queue: workers, running and waiting jobs, throughput."""
+        with self._cond:
+            return {
+                "workers": self.max_workers,
+                "running": len(self._running),
+                "queued": len(self._queue),
+                "queued_cost": sum(e.cost for e in self._queue),
+                "cost_per_s": self._rate,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop taking jobs; queued jobs are dropped, running ones finish."""
+        with self._cond:
+            self._closed = True
+            self._queue.clear()
+            self._cond.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def _start_workers(self) -> None:
+        # Called with the lock held; workers start on first use
+        while len(self._threads) < self.max_workers:
+            thread = threading.Thread(target=self._worker, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_entry(self) -> Optional[_Entry]:
+        # Called with the lock held
+        if not self._queue:
+            return None
+        entry = self._queue[0]
+        if entry.deferred and any(e.deferred for e, _ in self._running.values()):
+            return None
+        return heapq.heappop(self._queue)
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                entry = self._next_entry()
+                while entry is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    entry = self._next_entry()
+                start = time.monotonic()
+                self._running[entry.job_id] = (entry, start)
+
+            try:
+                self.execute(entry.payload)
+            except Exception:
+                logger.exception("Job %s failed in the scheduler", entry.job_id)
+
+            with self._cond:
+                del self._running[entry.job_id]
+                measured = entry.job_id not in self._unmeasured
+                self._unmeasured.discard(entry.job_id)
+                elapsed = time.monotonic() - start
+                if measured and entry.cost > 0 and elapsed > 0:
+                    rate = entry.cost / elapsed
+                    self._rate = rate if self._rate is None else (
+                        _RATE_SMOOTHING * rate + (1 - _RATE_SMOOTHING) * self._rate
+                    )
+                # A finished deferred job may unblock the next one
+                self._cond.notify_all()
@@ -0,0 +1,330 @@
+"""Bounded in-memory store of server-side jobs, with spill to disk or DB.
+
+A finished job keeps its full result dicts (game records, replays, card
+performance), so keeping every job for the life of the process grows
+without bound.  ``JobStore`` keeps waiting and running jobs in memory
+unconditionally and bounds the finished ones:
+
+* a finished job expires from memory ``ttl_s`` seconds after it
+  finished;
+* past ``max_bytes`` the least recently read finished jobs are evicted
+  first.  A job's size is the length of its JSON encoding, which tracks
+  the memory its result dicts hold.
+
+Evicted and expired jobs are written to an optional ``JobSpill`` (a
+directory of gzipped JSON files or the ``job_results`` table) and loaded
+back on the next ``get``, so status requests for old jobs keep working.
+Without a spill store they are simply forgotten.  Spill reads and writes
+run outside the store's lock, so a slow disk or database does not stall
+status requests for other jobs.  Like ``SampleCache``,
+spill backends log their errors and never fail a request.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+from auto_goldfish.blob_store import DbBlobStore, DiskBlobStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL_S = 3600.0
+DEFAULT_SPILL_MAX_BYTES = 1024 * 1024 * 1024
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+
+def encode_job(record: Dict[str, Any]) -> bytes:
+    """Gzipped JSON of a job record (see ``SimJob.to_dict``)."""
+    return gzip.compress(json.dumps(record, default=str).encode())
+
+
+def decode_job(data: bytes) -> Dict[str, Any]:
+    return json.loads(gzip.decompress(data))
+
+
+class JobSpill(ABC):
+    """LRU-capped store of finished job records.
+
+    Backends implement ``_read`` (``None`` on a miss), ``_write`` and
+    ``_evict``.  Backend errors are logged and treated as misses.
+
+    Args:
+        max_bytes: Size cap; least recently used records are evicted once
+            the store grows past it.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_SPILL_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.writes = 0
+        self.reads = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The record of *job_id*, or ``None``."""
+        try:
+            data = self._read(job_id)
+            record = decode_job(data) if data is not None else None
+        except Exception:
+            logger.exception("Job spill read failed for %s", job_id)
+            record = None
+        if record is None:
+            self.misses += 1
+        else:
+            self.reads += 1
+        return record
+
+    def save(self, job_id: str, record: Dict[str, Any]) -> bool:
+        """Store *record*, then enforce the size cap.  False if it was not stored."""
+        try:
+            data = encode_job(record)
+            if len(data) > self.max_bytes:
+                return False
+            self._write(job_id, data)
+            self.writes += 1
+            self.evictions += self._evict(self.max_bytes)
+            return True
+        except Exception:
+            logger.exception("Job spill write failed for %s", job_id)
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "writes": self.writes,
+            "reads": self.reads,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    # -- Backend hooks --
+
+    @abstractmethod
+    def _read(self, job_id: str) -> Optional[bytes]:
+        """The record bytes of *job_id*, marked as recently used, or ``None``."""
+
+    @abstractmethod
+    def _write(self, job_id: str, data: bytes) -> None:
+        """Store *data* as the record of *job_id*."""
+
+    @abstractmethod
+    def _evict(self, max_bytes: int) -> int:
+        """Drop least recently used records until under *max_bytes*; return the count."""
+
+
+class DiskJobSpill(JobSpill):
+    """One ``<job_id>.json.gz`` file per job; file mtime is the LRU clock."""
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_SPILL_MAX_BYTES) -> None:
+        super().__init__(max_bytes)
+        self.directory = directory
+        self._blobs = DiskBlobStore(directory, ".json.gz")
+
+    def _read(self, job_id: str) -> Optional[bytes]:
+        return self._blobs.read(job_id)
+
+    def _write(self, job_id: str, data: bytes) -> None:
+        self._blobs.write(job_id, data)
+
+    def _evict(self, max_bytes: int) -> int:
+        return self._blobs.evict(max_bytes)
+
+
+class DbJobSpill(JobSpill):
+    """Records in the ``job_results`` table of the optional database.
+
+    Args:
+        session_scope: Context manager factory yielding a committed
+            session (default: ``auto_goldfish.db.session.get_session``).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_SPILL_MAX_BYTES,
+        session_scope: Optional[Callable[[], ContextManager[Any]]] = None,
+    ) -> None:
+        super().__init__(max_bytes)
+        from auto_goldfish.db.models import JobResultRow
+
+        self._blobs = DbBlobStore(JobResultRow, JobResultRow.job_id, session_scope)
+
+    def _read(self, job_id: str) -> Optional[bytes]:
+        return self._blobs.read(job_id)
+
+    def _write(self, job_id: str, data: bytes) -> None:
+        self._blobs.write(job_id, data)
+
+    def _evict(self, max_bytes: int) -> int:
+        return self._blobs.evict(max_bytes)
+
+
+class JobStore:
+    """Jobs by ID: active jobs always in memory, finished ones bounded.
+
+    Jobs are duck-typed: they need ``job_id``, ``status`` and
+    ``to_dict()``; *from_dict* rebuilds one from a spilled record.
+
+    Args:
+        from_dict: ``callable(record) -> job``.
+        max_bytes: Size cap of the finished jobs held in memory.
+        ttl_s: Seconds a finished job stays in memory (``None`` keeps it
+            until the size cap evicts it).
+        spill: Optional ``JobSpill`` receiving evicted jobs.
+        clock: Time source (monotonic seconds).
+    """
+
+    def __init__(
+        self,
+        from_dict: Callable[[Dict[str, Any]], Any],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_s: Optional[float] = DEFAULT_TTL_S,
+        spill: Optional[JobSpill] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.from_dict = from_dict
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self.spill = spill
+        self._clock = clock
+        self._lock = threading.RLock()
+        # Least recently used first
+        self._jobs: "OrderedDict[str, Any]" = OrderedDict()
+        # Finished jobs only: job_id -> (size in bytes, finish time)
+        self._finished: Dict[str, tuple] = {}
+        # Finished jobs whose record the spill already holds
+        self._spilled: set = set()
+        # Evicted job records not yet written to the spill
+        self._unwritten: Dict[str, Dict[str, Any]] = {}
+        self.bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.reloads = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def add(self, job: Any) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = job
+            evicted = self._evict()
+        self._spill(evicted)
+
+    def remove(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            self._forget(job_id)
+
+    def get(self, job_id: str) -> Optional[Any]:
+        """The job, reloaded from the spill store when it was evicted."""
+        with self._lock:
+            evicted = self._evict()
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs.move_to_end(job_id)
+            record = self._unwritten.get(job_id)
+        self._spill(evicted)
+        if job is not None:
+            return job
+        if record is None:
+            if self.spill is None:
+                return None
+            record = self.spill.load(job_id)
+            if record is None:
+                return None
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                # Another thread reloaded it meanwhile
+                return job
+            job = self.from_dict(record)
+            self.reloads += 1
+            self._jobs[job_id] = job
+            self._spilled.add(job_id)
+            self._account(job)
+            evicted = self._evict(keep=job_id)
+        self._spill(evicted)
+        return job
+
+    def finish(self, job_id: str) -> None:
+        """Mark a job as finished: from now on it counts against the bounds."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job_id in self._finished:
+                return
+            self._account(job)
+            evicted = self._evict()
+        self._spill(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory metrics of the store (and its spill store, if any)."""
+        with self._lock:
+            stats = {
+                "jobs": len(self._jobs),
+                "active_jobs": len(self._jobs) - len(self._finished),
+                "finished_jobs": len(self._finished),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "reloads": self.reloads,
+            }
+            if self.spill is not None:
+                stats["spill"] = self.spill.stats()
+            return stats
+
+    def _account(self, job: Any) -> None:
+        size = len(json.dumps(job.to_dict(), default=str))
+        self._finished[job.job_id] = (size, self._clock())
+        self.bytes += size
+
+    def _forget(self, job_id: str) -> None:
+        entry = self._finished.pop(job_id, None)
+        if entry is not None:
+            self.bytes -= entry[0]
+        self._spilled.discard(job_id)
+
+    def _drop(self, job_id: str, evicted: List[str]) -> None:
+        job = self._jobs.pop(job_id)
+        if self.spill is not None and job_id not in self._spilled:
+            self._unwritten[job_id] = job.to_dict()
+            evicted.append(job_id)
+        self._forget(job_id)
+
+    def _evict(self, keep: Optional[str] = None) -> List[str]:
+        # Called with the lock held.  Returns the dropped jobs whose
+        # records still have to be written, see ``_spill``.
+        evicted: List[str] = []
+        if self.ttl_s is not None:
+            cutoff = self._clock() - self.ttl_s
+            for job_id in [j for j, (_, t) in self._finished.items() if t <= cutoff and j != keep]:
+                self._drop(job_id, evicted)
+                self.expirations += 1
+        if self.bytes <= self.max_bytes:
+            return evicted
+        for job_id in list(self._jobs):
+            if self.bytes <= self.max_bytes:
+                break
+            if job_id in self._finished and job_id != keep:
+                self._drop(job_id, evicted)
+                self.evictions += 1
+        return evicted
+
+    def _spill(self, evicted: List[str]) -> None:
+        # Called without the lock: spill writes are disk or DB I/O.  Until
+        # its write finishes, ``get`` reloads a job from ``_unwritten``.
+        for job_id in evicted:
+            with self._lock:
+                record = self._unwritten.get(job_id)
+            if record is not None:
+                self.spill.save(job_id, record)
+            with self._lock:
+                self._unwritten.pop(job_id, None)
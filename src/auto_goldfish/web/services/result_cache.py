@@ -0,0 +1,225 @@
+"""Content-addressed cache of simulation results.
+
+A seeded run is deterministic: the same deck, card effects, engine
+settings, ``sims``, ``turns`` and seed always produce the same results
+(every game is seeded with ``seed + j``, whatever the worker count).
+``ResultCache`` stores the results of such runs under ``result_key`` so
+an identical request is answered without simulating.
+
+Unseeded runs and runs cut by a wall-clock budget (``time_budget_s``)
+are not reproducible and get no key.  Results live gzipped in an
+in-memory LRU capped at ``max_bytes``; ``DbResultCache`` adds the
+``result_cache`` table behind it so cached results survive restarts.
+Like ``SampleCache``, backend errors are logged and treated as misses.
+
+Bump ``CACHE_VERSION`` whenever the engine's game outcomes or the
+result dicts change.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+from auto_goldfish.blob_store import DbBlobStore
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DB_MAX_BYTES = 1024 * 1024 * 1024
+
+# Config keys that do not change a run's results.  Effect overrides are
+# hashed through the effective registry instead (see ``result_key``).
+_IGNORED_CONFIG_KEYS = ("workers", "checkpoint", "effect_overrides")
+
+# Response header telling clients whether results came from the cache
+CACHE_HEADER = "X-Result-Cache"
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("auto_goldfish")
+    except Exception:
+        return "unknown"
+
+
+def effective_registry(config: Dict[str, Any]):
+    """``DEFAULT_REGISTRY`` with the ``effect_overrides`` of *config* applied."""
+    from auto_goldfish.effects.card_database import DEFAULT_REGISTRY
+    from auto_goldfish.effects.json_loader import build_overridden_registry
+
+    overrides = config.get("effect_overrides")
+    return build_overridden_registry(DEFAULT_REGISTRY, overrides) if overrides else DEFAULT_REGISTRY
+
+
+def result_key(
+    deck_list: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    namespace: str = "job",
+    registry: Any = None,
+) -> Optional[str]:
+    """Content hash of a run of *deck_list* with *config*, or ``None`` if not cacheable.
+
+    *config* carries every engine setting (``sims``, ``turns``, ``seed``,
+    land range, mulligan, ...), so all of it is hashed except
+    ``_IGNORED_CONFIG_KEYS``.  Card effects are hashed like in
+    ``sample_key``: the ``repr`` of each deck card's entry in *registry*
+    (default: ``effective_registry(config)``), so editing
+    ``card_effects.json`` or overriding a card of the deck changes the
+    key.  *namespace* keeps results of different producers apart (server
+    jobs and client runs return differently shaped result dicts).
+    """
+    if config.get("seed") is None or config.get("time_budget_s"):
+        return None
+    if registry is None:
+        registry = effective_registry(config)
+    names = sorted({card.get("name") for card in deck_list} - {None})
+    payload = {
+        "version": CACHE_VERSION,
+        "package": _package_version(),
+        "namespace": namespace,
+        "deck": deck_list,
+        "effects": {name: repr(registry.get(name)) for name in names},
+        "config": {k: v for k, v in config.items() if k not in _IGNORED_CONFIG_KEYS},
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def encode_results(results: List[Dict[str, Any]]) -> bytes:
+    return gzip.compress(json.dumps(results, default=str).encode())
+
+
+def decode_results(data: bytes) -> List[Dict[str, Any]]:
+    return json.loads(gzip.decompress(data))
+
+
+class ResultCache:
+    """In-memory LRU of result lists, capped at *max_bytes* of gzipped JSON.
+
+    ``get`` returns a fresh copy of the results, so callers may mutate
+    it.  Subclasses add a persistent tier through ``_read``/``_write``.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Least recently used first
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """The cached results for *key*, or ``None``."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+        if data is None:
+            try:
+                data = self._read(key)
+            except Exception:
+                logger.exception("Result cache read failed for %s", key)
+                data = None
+            if data is not None:
+                self._remember(key, data)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return decode_results(data)
+
+    def put(self, key: str, results: List[Dict[str, Any]], persist: bool = True) -> None:
+        """Store *results* under *key*; ``persist=False`` keeps them out of the persistent tier."""
+        try:
+            data = encode_results(results)
+        except Exception:
+            logger.exception("Result cache encoding failed for %s", key)
+            return
+        self._remember(key, data)
+        self.writes += 1
+        if not persist:
+            return
+        try:
+            self._write(key, data)
+        except Exception:
+            logger.exception("Result cache write failed for %s", key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+            }
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= len(old)
+            self._entries[key] = data
+            self.bytes += len(data)
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= len(evicted)
+                self.evictions += 1
+
+    # -- Persistent tier hooks (none by default) --
+
+    def _read(self, key: str) -> Optional[bytes]:
+        return None
+
+    def _write(self, key: str, data: bytes) -> None:
+        pass
+
+
+class DbResultCache(ResultCache):
+    """``ResultCache`` backed by the ``result_cache`` table of the optional database.
+
+    Args:
+        max_bytes: Size cap of the in-memory tier.
+        db_max_bytes: Size cap of the table; least recently used rows are
+            deleted past it.
+        session_scope: Context manager factory yielding a committed
+            session (default: ``auto_goldfish.db.session.get_session``).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        db_max_bytes: int = DEFAULT_DB_MAX_BYTES,
+        session_scope: Optional[Callable[[], ContextManager[Any]]] = None,
+    ) -> None:
+        super().__init__(max_bytes)
+        self.db_max_bytes = db_max_bytes
+        from auto_goldfish.db.models import ResultCacheRow
+
+        self._blobs = DbBlobStore(ResultCacheRow, ResultCacheRow.key, session_scope)
+
+    def _read(self, key: str) -> Optional[bytes]:
+        return self._blobs.read(key)
+
+    def _write(self, key: str, data: bytes) -> None:
+        if len(data) > self.db_max_bytes:
+            return
+        self._blobs.write(key, data)
+        self._blobs.evict(self.db_max_bytes)
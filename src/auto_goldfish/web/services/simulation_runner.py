@@ -1,15 +1,27 @@
 """Background simulation job manager.
 
-Runs Goldfisher simulations in daemon threads. GameState is self-contained
-(no module-level globals), so concurrent simulations are safe.
+Runs Goldfisher simulations on a bounded pool of worker threads
+(``JobScheduler``); each job plays its games in its own process pool.
+GameState is self-contained (no module-level globals), so concurrent
+simulations are safe.  Jobs are kept in a ``JobStore`` that bounds the
+memory held by finished jobs.
+
+Every change to a job bumps its ``version`` and wakes the threads
+blocked in ``wait_for_update``, so progress streams push changes as they
+happen instead of polling; ``get_status(since=n)`` returns only the
+results a client has not seen yet.
+
+Seeded jobs whose results are already in the ``ResultCache`` complete
+at submission without being queued.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import threading
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -17,9 +29,19 @@ logger = logging.getLogger(__name__)
 from auto_goldfish.decklist.loader import load_decklist
 from auto_goldfish.effects.card_database import DEFAULT_REGISTRY
 from auto_goldfish.effects.json_loader import build_overridden_registry
+from auto_goldfish.engine.cancellation import CancelToken, SimulationCancelled
 from auto_goldfish.engine.goldfisher import Goldfisher
 from auto_goldfish.engine.mulligan import CurveAwareMulligan
 from auto_goldfish.metrics.reporter import result_to_dict
+from auto_goldfish.web.services.job_queue import JobScheduler, estimate_job_cost
+from auto_goldfish.web.services.job_store import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_SPILL_MAX_BYTES,
+    DEFAULT_TTL_S,
+    FINISHED_STATUSES,
+    JobStore,
+)
+from auto_goldfish.web.services.result_cache import ResultCache, result_key
 
 
 @dataclass
@@ -27,22 +49,210 @@ class SimJob:
     job_id: str
     deck_name: str
     config: Dict[str, Any]
-    status: str = "pending"  # pending | running | completed | failed
+    status: str = "pending"  # pending | running | completed | failed | cancelled
     progress: int = 0
     total: int = 0
     results: List[Dict[str, Any]] = field(default_factory=list)
     error: Optional[str] = None
+    cache_stats: Optional[Dict[str, Any]] = None
+    leaderboard: Optional[Dict[str, Any]] = None
+    cost: int = 0
+    priority: int = 0
+    version: int = 0  # bumped on every change, see SimulationRunner.wait_for_update
+    cached: bool = False  # results served from the ResultCache
+    cancel: CancelToken = field(default_factory=CancelToken, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly record of the job (without its cancel token)."""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "cancel"}
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "SimJob":
+        names = {f.name for f in fields(cls)} - {"cancel"}
+        return cls(**{k: v for k, v in record.items() if k in names})
+
+
+def make_sample_cache():
+    """Optimizer sample cache for server-side jobs, or ``None``.
+
+    Uses ``SAMPLE_CACHE_DIR`` on disk when set, else the database when one
+    is configured.  ``SAMPLE_CACHE_MAX_MB`` caps its size (default 512).
+    """
+    from auto_goldfish.optimization.sample_cache import DbSampleCache, DiskSampleCache
+
+    max_bytes = int(float(os.environ.get("SAMPLE_CACHE_MAX_MB", 512)) * 1024 * 1024)
+    cache_dir = os.environ.get("SAMPLE_CACHE_DIR")
+    if cache_dir:
+        return DiskSampleCache(cache_dir, max_bytes)
+    try:
+        from auto_goldfish.db.session import is_initialized
+    except ImportError:
+        return None
+    if is_initialized():
+        return DbSampleCache(max_bytes)
+    return None
+
+
+def make_job_spill():
+    """Spill store for finished jobs evicted from memory, or ``None``.
+
+    Uses ``JOB_SPILL_DIR`` on disk when set, else the database when one is
+    configured.  ``JOB_SPILL_MAX_MB`` caps its size (default 1024).
+    """
+    from auto_goldfish.web.services.job_store import DbJobSpill, DiskJobSpill
+
+    max_bytes = int(float(
+        os.environ.get("JOB_SPILL_MAX_MB", DEFAULT_SPILL_MAX_BYTES / (1024 * 1024))
+    ) * 1024 * 1024)
+    spill_dir = os.environ.get("JOB_SPILL_DIR")
+    if spill_dir:
+        return DiskJobSpill(spill_dir, max_bytes)
+    try:
+        from auto_goldfish.db.session import is_initialized
+    except ImportError:
+        return None
+    if is_initialized():
+        return DbJobSpill(max_bytes)
+    return None
+
+
+def make_result_cache() -> Optional[ResultCache]:
+    """Result cache for seeded jobs, or ``None`` when disabled.
+
+    ``RESULT_CACHE_MAX_MB`` caps the in-memory tier (default 64; 0
+    disables the cache).  With a database configured results are also
+    kept in it, up to ``RESULT_CACHE_DB_MAX_MB`` (default 1024).
+    """
+    from auto_goldfish.web.services.result_cache import DbResultCache
+
+    max_bytes = int(float(os.environ.get("RESULT_CACHE_MAX_MB", 64)) * 1024 * 1024)
+    if max_bytes <= 0:
+        return None
+    try:
+        from auto_goldfish.db.session import is_initialized
+    except ImportError:
+        return ResultCache(max_bytes)
+    if is_initialized():
+        db_max_bytes = int(float(os.environ.get("RESULT_CACHE_DB_MAX_MB", 1024)) * 1024 * 1024)
+        return DbResultCache(max_bytes, db_max_bytes)
+    return ResultCache(max_bytes)
+
+
+def make_surrogate():
+    """Surrogate model for optimizer pre-screening and config-page previews, or ``None``.
+
+    Loaded from ``SURROGATE_MODEL``, a file written by ``auto-goldfish
+    train-surrogate``.  A missing or unreadable file is logged and ignored.
+    """
+    path = os.environ.get("SURROGATE_MODEL")
+    if not path:
+        return None
+    from auto_goldfish.optimization.surrogate import SurrogateModel
+
+    try:
+        return SurrogateModel.load(path)
+    except Exception:
+        logger.exception("Could not load surrogate model %s", path)
+        return None
+
+
+def make_checkpoint_store():
+    """Checkpoint store for server-side optimization jobs, or ``None``.
+
+    Uses ``CHECKPOINT_DIR`` when set, so a job re-submitted after a restart
+    resumes from its last checkpoint.
+    """
+    checkpoint_dir = os.environ.get("CHECKPOINT_DIR")
+    if not checkpoint_dir:
+        return None
+    from auto_goldfish.optimization.checkpoint import DiskCheckpointStore
+
+    return DiskCheckpointStore(checkpoint_dir)
 
 
 class SimulationRunner:
-    """Manages background simulation jobs."""
-
-    def __init__(self) -> None:
-        self._jobs: Dict[str, SimJob] = {}
+    """Manages background simulation jobs.
+
+    Settings default to environment variables so the web app can size the
+    pool without code changes:
+
+    * ``SIM_MAX_WORKERS``: jobs running at once (default 2).
+    * ``SIM_MAX_QUEUED``: jobs waiting before submissions are rejected
+      (default 32).
+    * ``SIM_MAX_JOB_COST``: cost (turn-games, see ``estimate_job_cost``)
+      above which admission control applies (default unlimited).
+    * ``SIM_ADMISSION``: ``"reject"`` or ``"defer"`` oversized jobs.
+    * ``SIM_JOB_PROCESSES``: processes per job (default: the CPUs split
+      across the workers).  A job's ``workers`` setting is capped at it.
+      Games always play in worker processes, even for one process per
+      job, so slots never contend for the GIL.
+    * ``JOB_STORE_MAX_MB``: memory held by finished jobs before the least
+      recently read ones are evicted (default 256).
+    * ``JOB_TTL_S``: seconds a finished job stays in memory (default 3600).
+
+    Evicted jobs go to ``make_job_spill()`` when one is configured and are
+    reloaded transparently by ``get_status``.  Results of seeded jobs are
+    cached in ``make_result_cache()`` unless *result_cache* is given.
+    Racing optimizations pre-screen configs with ``make_surrogate()``
+    unless *surrogate* is given.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queued: Optional[int] = None,
+        max_job_cost: Optional[int] = None,
+        admission: Optional[str] = None,
+        processes_per_job: Optional[int] = None,
+        job_store: Optional[JobStore] = None,
+        result_cache: Optional[ResultCache] = None,
+        surrogate: Any = None,
+    ) -> None:
         self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+        env = os.environ
+        if job_store is None:
+            job_store = JobStore(
+                SimJob.from_dict,
+                max_bytes=int(float(env.get(
+                    "JOB_STORE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024)
+                )) * 1024 * 1024),
+                ttl_s=float(env.get("JOB_TTL_S", DEFAULT_TTL_S)),
+                spill=make_job_spill(),
+            )
+        self._jobs = job_store
+        self.result_cache = result_cache if result_cache is not None else make_result_cache()
+        self.surrogate = surrogate if surrogate is not None else make_surrogate()
+        if max_workers is None:
+            max_workers = int(env.get("SIM_MAX_WORKERS", 2))
+        if max_queued is None:
+            max_queued = int(env.get("SIM_MAX_QUEUED", 32))
+        if max_job_cost is None and env.get("SIM_MAX_JOB_COST"):
+            max_job_cost = int(float(env["SIM_MAX_JOB_COST"]))
+        if admission is None:
+            admission = env.get("SIM_ADMISSION", "reject")
+        if processes_per_job is None:
+            processes_per_job = int(env.get(
+                "SIM_JOB_PROCESSES", max(1, (os.cpu_count() or 1) // max_workers)
+            ))
+        self.processes_per_job = processes_per_job
+        self.scheduler = JobScheduler(
+            lambda job: self._run_simulation(job),
+            max_workers=max_workers,
+            max_queued=max_queued,
+            max_cost=max_job_cost,
+            admission=admission,
+        )
 
-    def submit(self, deck_name: str, config: Dict[str, Any]) -> str:
-        """Start a background simulation. Returns the job ID."""
+    def submit(self, deck_name: str, config: Dict[str, Any], priority: int = 0) -> str:
+        """Queue a background simulation. Returns the job ID.
+
+        Jobs with a higher *priority* start first.  Raises ``JobRejected``
+        (a ``ValueError``) when the queue is full or the job is too large.
+        A seeded job with cached results is completed at once (its status
+        reports ``cached``) and never queued.
+        """
         job_id = uuid.uuid4().hex[:12]
         min_lands = config.get("min_lands", 36)
         max_lands = config.get("max_lands", 39)
@@ -53,41 +263,153 @@ class SimulationRunner:
             deck_name=deck_name,
             config=config,
             total=total,
+            cost=estimate_job_cost(config),
+            priority=priority,
         )
 
-        with self._lock:
-            self._jobs[job_id] = job
-
-        thread = threading.Thread(
-            target=self._run_simulation,
-            args=(job,),
-            daemon=True,
-        )
-        thread.start()
+        cached = self._cached_results(deck_name, config)
+        if cached is not None:
+            job.results = cached
+            job.progress = job.total
+            job.status = "completed"
+            job.cached = True
+            self._jobs.add(job)
+            self._jobs.finish(job_id)
+            return job_id
+
+        self._jobs.add(job)
+        try:
+            self.scheduler.submit(job_id, job, job.cost, priority)
+        except ValueError:
+            self._jobs.remove(job_id)
+            raise
         return job_id
 
-    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Return the current status of a job."""
+    def cancel(self, job_id: str) -> Optional[str]:
+        """Cancel a job.  Returns its status afterwards, ``None`` if unknown.
+
+        A waiting job leaves the queue at once.  A running job stops at
+        its next game (its worker processes are terminated) and frees its
+        slot; its status stays ``"running"`` until then.  Finished jobs
+        are left alone.
+        """
+        # Outside the runner lock: the store may reload the job from its spill
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        with self._lock:
+            if job.status in ("pending", "running"):
+                job.cancel.cancel()
+                if self.scheduler.discard(job_id):
+                    job.status = "cancelled"
+                    self._touch(job)
+            status = job.status
+        if status == "cancelled":
+            self._jobs.finish(job_id)
+        return status
+
+    def get_status(self, job_id: str, since: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Return the current status of a job.
+
+        With *since*, only ``results[since:]`` are returned and the config
+        is left out, so a client polling with the number of results it
+        already holds gets a payload that does not grow with the job.
+        ``n_results`` is the total number of results either way.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
         with self._lock:
-            job = self._jobs.get(job_id)
-            if job is None:
-                return None
-            return {
+            status = {
                 "job_id": job.job_id,
                 "deck_name": job.deck_name,
                 "status": job.status,
                 "progress": job.progress,
                 "total": job.total,
-                "config": job.config,
-                "results": job.results,
+                "results": job.results[since or 0:],
+                "n_results": len(job.results),
                 "error": job.error,
+                "cache_stats": job.cache_stats,
+                "leaderboard": job.leaderboard,
+                "cost": job.cost,
+                "cached": job.cached,
+                "version": job.version,
             }
+            if since is None:
+                status["config"] = job.config
+        if status["status"] in ("pending", "running"):
+            status["queue_position"] = self.scheduler.position(job_id)
+            status["eta_s"] = self.scheduler.eta(job_id)
+        else:
+            status["queue_position"] = None
+            status["eta_s"] = None
+        return status
+
+    def wait_for_update(
+        self, job_id: str, version: int, timeout: Optional[float] = None,
+    ) -> Optional[int]:
+        """Block until a job's version differs from *version* or it has finished.
+
+        Returns the job's current version (unchanged after *timeout*
+        seconds without a change), or ``None`` if the job is unknown.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        with self._changed:
+            self._changed.wait_for(
+                lambda: job.version != version or job.status in FINISHED_STATUSES, timeout,
+            )
+            return job.version
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue, job-store and result-cache metrics (memory held, evictions, hits)."""
+        stats = {"scheduler": self.scheduler.stats(), "jobs": self._jobs.stats()}
+        if self.result_cache is not None:
+            stats["result_cache"] = self.result_cache.stats()
+        return stats
+
+    def _cached_results(
+        self, deck_name: str, config: Dict[str, Any],
+    ) -> Optional[List[Dict[str, Any]]]:
+        if self.result_cache is None or config.get("seed") is None:
+            return None
+        try:
+            key = result_key(load_decklist(deck_name), self._cache_config(config))
+        except Exception:
+            # Unreadable deck: let the job run and report the error
+            return None
+        return self.result_cache.get(key) if key is not None else None
+
+    def _cache_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        # Surrogate pre-screening changes which configs a racing job ranks
+        if (self.surrogate is not None and config.get("optimization_enabled")
+                and config.get("algorithm", "racing") == "racing"):
+            return {**config, "surrogate": self.surrogate.digest()}
+        return config
+
+    def _touch(self, job: SimJob) -> None:
+        # Called with the lock held after changing *job*
+        job.version += 1
+        self._changed.notify_all()
 
     def _run_simulation(self, job: SimJob) -> None:
         """Execute the simulation in a background thread."""
+        try:
+            self._execute(job)
+        finally:
+            if job.status in FINISHED_STATUSES:
+                self._jobs.finish(job.job_id)
+
+    def _execute(self, job: SimJob) -> None:
         try:
             with self._lock:
+                if job.cancel.cancelled:
+                    job.status = "cancelled"
+                    self._touch(job)
+                    return
                 job.status = "running"
+                self._touch(job)
 
             deck_list = load_decklist(job.deck_name)
 
@@ -101,15 +423,21 @@ class SimulationRunner:
             if effect_overrides:
                 registry = build_overridden_registry(DEFAULT_REGISTRY, effect_overrides)
 
+            horizons = job.config.get("horizons")
+            turns = max(horizons) if horizons else job.config.get("turns", 10)
+
             goldfisher = Goldfisher(
                 deck_list,
-                turns=job.config.get("turns", 10),
+                turns=turns,
                 sims=job.config.get("sims", 1000),
                 verbose=False,
                 record_results=job.config.get("record_results", "quartile"),
                 deck_name=job.deck_name,
                 seed=job.config.get("seed"),
-                workers=job.config.get("workers", 1),
+                workers=min(
+                    job.config.get("workers") or self.processes_per_job, self.processes_per_job
+                ),
+                in_process=False,
                 mulligan_strategy=mulligan_strategy,
                 registry=registry,
                 mana_mode=job.config.get("mana_mode", "value"),
@@ -125,17 +453,31 @@ class SimulationRunner:
                 min_lands = job.config.get("min_lands", goldfisher.land_count)
                 max_lands = job.config.get("max_lands", goldfisher.land_count)
 
-                for i in range(min_lands, max_lands + 1):
-                    goldfisher.set_lands(i, cuts=job.config.get("cuts", []))
-                    result = goldfisher.simulate()
-                    result_dict = result_to_dict(result)
-
-                    with self._lock:
-                        job.results.append(result_dict)
-                        job.progress = len(job.results)
+                with goldfisher.shared_pool():
+                    for n_done, i in enumerate(range(min_lands, max_lands + 1), 1):
+                        goldfisher.set_lands(i, cuts=job.config.get("cuts", []))
+                        if horizons:
+                            horizon_results = goldfisher.simulate(
+                                horizons=horizons, cancel=job.cancel,
+                            )
+                            result_dicts = [result_to_dict(r) for r in horizon_results.values()]
+                        else:
+                            result_dicts = [result_to_dict(goldfisher.simulate(cancel=job.cancel))]
+
+                        with self._lock:
+                            job.results.extend(result_dicts)
+                            job.progress = n_done
+                            self._touch(job)
+
+            # Cached before the job reports completion, so a repeat
+            # submitted as soon as it completes is a hit
+            key = result_key(deck_list, self._cache_config(job.config), registry=registry)
+            if self.result_cache is not None and key is not None:
+                self.result_cache.put(key, job.results)
 
             with self._lock:
                 job.status = "completed"
+                self._touch(job)
 
             try:
                 from auto_goldfish.db.persistence import persist_completed_job
@@ -144,10 +486,16 @@ class SimulationRunner:
             except Exception:
                 logger.exception("Failed to persist simulation run to DB")
 
+        except SimulationCancelled:
+            with self._lock:
+                job.status = "cancelled"
+                self._touch(job)
+            logger.info("Simulation job %s cancelled", job.job_id)
         except Exception as e:
             with self._lock:
                 job.status = "failed"
                 job.error = str(e)
+                self._touch(job)
 
     def _run_optimization(self, job: SimJob, goldfisher: Goldfisher) -> None:
         """Run enumerate-and-evaluate optimization within a simulation job."""
@@ -183,11 +531,18 @@ class SimulationRunner:
             with self._lock:
                 job.progress = current
                 job.total = total
+                self._touch(job)
 
         def eval_cb(current: int, total: int) -> None:
             with self._lock:
                 job.progress = current
                 job.total = total
+                self._touch(job)
+
+        def leaderboard_cb(board: Dict[str, Any]) -> None:
+            with self._lock:
+                job.leaderboard = board
+                self._touch(job)
 
         # Compute land deltas from absolute min/max lands
         min_lands = config.get("min_lands")
@@ -200,6 +555,8 @@ class SimulationRunner:
             land_delta_max = max_lands - goldfisher.land_count
 
         algorithm = config.get("algorithm", "racing")
+        cache = make_sample_cache()
+        checkpoint = make_checkpoint_store()
         optimize_for = config.get("optimize_for", "floor_performance")
         swap_mode = config.get("swap_mode", False)
         max_draw = config.get("max_draw_additions", 2)
@@ -216,6 +573,17 @@ class SimulationRunner:
                 land_delta_max=land_delta_max,
                 optimize_for=optimize_for,
                 hyperband_max_sims=hyperband_max_sims,
+                workers=goldfisher.workers,
+                search=config.get("search", "racing"),
+                objectives=config.get("objectives"),
+                time_budget_s=config.get("time_budget_s"),
+                max_games=config.get("max_games"),
+                search_budget=config.get("search_budget"),
+                cut_sets=config.get("cut_sets", 0),
+                cache=cache,
+                checkpoint=checkpoint,
+                cancel=job.cancel,
+                surrogate=self.surrogate,
             )
         else:
             optimizer = DeckOptimizer(
@@ -231,6 +599,12 @@ class SimulationRunner:
                 eta=eta,
                 hyperband_min_sims=hyperband_min_sims,
                 hyperband_top_k=hyperband_top_k,
+                workers=goldfisher.workers,
+                cache=cache,
+                time_budget_s=config.get("time_budget_s"),
+                max_games=config.get("max_games"),
+                checkpoint=checkpoint,
+                cancel=job.cancel,
             )
 
         ranked = optimizer.run(
@@ -238,11 +612,24 @@ class SimulationRunner:
             final_top_k=5,
             enum_progress=enum_cb,
             eval_progress=eval_cb,
+            leaderboard=leaderboard_cb,
         )
+        if optimizer.cache_stats is not None:
+            logger.info("Sample cache for job %s: %s", job.job_id, optimizer.cache_stats)
+            with self._lock:
+                job.cache_stats = optimizer.cache_stats
+                self._touch(job)
+
+        if ranked and optimizer.stop_reason is not None:
+            ranked[0][1]["opt_stop_reason"] = optimizer.stop_reason
+        if ranked and optimizer.resumed_from is not None:
+            ranked[0][1]["opt_resumed_from"] = optimizer.resumed_from
 
         for deck_config, result_dict in ranked:
             result_dict["opt_config"] = deck_config.describe()
             result_dict["opt_land_delta"] = deck_config.land_delta
             result_dict["opt_added_cards"] = list(deck_config.added_cards)
+            result_dict["opt_cuts"] = list(deck_config.cuts)
             with self._lock:
                 job.results.append(result_dict)
+                self._touch(job)
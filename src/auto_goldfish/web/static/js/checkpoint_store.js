@@ -0,0 +1,54 @@
+/**
+ * CheckpointStore — IndexedDB storage for in-browser optimizer checkpoints.
+ *
+ * Keeps the latest checkpoint per deck as {runKey, data, saved_at}, where
+ * data is the base64 string the Pyodide worker posted.  The optimizer
+ * ignores a checkpoint whose run key does not match its settings, so a
+ * stale entry is harmless.  Every method resolves (to null on failure),
+ * since a missing checkpoint only means starting from scratch.
+ */
+var CheckpointStore = {
+    _dbName: 'ag_checkpoints',
+    _storeName: 'checkpoints',
+
+    _open: function() {
+        var self = this;
+        return new Promise(function(resolve) {
+            if (!window.indexedDB) return resolve(null);
+            var req = indexedDB.open(self._dbName, 1);
+            req.onupgradeneeded = function() {
+                req.result.createObjectStore(self._storeName);
+            };
+            req.onsuccess = function() { resolve(req.result); };
+            req.onerror = function() { resolve(null); };
+        });
+    },
+
+    _request: function(mode, action) {
+        var self = this;
+        return this._open().then(function(db) {
+            if (!db) return null;
+            return new Promise(function(resolve) {
+                var tx = db.transaction(self._storeName, mode);
+                var req = action(tx.objectStore(self._storeName));
+                req.onsuccess = function() { resolve(req.result || null); };
+                req.onerror = function() { resolve(null); };
+            });
+        });
+    },
+
+    /** Latest checkpoint entry for deckName, or null. */
+    get: function(deckName) {
+        return this._request('readonly', function(store) { return store.get(deckName); });
+    },
+
+    put: function(deckName, runKey, data) {
+        return this._request('readwrite', function(store) {
+            return store.put({runKey: runKey, data: data, saved_at: Date.now()}, deckName);
+        });
+    },
+
+    remove: function(deckName) {
+        return this._request('readwrite', function(store) { return store.delete(deckName); });
+    }
+};
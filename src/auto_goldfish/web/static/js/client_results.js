@@ -79,9 +79,21 @@ const ClientResults = (function() {
         return escapeHtml(str).replace(/\(([^)]+)\)/g, '<sub>($1)</sub>');
     }
 
+    // Distinct turn cutoffs of a multi-horizon run, ascending ([] for a
+    // run with a single horizon)
+    function horizonsOf(results) {
+        const turns = Array.from(new Set(results.map(r => r.turns))).sort((a, b) => a - b);
+        return turns.length > 1 ? turns : [];
+    }
+
     // -- Section renderers --
 
     function renderSummaryTable(results, isOptimization) {
+        const horizons = isOptimization ? [] : horizonsOf(results);
+        if (horizons.length) {
+            // One block of land counts per turn cutoff
+            results = results.slice().sort((a, b) => a.turns - b.turns || a.land_count - b.land_count);
+        }
         let html = '<h2>' + (isOptimization ? 'Optimization Results' : 'Summary Statistics') + '</h2>';
         if (isOptimization) {
             html += '<p class="hint">Ranked by optimization target. Top configurations evaluated with full simulation count.</p>';
@@ -115,6 +127,7 @@ const ClientResults = (function() {
         </details>`;
         html += '<div class="table-wrap"><table class="stats-table"><thead><tr>';
         if (isOptimization) html += '<th rowspan="2">Rank</th><th rowspan="2">Configuration</th>';
+        if (horizons.length) html += '<th rowspan="2">Turns</th>';
         html += '<th rowspan="2">Lands</th><th rowspan="2">Consistency</th><th rowspan="2">Avg Spells</th>';
         html += '<th colspan="5">Mana Spent <span class="mana-view-toggle" data-current="bottom_25">';
         html += '<button class="mana-view-btn active" data-view="bottom_25" title="Average mana in worst 25% of games">Floor</button>';
@@ -128,13 +141,14 @@ const ClientResults = (function() {
         html += '<th>Value</th><th>Draw</th><th>Ramp</th><th>V+D</th><th>All</th>';
         html += '<th>25th</th><th>50th</th><th>75th</th></tr></thead><tbody>';
 
-        const colCount = isOptimization ? 19 : 17;
+        const colCount = isOptimization ? 19 : horizons.length ? 18 : 17;
         for (let i = 0; i < results.length; i++) {
             const r = results[i];
             const isBaselineRef = isOptimization && r.opt_baseline_rank != null;
 
-            // Insert separator before the baseline reference row
-            if (isBaselineRef) {
+            // Insert separator before the baseline reference row and
+            // between turn cutoffs
+            if (isBaselineRef || (horizons.length && i > 0 && r.turns !== results[i - 1].turns)) {
                 html += '<tr class="baseline-separator"><td colspan="' + colCount + '"></td></tr>';
             }
 
@@ -149,6 +163,7 @@ const ClientResults = (function() {
                 const sourceBadge = r.opt_source ? ' <span class="source-badge source-' + r.opt_source + '">' + r.opt_source + '</span>' : '';
                 html += '<td style="text-align:left">' + formatConfig(r.opt_config || 'Base deck') + sourceBadge + '</td>';
             }
+            if (horizons.length) html += '<td>' + r.turns + '</td>';
             html += '<td>' + r.land_count + '</td>';
             html += '<td>' + fmt(r.consistency, 3) + ' <small>&plusmn;' + fmt(conMargin, 4) + '</small></td>';
             html += '<td>' + fmt(r.mean_spells_cast ?? 0, 2) + '</td>';
@@ -266,15 +281,22 @@ const ClientResults = (function() {
 
     // -- Chart rendering --
 
-    function renderCharts(data) {
-        const labels = data.map(d => d.land_count);
+    const HORIZON_COLORS = ['#2563eb', '#16a34a', '#dc2626', '#9333ea', '#ea580c', '#0891b2'];
 
+    function renderCharts(data) {
         // Destroy existing charts
         ['manaChart', 'consistencyChart'].forEach(id => {
             const existing = Chart.getChart(id);
             if (existing) existing.destroy();
         });
 
+        const horizons = horizonsOf(data);
+        if (horizons.length) {
+            renderHorizonCharts(data, horizons);
+            return;
+        }
+        const labels = data.map(d => d.land_count);
+
         // Mana EV
         new Chart(document.getElementById('manaChart'), {
             type: 'line',
@@ -327,6 +349,46 @@ const ClientResults = (function() {
         });
     }
 
+    // One line per turn cutoff, over the land counts
+    function renderHorizonCharts(data, horizons) {
+        const labels = Array.from(new Set(data.map(d => d.land_count))).sort((a, b) => a - b);
+        function datasets(field) {
+            return horizons.map(function(turns, i) {
+                const color = HORIZON_COLORS[i % HORIZON_COLORS.length];
+                const byLands = {};
+                data.filter(d => d.turns === turns).forEach(d => { byLands[d.land_count] = d[field]; });
+                return {label: turns + ' turns', data: labels.map(l => byLands[l] ?? null),
+                        borderColor: color, backgroundColor: color, borderWidth: 2, fill: false};
+            });
+        }
+
+        new Chart(document.getElementById('manaChart'), {
+            type: 'line',
+            data: {labels: labels, datasets: datasets('mean_mana')},
+            options: {
+                responsive: true,
+                plugins: {title: {display: true, text: 'Mean Mana by Land Count and Turns'}},
+                scales: {
+                    x: {title: {display: true, text: 'Land Count'}},
+                    y: {title: {display: true, text: 'Total Mana Spent'}}
+                }
+            }
+        });
+
+        new Chart(document.getElementById('consistencyChart'), {
+            type: 'line',
+            data: {labels: labels, datasets: datasets('consistency')},
+            options: {
+                responsive: true,
+                plugins: {title: {display: true, text: 'Consistency Score by Land Count and Turns'}},
+                scales: {
+                    x: {title: {display: true, text: 'Land Count'}},
+                    y: {title: {display: true, text: 'Consistency'}, min: 0, max: 1.2}
+                }
+            }
+        });
+    }
+
     // -- Replay viewer --
 
     function initReplayViewer(data) {
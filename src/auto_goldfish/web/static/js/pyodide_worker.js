@@ -3,18 +3,43 @@
  *
  * Message protocol:
  *   Main → Worker:
- *     {type: "init", wheelUrl: string}  -- Load Pyodide and install package
+ *     {type: "init", wheelUrl: string, cancelBuffer: SharedArrayBuffer|null}
+ *         -- Load Pyodide and install package.  The main thread cancels a
+ *         run by storing 1 in cancelBuffer (Int32 slot 0); the worker is
+ *         busy in Python and cannot receive messages meanwhile.  Without
+ *         shared memory (page not cross-origin isolated) the main thread
+ *         terminates the worker instead.
  *     {type: "run", deckJson: string, configJson: string}  -- Run simulation
+ *     {type: "predict", deckJson: string, configJson: string, modelJson: string}
+ *         -- Surrogate estimates per land count, without simulating
  *
  *   Worker → Main:
  *     {type: "init_progress", message: string}  -- Init status updates
  *     {type: "ready"}  -- Pyodide loaded and ready
  *     {type: "progress", current: number, total: number}  -- Sim progress
+ *     {type: "leaderboard", data: Object}  -- Interim optimizer standings
+ *     {type: "checkpoint", runKey: string, data: string|null}  -- Optimizer
+ *         checkpoint (base64) to keep for resuming; null once the run completed
  *     {type: "result", data: Array}  -- Simulation results
+ *     {type: "prediction", data: Array}  -- Surrogate estimates
+ *     {type: "cancelled"}  -- The run was cancelled
  *     {type: "error", message: string}  -- Error occurred
  */
 
 let pyodide = null;
+let cancelFlag = null;
+
+function shouldCancel() {
+    return cancelFlag !== null && Atomics.load(cancelFlag, 0) === 1;
+}
+
+function postFailure(prefix, err) {
+    if (String(err.message).includes("SimulationCancelled")) {
+        postMessage({type: "cancelled"});
+    } else {
+        postMessage({type: "error", message: prefix + err.message});
+    }
+}
 
 async function initPyodide(wheelUrl) {
     try {
@@ -60,6 +85,7 @@ async function runSimulation(deckJson, configJson) {
         pyodide.globals.set("_js_progress_callback", function(current, total) {
             postMessage({type: "progress", current: current, total: total});
         });
+        pyodide.globals.set("_js_should_cancel", shouldCancel);
 
         // Run the simulation
         const resultJson = await pyodide.runPythonAsync(`
@@ -69,6 +95,7 @@ _result = _run_sim(
     ${JSON.stringify(deckJson)},
     ${JSON.stringify(configJson)},
     progress_callback=_js_progress_callback,
+    should_cancel=_js_should_cancel,
 )
 _result
 `);
@@ -76,7 +103,7 @@ _result
         const results = JSON.parse(resultJson);
         postMessage({type: "result", data: results});
     } catch (err) {
-        postMessage({type: "error", message: "Simulation failed: " + err.message});
+        postFailure("Simulation failed: ", err);
     }
 }
 
@@ -93,6 +120,13 @@ async function runOptimization(deckJson, configJson) {
         pyodide.globals.set("_js_eval_callback", function(current, total) {
             postMessage({type: "progress", current: current, total: total, phase: "eval"});
         });
+        pyodide.globals.set("_js_leaderboard_callback", function(boardJson) {
+            postMessage({type: "leaderboard", data: JSON.parse(boardJson)});
+        });
+        pyodide.globals.set("_js_checkpoint_callback", function(runKey, data) {
+            postMessage({type: "checkpoint", runKey: runKey, data: data == null ? null : data});
+        });
+        pyodide.globals.set("_js_should_cancel", shouldCancel);
 
         const resultJson = await pyodide.runPythonAsync(`
 from auto_goldfish.pyodide_runner import run_optimization as _run_opt
@@ -102,6 +136,9 @@ _result = _run_opt(
     ${JSON.stringify(configJson)},
     enum_callback=_js_enum_callback,
     eval_callback=_js_eval_callback,
+    leaderboard_callback=_js_leaderboard_callback,
+    checkpoint_callback=_js_checkpoint_callback,
+    should_cancel=_js_should_cancel,
 )
 _result
 `);
@@ -109,17 +146,39 @@ _result
         const results = JSON.parse(resultJson);
         postMessage({type: "result", data: results});
     } catch (err) {
-        postMessage({type: "error", message: "Optimization failed: " + err.message});
+        postFailure("Optimization failed: ", err);
+    }
+}
+
+async function predictScores(deckJson, configJson, modelJson) {
+    if (!pyodide) return;
+    try {
+        const resultJson = await pyodide.runPythonAsync(`
+from auto_goldfish.pyodide_runner import predict_scores as _predict
+
+_predict(
+    ${JSON.stringify(deckJson)},
+    ${JSON.stringify(configJson)},
+    ${JSON.stringify(modelJson)},
+)
+`);
+        postMessage({type: "prediction", data: JSON.parse(resultJson)});
+    } catch (err) {
+        // Previews are best effort; the config page simply shows none
+        console.warn("Surrogate preview failed: " + err.message);
     }
 }
 
 onmessage = function(e) {
     const msg = e.data;
     if (msg.type === "init") {
+        cancelFlag = msg.cancelBuffer ? new Int32Array(msg.cancelBuffer) : null;
         initPyodide(msg.wheelUrl);
     } else if (msg.type === "run") {
         runSimulation(msg.deckJson, msg.configJson);
     } else if (msg.type === "run_optimization") {
         runOptimization(msg.deckJson, msg.configJson);
+    } else if (msg.type === "predict") {
+        predictScores(msg.deckJson, msg.configJson, msg.modelJson);
     }
 };
@@ -0,0 +1,134 @@
+"""Integration tests for budgeted (anytime) optimization runs."""
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+from auto_goldfish.optimization.optimizer import DeckOptimizer
+
+
+def _simple_deck(num_lands: int = 37, num_spells: int = 62) -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _candidates():
+    return {cid: c for cid, c in ALL_CANDIDATES.items() if cid in ("draw_2cmc_2", "ramp_2cmc_1")}
+
+
+def _goldfisher(played=None):
+    gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+    if played is not None:
+        play_sample = gf.play_sample
+
+        def counted(n_games, *args, **kw):
+            played.append(n_games)
+            return play_sample(n_games, *args, **kw)
+
+        gf.play_sample = counted
+    return gf
+
+
+def _fast(gf, **kwargs):
+    return FastDeckOptimizer(
+        gf, _candidates(), max_draw=1, max_ramp=1, land_range=1,
+        optimize_for="mean_mana", batch_size=10, min_games=20,
+        max_sims_per_config=200, **kwargs,
+    )
+
+
+def _check_board(board, phase):
+    assert board["phase"] == phase
+    assert board["entries"]
+    assert [e["rank"] for e in board["entries"]] == list(range(1, len(board["entries"]) + 1))
+    scores = [e["score"] for e in board["entries"]]
+    assert scores == sorted(scores, reverse=True)
+    for entry in board["entries"]:
+        lo, hi = entry["ci"]
+        assert lo <= entry["score"] <= hi
+
+
+class TestRacingBudgets:
+    def test_unbudgeted_run_has_no_stop_reason(self):
+        optimizer = _fast(_goldfisher())
+        optimizer.run(final_sims=50, final_top_k=3)
+        assert optimizer.stop_reason is None
+
+    def test_game_budget_stops_racing(self):
+        full_played, capped_played = [], []
+        _fast(_goldfisher(full_played)).run(final_sims=50, final_top_k=3)
+        capped = _fast(_goldfisher(capped_played), max_games=100)
+        results = capped.run(final_sims=50, final_top_k=3)
+        assert capped.stop_reason == "max_games"
+        assert sum(capped_played) < sum(full_played)
+        assert results
+
+    def test_leaderboards_and_final_board(self):
+        boards = []
+        optimizer = _fast(_goldfisher())
+        optimizer.run(final_sims=50, final_top_k=3, leaderboard=boards.append,
+                      leaderboard_interval_s=0.0)
+        assert len(boards) > 1
+        for board in boards:
+            _check_board(board, "racing")
+        games = [b["games"] for b in boards]
+        assert games == sorted(games)
+
+    def test_callback_can_stop_the_race(self):
+        boards = []
+
+        def stop_after_first(board):
+            boards.append(board)
+            return True
+
+        optimizer = _fast(_goldfisher())
+        results = optimizer.run(final_sims=50, final_top_k=3, leaderboard=stop_after_first)
+        assert optimizer.stop_reason == "stopped"
+        assert results
+        # The stop request is honoured before another racing round
+        assert len(boards) <= 2
+
+    def test_pareto_race_leaderboard(self):
+        boards = []
+        optimizer = _fast(_goldfisher(), objectives=("mean_mana_value", "consistency"),
+                          max_games=150)
+        optimizer.run(final_sims=50, final_top_k=3, leaderboard=boards.append)
+        assert optimizer.stop_reason == "max_games"
+        assert boards and "objectives" in boards[-1]["entries"][0]
+
+    def test_local_search_leaderboard(self):
+        boards = []
+        optimizer = _fast(_goldfisher(), search="local", search_budget=2000, max_games=300)
+        optimizer.run(final_sims=50, final_top_k=3, leaderboard=boards.append)
+        assert optimizer.stop_reason == "max_games"
+        assert boards
+        for board in boards:
+            _check_board(board, "local_search")
+
+
+class TestHyperbandBudgets:
+    def _optimizer(self, **kwargs):
+        return DeckOptimizer(
+            goldfisher=_goldfisher(), candidates=_candidates(), max_draw=1, max_ramp=1,
+            land_range=1, optimize_for="mean_mana", hyperband_max_sims=200, **kwargs,
+        )
+
+    def test_game_budget_stops_hyperband(self):
+        boards = []
+        optimizer = self._optimizer(max_games=300)
+        results = optimizer.run(final_sims=50, final_top_k=3, leaderboard=boards.append)
+        assert optimizer.stop_reason == "max_games"
+        assert results
+        assert boards and boards[-1]["phase"] == "hyperband"
+        _check_board(boards[-1], "hyperband")
+
+    def test_unbudgeted_hyperband_has_no_stop_reason(self):
+        optimizer = self._optimizer()
+        optimizer.run(final_sims=50, final_top_k=3)
+        assert optimizer.stop_reason is None
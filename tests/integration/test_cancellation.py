@@ -0,0 +1,150 @@
+"""Integration tests for cancelling simulations and optimizer runs."""
+
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from auto_goldfish.engine.cancellation import CancelToken, SimulationCancelled
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.checkpoint import DiskCheckpointStore
+from auto_goldfish.optimization.deck_config import DeckConfig
+from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+from auto_goldfish.optimization.optimizer import DeckOptimizer
+from auto_goldfish.optimization.samples import SampleStore
+
+
+def _simple_deck(num_lands: int = 37, num_spells: int = 62) -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _candidates():
+    return {cid: c for cid, c in ALL_CANDIDATES.items() if cid in ("draw_2cmc_2", "ramp_2cmc_1")}
+
+
+def _cancel_after(token, seconds):
+    timer = threading.Timer(seconds, token.cancel)
+    timer.start()
+    return timer
+
+
+class TestSimulate:
+    def test_uncancelled_token_changes_nothing(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=40, seed=1, record_results=None)
+        plain = gf.simulate(progress_callback=lambda *_: None)
+        with_token = gf.simulate(progress_callback=lambda *_: None, cancel=CancelToken())
+        assert with_token.mean_mana == plain.mean_mana
+
+    def test_cancelled_before_start(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=40, seed=1, record_results=None)
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(SimulationCancelled):
+            gf.simulate(progress_callback=lambda *_: None, cancel=token)
+
+    def test_sequential_stops_at_next_game(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=500, seed=1, record_results=None)
+        token = CancelToken()
+        seen = []
+
+        def progress(current, total):
+            seen.append(current)
+            if current == 10:
+                token.cancel()
+
+        with pytest.raises(SimulationCancelled):
+            gf.simulate(progress_callback=progress, cancel=token)
+        assert seen[-1] == 10
+
+    def test_horizons_cancel(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=40, seed=1, record_results=None)
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(SimulationCancelled):
+            gf.simulate(progress_callback=lambda *_: None, horizons=[3, 5], cancel=token)
+
+    def test_parallel_workers_stop_promptly(self):
+        gf = Goldfisher(_simple_deck(), turns=10, sims=200000, seed=1,
+                        record_results=None, workers=2)
+        token = CancelToken()
+        _cancel_after(token, 0.5)
+        with pytest.raises(SimulationCancelled):
+            gf.simulate(cancel=token)
+        cancelled_at = time.monotonic()
+        # The worker processes were terminated, not left to finish their batches
+        for _ in range(50):
+            if not multiprocessing.active_children():
+                break
+            time.sleep(0.02)
+        assert not multiprocessing.active_children()
+        # Games keep playing fine afterwards
+        gf.sims = 20
+        gf.workers = 1
+        assert gf.simulate(progress_callback=lambda *_: None).mean_mana > 0
+        assert time.monotonic() - cancelled_at < 5
+
+
+class TestSampleStore:
+    def test_parallel_extend_cancel_then_resume(self):
+        gf = Goldfisher(_simple_deck(), turns=10, sims=10, seed=3, record_results=None)
+        token = CancelToken()
+        store = SampleStore(gf, {}, workers=2, cancel=token)
+        try:
+            _cancel_after(token, 0.5)
+            start = time.monotonic()
+            with pytest.raises(SimulationCancelled):
+                store.extend([DeckConfig()], 200000)
+            assert time.monotonic() - start < 3
+            assert store.games(DeckConfig()) == 0
+
+            # A new token lets the same store play again with a fresh pool
+            store.cancel = None
+            store.extend([DeckConfig()], 20)
+            assert store.games(DeckConfig()) == 20
+        finally:
+            store.close()
+
+
+OPTIMIZERS = {
+    "racing": lambda gf, **kw: FastDeckOptimizer(
+        gf, _candidates(), max_draw=2, max_ramp=2, land_range=1, optimize_for="mean_mana",
+        batch_size=10, min_games=20, max_sims_per_config=100, **kw),
+    "hyperband": lambda gf, **kw: DeckOptimizer(
+        goldfisher=gf, candidates=_candidates(), max_draw=2, max_ramp=2, land_range=1,
+        optimize_for="mean_mana", hyperband_max_sims=60, **kw),
+}
+
+
+@pytest.mark.parametrize("kind", sorted(OPTIMIZERS))
+def test_optimizer_cancel_keeps_checkpoint(kind, tmp_path):
+    store = DiskCheckpointStore(str(tmp_path))
+    token = CancelToken()
+    calls = []
+
+    def progress(current, total):
+        calls.append(current)
+        if len(calls) == 3:
+            token.cancel()
+
+    gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+    optimizer = OPTIMIZERS[kind](gf, checkpoint=store, cancel=token)
+    with pytest.raises(SimulationCancelled):
+        optimizer.run(final_sims=50, final_top_k=2, enum_progress=progress)
+    assert gf.decklist is not None
+
+    # The cancelled run left a checkpoint the next run resumes from
+    gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+    optimizer = OPTIMIZERS[kind](gf, checkpoint=store)
+    ranked = optimizer.run(final_sims=50, final_top_k=2)
+    assert ranked
+    assert optimizer.resumed_from is not None
@@ -0,0 +1,77 @@
+"""Integration tests for paired leave-one-out card impact."""
+
+import pytest
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.optimization.card_impact import card_impacts, card_variant, impact_cards
+from auto_goldfish.optimization.deck_config import apply_config
+
+
+def _simple_deck(num_lands: int = 37, num_spells: int = 62) -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _goldfisher(**kwargs):
+    return Goldfisher(_simple_deck(), turns=6, sims=200, seed=42, record_results=None, **kwargs)
+
+
+def test_variants_remove_or_replace_one_card():
+    gf = _goldfisher()
+    size = len(gf.decklist)
+    apply_config(gf, card_variant("Creature 3"), {})
+    assert len(gf.decklist) == size - 1
+    assert "Creature 3" not in gf.deckdict
+
+    apply_config(gf, card_variant("Creature 3", "land"), {})
+    assert len(gf.decklist) == size and gf.land_count == 38
+    assert "Creature 3" not in gf.deckdict
+    gf.restore_original_decklist()
+    assert impact_cards(gf) == [f"Creature {i}" for i in range(62)]
+
+
+class TestCardImpacts:
+    def test_reports_paired_impacts(self):
+        gf = _goldfisher()
+        size = len(gf.decklist)
+        cards = ["Creature 0", "Creature 5", "Creature 11"]
+        calls = []
+        report = card_impacts(gf, cards, n_games=200, batch_size=80,
+                              progress=lambda c, t: calls.append((c, t)))
+
+        assert report["games"] == 200 and report["mode"] == "remove"
+        assert sorted(e["card"] for e in report["cards"]) == sorted(cards)
+        impacts = [e["impact"] for e in report["cards"]]
+        assert impacts == sorted(impacts, reverse=True)
+        for entry in report["cards"]:
+            lo, hi = entry["ci"]
+            assert lo <= entry["impact"] <= hi
+            assert entry["significant"] == (lo > 0 or hi < 0)
+            assert entry["impact"] == pytest.approx(report["baseline_score"] - entry["score"])
+        assert calls == [(320, 800), (640, 800), (800, 800)]
+        assert len(gf.decklist) == size
+
+    def test_bootstrap_targets_and_land_mode(self):
+        gf = _goldfisher()
+        report = card_impacts(gf, ["Creature 1", "Creature 4"], mode="land",
+                              n_games=100, optimize_for="floor_performance", n_bootstrap=50)
+        for entry in report["cards"]:
+            lo, hi = entry["ci"]
+            assert lo <= hi
+
+    def test_matches_across_worker_counts(self):
+        cards = ["Creature 2", "Creature 7"]
+        serial = card_impacts(_goldfisher(), cards, n_games=100)
+        parallel = card_impacts(_goldfisher(), cards, n_games=100, workers=2)
+        assert serial == parallel
+
+    def test_rejects_invalid_mode(self):
+        with pytest.raises(ValueError):
+            card_impacts(_goldfisher(), ["Creature 0"], mode="swap")
@@ -0,0 +1,175 @@
+"""Integration tests for checkpointing and resuming optimizer runs."""
+
+import pytest
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.checkpoint import DiskCheckpointStore
+from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+from auto_goldfish.optimization.optimizer import DeckOptimizer
+
+
+def _simple_deck(num_lands: int = 37, num_spells: int = 62) -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _candidates():
+    return {cid: c for cid, c in ALL_CANDIDATES.items() if cid in ("draw_2cmc_2", "ramp_2cmc_1")}
+
+
+def _goldfisher(played, seed=42):
+    gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=seed, record_results=None)
+    play_sample = gf.play_sample
+
+    def counted(n_games, *args, **kw):
+        played.append(n_games)
+        return play_sample(n_games, *args, **kw)
+
+    gf.play_sample = counted
+    return gf
+
+
+OPTIMIZERS = {
+    "racing": lambda gf, **kw: FastDeckOptimizer(
+        gf, _candidates(), max_draw=2, max_ramp=2, land_range=1, optimize_for="mean_mana",
+        batch_size=10, min_games=20, max_sims_per_config=200, **kw),
+    "local": lambda gf, **kw: FastDeckOptimizer(
+        gf, _candidates(), max_draw=2, max_ramp=2, land_range=2, optimize_for="mean_mana",
+        batch_size=10, min_games=20, max_sims_per_config=80, search="local",
+        search_budget=3000, **kw),
+    "pareto": lambda gf, **kw: FastDeckOptimizer(
+        gf, _candidates(), max_draw=2, max_ramp=2, land_range=1,
+        objectives=("mean_mana_value", "consistency"),
+        batch_size=10, min_games=20, max_sims_per_config=200, **kw),
+    "hyperband": lambda gf, **kw: DeckOptimizer(
+        goldfisher=gf, candidates=_candidates(), max_draw=2, max_ramp=2, land_range=1,
+        optimize_for="mean_mana", hyperband_max_sims=200, **kw),
+}
+
+
+class _Interrupt(Exception):
+    pass
+
+
+def _interrupted_run(kind, store, seed=42, after=4):
+    """Run until the *after*-th search progress report, then raise."""
+    calls = []
+
+    def progress(current, total):
+        calls.append(current)
+        if len(calls) == after:
+            raise _Interrupt
+
+    optimizer = OPTIMIZERS[kind](_goldfisher([], seed), checkpoint=store,
+                                 checkpoint_interval_s=3600)
+    with pytest.raises(_Interrupt):
+        optimizer.run(final_sims=100, final_top_k=3, enum_progress=progress)
+
+
+def _ranking(results):
+    return [(cfg, rd["mean_mana"], rd["consistency"]) for cfg, rd in results]
+
+
+class TestResume:
+    @pytest.mark.parametrize("kind", sorted(OPTIMIZERS))
+    def test_resumed_run_matches_uninterrupted(self, kind, tmp_path):
+        full_played = []
+        expected = OPTIMIZERS[kind](_goldfisher(full_played)).run(final_sims=100, final_top_k=3)
+
+        store = DiskCheckpointStore(str(tmp_path))
+        _interrupted_run(kind, store)
+        played = []
+        optimizer = OPTIMIZERS[kind](_goldfisher(played), checkpoint=store)
+        results = optimizer.run(final_sims=100, final_top_k=3)
+
+        assert _ranking(results) == _ranking(expected)
+        assert optimizer.resumed_from is not None
+        assert optimizer.resumed_from["games"] > 0
+        assert sum(played) < sum(full_played)
+        # A completed run drops its checkpoint
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unseeded_run_resumes_with_its_base_seed(self, tmp_path):
+        store = DiskCheckpointStore(str(tmp_path))
+        _interrupted_run("racing", store, seed=None)
+        state = store.load(next(tmp_path.iterdir()).stem)[0]
+        optimizer = OPTIMIZERS["racing"](_goldfisher([], seed=None), checkpoint=store)
+        results = optimizer.run(final_sims=100, final_top_k=3)
+        assert optimizer.resumed_from["base_seed"] == state["base_seed"]
+
+        seeded = OPTIMIZERS["racing"](_goldfisher([], seed=state["base_seed"]))
+        assert _ranking(results) == _ranking(seeded.run(final_sims=100, final_top_k=3))
+
+    def test_other_settings_start_fresh(self, tmp_path):
+        store = DiskCheckpointStore(str(tmp_path))
+        _interrupted_run("racing", store)
+        optimizer = FastDeckOptimizer(
+            _goldfisher([]), _candidates(), max_draw=2, max_ramp=2, land_range=1,
+            optimize_for="consistency", batch_size=10, min_games=20,
+            max_sims_per_config=200, checkpoint=store,
+        )
+        optimizer.run(final_sims=100, final_top_k=3)
+        assert optimizer.resumed_from is None
+        # The other run's checkpoint is left alone
+        assert len(list(tmp_path.iterdir())) == 1
+
+
+class TestPeriodicCheckpoints:
+    def test_checkpoints_during_search(self, tmp_path):
+        store = DiskCheckpointStore(str(tmp_path))
+        phases = []
+
+        def progress(current, total):
+            files = list(tmp_path.iterdir())
+            if files:
+                phases.append(store.load(files[0].stem)[0]["phase"])
+
+        optimizer = OPTIMIZERS["racing"](_goldfisher([]), checkpoint=store,
+                                         checkpoint_interval_s=0.0)
+        optimizer.run(final_sims=100, final_top_k=3, enum_progress=progress,
+                      eval_progress=progress)
+        assert "racing" in phases and phases[-1] == "final"
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestPyodideCheckpoints:
+    def test_callback_checkpoints_resume(self):
+        import json
+
+        from auto_goldfish.pyodide_runner import run_optimization
+
+        config = {
+            "turns": 5, "sims": 50, "seed": 42, "optimize_for": "mean_mana",
+            "enabled_candidates": ["draw_2cmc_2", "ramp_2cmc_1"],
+            "max_draw_additions": 1, "max_ramp_additions": 1,
+            "checkpoint_interval_s": 0.0,
+        }
+        saved = []
+
+        def interrupt(current, total):
+            if saved:
+                raise _Interrupt
+
+        with pytest.raises(_Interrupt):
+            run_optimization(json.dumps(_simple_deck()), json.dumps(config),
+                             enum_callback=interrupt,
+                             checkpoint_callback=lambda k, d: saved.append((k, d)))
+        key, data = saved[-1]
+        assert data is not None
+
+        calls = []
+        config["checkpoint"] = data
+        results = json.loads(run_optimization(
+            json.dumps(_simple_deck()), json.dumps(config),
+            checkpoint_callback=lambda k, d: calls.append((k, d)),
+        ))
+        assert results[0]["opt_resumed_from"]["run_key"] == key
+        assert calls[-1] == (key, None)
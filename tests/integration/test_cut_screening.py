@@ -0,0 +1,87 @@
+"""Integration tests for screened swap-mode cuts."""
+
+import pytest
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.deck_config import DeckConfig, apply_config, no_effect_cuts
+from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+
+
+def _simple_deck(num_lands: int = 37, num_spells: int = 62) -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _candidates():
+    return {cid: c for cid, c in ALL_CANDIDATES.items() if cid in ("draw_2cmc_2", "ramp_2cmc_1")}
+
+
+def _fast(gf, **kwargs):
+    return FastDeckOptimizer(
+        gf, _candidates(), swap_mode=True, max_draw=1, max_ramp=1, land_range=0,
+        optimize_for="mean_mana", batch_size=50, min_games=100,
+        max_sims_per_config=300, **kwargs,
+    )
+
+
+def test_apply_config_removes_explicit_cuts():
+    gf = Goldfisher(_simple_deck(), turns=5, sims=10, record_results="quartile")
+    original_count = len(gf.decklist)
+    config = DeckConfig(added_cards=("draw_2cmc_2",), cuts=("Creature 0",))
+    apply_config(gf, config, _candidates(), swap_mode=True)
+    names = [c.name for c in gf.decklist]
+    assert len(names) == original_count
+    assert "Creature 0" not in names
+    assert [c.index for c in gf.decklist] == list(range(original_count))
+
+
+def test_heuristic_cuts_unchanged_without_explicit_cuts():
+    gf = Goldfisher(_simple_deck(), turns=5, sims=10, record_results="quartile")
+    expected = no_effect_cuts(gf, 2)
+    apply_config(gf, DeckConfig(added_cards=("draw_2cmc_2", "ramp_2cmc_1")), _candidates(),
+                 swap_mode=True)
+    names = {c.name for c in gf.decklist}
+    assert all(name not in names for name in expected)
+    assert all(f"Creature {i}" in names for i in range(62) if f"Creature {i}" not in expected)
+
+
+class TestScreenedCutRacing:
+    def test_races_screened_cut_sets(self):
+        # Enough games for spells to be drawn in, and missing from, 20 of them
+        gf = Goldfisher(_simple_deck(), turns=8, sims=300, seed=42, record_results=None)
+        optimizer = _fast(gf, cut_sets=2)
+        results = optimizer.run(final_sims=300, final_top_k=3)
+
+        screened = [c["card"] for c in optimizer.cut_screening]
+        assert screened and results[0][1]["cut_screening"] == optimizer.cut_screening
+        raced = [cfg for cfg, _, _ in optimizer.all_round_scores]
+        cut_configs = [cfg for cfg in raced if cfg.cuts]
+        assert cut_configs
+        for cfg in cut_configs:
+            assert len(cfg.cuts) == len(cfg.added_cards)
+            assert set(cfg.cuts) <= set(screened[:len(cfg.cuts) + 1])
+        # Every addition config is also raced with the heuristic cuts
+        assert DeckConfig(added_cards=("draw_2cmc_2",)) in raced
+        for cfg, result in results:
+            assert len(cfg.cuts) in (0, len(cfg.added_cards))
+
+    def test_disabled_by_default(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+        optimizer = _fast(gf)
+        results = optimizer.run(final_sims=50, final_top_k=3)
+        assert optimizer.cut_screening is None
+        assert "cut_screening" not in results[0][1]
+        assert not any(cfg.cuts for cfg, _, _ in optimizer.all_round_scores)
+
+    def test_rejects_negative_cut_sets(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+        with pytest.raises(ValueError):
+            _fast(gf, cut_sets=-1)
@@ -0,0 +1,98 @@
+"""Exact evaluator as an oracle for the sampled goldfish engine."""
+
+import numpy as np
+import pytest
+
+from auto_goldfish.engine.exact import evaluate_exact, supports_exact
+from auto_goldfish.engine.goldfisher import Goldfisher
+
+
+def _vanilla_deck(num_lands: int = 37, num_spells: int = 62, max_cmc: int = 6) -> list[dict]:
+    """Commander plus lands and a flat curve of vanilla creatures."""
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % max_cmc) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _sampled(gf: Goldfisher, n: int, offset: int = 1000) -> np.ndarray:
+    return np.array([gf.simulate_single_game(offset + j) for j in range(n)])
+
+
+def test_supports_vanilla_deck():
+    gf = Goldfisher(_vanilla_deck(), turns=5, sims=10)
+    assert supports_exact(gf)
+
+
+def test_rejects_cards_with_effects():
+    deck = _vanilla_deck()
+    deck.append({"name": "Sol Ring", "cmc": 1, "cost": "{1}", "text": "",
+                 "types": ["Artifact"], "commander": False})
+    gf = Goldfisher(deck, turns=5, sims=10)
+    assert not supports_exact(gf)
+    with pytest.raises(ValueError, match="effectless"):
+        evaluate_exact(gf)
+
+
+def test_distribution_is_normalized():
+    ex = evaluate_exact(Goldfisher(_vanilla_deck(), turns=5, sims=10))
+    assert ex.probs.sum() == pytest.approx(1.0)
+    assert np.all(np.diff(ex.mana_by_turn) >= 0)
+    assert ex.mana_by_turn[-1] == pytest.approx(ex.mean_mana)
+    assert ex.percentile(25) <= ex.percentile(50) <= ex.percentile(75)
+    assert 0 < ex.consistency <= 1
+
+
+def test_lands_only_deck_is_deterministic():
+    """Seven-land hands mulligan twice; every turn then makes a land drop."""
+    deck = _vanilla_deck(num_lands=60, num_spells=0)
+    ex = evaluate_exact(Goldfisher(deck, turns=4, sims=10))
+    assert ex.mean_mulls == pytest.approx(2.0)
+    assert ex.mean_lands == pytest.approx(4.0)
+    assert ex.mean_draws == pytest.approx(10.0)
+    # The commander (cost 4) is cast on turn 4.
+    assert ex.values.tolist() == [4.0]
+    assert ex.mana_by_turn == pytest.approx([0.0, 0.0, 0.0, 4.0])
+
+
+@pytest.mark.parametrize("mana_efficiency", ["greedy", "mana_efficient", "spell_count"])
+def test_sampled_engine_matches_exact(mana_efficiency):
+    gf = Goldfisher(_vanilla_deck(max_cmc=4), turns=5, sims=10,
+                    mana_efficiency=mana_efficiency)
+    ex = evaluate_exact(gf)
+    vals = _sampled(gf, 3000)
+    se = vals.std(ddof=1) / np.sqrt(len(vals))
+    assert abs(vals.mean() - ex.mean_mana) < 4 * se
+    assert abs(np.percentile(vals, 50) - ex.percentile(50)) <= 1
+
+
+def test_summary_stats_match_sampled():
+    gf = Goldfisher(_vanilla_deck(), turns=6, sims=3000, seed=5, record_results=None)
+    sampled = gf.simulate(progress_callback=lambda *_: None)
+    exact = evaluate_exact(gf).to_simulation_result()
+    for name, tol in [("mean_mana", 0.3), ("mean_lands", 0.1), ("mean_mulls", 0.05),
+                      ("mean_spells_cast", 0.15), ("mean_hand_sum", 0.4),
+                      ("mean_bad_turns", 0.1), ("consistency", 0.02)]:
+        assert getattr(sampled, name) == pytest.approx(getattr(exact, name), abs=tol), name
+
+
+def test_simulate_uses_exact_fast_path():
+    gf = Goldfisher(_vanilla_deck(), turns=5, sims=10, exact=True)
+    result = gf.simulate()
+    assert result.mean_mana == pytest.approx(evaluate_exact(gf).mean_mana)
+    assert result.ci_mean_mana[0] == result.ci_mean_mana[1]
+    assert result.turns == 5
+
+
+def test_exact_flag_falls_back_to_sampling():
+    deck = _vanilla_deck()
+    deck.append({"name": "Sol Ring", "cmc": 1, "cost": "{1}", "text": "",
+                 "types": ["Artifact"], "commander": False})
+    gf = Goldfisher(deck, turns=5, sims=50, seed=1, exact=True)
+    result = gf.simulate(progress_callback=lambda *_: None)
+    assert result.ci_mean_mana[0] < result.ci_mean_mana[1]
@@ -132,7 +132,9 @@ class TestFastDeckOptimizerIntegration:
 
         results = optimizer.run(final_sims=50, final_top_k=3)
         assert len(results) > 0
-        assert len(results) <= 3
+        # Top 3, plus the baseline as a reference when it missed the cut
+        baseline_in_top = any(cfg == DeckConfig() for cfg, _ in results[:3])
+        assert len(results) <= (3 if baseline_in_top else 4)
 
         for config, result_dict in results:
             assert isinstance(config, DeckConfig)
@@ -253,3 +255,100 @@ class TestFastDeckOptimizerIntegration:
             assert isinstance(config, DeckConfig)
             assert "threshold_mana" in result_dict
             assert result_dict["threshold_mana"] >= 0
+
+
+class TestParallelRacing:
+    """Racing across processes must match in-process racing exactly."""
+
+    def _race(self, workers: int, swap_mode: bool = False):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+        enabled = {
+            cid: c for cid, c in ALL_CANDIDATES.items()
+            if cid in ("draw_2cmc_2", "ramp_2cmc_1")
+        }
+        optimizer = FastDeckOptimizer(
+            goldfisher=gf,
+            candidates=enabled,
+            swap_mode=swap_mode,
+            max_draw=1,
+            max_ramp=1,
+            land_range=1,
+            optimize_for="mean_mana",
+            batch_size=10,
+            min_games=20,
+            max_sims_per_config=60,
+            workers=workers,
+        )
+        from auto_goldfish.optimization.deck_config import enumerate_configs
+
+        configs = enumerate_configs(enabled, max_draw=1, max_ramp=1, land_range=1)
+        top = optimizer._race(configs, top_k=2, progress=None)
+        scores = sorted((c.describe(), s, n) for c, s, n in optimizer.all_round_scores)
+        return top, scores, gf
+
+    def test_parallel_matches_sequential(self):
+        top_seq, scores_seq, _ = self._race(workers=1)
+        top_par, scores_par, _ = self._race(workers=2)
+        assert scores_par == scores_seq
+        assert top_par == top_seq
+
+    def test_swap_mode_parallel_matches_sequential(self):
+        _, scores_seq, _ = self._race(workers=1, swap_mode=True)
+        _, scores_par, _ = self._race(workers=2, swap_mode=True)
+        assert scores_par == scores_seq
+
+    def test_race_restores_decklist(self):
+        _, _, gf = self._race(workers=1)
+        assert gf.land_count == 37
+        assert len(gf.decklist) == 99
+
+
+class TestParetoRacing:
+    """Multi-objective racing end to end."""
+
+    def _run(self, **kwargs):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+        enabled = {
+            cid: c for cid, c in ALL_CANDIDATES.items()
+            if cid in ("draw_2cmc_2", "ramp_2cmc_1")
+        }
+        played = []
+        play_sample = gf.play_sample
+
+        def counted(n_games, *args, **kw):
+            played.append(n_games)
+            return play_sample(n_games, *args, **kw)
+
+        gf.play_sample = counted
+        optimizer = FastDeckOptimizer(
+            goldfisher=gf, candidates=enabled, max_draw=1, max_ramp=1, land_range=1,
+            batch_size=10, min_games=20, max_sims_per_config=60, **kwargs,
+        )
+        return optimizer.run(final_sims=100, final_top_k=3), sum(played)
+
+    def test_returns_front_with_paired_cis(self):
+        objectives = ("mean_mana_value", "consistency")
+        results, _ = self._run(objectives=objectives)
+        front = [rd for _, rd in results if rd["opt_pareto_front"]]
+        assert front and results[0][1]["opt_pareto_front"]
+        # Front members first, by the first objective
+        flags = [rd["opt_pareto_front"] for _, rd in results]
+        assert flags == sorted(flags, reverse=True)
+        firsts = [rd["opt_objectives"]["mean_mana_value"] for rd in front]
+        assert firsts == sorted(firsts, reverse=True)
+
+        for cfg, rd in results:
+            assert rd["opt_objectives"]["mean_mana_value"] == rd["mean_mana_value"]
+            assert rd["opt_objectives"]["consistency"] == rd["consistency"]
+            for objective in objectives:
+                ci = rd["opt_paired_ci"][objective]
+                if cfg == DeckConfig():
+                    assert ci == {"diff": 0.0, "ci": [0.0, 0.0]}
+                else:
+                    assert ci["ci"][0] <= ci["diff"] <= ci["ci"][1]
+        assert any(cfg == DeckConfig() for cfg, _ in results)
+
+    def test_budget_close_to_single_objective(self):
+        _, single = self._run(optimize_for="mean_mana_value")
+        _, pareto = self._run(objectives=("mean_mana_value", "consistency"))
+        assert pareto <= 1.25 * single
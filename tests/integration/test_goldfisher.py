@@ -164,6 +164,44 @@ def test_parallel_simulation():
     assert r_seq.mean_mulls == r_par.mean_mulls
 
 
+def test_one_process_pool_matches_in_thread():
+    """in_process=False plays one worker's games in a pool, with every setting."""
+    from auto_goldfish.effects.builtin import ProduceMana
+    from auto_goldfish.effects.card_database import DEFAULT_REGISTRY
+    from auto_goldfish.effects.registry import CardEffects
+
+    registry = DEFAULT_REGISTRY.copy()
+    registry.register("Creature 1", CardEffects(on_play=[ProduceMana(2)], ramp=True))
+    kwargs = dict(turns=5, sims=100, record_results="quartile", seed=11, registry=registry)
+    r_thread = Goldfisher(_simple_deck(), **kwargs).simulate()
+    r_pool = Goldfisher(_simple_deck(), in_process=False, **kwargs).simulate()
+    assert r_thread.mean_mana == r_pool.mean_mana
+    assert r_thread.mean_lands == r_pool.mean_lands
+    assert r_thread.mean_mulls == r_pool.mean_mulls
+
+
+def test_server_pools_do_not_fork():
+    """Pools driven from a server thread start workers without fork."""
+    from auto_goldfish.engine.goldfisher import pool_context
+
+    assert pool_context(True) is None
+    assert pool_context(False).get_start_method() in ("forkserver", "spawn")
+
+
+def test_shared_pool_reused_across_simulations():
+    """shared_pool() plays every simulate() in the block on one pool."""
+    kwargs = dict(turns=5, sims=60, record_results="quartile", seed=5)
+    gf = Goldfisher(_simple_deck(), in_process=False, **kwargs)
+    with gf.shared_pool():
+        pool = gf._shared_pool
+        r_first = gf.simulate()
+        assert gf._shared_pool is pool
+        r_second = gf.simulate()
+    assert gf._shared_pool is None
+    r_fresh = Goldfisher(_simple_deck(), **kwargs).simulate()
+    assert r_first.mean_mana == r_second.mean_mana == r_fresh.mean_mana
+
+
 def test_crn_across_land_counts():
     """CRN: same seed across land counts uses same random draws per game index."""
     deck = _simple_deck(num_lands=35, num_spells=64)
@@ -184,6 +222,70 @@ def test_crn_across_land_counts():
     assert r36.mean_mana == r36_again.mean_mana
 
 
+def _paired_diff_var(shuffle: str) -> float:
+    deck = _simple_deck()
+    gf = Goldfisher(deck, turns=6, sims=10, record_results=None, shuffle=shuffle)
+    base = gf.sample_primary(gf.play_sample(600, 9))
+    gf.set_lands(38)
+    more = gf.sample_primary(gf.play_sample(600, 9))
+    return float((more - base).var())
+
+
+def test_coupled_shuffle_reduces_paired_variance():
+    """One extra land barely disturbs coupled games; standard ones decorrelate."""
+    assert _paired_diff_var("coupled") < 0.25 * _paired_diff_var("standard")
+
+
+def test_standard_shuffle_is_reproducible():
+    deck = _simple_deck()
+    r1 = Goldfisher(deck, turns=5, sims=100, seed=4, record_results=None, shuffle="standard").simulate()
+    r2 = Goldfisher(deck, turns=5, sims=100, seed=4, record_results=None, shuffle="standard").simulate()
+    assert r1.mean_mana == r2.mean_mana
+
+
+def test_invalid_shuffle_raises():
+    with pytest.raises(ValueError, match="Invalid shuffle"):
+        Goldfisher(_simple_deck(), turns=5, sims=10, shuffle="riffle")
+
+
+def test_horizons_match_separate_runs():
+    """Each horizon from one pass equals a separate run at that turn count."""
+    deck = _simple_deck()
+    gf = Goldfisher(deck, turns=5, sims=200, record_results="quartile", seed=42)
+    by_horizon = gf.simulate(horizons=[6, 3])
+
+    assert sorted(by_horizon) == [3, 6]
+    assert gf.turns == 5  # restored after the multi-horizon pass
+    for h, result in by_horizon.items():
+        single = Goldfisher(deck, turns=h, sims=200, record_results="quartile", seed=42).simulate()
+        assert result.turns == h
+        assert result.mean_mana == single.mean_mana
+        assert result.mean_lands == single.mean_lands
+        assert result.mean_draws == single.mean_draws
+        assert result.mean_bad_turns == single.mean_bad_turns
+        assert result.consistency == single.consistency
+        assert result.percentile_50 == single.percentile_50
+        assert result.ci_consistency == single.ci_consistency
+
+
+def test_horizons_parallel_matches_sequential():
+    """Multi-horizon results are identical across sequential and parallel paths."""
+    deck = _simple_deck()
+    seq = Goldfisher(deck, turns=5, sims=100, record_results="quartile", seed=7)
+    par = Goldfisher(deck, turns=5, sims=100, record_results="quartile", seed=7, workers=2)
+    r_seq = seq.simulate(horizons=[2, 4])
+    r_par = par.simulate(horizons=[2, 4])
+    for h in (2, 4):
+        assert r_seq[h].mean_mana == r_par[h].mean_mana
+        assert r_seq[h].consistency == r_par[h].consistency
+
+
+def test_invalid_horizons_raise():
+    gf = Goldfisher(_simple_deck(), turns=5, sims=10, record_results="quartile", seed=1)
+    with pytest.raises(ValueError, match="horizons"):
+        gf.simulate(horizons=[0, 3])
+
+
 # ---------------------------------------------------------------------------
 # Spell priority mode tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,98 @@
+"""Tests for budgeted local search over the lazy config space."""
+
+import pytest
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.deck_config import ConfigSpace, DeckConfig
+from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+from auto_goldfish.optimization.local_search import LocalSearch
+from auto_goldfish.optimization.samples import SampleStore
+
+
+def _simple_deck(num_lands: int = 37, num_spells: int = 62) -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _candidates():
+    return {cid: c for cid, c in ALL_CANDIDATES.items() if cid in ("draw_2cmc_2", "ramp_2cmc_1")}
+
+
+def _optimizer(gf, search, **kwargs):
+    return FastDeckOptimizer(
+        gf, _candidates(), max_draw=2, max_ramp=2, land_range=2,
+        optimize_for="mean_mana", batch_size=10, min_games=20, max_sims_per_config=80,
+        search=search, **kwargs,
+    )
+
+
+class TestLocalSearch:
+    def test_respects_budget(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=7, record_results=None)
+        space = ConfigSpace(_candidates(), max_draw=2, max_ramp=2, land_range=2)
+        played = []
+        play_sample = gf.play_sample
+        gf.play_sample = lambda n, *a, **k: played.append(n) or play_sample(n, *a, **k)
+        store = SampleStore(gf, _candidates())
+        search = LocalSearch(store, space, "mean_mana", budget=300, batch_size=10,
+                             max_games=80, seed=1)
+        top = search.run(top_k=2)
+        gf.restore_original_decklist()
+
+        assert len(top) == 2
+        assert all(cfg in space for cfg in top)
+        # A step always evaluates at least one neighbor, so the search can
+        # overshoot by one config at the top level
+        assert search.games_played == sum(played)
+        assert search.games_played <= 300 + 80
+
+    def test_progress_ends_complete(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=7, record_results=None)
+        space = ConfigSpace(_candidates(), max_draw=1, max_ramp=1, land_range=1)
+        calls = []
+        search = LocalSearch(SampleStore(gf, _candidates()), space, "mean_mana",
+                             budget=200, batch_size=10, max_games=40, seed=1)
+        search.run(top_k=1, progress=lambda cur, total: calls.append((cur, total)))
+        gf.restore_original_decklist()
+        assert calls[-1][0] == calls[-1][1] == search.games_played
+
+
+class TestFastDeckOptimizerSearch:
+    def test_local_search_end_to_end(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+        optimizer = _optimizer(gf, "local", search_budget=1500)
+        results = optimizer.run(final_sims=100, final_top_k=3)
+
+        configs = [cfg for cfg, _ in results]
+        assert DeckConfig() in configs
+        assert len(configs) == len(set(configs))
+        assert optimizer.all_round_scores
+        assert gf.land_count == 37
+        assert len(gf.decklist) == 99
+
+    def test_matches_racing_on_small_space(self):
+        scores = {}
+        for search in ("racing", "local"):
+            gf = Goldfisher(_simple_deck(), turns=6, sims=50, seed=5, record_results=None)
+            results = _optimizer(gf, search, search_budget=5000).run(final_sims=200, final_top_k=3)
+            scores[search] = results[0][1]["mean_mana"]
+        assert scores["local"] >= scores["racing"] - 0.5
+
+    def test_auto_races_small_spaces(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+        space = ConfigSpace(_candidates(), max_draw=2, max_ramp=2, land_range=2)
+        assert not _optimizer(gf, "auto", search_budget=len(space) * 20)._use_local_search(space)
+        assert _optimizer(gf, "auto", search_budget=len(space) * 20 - 1)._use_local_search(space)
+
+    def test_invalid_search_raises(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, record_results=None)
+        with pytest.raises(ValueError, match="Invalid search"):
+            _optimizer(gf, "genetic")
@@ -0,0 +1,84 @@
+"""Tests for opt-in engine instrumentation."""
+
+import pytest
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.engine.profiling import PROFILED_PHASES, EngineProfile
+
+
+def _deck() -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(37)]
+    for name, cmc, card_type in [("Sol Ring", 1, "Artifact"), ("Rhystic Study", 3, "Enchantment"),
+                                 ("Harmonize", 4, "Sorcery")]:
+        deck.append({"name": name, "cmc": cmc, "cost": f"{{{cmc}}}", "text": "",
+                     "types": [card_type], "commander": False})
+    for i in range(59):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _simulate(**kwargs):
+    gf = Goldfisher(_deck(), turns=8, sims=200, seed=3, **kwargs)
+    return gf, gf.simulate(progress_callback=lambda *_: None)
+
+
+def test_disabled_by_default():
+    gf, result = _simulate()
+    assert gf.profile is None
+    assert result.profile == {}
+    for attr in PROFILED_PHASES.values():
+        assert attr not in vars(gf)
+
+
+def test_profile_does_not_change_results():
+    _, plain = _simulate()
+    _, profiled = _simulate(profile=True)
+    assert profiled.mean_mana == plain.mean_mana
+    assert profiled.ci_consistency == plain.ci_consistency
+
+
+def test_records_phases_and_effects():
+    _, result = _simulate(profile=True)
+    profile = result.profile
+    assert profile["games"] == 200
+    assert profile["calls"]["draw"] == 200 * 8
+    assert profile["calls"]["bootstrap"] == 1
+    assert set(profile["timings"]) <= set(PROFILED_PHASES)
+    assert profile["total_seconds"] >= sum(profile["timings"].values())
+    assert profile["effect_calls"]["ProduceMana"] > 0
+
+
+def test_profile_resets_between_runs():
+    gf, _ = _simulate(profile=True)
+    second = gf.simulate(progress_callback=lambda *_: None)
+    assert second.profile["games"] == 200
+
+
+def test_horizons_attach_to_longest():
+    gf = Goldfisher(_deck(), turns=8, sims=100, seed=3, profile=True)
+    results = gf.simulate(horizons=[4, 8], progress_callback=lambda *_: None)
+    assert results[8].profile["games"] == 100
+    assert results[4].profile == {}
+
+
+def test_parallel_merges_worker_profiles():
+    gf = Goldfisher(_deck(), turns=6, sims=60, seed=3, workers=2, profile=True)
+    result = gf.simulate()
+    assert result.profile["games"] == 60
+    assert result.profile["calls"]["draw"] == 60 * 6
+
+
+def test_merge_and_rows():
+    profile = EngineProfile()
+    profile.merge({"timings": {"draw": 0.5}, "calls": {"draw": 10, "reset": 2},
+                   "effect_calls": {"DrawCards": 3}})
+    profile.merge({"timings": {"draw": 0.5}, "calls": {"draw": 10}})
+    assert profile.games == 2
+    assert profile.timings["draw"] == pytest.approx(1.0)
+    rows = profile.as_rows()
+    assert [r[0] for r in rows] == ["reset", "draw"]
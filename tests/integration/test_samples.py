@@ -0,0 +1,306 @@
+"""Tests for CRN game samples and warm-started final evaluation."""
+
+import numpy as np
+import pytest
+
+from auto_goldfish.effects.card_database import DEFAULT_REGISTRY
+from auto_goldfish.effects.json_loader import build_overridden_registry
+from auto_goldfish.engine.goldfisher import GameSample, Goldfisher
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.deck_config import DeckConfig
+from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+from auto_goldfish.optimization.optimizer import DeckOptimizer
+from auto_goldfish.optimization.sample_cache import DiskSampleCache
+from auto_goldfish.optimization.samples import SampleStore, score_sample
+
+
+def _simple_deck(num_lands: int = 37, num_spells: int = 62) -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _candidates():
+    return {cid: c for cid, c in ALL_CANDIDATES.items() if cid in ("draw_2cmc_2", "ramp_2cmc_1")}
+
+
+def _count_games(gf: Goldfisher) -> list[int]:
+    """Record the size of every block played through ``play_sample``."""
+    blocks: list[int] = []
+    play_sample = gf.play_sample
+
+    def counted(n_games, *args, **kwargs):
+        blocks.append(n_games)
+        return play_sample(n_games, *args, **kwargs)
+
+    gf.play_sample = counted
+    return blocks
+
+
+class TestGameSample:
+    def test_extended_sample_matches_simulate(self):
+        gf = Goldfisher(_simple_deck(), turns=6, sims=200, seed=11, record_results=None)
+        expected = gf.simulate()
+        sample = GameSample.concat([gf.play_sample(80, 11), gf.play_sample(120, 11, 80)])
+        result = gf.result_from_sample(sample)
+        assert result.mean_mana == expected.mean_mana
+        assert result.threshold_mana == expected.threshold_mana
+        assert result.ci_consistency == expected.ci_consistency
+        assert result.card_performance == expected.card_performance
+
+    def test_primary_matches_single_game(self):
+        gf = Goldfisher(_simple_deck(), turns=6, sims=10, record_results=None)
+        sample = gf.play_sample(10, 3)
+        assert gf.sample_primary(sample).tolist() == [gf.simulate_single_game(3 + j) for j in range(10)]
+
+    def test_head_drops_later_replays(self):
+        gf = Goldfisher(_simple_deck(), turns=4, sims=50, record_results=None)
+        sample = gf.play_sample(50, 0, capture_replays=True)
+        assert sample.replays
+        head = sample.head(20)
+        assert head.n_games == 20
+        assert all(row < 20 for row, _ in head.replays)
+
+
+class TestSampleStore:
+    def test_extend_plays_only_missing_games(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=3, record_results=None)
+        blocks = _count_games(gf)
+        store = SampleStore(gf, _candidates())
+        cfg = DeckConfig(land_delta=1)
+        store.extend([cfg, DeckConfig()], 30)
+        new = store.extend([cfg, DeckConfig()], 30)
+        assert new == [None, None]
+        store.extend([cfg], 50)
+        assert blocks == [30, 30, 20]
+        assert store.games(cfg) == 50
+        gf.restore_original_decklist()
+
+    def test_parallel_store_matches_in_process(self):
+        configs = [DeckConfig(), DeckConfig(land_delta=-1), DeckConfig(land_delta=1)]
+        samples = []
+        for workers in (1, 2):
+            gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=3, record_results=None)
+            store = SampleStore(gf, _candidates(), workers=workers)
+            try:
+                store.extend(configs, 40)
+            finally:
+                store.close()
+            samples.append([store.sample(cfg) for cfg in configs])
+        for seq, par in zip(*samples):
+            np.testing.assert_array_equal(seq.stats, par.stats)
+            np.testing.assert_array_equal(seq.drawn, par.drawn)
+
+    def test_store_follows_goldfisher_in_process(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=3, record_results=None,
+                        in_process=False)
+        store = SampleStore(gf, _candidates())
+        try:
+            assert store._get_executor() is not None
+        finally:
+            store.close()
+        assert SampleStore(gf, _candidates(), in_process=True)._get_executor() is None
+
+    def test_store_plays_coupled_without_changing_goldfisher(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=3, record_results=None)
+        store = SampleStore(gf, _candidates())
+        store.extend([DeckConfig()], 30)
+        assert gf.shuffle == "standard"
+        coupled = Goldfisher(_simple_deck(), turns=5, sims=10, seed=3, record_results=None,
+                             shuffle="coupled")
+        np.testing.assert_array_equal(store.sample(DeckConfig()).stats,
+                                      coupled.play_sample(30, 3).stats)
+
+    def test_result_replays_games_played_without_capture(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=3, record_results=None)
+        store = SampleStore(gf, _candidates())
+        cfg = DeckConfig(land_delta=1)
+        store.extend([cfg], 200)
+        assert not store.sample(cfg).replays
+
+        result = store.result(cfg, 200)
+        replays = [r for bucket in result.replay_data.values() for r in bucket]
+        assert replays
+        # The re-played games are the stored ones
+        mana = store.sample(cfg).column("mana_spent")
+        assert {r["total_mana"] for r in replays} <= set(mana.tolist())
+        assert result.mean_mana == gf.result_from_sample(store.sample(cfg)).mean_mana
+
+    def test_extract_score_wrapper(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=100, seed=3, record_results=None)
+        opt = DeckOptimizer(gf, _candidates(), optimize_for="floor_performance")
+        sample = gf.play_sample(100, 3)
+        result = gf.result_from_sample(sample)
+        assert opt._extract_score(result) == result.threshold_mana
+        assert opt._extract_score(sample) == pytest.approx(result.threshold_mana)
+
+    def test_requested_games_ignore_cached_extras(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=3, record_results=None)
+        store = SampleStore(gf, _candidates())
+        cfg = DeckConfig(land_delta=1)
+        store.extend([cfg], 30)
+        store.extend([cfg], 20)
+        assert store.requested(cfg) == 30 and store.games_requested == 30
+        store.discard(cfg)
+        assert store.requested(cfg) == 0
+        store.extend([cfg], 10)
+        assert store.games_requested == 40
+        gf.restore_original_decklist()
+
+    def test_snapshot_restores_discarded_configs(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=10, seed=3, record_results=None)
+        cfg = DeckConfig(land_delta=1)
+        store = SampleStore(gf, _candidates(), snapshots=True)
+        store.extend([cfg, DeckConfig()], 30)
+        expected = store.sample(cfg).stats.copy()
+        store.discard(cfg)
+        snapshot = store.snapshot()
+        assert {c: n for c, (n, _) in snapshot.items()} == {cfg: 30, DeckConfig(): 30}
+
+        blocks = _count_games(gf)
+        resumed = SampleStore(gf, _candidates(), base_seed=store.base_seed)
+        resumed.restore(snapshot)
+        resumed.extend([cfg], 20)
+        resumed.extend([cfg], 40)
+        assert blocks == [10]
+        assert resumed.games_restored == 30 and resumed.games_requested == 40
+        np.testing.assert_array_equal(resumed.sample(cfg).stats[:30], expected)
+        gf.restore_original_decklist()
+
+
+class TestWarmStartFinalEvaluation:
+    def test_racing_final_phase_extends_samples(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+        optimizer = FastDeckOptimizer(
+            gf, _candidates(), max_draw=1, max_ramp=1, land_range=1,
+            optimize_for="mean_mana", batch_size=10, min_games=20, max_sims_per_config=60,
+        )
+        blocks = _count_games(gf)
+        results = optimizer.run(final_sims=100, final_top_k=2)
+
+        racing_games = sum(n for _, _, n in optimizer.all_round_scores)
+        raced = {}
+        for cfg, _, n in optimizer.all_round_scores:
+            raced[cfg] = max(raced.get(cfg, 0), n)
+        # Survivors and baseline only play the games they did not race
+        final_games = sum(blocks) - racing_games
+        assert final_games == sum(100 - raced[cfg] for cfg, _ in results)
+
+        baseline = dict(results)[DeckConfig()]
+        reference = Goldfisher(_simple_deck(), turns=5, sims=100, seed=42, record_results=None,
+                               shuffle="coupled")
+        assert baseline["mean_mana"] == reference.simulate().mean_mana
+
+    def test_hyperband_rounds_reuse_games(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=20, seed=42, record_results=None)
+        optimizer = DeckOptimizer(gf, _candidates(), optimize_for="mean_mana")
+        optimizer._samples = SampleStore(gf, _candidates())
+        blocks = _count_games(gf)
+        cfg = DeckConfig(land_delta=1)
+        optimizer._evaluate(cfg)
+        gf.sims = 60
+        optimizer._evaluate(cfg)
+        assert blocks == [20, 40]
+
+    def test_hyperband_final_phase_matches_fresh_simulation(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+        optimizer = DeckOptimizer(
+            gf, _candidates(), max_draw=1, max_ramp=1, land_range=1,
+            optimize_for="mean_mana", hyperband_max_sims=60,
+        )
+        results = optimizer.run(final_sims=80, final_top_k=2)
+
+        baseline = dict(results)[DeckConfig()]
+        reference = Goldfisher(_simple_deck(), turns=5, sims=80, seed=42, record_results=None,
+                               shuffle="coupled")
+        assert baseline["mean_mana"] == reference.simulate().mean_mana
+        assert gf.land_count == 37
+
+
+class TestSampleCache:
+    def _key(self, gf, cfg=DeckConfig()):
+        return SampleStore(gf, _candidates())._key(cfg)
+
+    def test_store_reuses_and_extends_cached_games(self, tmp_path):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=3, record_results=None)
+        cfg = DeckConfig(land_delta=1)
+        first = SampleStore(gf, _candidates(), cache=DiskSampleCache(str(tmp_path)))
+        first.extend([cfg], 30)
+        first.close()
+
+        blocks = _count_games(gf)
+        second = SampleStore(gf, _candidates(), cache=DiskSampleCache(str(tmp_path)))
+        second.extend([cfg], 50)
+        second.close()
+        assert blocks == [20]
+        assert second.games_reused == 30 and second.games_played == 20
+        fresh = SampleStore(gf, _candidates())
+        fresh.extend([cfg], 50)
+        np.testing.assert_array_equal(second.sample(cfg).stats, fresh.sample(cfg).stats)
+
+    def test_key_tracks_seed_config_and_overrides(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=3, record_results=None)
+        key = self._key(gf)
+        assert key == self._key(Goldfisher(_simple_deck(), turns=5, sims=50, seed=3, record_results=None))
+        assert key != self._key(gf, DeckConfig(land_delta=1))
+        assert key != self._key(Goldfisher(_simple_deck(), turns=5, sims=50, seed=4, record_results=None))
+        assert key != self._key(Goldfisher(_simple_deck(), turns=6, sims=50, seed=3, record_results=None))
+        registry = build_overridden_registry(DEFAULT_REGISTRY, {
+            "Creature 0": {"categories": [{"category": "ramp", "immediate": False,
+                                           "producer": {"mana_amount": 2}}]},
+        })
+        overridden = Goldfisher(_simple_deck(), turns=5, sims=50, seed=3,
+                                registry=registry, record_results=None)
+        assert key != self._key(overridden)
+
+    def test_key_leaves_goldfisher_deck_alone(self):
+        gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=3, record_results=None)
+        decklist, land_count = list(gf.decklist), gf.land_count
+        self._key(gf, DeckConfig(land_delta=-2, added_cards=("draw_2cmc_2",)))
+        assert gf.decklist == decklist and gf.land_count == land_count
+
+    def test_cached_racing_rerun_plays_nothing(self, tmp_path):
+        def run():
+            gf = Goldfisher(_simple_deck(), turns=5, sims=50, seed=42, record_results=None)
+            optimizer = FastDeckOptimizer(
+                gf, _candidates(), max_draw=1, max_ramp=1, land_range=1,
+                optimize_for="mean_mana", batch_size=10, min_games=20, max_sims_per_config=60,
+                cache=DiskSampleCache(str(tmp_path)),
+            )
+            blocks = _count_games(gf)
+            return optimizer.run(final_sims=100, final_top_k=2), blocks, optimizer.cache_stats
+
+        first, first_blocks, first_stats = run()
+        second, second_blocks, second_stats = run()
+        assert first_stats["hits"] == 0 and sum(first_blocks) > 0
+        assert second_blocks == []
+        assert second_stats["games_played"] == 0
+        assert second_stats["games_reused"] == sum(first_blocks)
+        assert second == first
+
+
+class TestScoreSample:
+    def test_matches_full_result_for_every_target(self):
+        gf = Goldfisher(_simple_deck(), turns=6, sims=10, record_results=None, mana_mode="total")
+        sample = gf.play_sample(150, 5)
+        result = gf.result_from_sample(sample)
+        expected = {
+            "floor_performance": result.threshold_mana,
+            "consistency": result.consistency,
+            "mean_mana": result.mean_mana,
+            "mean_mana_value": result.mean_mana_value,
+            "mean_mana_total": result.mean_mana_total,
+            "mean_spells_cast": result.mean_spells_cast,
+        }
+        for target, value in expected.items():
+            assert score_sample(gf, sample, target) == pytest.approx(value, abs=1e-12), target
+
+    def test_empty_sample_scores_zero(self):
+        gf = Goldfisher(_simple_deck(), turns=4, sims=10, record_results=None)
+        assert score_sample(gf, gf.play_sample(0, 1), "consistency") == 0.0
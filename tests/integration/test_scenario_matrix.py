@@ -0,0 +1,95 @@
+"""Integration tests for the shared-seed scenario matrix runner."""
+
+import numpy as np
+import pytest
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.engine.scenario_matrix import (
+    Scenario,
+    enumerate_scenarios,
+    run_scenario_matrix,
+)
+
+
+def _deck() -> list[dict]:
+    """Commander, 37 lands and a flat curve of vanilla creatures."""
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(37)]
+    deck += [{"name": f"Creature {i}", "cmc": (i % 6) + 1, "cost": f"{{{(i % 6) + 1}}}",
+              "text": "", "types": ["Creature"], "commander": False} for i in range(62)]
+    return deck
+
+
+def _goldfisher(**kwargs) -> Goldfisher:
+    return Goldfisher(_deck(), turns=6, sims=60, seed=7, **kwargs)
+
+
+def test_enumerate_cross_product():
+    scenarios = enumerate_scenarios(
+        spell_priorities=("priority_then_cmc", "ramp_first"),
+        mulligans=("default", "curve_aware"),
+        ramp_cutoff_turns=(0, 5),
+    )
+    assert len(scenarios) == 8
+    assert len(set(scenarios)) == 8
+
+
+def test_values_match_single_games():
+    """Every scenario plays the same seeds as simulate_single_game."""
+    gf = _goldfisher()
+    scenarios = enumerate_scenarios(mulligans=("default", "curve_aware"))
+    matrix = run_scenario_matrix(gf, scenarios, sims=20)
+    assert matrix.values.shape == (2, 20)
+
+    ref = _goldfisher(mulligan_strategy=None)
+    expected = [ref.simulate_single_game(7 + j) for j in range(20)]
+    assert matrix.values[0].tolist() == expected
+
+
+def test_identical_scenario_has_zero_paired_diff():
+    gf = _goldfisher()
+    base = Scenario()
+    other = Scenario(mulligan="curve_aware")
+    matrix = run_scenario_matrix(gf, [base, other], sims=40)
+    rows = matrix.table()
+    assert rows[0]["baseline"] is True
+    assert rows[0]["diff_mean"] == 0.0
+    assert rows[0]["diff_mean_ci"] == [0.0, 0.0]
+    assert rows[0]["diff_floor_ci"] == [0.0, 0.0]
+    lo, hi = rows[1]["diff_mean_ci"]
+    assert lo <= rows[1]["diff_mean"] <= hi
+
+
+def test_baseline_outside_scenarios_is_added():
+    gf = _goldfisher()
+    base = Scenario(ramp_cutoff_turn=3)
+    matrix = run_scenario_matrix(gf, [Scenario()], sims=10, baseline=base)
+    assert matrix.scenarios[matrix.baseline_index] == base
+    assert len(matrix.scenarios) == 2
+
+
+def test_play_settings_restored():
+    gf = _goldfisher(spell_priority="ramp_first")
+    mulligan = gf.mulligan_strategy
+    run_scenario_matrix(
+        gf, enumerate_scenarios(mana_efficiencies=("greedy", "spell_count"), ramp_cutoff_turns=(4,)),
+        sims=10,
+    )
+    assert gf.spell_priority == "ramp_first"
+    assert gf.mana_efficiency == "greedy"
+    assert gf.ramp_cutoff_turn == 0
+    assert gf.mulligan_strategy is mulligan
+
+
+def test_parallel_matches_sequential():
+    scenarios = enumerate_scenarios(mulligans=("default", "curve_aware"))
+    seq = run_scenario_matrix(_goldfisher(), scenarios, sims=30, workers=1)
+    par = run_scenario_matrix(_goldfisher(), scenarios, sims=30, workers=2)
+    np.testing.assert_array_equal(seq.values, par.values)
+
+
+def test_invalid_scenario_raises():
+    with pytest.raises(ValueError, match="Invalid mulligan"):
+        run_scenario_matrix(_goldfisher(), [Scenario(mulligan="bogus")], sims=5)
@@ -0,0 +1,125 @@
+"""Unit tests for anytime budgets and interim leaderboards."""
+
+from statistics import NormalDist
+
+import numpy as np
+import pytest
+
+from auto_goldfish.optimization.anytime import (
+    AnytimeControl,
+    leaderboard_entries,
+    score_interval,
+)
+from auto_goldfish.optimization.deck_config import DeckConfig
+from auto_goldfish.optimization.samples import z_value
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAnytimeControl:
+    def test_unbudgeted_never_exhausts(self):
+        control = AnytimeControl()
+        control.spend(10**9)
+        assert not control.budgeted
+        assert not control.exhausted()
+        assert control.stop_reason is None
+
+    def test_game_budget(self):
+        control = AnytimeControl(max_games=100)
+        control.spend(60)
+        assert not control.exhausted()
+        control.spend(40)
+        assert control.exhausted()
+        assert control.stop_reason == "max_games"
+
+    def test_time_budget(self):
+        clock = _Clock()
+        control = AnytimeControl(time_budget_s=5.0, clock=clock)
+        clock.now = 4.9
+        assert not control.exhausted()
+        clock.now = 5.0
+        assert control.exhausted()
+        assert control.stop_reason == "time_budget"
+
+    def test_first_reason_sticks(self):
+        control = AnytimeControl(max_games=1)
+        control.stop("settled")
+        control.spend(5)
+        assert control.exhausted()
+        assert control.stop_reason == "settled"
+
+    def test_emit_is_throttled_and_lazy(self):
+        clock = _Clock()
+        boards = []
+        control = AnytimeControl(leaderboard=boards.append, interval_s=1.0, clock=clock)
+        assert control.due()
+        control.spend(30)
+        control.emit("racing", lambda: [{"rank": 1}])
+        assert not control.due()
+        clock.now = 1.0
+        assert control.due()
+        assert boards == [{"phase": "racing", "elapsed_s": 0.0, "games": 30,
+                           "settled": False, "entries": [{"rank": 1}]}]
+
+        silent = AnytimeControl()
+        silent.emit("racing", lambda: pytest.fail("entries built without a callback"))
+        assert not silent.due()
+
+    def test_callback_can_stop(self):
+        control = AnytimeControl(leaderboard=lambda board: True)
+        control.emit("racing", list)
+        assert control.exhausted()
+        assert control.stop_reason == "stopped"
+
+
+class TestScoreInterval:
+    def test_mean_uses_normal_interval(self):
+        values = np.arange(100, dtype=float)
+        score, lo, hi = score_interval(values, "mean_mana")
+        half = NormalDist().inv_cdf(0.975) * values.std(ddof=1) / 10
+        assert score == pytest.approx(49.5)
+        assert (lo, hi) == pytest.approx((49.5 - half, 49.5 + half))
+
+    @pytest.mark.parametrize("target", ["consistency", "floor_performance"])
+    def test_tail_targets_bootstrap(self, target):
+        values = np.random.RandomState(0).normal(20, 4, size=300)
+        score, lo, hi = score_interval(values, target)
+        assert lo < score < hi
+
+    def test_single_game(self):
+        assert score_interval(np.array([3.0]), "mean_mana") == (3.0, 3.0, 3.0)
+
+    def test_any_confidence_level(self):
+        values = np.arange(100, dtype=float)
+        _, lo80, hi80 = score_interval(values, "mean_mana", confidence=0.80)
+        _, lo95, hi95 = score_interval(values, "mean_mana", confidence=0.95)
+        assert (hi80 - lo80) / (hi95 - lo95) == pytest.approx(1.2816 / 1.9600, rel=1e-4)
+
+
+@pytest.mark.parametrize("confidence, two_sided, z", [
+    (0.95, True, 1.95996),
+    (0.99, True, 2.57583),
+    (0.80, True, 1.28155),
+    (0.95, False, 1.64485),
+    (0.90, False, 1.28155),
+])
+def test_z_value(confidence, two_sided, z):
+    assert z_value(confidence, two_sided) == pytest.approx(z, abs=1e-5)
+
+
+class TestLeaderboardEntries:
+    def test_ranked_and_truncated(self):
+        rows = [(DeckConfig(land_delta=d), np.full(10, 10.0 + d)) for d in (-1, 2, 0, 1)]
+        entries = leaderboard_entries(rows, "mean_mana", size=3,
+                                      extra=[{"tag": d} for d in (-1, 2, 0, 1)])
+        assert [e["land_delta"] for e in entries] == [2, 1, 0]
+        assert [e["rank"] for e in entries] == [1, 2, 3]
+        assert [e["tag"] for e in entries] == [2, 1, 0]
+        assert entries[0]["score"] == 12.0 and entries[0]["ci"] == [12.0, 12.0]
+        assert entries[0]["games"] == 10
@@ -0,0 +1,112 @@
+"""Tests for the throughput benchmark suite."""
+
+import json
+
+import pytest
+
+from auto_goldfish.benchmarks import (
+    CASES,
+    compare,
+    load_baseline,
+    load_benchmark_decks,
+    run_suite,
+    save_baseline,
+)
+from auto_goldfish.benchmarks.cli import main as bench_main
+from auto_goldfish.benchmarks.runner import SCHEMA_VERSION, _slowdown_pvalue
+
+
+def _deck() -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(37)]
+    for i in range(62):
+        cmc = (i % 6) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _baseline(samples: dict[str, list[float]]) -> dict:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "results": {"deck": {case: {"unit": "games", "samples": s} for case, s in samples.items()}},
+    }
+
+
+class TestRunSuite:
+    def test_records_samples_per_case(self):
+        data = run_suite({"deck": _deck()}, cases=["simulate_single_game", "apply_config"],
+                         repeats=2, scale=0.05)
+        assert data["schema_version"] == SCHEMA_VERSION
+        for case in ("simulate_single_game", "apply_config"):
+            entry = data["results"]["deck"][case]
+            assert entry["unit"] == CASES[case].unit
+            assert len(entry["samples"]) == 2
+            assert all(s > 0 for s in entry["samples"])
+
+    def test_unknown_case_raises(self):
+        with pytest.raises(ValueError, match="Unknown benchmark cases"):
+            run_suite({"deck": _deck()}, cases=["nope"])
+
+
+class TestCompare:
+    def test_flags_significant_slowdown(self):
+        before = _baseline({"simulate": [1000, 1010, 990, 1005, 995]})
+        after = _baseline({"simulate": [800, 810, 790, 805, 795]})
+        (row,) = compare(before, after)
+        assert row["regression"]
+        assert row["change"] == pytest.approx(-0.2, abs=0.01)
+
+    def test_ignores_noise_and_speedups(self):
+        before = _baseline({"a": [1000, 900, 1100, 950, 1050], "b": [100, 101, 99, 100, 100]})
+        after = _baseline({"a": [980, 1090, 910, 1000, 940], "b": [150, 151, 149, 150, 150]})
+        assert not any(r["regression"] for r in compare(before, after))
+
+    def test_skips_missing_pairs(self):
+        before = _baseline({"simulate": [1.0, 1.0]})
+        after = _baseline({"racing": [1.0, 1.0]})
+        assert compare(before, after) == []
+
+    def test_exact_pvalue_floor(self):
+        # 5 vs 5 samples: the most extreme split has p = 1 / C(10, 5)
+        assert _slowdown_pvalue([10, 11, 12, 13, 14], [1, 2, 3, 4, 5]) == pytest.approx(1 / 252)
+
+
+class TestBaselineFiles:
+    def test_round_trip(self, tmp_path):
+        data = _baseline({"simulate": [1.0, 2.0]})
+        path = tmp_path / "baseline.json"
+        save_baseline(data, str(path))
+        assert load_baseline(str(path)) == data
+
+    def test_rejects_other_schema(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"schema_version": SCHEMA_VERSION + 1, "results": {}}))
+        with pytest.raises(ValueError, match="schema"):
+            load_baseline(str(path))
+
+    def test_load_decks_is_offline(self, tmp_path):
+        deck_dir = tmp_path / "rubys_ripjaw_raptors"
+        deck_dir.mkdir()
+        (deck_dir / "rubys_ripjaw_raptors.json").write_text(json.dumps(_deck()))
+        decks = load_benchmark_decks(cache_dir=str(tmp_path))
+        assert list(decks) == ["rubys_ripjaw_raptors"]
+
+
+def test_cli_gate_exit_codes(tmp_path, capsys):
+    deck_dir = tmp_path / "decks" / "rubys_ripjaw_raptors"
+    deck_dir.mkdir(parents=True)
+    (deck_dir / "rubys_ripjaw_raptors.json").write_text(json.dumps(_deck()))
+    fast = _baseline({"simulate_single_game": [1e9] * 5})
+    fast["results"] = {"rubys_ripjaw_raptors": fast["results"]["deck"]}
+    baseline_path = tmp_path / "fast.json"
+    baseline_path.write_text(json.dumps(fast))
+
+    args = ["--cache_dir", str(tmp_path / "decks"), "--cases", "simulate_single_game",
+            "--repeats", "5", "--quick"]
+    assert bench_main(args) == 0
+    assert bench_main(args + ["--compare", str(baseline_path)]) == 1
+    assert bench_main(["--cache_dir", str(tmp_path / "empty")]) == 2
+    assert "REGRESSION" in capsys.readouterr().out
@@ -0,0 +1,71 @@
+"""Unit tests for the shared disk and database blob stores."""
+
+import os
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from auto_goldfish.blob_store import DbBlobStore, DiskBlobStore
+from auto_goldfish.db.models import Base, ResultCacheRow
+
+
+@pytest.fixture
+def session_scope():
+    """Committing session scope over an in-memory SQLite database."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    @contextmanager
+    def scope():
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    return scope
+
+
+class TestDiskBlobStore:
+    def test_round_trip_and_delete(self, tmp_path):
+        blobs = DiskBlobStore(str(tmp_path), ".bin")
+        assert blobs.read("a") is None
+        blobs.write("a", b"x" * 10)
+        assert blobs.read("a") == b"x" * 10
+        blobs.delete("a")
+        blobs.delete("a")
+        assert blobs.read("a") is None
+
+    def test_key_cannot_leave_directory(self, tmp_path):
+        blobs = DiskBlobStore(str(tmp_path / "store"), ".bin")
+        blobs.write("../a", b"x")
+        assert os.path.exists(tmp_path / "store" / "a.bin")
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        blobs = DiskBlobStore(str(tmp_path), ".bin")
+        for i, key in enumerate(("a", "b", "c")):
+            blobs.write(key, b"x" * 10)
+            os.utime(blobs.path(key), (i, i))
+        (tmp_path / "other.txt").write_bytes(b"ignored")
+        assert blobs.evict(20) == 1
+        assert blobs.read("a") is None
+        assert blobs.read("b") is not None
+        assert blobs.evict(20) == 0
+
+
+class TestDbBlobStore:
+    def test_overwrite_and_evict_lru(self, session_scope):
+        blobs = DbBlobStore(ResultCacheRow, ResultCacheRow.key, session_scope)
+        for key in ("a", "b", "c"):
+            blobs.write(key, b"x" * 10)
+        blobs.write("a", b"y" * 10)
+        assert blobs.read("a") == b"y" * 10
+        assert blobs.evict(20) == 1
+        with session_scope() as session:
+            keys = set(session.execute(select(ResultCacheRow.key)).scalars())
+        assert keys == {"a", "c"}
+        assert blobs.evict(20) == 0
@@ -0,0 +1,66 @@
+"""Unit tests for cancellation tokens."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from auto_goldfish.engine.cancellation import (
+    CancelToken,
+    SimulationCancelled,
+    wait_or_cancel,
+)
+
+
+class TestCancelToken:
+    def test_starts_uncancelled(self):
+        token = CancelToken()
+        assert not token.cancelled
+        token.check()
+
+    def test_cancel(self):
+        token = CancelToken()
+        token.cancel()
+        assert token.cancelled
+        with pytest.raises(SimulationCancelled):
+            token.check()
+
+    def test_poll_source(self):
+        flag = {"set": False}
+        token = CancelToken(poll=lambda: flag["set"])
+        assert not token.cancelled
+        flag["set"] = True
+        assert token.cancelled
+        # Sticky once observed
+        flag["set"] = False
+        assert token.cancelled
+
+
+class TestWaitOrCancel:
+    def test_without_token_waits(self):
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(time.sleep, 0.01) for _ in range(3)]
+            wait_or_cancel(futures, executor, None)
+            assert all(f.done() for f in futures)
+
+    def test_cancelled_token_raises_promptly(self):
+        token = CancelToken()
+        token.cancel()
+        executor = ThreadPoolExecutor(1)
+        futures = [executor.submit(time.sleep, 0.2) for _ in range(5)]
+        start = time.monotonic()
+        with pytest.raises(SimulationCancelled):
+            wait_or_cancel(futures, executor, token)
+        assert time.monotonic() - start < 0.1
+        # Queued work was dropped
+        assert any(f.cancelled() for f in futures)
+
+    def test_worker_error_returns_early(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        with ThreadPoolExecutor(1) as executor:
+            futures = [executor.submit(boom)]
+            wait_or_cancel(futures, executor, CancelToken())
+            with pytest.raises(RuntimeError):
+                futures[0].result()
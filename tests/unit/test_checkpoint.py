@@ -0,0 +1,146 @@
+"""Unit tests for optimizer checkpoint storage."""
+
+import io
+import json
+
+import numpy as np
+
+from auto_goldfish.engine.goldfisher import GameSample
+from auto_goldfish.optimization.anytime import AnytimeControl
+from auto_goldfish.optimization.checkpoint import (
+    CallbackCheckpointStore,
+    Checkpointer,
+    DiskCheckpointStore,
+    decode_checkpoint,
+    encode_checkpoint,
+)
+from auto_goldfish.optimization.deck_config import DeckConfig
+from auto_goldfish.optimization.sample_cache import decode_sample, encode_sample
+
+
+def _snapshot():
+    rng = np.random.default_rng(0)
+    sample = GameSample(rng.integers(0, 9, size=(12, 4)).astype(float),
+                        rng.random((12, 7)) < 0.5)
+    return {
+        DeckConfig(): (12, encode_sample(sample)),
+        DeckConfig(land_delta=-1, added_cards=("draw_2cmc_2",)): (12, encode_sample(sample)),
+    }
+
+
+def _state(key="k"):
+    return {"version": 1, "run_key": key, "base_seed": 7, "phase": "racing",
+            "progress": {"round": 3}, "games": 24, "elapsed_s": 1.5}
+
+
+class _Store:
+    """Minimal SampleStore stand-in for Checkpointer."""
+
+    def __init__(self):
+        self.base_seed = 11
+        self.games_requested = 0
+        self.restored = None
+
+    def snapshot(self):
+        return _snapshot()
+
+    def restore(self, snapshot):
+        self.restored = snapshot
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEncoding:
+    def test_round_trip(self):
+        snapshot = _snapshot()
+        cut = DeckConfig(added_cards=("draw_2cmc_2",), cuts=("Creature 5",))
+        snapshot[cut] = snapshot[DeckConfig()]
+        state, samples = decode_checkpoint(encode_checkpoint(_state(), snapshot))
+        assert state == _state()
+        assert samples.keys() == snapshot.keys()
+        for cfg, (n, data) in samples.items():
+            assert n == 12
+            np.testing.assert_array_equal(decode_sample(data).stats,
+                                          decode_sample(snapshot[cfg][1]).stats)
+
+    def test_reads_configs_saved_without_cuts(self):
+        data = encode_checkpoint(_state(), _snapshot())
+        with np.load(io.BytesIO(data)) as z:
+            arrays = dict(z)
+        arrays["configs"] = np.array(json.dumps(
+            [row[:3] for row in json.loads(str(arrays["configs"]))]
+        ))
+        buf = io.BytesIO()
+        np.savez(buf, **arrays)
+        _, samples = decode_checkpoint(buf.getvalue())
+        assert samples.keys() == _snapshot().keys()
+        assert all(cfg.cuts == () for cfg in samples)
+
+
+class TestDiskCheckpointStore:
+    def test_save_load_clear(self, tmp_path):
+        store = DiskCheckpointStore(str(tmp_path))
+        assert store.load("k") is None
+        store.save("k", _state(), _snapshot())
+        state, samples = store.load("k")
+        assert state["phase"] == "racing" and len(samples) == 2
+        store.clear("k")
+        assert store.load("k") is None
+        store.clear("k")
+
+    def test_ignores_foreign_and_corrupt_checkpoints(self, tmp_path):
+        store = DiskCheckpointStore(str(tmp_path))
+        store.save("k", _state(key="other"), _snapshot())
+        assert store.load("k") is None
+        (tmp_path / "bad.ckpt").write_bytes(b"not a checkpoint")
+        assert store.load("bad") is None
+
+
+class TestCallbackCheckpointStore:
+    def test_hands_bytes_to_callback(self):
+        calls = []
+        store = CallbackCheckpointStore(on_save=lambda key, data: calls.append((key, data)))
+        store.save("k", _state(), _snapshot())
+        assert calls[0][0] == "k" and isinstance(calls[0][1], bytes)
+
+        resumed = CallbackCheckpointStore(saved=calls[0][1])
+        assert resumed.load("k")[0]["games"] == 24
+        assert resumed.load("other") is None
+        store.clear("k")
+        assert calls[-1] == ("k", None)
+
+
+class TestCheckpointer:
+    def test_disabled_without_store(self):
+        checkpoints = Checkpointer()
+        checkpoints.save(_Store(), AnytimeControl(), "racing")
+        assert checkpoints.resume(_Store()) is None
+        assert not checkpoints.due()
+
+    def test_throttles_and_records_progress(self, tmp_path):
+        clock = _Clock()
+        disk = DiskCheckpointStore(str(tmp_path))
+        checkpoints = Checkpointer(disk, "k", interval_s=10.0, clock=clock)
+        samples = _Store()
+        checkpoints.maybe_save(samples, AnytimeControl(), "racing", round=1)
+        assert disk.load("k") is None
+        clock.now = 10.0
+        checkpoints.maybe_save(samples, AnytimeControl(), "racing", round=2)
+        assert disk.load("k")[0]["progress"] == {"round": 2}
+        # A save without a phase records the last known position
+        checkpoints.maybe_save(samples, AnytimeControl(), "racing", round=3)
+        checkpoints.save(samples, AnytimeControl())
+        state = disk.load("k")[0]
+        assert state["progress"] == {"round": 3} and state["base_seed"] == 11
+
+        resumed = _Store()
+        assert Checkpointer(disk, "k").resume(resumed)["phase"] == "racing"
+        assert resumed.base_seed == 11 and len(resumed.restored) == 2
+        checkpoints.finish()
+        assert disk.load("k") is None
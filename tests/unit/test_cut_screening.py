@@ -0,0 +1,63 @@
+"""Unit tests for swap-mode cut screening."""
+
+import itertools
+from types import SimpleNamespace
+
+import numpy as np
+
+from auto_goldfish.optimization.cut_screening import ScreenedCut, best_cut_sets, screen_cuts
+
+
+def _deck(n_spells: int = 4):
+    cards = [SimpleNamespace(name="Commander", land=False, commander=True),
+             SimpleNamespace(name="Island", land=True, commander=False)]
+    cards += [SimpleNamespace(name=f"Spell {i}", land=False, commander=False)
+              for i in range(n_spells)]
+    return SimpleNamespace(decklist=cards)
+
+
+class TestScreenCuts:
+    def test_impact_is_drawn_minus_not_drawn_mean(self):
+        rng = np.random.default_rng(0)
+        drawn = rng.random((400, 6)) < 0.5
+        # Spell 0 adds 3 mana when drawn, Spell 1 costs 1, the rest nothing
+        values = 10 + 3.0 * drawn[:, 2] - 1.0 * drawn[:, 3]
+        screened = screen_cuts(_deck(), drawn, values)
+
+        assert [c.name for c in screened][0] == "Spell 1"
+        assert screened[-1].name == "Spell 0"
+        by_name = {c.name: c for c in screened}
+        k = 2
+        expected = values[drawn[:, k]].mean() - values[~drawn[:, k]].mean()
+        assert np.isclose(by_name["Spell 0"].impact, expected)
+        assert np.isclose(by_name["Spell 0"].drawn_pct, drawn[:, k].mean())
+
+    def test_skips_lands_commanders_and_rare_cards(self):
+        drawn = np.zeros((100, 6), dtype=bool)
+        drawn[:50] = True
+        drawn[:, 4:] = False
+        drawn[:5, 4] = True
+        screened = screen_cuts(_deck(), drawn, np.arange(100.0))
+        assert sorted(c.name for c in screened) == ["Spell 0", "Spell 1"]
+
+
+class TestBestCutSets:
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        screened = sorted(
+            (ScreenedCut(f"Card {i}", float(x), 0.2) for i, x in enumerate(rng.normal(size=9))),
+            key=lambda c: c.impact,
+        )
+        for size in (1, 2, 3):
+            brute = sorted(
+                (sum(c.impact for c in combo), tuple(sorted(c.name for c in combo)))
+                for combo in itertools.combinations(screened, size)
+            )
+            assert best_cut_sets(screened, size, 4) == [names for _, names in brute[:4]]
+
+    def test_small_pool_and_empty_requests(self):
+        screened = [ScreenedCut("A", -1.0, 0.2), ScreenedCut("B", 0.5, 0.2)]
+        assert best_cut_sets(screened, 2, 3) == [("A", "B")]
+        assert best_cut_sets(screened, 3, 3) == []
+        assert best_cut_sets(screened, 0, 3) == []
+        assert ScreenedCut("A", -1.0, 0.2).to_dict() == {"card": "A", "impact": -1.0, "drawn_pct": 0.2}
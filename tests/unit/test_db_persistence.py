@@ -18,6 +18,7 @@ from auto_goldfish.db.persistence import (
     get_or_create_card,
     get_or_create_deck,
     get_or_create_effect_label,
+    load_surrogate_training_rows,
     save_deck_cards,
     save_simulation_run,
 )
@@ -253,3 +254,35 @@ class TestSaveSimulationRun:
         assert run.max_lands == 40
         assert run.seed == 42
         assert run.mulligan_strategy == "curve_aware"
+
+    def test_multi_horizon_run_keeps_longest_horizon(self, db_session: Session):
+        deck = get_or_create_deck(db_session, "test-deck")
+        results = [
+            {**r, "turns": turns}
+            for r in _make_results() for turns in (8, 12)
+        ]
+        config = {"horizons": [8, 12], "sims": 1000, "min_lands": 37, "max_lands": 38}
+
+        run = save_simulation_run(db_session, "horizon_job", deck, config, results)
+        db_session.commit()
+
+        assert run.turns == 12
+        result_rows = db_session.execute(select(SimulationResultRow)).scalars().all()
+        assert sorted(row.land_count for row in result_rows) == [37, 38]
+
+
+class TestSurrogateTrainingRows:
+    def test_only_land_sweeps_with_threshold(self, db_session: Session):
+        deck = get_or_create_deck(db_session, "test-deck")
+        config = {"turns": 8, "sims": 500, "min_lands": 37, "max_lands": 38}
+        results = [dict(r, threshold_mana=5.0) for r in _make_results()]
+        save_simulation_run(db_session, "sweep", deck, config, results)
+        save_simulation_run(db_session, "opt", deck, {**config, "optimization_enabled": True},
+                            results)
+        save_simulation_run(db_session, "old", deck, config, _make_results())
+        db_session.commit()
+
+        rows = load_surrogate_training_rows(db_session)
+        assert [r["land_count"] for r in rows] == [37, 38]
+        assert rows[0]["deck_name"] == "test-deck"
+        assert (rows[0]["turns"], rows[0]["sims"], rows[0]["threshold_mana"]) == (8, 500, 5.0)
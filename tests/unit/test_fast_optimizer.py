@@ -6,6 +6,7 @@ import pytest
 from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
 from auto_goldfish.optimization.deck_config import DeckConfig
 from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+from auto_goldfish.optimization.samples import z_value
 
 
 class TestComputeConsistency:
@@ -55,6 +56,17 @@ class TestComputeConsistency:
         assert actual == pytest.approx(expected, abs=1e-10)
 
 
+def _ttest(opt: FastDeckOptimizer, matrix: np.ndarray, best_idx: int) -> np.ndarray:
+    """``_ttest_from_moments`` on the moments of a full game matrix."""
+    return opt._ttest_from_moments(
+        matrix.sum(axis=1),
+        (matrix ** 2).sum(axis=1),
+        matrix @ matrix[best_idx],
+        best_idx,
+        matrix.shape[1],
+    )
+
+
 class TestElimination:
     """Test the vectorized elimination logic."""
 
@@ -63,6 +75,7 @@ class TestElimination:
         opt.optimize_for = optimize_for
         opt.confidence = 0.95
         opt.n_bootstrap = 200
+        opt.bootstrap_memory_mb = 64.0
         return opt
 
     def test_ttest_clearly_worse_is_dominated(self):
@@ -71,7 +84,7 @@ class TestElimination:
         rng = np.random.RandomState(42)
         # Row 0 = best (high mean), Row 1 = worse (low mean)
         matrix = np.vstack([rng.normal(20, 2, size=100), rng.normal(10, 2, size=100)])
-        dominated = opt._ttest_elimination(matrix, best_idx=0)
+        dominated = _ttest(opt, matrix, best_idx=0)
         assert not dominated[0]  # best is not dominated
         assert dominated[1]  # worse is dominated
 
@@ -81,7 +94,7 @@ class TestElimination:
         rng = np.random.RandomState(42)
         # Row 0 = best, Row 1 = slightly worse
         matrix = np.vstack([rng.normal(20, 2, size=100), rng.normal(19.5, 2, size=100)])
-        dominated = opt._ttest_elimination(matrix, best_idx=0)
+        dominated = _ttest(opt, matrix, best_idx=0)
         assert not dominated[0]  # best is never dominated
 
     def test_ttest_similar_not_dominated_with_few_samples(self):
@@ -89,10 +102,27 @@ class TestElimination:
         opt = self._make_optimizer("mean_mana")
         rng = np.random.RandomState(42)
         matrix = np.vstack([rng.normal(15, 5, size=20), rng.normal(15.5, 5, size=20)])
-        dominated = opt._ttest_elimination(matrix, best_idx=1)
+        dominated = _ttest(opt, matrix, best_idx=1)
         # With only 20 samples and similar means, should not be confident
         assert not dominated[0]
 
+    def test_eliminate_round_drops_dominated_configs(self):
+        """A racing round removes clearly worse configs but keeps the top k."""
+        from auto_goldfish.optimization.fast_optimizer import _RaceState
+
+        opt = self._make_optimizer("mean_mana")
+        rng = np.random.RandomState(42)
+        matrix = np.vstack([rng.normal(mu, 2, size=100) for mu in (20, 10, 19.8, 9)])
+        state = _RaceState(4, 100)
+        state.append(matrix)
+        opt._eliminate_round(state, top_k=1)
+        assert state.active.tolist() == [0, 2]
+
+        state = _RaceState(4, 100)
+        state.append(matrix)
+        opt._eliminate_round(state, top_k=3)
+        assert state.active.tolist() == [0, 1, 2]
+
     def test_bootstrap_clearly_worse_is_dominated(self):
         """Bootstrap detects clearly worse consistency."""
         opt = self._make_optimizer("consistency")
@@ -107,6 +137,91 @@ class TestElimination:
         assert dominated[1]
 
 
+class TestBoundedBootstrap:
+    """Chunked bootstrap matches the sort-based reference exactly."""
+
+    @staticmethod
+    def _reference(matrix, boot_idx):
+        n_games = matrix.shape[1]
+        samples = matrix[:, boot_idx]
+        cutoff = max(1, int(n_games * 0.25))
+        tails = np.sort(samples, axis=2)[:, :, :cutoff].mean(axis=2)
+        return tails / np.maximum(samples.mean(axis=2), 1e-10)
+
+    @pytest.mark.parametrize("memory_mb", [0.001, 64.0])
+    def test_exact_parity_on_integer_games(self, memory_mb):
+        opt = FastDeckOptimizer.__new__(FastDeckOptimizer)
+        opt.bootstrap_memory_mb = memory_mb
+        rng = np.random.RandomState(7)
+        matrix = rng.randint(0, 40, size=(12, 150)).astype(float)
+        matrix[4] = 0.0
+        boot_idx = rng.randint(0, 150, size=(100, 150))
+        np.testing.assert_array_equal(
+            opt._bootstrap_consistency(matrix, boot_idx),
+            self._reference(matrix, boot_idx),
+        )
+
+    def test_decisions_independent_of_memory_budget(self):
+        opt = FastDeckOptimizer.__new__(FastDeckOptimizer)
+        opt.confidence = 0.95
+        opt.n_bootstrap = 200
+        rng = np.random.RandomState(8)
+        matrix = rng.randint(0, 40, size=(20, 200)).astype(float)
+        opt.bootstrap_memory_mb = 0.001
+        small = opt._bootstrap_elimination_vectorized(matrix, 0, 200)
+        opt.bootstrap_memory_mb = 512.0
+        large = opt._bootstrap_elimination_vectorized(matrix, 0, 200)
+        np.testing.assert_array_equal(small, large)
+
+
+class TestRaceState:
+    """Incremental racing buffers match statistics computed from scratch."""
+
+    def test_moments_match_matrix(self):
+        from auto_goldfish.optimization.fast_optimizer import _RaceState
+
+        rng = np.random.RandomState(0)
+        full = rng.randint(0, 40, size=(4, 60)).astype(float)
+        state = _RaceState(4, 60)
+        state.append(full[:, :20])
+        state.set_best(2)
+        state.append(full[:, 20:40])
+        state.compact(np.array([True, False, True, True]))
+        state.append(full[[0, 2, 3], 40:60])
+
+        rows = state.active
+        assert rows.tolist() == [0, 2, 3]
+        np.testing.assert_allclose(state.sums[rows], full[rows].sum(axis=1))
+        np.testing.assert_allclose(state.sumsq[rows], (full[rows] ** 2).sum(axis=1))
+        np.testing.assert_allclose(state.cross[rows], full[rows] @ full[2])
+        assert state.games.tolist() == [60, 40, 60, 60]
+
+    def test_moment_ttest_matches_matrix_ttest(self):
+        from auto_goldfish.optimization.fast_optimizer import _RaceState
+
+        opt = FastDeckOptimizer.__new__(FastDeckOptimizer)
+        opt.optimize_for = "mean_mana"
+        opt.confidence = 0.95
+        rng = np.random.RandomState(1)
+        matrix = np.vstack([rng.normal(mu, 3, size=80).round() for mu in (20, 19, 17, 20.2)])
+        best = 3
+        diffs = matrix - matrix[best]
+        upper = diffs.mean(axis=1) + z_value(0.95, two_sided=False) * np.maximum(diffs.std(axis=1, ddof=1), 1e-10) / np.sqrt(80)
+        expected = upper < 0
+        expected[best] = False
+        state = _RaceState(4, 80)
+        state.append(matrix[:, :40])
+        state.set_best(best)
+        state.append(matrix[:, 40:])
+        rows = state.active
+        np.testing.assert_array_equal(
+            opt._ttest_from_moments(
+                state.sums[rows], state.sumsq[rows], state.cross[rows], best, 80,
+            ),
+            expected,
+        )
+
+
 class TestComputeScore:
     """Test score extraction for different optimize_for modes."""
 
@@ -257,3 +372,56 @@ class TestLandDeltaParams:
         )
         assert opt.land_delta_min == -1
         assert opt.land_delta_max == 3
+
+
+class TestObjectives:
+    """Multi-objective (Pareto) racing options and elimination."""
+
+    def _make_optimizer(self, objectives) -> FastDeckOptimizer:
+        opt = FastDeckOptimizer.__new__(FastDeckOptimizer)
+        opt.objectives = objectives
+        opt.confidence = 0.95
+        opt.n_bootstrap = 200
+        opt.bootstrap_memory_mb = 64.0
+        return opt
+
+    def test_first_objective_drives_optimize_for(self):
+        from unittest.mock import MagicMock
+
+        opt = FastDeckOptimizer(goldfisher=MagicMock(), candidates={},
+                                objectives=["consistency", "mean_mana"])
+        assert opt.objectives == ("consistency", "mean_mana")
+        assert opt.optimize_for == "consistency"
+
+    @pytest.mark.parametrize("kwargs", [
+        {"objectives": ["mean_mana", "bogus"]},
+        {"objectives": ["mean_mana"]},
+        {"objectives": ["mean_mana", "mean_mana"]},
+        {"objectives": ["mean_mana", "consistency"], "search": "local"},
+    ])
+    def test_invalid_objectives(self, kwargs):
+        from unittest.mock import MagicMock
+
+        with pytest.raises(ValueError):
+            FastDeckOptimizer(goldfisher=MagicMock(), candidates={}, **kwargs)
+
+    def test_keeps_tradeoffs_and_drops_dominated(self):
+        opt = self._make_optimizer(("mean_mana", "consistency"))
+        rng = np.random.RandomState(0)
+        base = rng.normal(20, 3, size=400)
+        per_game = np.array([
+            base + 2.0,  # highest mean
+            20 + 0.3 * (base - 20) + 1.0,  # lower mean, far more consistent
+            base - 2.0,  # worse than row 0 on both
+            base + 2.0 * (base - 20) - 1.0,  # worse than both front rows on both
+        ])
+        keep = opt._pareto_eliminate(np.stack([per_game, per_game]), top_k=1)
+        assert keep.tolist() == [True, True, False, False]
+
+    def test_never_drops_below_top_k(self):
+        opt = self._make_optimizer(("mean_mana", "mean_spells_cast"))
+        rng = np.random.RandomState(0)
+        base = rng.normal(20, 3, size=200)
+        per_game = np.array([base + 5, base, base - 5])
+        keep = opt._pareto_eliminate(np.stack([per_game, per_game]), top_k=2)
+        assert keep.tolist() == [True, True, False]
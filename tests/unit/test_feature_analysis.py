@@ -4,15 +4,21 @@ import numpy as np
 import pytest
 
 from auto_goldfish.optimization.feature_analysis import (
+    FeatureEncoder,
+    IncrementalWLS,
+    RegressionTracker,
     aggregate_hyperband_scores,
     analyze_optimization,
     compute_marginal_impact,
+    configs_to_feature_matrix,
+    extract_features,
     fit_ols,
     predict_top_configs,
     regression_analysis,
     synthesize_recommendations,
 )
-from auto_goldfish.optimization.deck_config import DeckConfig
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.deck_config import DeckConfig, enumerate_configs
 
 
 # ── Helpers ───────────────────────────────────────────────────────────
@@ -74,6 +80,70 @@ class TestFitOLS:
         assert r_sq_w == pytest.approx(r_sq_u, abs=1e-10)
 
 
+# ── Feature encoding and incremental WLS tests ────────────────────────
+
+
+def _enabled():
+    return {cid: c for cid, c in ALL_CANDIDATES.items() if c.default_enabled}
+
+
+class TestFeatureEncoder:
+    def test_matches_extract_features(self):
+        configs = enumerate_configs(_enabled(), max_draw=2, max_ramp=1, land_range=1)
+        X, names, dicts = configs_to_feature_matrix(configs)
+        for cfg, row, fd in zip(configs, X, dicts):
+            assert fd == extract_features(cfg)
+            assert list(row) == [extract_features(cfg)[n] for n in names]
+
+    def test_caches_rows(self):
+        encoder = FeatureEncoder()
+        configs = enumerate_configs(_enabled(), max_draw=1, max_ramp=1, land_range=2)
+        first = encoder.rows(configs[:40])
+        assert list(encoder.rows(configs[:40])) == list(first)
+        rows = encoder.rows(configs)
+        assert list(rows[:40]) == list(first)
+        assert len(encoder.index) == len(configs)
+        assert encoder.matrix([configs[7]]).dtype == np.int64
+
+
+class TestIncrementalWLS:
+    def test_matches_fit_ols(self):
+        rng = np.random.default_rng(3)
+        X = rng.integers(-2, 3, size=(40, 4)).astype(float)
+        y = X @ [1.0, -0.5, 0.2, 0.0] + 3 + rng.normal(scale=0.3, size=40)
+        w = rng.uniform(1, 5, size=40)
+
+        wls = IncrementalWLS(4)
+        for row, yi, wi in zip(X, y, w):
+            wls.add(row, yi, wi)
+        wls.add(X[0], 100.0, 2.0)
+        wls.remove(X[0], 100.0, 2.0)
+
+        for got, want in zip(wls.fit(), fit_ols(X, y, w)):
+            np.testing.assert_allclose(got, want, rtol=1e-8, atol=1e-10)
+
+    def test_tracker_matches_batch_fit(self):
+        rng = np.random.default_rng(4)
+        configs = enumerate_configs(_enabled(), max_draw=1, max_ramp=1, land_range=1)
+        tracker = RegressionTracker()
+        round_scores = []
+        for rung, n_sims in enumerate((20, 60, 180)):
+            for cfg in configs[: len(configs) // (rung + 1)]:
+                round_scores.append((cfg, float(rng.normal(10 + cfg.land_delta)), n_sims))
+                tracker.observe(*round_scores[-1])
+
+        agg_configs, scores, weights = aggregate_hyperband_scores(round_scores)
+        X, _, _ = configs_to_feature_matrix(agg_configs)
+        coeffs, intercept, r_sq, _ = fit_ols(X, scores, weights)
+        got_coeffs, got_intercept, got_r_sq, _ = tracker.fit()
+        np.testing.assert_allclose(
+            X @ got_coeffs + got_intercept, X @ coeffs + intercept, atol=1e-8,
+        )
+        assert got_r_sq == pytest.approx(r_sq, abs=1e-8)
+        assert tracker.n_configs == len(agg_configs)
+        np.testing.assert_allclose(tracker.predict(agg_configs), X @ coeffs + intercept, atol=1e-8)
+
+
 # ── regression_analysis tests ─────────────────────────────────────────
 
 
@@ -279,6 +349,15 @@ class TestPredictTopConfigs:
         assert len(top) == 3
         assert reg_info == {}
 
+    def test_uses_given_tracker(self):
+        all_configs = [DeckConfig(land_delta=d) for d in range(-2, 3)]
+        round_scores = [(DeckConfig(land_delta=d), 10.0 - d, 100) for d in range(-2, 3)]
+        tracker = RegressionTracker()
+        tracker.observe_many(round_scores)
+        top, reg_info = predict_top_configs(round_scores, all_configs, top_k=1, tracker=tracker)
+        assert top == [DeckConfig(land_delta=-2)]
+        assert reg_info["r_squared"] == pytest.approx(1.0)
+
     def test_respects_top_k(self):
         all_configs = [DeckConfig(land_delta=d) for d in range(-2, 3)]
         round_scores = [
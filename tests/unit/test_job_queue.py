@@ -0,0 +1,165 @@
+"""Tests for the bounded simulation job scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from auto_goldfish.web.services.job_queue import (
+    JobRejected,
+    JobScheduler,
+    estimate_job_cost,
+)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.01)
+
+
+class TestEstimateJobCost:
+    def test_land_sweep(self):
+        cost = estimate_job_cost({"sims": 100, "turns": 8, "min_lands": 36, "max_lands": 38})
+        assert cost == 100 * 8 * 3
+
+    def test_horizons_use_longest(self):
+        assert estimate_job_cost({"sims": 10, "horizons": [6, 10]}) == 100
+
+    def test_optimization_scales_with_configs(self):
+        base = {"sims": 100, "turns": 10, "min_lands": 36, "max_lands": 36,
+                "optimization_enabled": True}
+        small = estimate_job_cost({**base, "enabled_candidates": []})
+        large = estimate_job_cost({**base, "enabled_candidates": ["draw_2cmc_2"]})
+        assert small == 1000
+        assert large > small
+
+    def test_max_games_caps_optimization(self):
+        config = {"sims": 1000, "turns": 10, "optimization_enabled": True,
+                  "max_games": 50}
+        assert estimate_job_cost(config) == 500
+
+
+class TestJobScheduler:
+    def test_runs_jobs(self):
+        done = []
+        scheduler = JobScheduler(done.append, max_workers=2)
+        for i in range(4):
+            scheduler.submit(f"j{i}", i, cost=1)
+        _wait_for(lambda: len(done) == 4)
+        assert sorted(done) == [0, 1, 2, 3]
+
+    def test_priority_then_fifo(self):
+        gate = threading.Event()
+        order = []
+
+        def execute(payload):
+            if payload == "blocker":
+                gate.wait(5)
+            order.append(payload)
+
+        scheduler = JobScheduler(execute, max_workers=1)
+        scheduler.submit("b", "blocker", cost=1)
+        _wait_for(lambda: scheduler.stats()["running"] == 1)
+        scheduler.submit("low1", "low1", cost=1)
+        scheduler.submit("low2", "low2", cost=1)
+        scheduler.submit("high", "high", cost=1, priority=5)
+        assert scheduler.position("high") == 1
+        assert scheduler.position("low2") == 3
+        assert scheduler.position("b") is None
+        gate.set()
+        _wait_for(lambda: len(order) == 4)
+        assert order == ["blocker", "high", "low1", "low2"]
+
+    def test_full_queue_rejects(self):
+        gate = threading.Event()
+        scheduler = JobScheduler(lambda p: gate.wait(5), max_workers=1, max_queued=1)
+        scheduler.submit("a", None, cost=1)
+        _wait_for(lambda: scheduler.stats()["running"] == 1)
+        scheduler.submit("b", None, cost=1)
+        with pytest.raises(JobRejected):
+            scheduler.submit("c", None, cost=1)
+        gate.set()
+
+    def test_oversized_rejected(self):
+        scheduler = JobScheduler(lambda p: None, max_cost=10)
+        with pytest.raises(ValueError, match="exceeds"):
+            scheduler.submit("big", None, cost=11)
+        assert scheduler.stats()["queued"] == 0
+
+    def test_oversized_deferred_behind_regular_jobs(self):
+        gate = threading.Event()
+        order = []
+
+        def execute(payload):
+            if payload == "blocker":
+                gate.wait(5)
+            order.append(payload)
+
+        scheduler = JobScheduler(execute, max_workers=1, max_cost=10, admission="defer")
+        scheduler.submit("b", "blocker", cost=1)
+        _wait_for(lambda: scheduler.stats()["running"] == 1)
+        scheduler.submit("big", "big", cost=100, priority=9)
+        scheduler.submit("small", "small", cost=1)
+        assert scheduler.position("small") == 1
+        gate.set()
+        _wait_for(lambda: len(order) == 3)
+        assert order == ["blocker", "small", "big"]
+
+    def test_one_deferred_job_at_a_time(self):
+        gate = threading.Event()
+        running = []
+        scheduler = JobScheduler(
+            lambda p: (running.append(p), gate.wait(5)),
+            max_workers=2, max_cost=10, admission="defer",
+        )
+        scheduler.submit("big1", "big1", cost=100)
+        scheduler.submit("big2", "big2", cost=100)
+        _wait_for(lambda: scheduler.stats()["running"] == 1)
+        time.sleep(0.05)
+        assert running == ["big1"]
+        assert scheduler.position("big2") == 1
+        gate.set()
+        _wait_for(lambda: len(running) == 2)
+
+    def test_eta_after_first_job(self):
+        gate = threading.Event()
+        scheduler = JobScheduler(
+            lambda p: gate.wait(5) if p == "wait" else time.sleep(0.02), max_workers=1,
+        )
+        assert scheduler.eta("x") is None
+        scheduler.submit("first", None, cost=100)
+        _wait_for(lambda: scheduler.stats()["cost_per_s"] is not None)
+        scheduler.submit("running", "wait", cost=100)
+        scheduler.submit("queued", None, cost=100)
+        _wait_for(lambda: scheduler.stats()["running"] == 1)
+        eta_running = scheduler.eta("running")
+        eta_queued = scheduler.eta("queued")
+        assert eta_running is not None and eta_queued is not None
+        assert eta_queued > eta_running
+        gate.set()
+
+    def test_failing_job_does_not_kill_worker(self):
+        done = []
+
+        def execute(payload):
+            if payload == "boom":
+                raise RuntimeError("boom")
+            done.append(payload)
+
+        scheduler = JobScheduler(execute, max_workers=1)
+        scheduler.submit("a", "boom", cost=1)
+        scheduler.submit("b", "ok", cost=1)
+        _wait_for(lambda: done == ["ok"])
+
+    def test_invalid_admission(self):
+        with pytest.raises(ValueError, match="admission"):
+            JobScheduler(lambda p: None, admission="maybe")
+
+    def test_shutdown_rejects_new_jobs(self):
+        scheduler = JobScheduler(lambda p: None)
+        scheduler.shutdown()
+        with pytest.raises(JobRejected):
+            scheduler.submit("a", None, cost=1)
@@ -0,0 +1,241 @@
+"""Unit tests for the bounded job store and its spill backends."""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from auto_goldfish.db.models import Base, JobResultRow
+from auto_goldfish.web.services.job_store import (
+    DbJobSpill,
+    DiskJobSpill,
+    JobStore,
+    decode_job,
+    encode_job,
+)
+from auto_goldfish.web.services.simulation_runner import SimJob
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _job(job_id: str, status: str = "completed", payload: int = 1000) -> SimJob:
+    return SimJob(
+        job_id=job_id,
+        deck_name="deck",
+        config={"sims": 10},
+        status=status,
+        results=[{"land_count": 36, "notes": "x" * payload}],
+    )
+
+
+def _size(job: SimJob) -> int:
+    return len(json.dumps(job.to_dict(), default=str))
+
+
+@pytest.fixture
+def session_scope():
+    """Committing session scope over an in-memory SQLite database."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    @contextmanager
+    def scope():
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    return scope
+
+
+class TestEncoding:
+    def test_round_trip(self):
+        record = _job("a").to_dict()
+        assert decode_job(encode_job(record)) == record
+
+    def test_sim_job_round_trip(self):
+        job = _job("a")
+        job.leaderboard = {"top": [1, 2]}
+        restored = SimJob.from_dict(decode_job(encode_job(job.to_dict())))
+        assert restored.to_dict() == job.to_dict()
+        assert not restored.cancel.cancelled
+
+
+class TestJobStore:
+    def test_active_jobs_not_counted(self):
+        store = JobStore(SimJob.from_dict, max_bytes=10, ttl_s=None)
+        for i in range(3):
+            store.add(_job(f"j{i}", status="running"))
+        assert len(store) == 3
+        assert store.stats()["bytes"] == 0
+        assert store.stats()["active_jobs"] == 3
+
+    def test_ttl_expires_finished_jobs(self):
+        clock = _Clock()
+        store = JobStore(SimJob.from_dict, ttl_s=60, clock=clock)
+        store.add(_job("a"))
+        store.finish("a")
+        store.add(_job("b", status="running"))
+        clock.now = 59
+        assert store.get("a") is not None
+        clock.now = 61
+        assert store.get("a") is None
+        assert store.get("b") is not None
+        assert store.stats()["expirations"] == 1
+        assert store.stats()["bytes"] == 0
+
+    def test_byte_cap_evicts_least_recently_read(self):
+        size = _size(_job("a"))
+        store = JobStore(SimJob.from_dict, max_bytes=2 * size, ttl_s=None)
+        for job_id in ("a", "b"):
+            store.add(_job(job_id))
+            store.finish(job_id)
+        store.get("a")
+        store.add(_job("c"))
+        store.finish("c")
+        assert store.get("b") is None
+        assert store.get("a") is not None
+        assert store.get("c") is not None
+        stats = store.stats()
+        assert stats["evictions"] == 1
+        assert stats["bytes"] == 2 * size
+
+    def test_remove_releases_bytes(self):
+        store = JobStore(SimJob.from_dict, ttl_s=None)
+        store.add(_job("a"))
+        store.finish("a")
+        store.remove("a")
+        assert store.get("a") is None
+        assert store.stats()["bytes"] == 0
+
+    def test_evicted_job_reloaded_from_spill(self, tmp_path):
+        clock = _Clock()
+        spill = DiskJobSpill(str(tmp_path))
+        store = JobStore(SimJob.from_dict, ttl_s=10, spill=spill, clock=clock)
+        job = _job("a")
+        store.add(job)
+        store.finish("a")
+        clock.now = 11
+        assert len(store) == 1
+        store.get("missing")
+        assert len(store) == 0
+        assert os.path.exists(tmp_path / "a.json.gz")
+
+        reloaded = store.get("a")
+        assert reloaded is not job
+        assert reloaded.to_dict() == job.to_dict()
+        assert store.stats()["reloads"] == 1
+        assert store.stats()["spill"]["writes"] == 1
+
+    def test_reloaded_job_not_spilled_again(self, tmp_path):
+        clock = _Clock()
+        spill = DiskJobSpill(str(tmp_path))
+        store = JobStore(SimJob.from_dict, ttl_s=10, spill=spill, clock=clock)
+        store.add(_job("a"))
+        store.finish("a")
+        clock.now = 11
+        store.get("a")
+        clock.now = 30
+        store.get("missing")
+        assert spill.stats()["writes"] == 1
+        assert store.get("a") is not None
+
+
+    def test_spill_written_outside_the_lock(self, tmp_path):
+        clock = _Clock()
+        seen = {}
+
+        class _ProbeSpill(DiskJobSpill):
+            def _write(self, job_id, data):
+                # Another thread can use the store while the write runs,
+                # and still finds the job being written
+                reader = threading.Thread(
+                    target=lambda: seen.setdefault("job", store.get(job_id)),
+                )
+                reader.start()
+                reader.join(timeout=2)
+                seen["blocked"] = reader.is_alive()
+                super()._write(job_id, data)
+
+        store = JobStore(SimJob.from_dict, ttl_s=10, spill=_ProbeSpill(str(tmp_path)), clock=clock)
+        store.add(_job("a"))
+        store.finish("a")
+        clock.now = 11
+        store.get("missing")
+        assert seen["blocked"] is False
+        assert seen["job"].job_id == "a"
+        assert os.path.exists(tmp_path / "a.json.gz")
+
+class TestDiskJobSpill:
+    def test_miss(self, tmp_path):
+        spill = DiskJobSpill(str(tmp_path))
+        assert spill.load("nope") is None
+        assert spill.stats()["misses"] == 1
+
+    def test_lru_cap(self, tmp_path):
+        record = _job("a").to_dict()
+        size = len(encode_job(record))
+        spill = DiskJobSpill(str(tmp_path), max_bytes=2 * size + size // 2)
+        for i, job_id in enumerate(("a", "b", "c")):
+            assert spill.save(job_id, _job(job_id).to_dict())
+            os.utime(tmp_path / f"{job_id}.json.gz", (i, i))
+        spill.save("d", _job("d").to_dict())
+        assert spill.load("a") is None
+        assert spill.load("d") is not None
+        assert spill.stats()["evictions"] >= 1
+
+    def test_oversized_record_not_stored(self, tmp_path):
+        spill = DiskJobSpill(str(tmp_path), max_bytes=10)
+        assert not spill.save("a", _job("a").to_dict())
+        assert spill.load("a") is None
+
+
+class TestDbJobSpill:
+    def test_round_trip(self, session_scope):
+        spill = DbJobSpill(session_scope=session_scope)
+        record = _job("a").to_dict()
+        assert spill.save("a", record)
+        assert spill.load("a") == record
+        assert spill.load("b") is None
+
+    def test_overwrite(self, session_scope):
+        spill = DbJobSpill(session_scope=session_scope)
+        spill.save("a", _job("a", payload=10).to_dict())
+        spill.save("a", _job("a", payload=20).to_dict())
+        with session_scope() as session:
+            rows = session.execute(select(JobResultRow)).scalars().all()
+            assert len(rows) == 1
+            assert rows[0].size_bytes == len(rows[0].data)
+
+    def test_lru_cap(self, session_scope):
+        size = len(encode_job(_job("a").to_dict()))
+        spill = DbJobSpill(max_bytes=2 * size + size // 2, session_scope=session_scope)
+        for job_id in ("a", "b", "c"):
+            spill.save(job_id, _job(job_id).to_dict())
+        with session_scope() as session:
+            ids = set(session.execute(select(JobResultRow.job_id)).scalars())
+        assert len(ids) == 2
+        assert "c" in ids
+
+    def test_backend_errors_are_misses(self):
+        @contextmanager
+        def broken():
+            raise RuntimeError("db down")
+            yield
+
+        spill = DbJobSpill(session_scope=broken)
+        assert not spill.save("a", _job("a").to_dict())
+        assert spill.load("a") is None
@@ -1,6 +1,13 @@
 """Tests for engine/mulligan.py."""
 
-from auto_goldfish.engine.mulligan import CurveAwareMulligan, DefaultMulligan
+import pytest
+
+from auto_goldfish.engine.mulligan import (
+    VALID_MULLIGAN_STRATEGIES,
+    CurveAwareMulligan,
+    DefaultMulligan,
+    get_mulligan_strategy,
+)
 from auto_goldfish.models.card import Card
 from auto_goldfish.models.game_state import GameState
 
@@ -98,3 +105,17 @@ class TestCurveAwareMulligan:
                  _creature(5, 3), _creature(6, 4), _creature(7, 5), _creature(7, 6)]
         state = _make_state_with_hand(cards)
         assert m.should_keep(state, 7, 3) is True
+
+
+class TestGetMulliganStrategy:
+    def test_all_valid_names(self):
+        for name in VALID_MULLIGAN_STRATEGIES:
+            assert get_mulligan_strategy(name) is not None
+
+    def test_returns_matching_class(self):
+        assert isinstance(get_mulligan_strategy("default"), DefaultMulligan)
+        assert isinstance(get_mulligan_strategy("curve_aware"), CurveAwareMulligan)
+
+    def test_invalid_raises(self):
+        with pytest.raises(ValueError, match="Invalid mulligan"):
+            get_mulligan_strategy("london")
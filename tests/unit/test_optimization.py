@@ -10,6 +10,7 @@ from auto_goldfish.optimization.candidate_cards import (
     make_custom_candidate,
 )
 from auto_goldfish.optimization.deck_config import (
+    ConfigSpace,
     DeckConfig,
     enumerate_configs,
 )
@@ -78,6 +79,11 @@ class TestDeckConfig:
         cfg = DeckConfig(land_delta=-2)
         assert "-2 land" in cfg.describe()
 
+    def test_config_describe_cuts(self):
+        cfg = DeckConfig(added_cards=("draw_2cmc_2",), cuts=("Creature 5",))
+        assert cfg.describe() == "Draw2(mv2), cut Creature 5"
+        assert cfg != DeckConfig(added_cards=("draw_2cmc_2",))
+
     def test_config_hashable(self):
         c1 = DeckConfig(land_delta=1, added_cards=("draw_1cmc_1",))
         c2 = DeckConfig(land_delta=1, added_cards=("draw_1cmc_1",))
@@ -167,6 +173,52 @@ class TestEnumerateConfigs:
         assert len(configs) == len(set(configs))
 
 
+class TestConfigSpace:
+    def _enabled(self):
+        return {cid: c for cid, c in ALL_CANDIDATES.items() if c.default_enabled}
+
+    def test_len_matches_enumeration(self):
+        space = ConfigSpace(self._enabled(), max_draw=2, max_ramp=1, land_range=2)
+        assert len(space) == len(list(space)) == len(set(space))
+
+    def test_len_without_enumerating_huge_space(self):
+        space = ConfigSpace(self._enabled(), max_draw=6, max_ramp=6, land_range=5)
+        n_draw = sum(math.comb(len(space.draw_ids) + k - 1, k) for k in range(7))
+        n_ramp = sum(math.comb(len(space.ramp_ids) + k - 1, k) for k in range(7))
+        assert len(space) == 11 * n_draw * n_ramp
+
+    def test_contains(self):
+        space = ConfigSpace(self._enabled(), max_draw=1, max_ramp=1, land_range=1)
+        assert DeckConfig() in space
+        assert DeckConfig(land_delta=2) not in space
+        assert DeckConfig(added_cards=("draw_2cmc_2", "draw_2cmc_2")) not in space
+        assert DeckConfig(added_cards=("not_a_card",)) not in space
+
+    def test_neighbors_stay_in_space(self):
+        space = ConfigSpace(self._enabled(), max_draw=2, max_ramp=2, land_range=1)
+        for config in list(space)[::7]:
+            neighbors = space.neighbors(config)
+            assert config not in neighbors
+            assert len(neighbors) == len(set(neighbors))
+            assert all(n in space for n in neighbors)
+
+    def test_base_neighbors(self):
+        candidates = {"draw_2cmc_2": ALL_CANDIDATES["draw_2cmc_2"]}
+        space = ConfigSpace(candidates, max_draw=1, max_ramp=0, land_range=1)
+        assert set(space.neighbors(DeckConfig())) == {
+            DeckConfig(land_delta=-1),
+            DeckConfig(land_delta=1),
+            DeckConfig(added_cards=("draw_2cmc_2",)),
+        }
+
+    def test_random_config_in_space(self):
+        import random
+
+        space = ConfigSpace(self._enabled(), max_draw=3, max_ramp=3, land_range=2)
+        rng = random.Random(0)
+        assert all(space.random_config(rng) in space for _ in range(50))
+
+
 class TestHyperbandPlanning:
     """Unit tests for Hyperband bracket planning logic."""
 
@@ -0,0 +1,67 @@
+"""Unit tests for Pareto dominance helpers."""
+
+import numpy as np
+import pytest
+
+from auto_goldfish.optimization.pareto import (
+    confidently_dominated,
+    crowding_distance,
+    dominates,
+    paired_ci,
+    pareto_front,
+    pareto_ranks,
+    select,
+)
+
+
+class TestDominance:
+    def test_dominates(self):
+        assert dominates(np.array([2, 2]), np.array([1, 2]))
+        assert not dominates(np.array([2, 2]), np.array([2, 2]))
+        assert not dominates(np.array([3, 1]), np.array([1, 3]))
+
+    def test_ranks_layers(self):
+        scores = np.array([[3, 1], [1, 3], [2, 2], [1, 1], [0, 0], [2, 1]])
+        assert pareto_ranks(scores).tolist() == [0, 0, 0, 2, 3, 1]
+        assert pareto_front(scores).tolist() == [True, True, True, False, False, False]
+
+    def test_ties_share_a_layer(self):
+        assert pareto_ranks(np.array([[1, 1], [1, 1]])).tolist() == [0, 0]
+
+
+class TestSelection:
+    def test_crowding_keeps_extremes(self):
+        scores = np.array([[0.0, 4.0], [1.0, 3.0], [1.1, 2.9], [4.0, 0.0]])
+        distance = crowding_distance(scores)
+        assert np.isinf(distance[0]) and np.isinf(distance[3])
+        assert distance[1] > 0 and distance[2] > 0
+
+    def test_select_prefers_front_then_spread(self):
+        scores = np.array([[0.0, 4.0], [1.0, 3.0], [1.1, 2.9], [4.0, 0.0], [0.5, 0.5]])
+        chosen = select(scores, 3).tolist()
+        assert sorted(chosen[:2]) == [0, 3]
+        assert chosen[2] in (1, 2)
+        assert select(scores, 5).tolist()[-1] == 4
+
+
+class TestConfidentDominance:
+    def _boot(self, means, spread=0.1, n_boot=200, seed=0):
+        rng = np.random.RandomState(seed)
+        noise = rng.normal(0, spread, size=(1, 1, n_boot))
+        return np.asarray(means, dtype=float).T[:, :, np.newaxis] + noise
+
+    def test_needs_every_objective(self):
+        # Row 1 is worse on both objectives, row 2 only on the first
+        boot = self._boot([[5, 5], [4, 4], [4, 6]])
+        dominated = confidently_dominated(boot, np.array([0, 2]), 0.95)
+        assert dominated.tolist() == [False, True, False]
+
+    def test_noisy_differences_are_kept(self):
+        rng = np.random.RandomState(1)
+        boot = rng.normal(0, 1, size=(2, 2, 200)) + np.array([[[0.0], [-0.1]]] * 2)
+        assert not confidently_dominated(boot, np.array([0]), 0.95).any()
+
+    def test_paired_ci(self):
+        a = np.linspace(1.0, 2.0, 201)
+        lo, hi = paired_ci(a, np.zeros(201), 0.9)
+        assert lo == pytest.approx(1.05) and hi == pytest.approx(1.95)
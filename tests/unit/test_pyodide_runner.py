@@ -67,6 +67,21 @@ class TestRunSimulation:
         assert len(results) == 3
         assert [r["land_count"] for r in results] == [9, 10, 11]
 
+    def test_horizons(self):
+        """Horizons return one result per land count and turn cutoff."""
+        deck_json = _make_deck_json()
+        config = json.dumps({
+            "sims": 20,
+            "min_lands": 10,
+            "max_lands": 11,
+            "seed": 42,
+            "horizons": [2, 4],
+        })
+        results = json.loads(run_simulation(deck_json, config))
+        assert [(r["land_count"], r["turns"]) for r in results] == [
+            (10, 2), (10, 4), (11, 2), (11, 4),
+        ]
+
     def test_progress_callback(self):
         """Progress callback is called with global progress across land counts."""
         deck_json = _make_deck_json()
@@ -0,0 +1,161 @@
+"""Unit tests for the content-hash simulation result cache."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from auto_goldfish.db.models import Base, ResultCacheRow
+from auto_goldfish.web.services.result_cache import (
+    DbResultCache,
+    ResultCache,
+    decode_results,
+    encode_results,
+    result_key,
+)
+
+DECK = [{"name": "Island", "types": ["Land"], "cmc": 0, "quantity": 36}]
+CONFIG = {"sims": 100, "turns": 8, "seed": 7, "effect_overrides": {"Sol Ring": {"ramp": 2}}}
+
+
+def _results(n: int = 3, pad: int = 0):
+    return [{"land_count": 36 + i, "mean_mana": 10.0 + i, "notes": "x" * pad} for i in range(n)]
+
+
+@pytest.fixture
+def session_scope():
+    """Committing session scope over an in-memory SQLite database."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    @contextmanager
+    def scope():
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    return scope
+
+
+class TestResultKey:
+    def test_stable_across_dict_order(self):
+        reordered = dict(reversed(list(CONFIG.items())))
+        assert result_key(DECK, CONFIG) == result_key(DECK, reordered)
+
+    def test_unseeded_or_time_budgeted_not_cacheable(self):
+        assert result_key(DECK, {**CONFIG, "seed": None}) is None
+        assert result_key(DECK, {"sims": 100}) is None
+        assert result_key(DECK, {**CONFIG, "time_budget_s": 30}) is None
+
+    def test_worker_count_ignored(self):
+        assert result_key(DECK, {**CONFIG, "workers": 4}) == result_key(DECK, CONFIG)
+
+    @pytest.mark.parametrize("change", [
+        {"sims": 101},
+        {"turns": 9},
+        {"seed": 8},
+        {"mulligan": "curve_aware"},
+    ])
+    def test_settings_change_key(self, change):
+        assert result_key(DECK, {**CONFIG, **change}) != result_key(DECK, CONFIG)
+
+    def test_effects_of_deck_cards_change_key(self):
+        deck = DECK + [{"name": "Sol Ring", "types": ["Artifact"], "cmc": 1, "quantity": 1}]
+        assert result_key(deck, {**CONFIG, "effect_overrides": {}}) != result_key(deck, CONFIG)
+        # Overrides of cards outside the deck do not matter
+        assert result_key(DECK, {**CONFIG, "effect_overrides": {}}) == result_key(DECK, CONFIG)
+
+    def test_registry_edits_change_key(self):
+        from auto_goldfish.effects.card_database import DEFAULT_REGISTRY
+        from auto_goldfish.effects.registry import CardEffects
+
+        deck = DECK + [{"name": "Sol Ring", "types": ["Artifact"], "cmc": 1, "quantity": 1}]
+        config = {**CONFIG, "effect_overrides": {}}
+        edited = DEFAULT_REGISTRY.copy()
+        edited.register("Sol Ring", CardEffects(priority=5))
+        assert result_key(deck, config, registry=edited) != result_key(deck, config)
+        assert result_key(deck, config, registry=DEFAULT_REGISTRY) == result_key(deck, config)
+
+    def test_deck_and_namespace_change_key(self):
+        other_deck = [dict(DECK[0], quantity=35)]
+        assert result_key(other_deck, CONFIG) != result_key(DECK, CONFIG)
+        assert result_key(DECK, CONFIG, namespace="client") != result_key(DECK, CONFIG)
+
+
+class TestResultCache:
+    def test_round_trip(self):
+        assert decode_results(encode_results(_results())) == _results()
+        cache = ResultCache()
+        assert cache.get("k") is None
+        cache.put("k", _results())
+        assert cache.get("k") == _results()
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["writes"], stats["entries"]) == (1, 1, 1, 1)
+
+    def test_get_returns_copy(self):
+        cache = ResultCache()
+        cache.put("k", _results())
+        cache.get("k")[0]["mean_mana"] = -1
+        assert cache.get("k") == _results()
+
+    def test_lru_byte_cap(self):
+        size = len(encode_results(_results(pad=100)))
+        cache = ResultCache(max_bytes=2 * size + size // 2)
+        cache.put("a", _results(pad=100))
+        cache.put("b", _results(pad=100))
+        cache.get("a")
+        cache.put("c", _results(pad=100))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+    def test_oversized_entry_not_kept(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put("k", _results())
+        assert cache.get("k") is None
+        assert cache.stats()["bytes"] == 0
+
+
+class TestDbResultCache:
+    def test_survives_restart(self, session_scope):
+        DbResultCache(session_scope=session_scope).put("k", _results())
+        fresh = DbResultCache(session_scope=session_scope)
+        assert fresh.get("k") == _results()
+        assert fresh.stats()["entries"] == 1
+
+    def test_overwrite(self, session_scope):
+        cache = DbResultCache(session_scope=session_scope)
+        cache.put("k", _results(1))
+        cache.put("k", _results(2))
+        with session_scope() as session:
+            rows = session.execute(select(ResultCacheRow)).scalars().all()
+            assert len(rows) == 1
+            assert decode_results(rows[0].data) == _results(2)
+
+    def test_db_cap(self, session_scope):
+        size = len(encode_results(_results(pad=100)))
+        cache = DbResultCache(db_max_bytes=2 * size + size // 2, session_scope=session_scope)
+        for key in ("a", "b", "c"):
+            cache.put(key, _results(pad=100))
+        with session_scope() as session:
+            keys = set(session.execute(select(ResultCacheRow.key)).scalars())
+        assert len(keys) == 2
+        assert "c" in keys
+
+    def test_backend_errors_are_misses(self):
+        @contextmanager
+        def broken():
+            raise RuntimeError("db down")
+            yield
+
+        cache = DbResultCache(session_scope=broken)
+        cache.put("k", _results())
+        assert cache.get("k") == _results()
+        assert cache.get("other") is None
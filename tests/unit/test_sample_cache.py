@@ -0,0 +1,130 @@
+"""Unit tests for the persistent game sample cache."""
+
+import os
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from auto_goldfish.db.models import Base, SampleCacheRow
+from auto_goldfish.engine.goldfisher import GameSample
+from auto_goldfish.optimization.sample_cache import (
+    DbSampleCache,
+    DiskSampleCache,
+    decode_sample,
+    encode_sample,
+)
+
+
+def _sample(n_games: int = 20, width: int = 13, seed: int = 0) -> GameSample:
+    rng = np.random.default_rng(seed)
+    stats = rng.integers(0, 50, size=(n_games, 4)).astype(np.float64)
+    drawn = rng.random((n_games, width)) < 0.4
+    return GameSample(stats, drawn, [(3, ("Cast Sol Ring", "Draw")), (7, ("Pass",))])
+
+
+def _assert_same(a: GameSample, b: GameSample) -> None:
+    np.testing.assert_array_equal(a.stats, b.stats)
+    np.testing.assert_array_equal(a.drawn, b.drawn)
+    assert a.replays == b.replays
+
+
+@pytest.fixture
+def session_scope():
+    """Committing session scope over an in-memory SQLite database."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    @contextmanager
+    def scope():
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    return scope
+
+
+class TestEncoding:
+    def test_round_trip(self):
+        sample = _sample()
+        decoded = decode_sample(encode_sample(sample))
+        _assert_same(decoded, sample)
+        assert decoded.drawn.dtype == bool
+
+    def test_round_trip_without_replays(self):
+        sample = GameSample(np.zeros((3, 4)), np.zeros((3, 9), dtype=bool))
+        _assert_same(decode_sample(encode_sample(sample)), sample)
+
+
+class TestDiskSampleCache:
+    def test_round_trip_and_stats(self, tmp_path):
+        cache = DiskSampleCache(str(tmp_path))
+        assert cache.get("a" * 64) is None
+        cache.put("a" * 64, _sample())
+        _assert_same(cache.get("a" * 64), _sample())
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["games_loaded"] == 20
+        assert stats["writes"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        DiskSampleCache(str(tmp_path)).put("k", _sample())
+        _assert_same(DiskSampleCache(str(tmp_path)).get("k"), _sample())
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        size = len(encode_sample(_sample(seed=0)))
+        cache = DiskSampleCache(str(tmp_path), max_bytes=int(size * 2.5))
+        for i, key in enumerate(("a", "b")):
+            cache.put(key, _sample(seed=i))
+            os.utime(tmp_path / f"{key}.npz", (i, i))
+        cache.get("a")  # touch: "b" is now the oldest
+        cache.put("c", _sample(seed=2))
+        assert cache.evictions == 1
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "bad.npz").write_bytes(b"not an npz")
+        cache = DiskSampleCache(str(tmp_path))
+        assert cache.get("bad") is None
+        assert cache.misses == 1
+
+    def test_skips_empty_samples(self, tmp_path):
+        cache = DiskSampleCache(str(tmp_path))
+        cache.put("k", _sample(n_games=0))
+        assert cache.writes == 0
+        assert not list(tmp_path.iterdir())
+
+
+class TestDbSampleCache:
+    def test_round_trip(self, session_scope):
+        cache = DbSampleCache(session_scope=session_scope)
+        assert cache.get("k") is None
+        cache.put("k", _sample())
+        _assert_same(cache.get("k"), _sample())
+        assert cache.stats()["hits"] == 1
+
+    def test_keeps_longer_sample(self, session_scope):
+        cache = DbSampleCache(session_scope=session_scope)
+        cache.put("k", _sample(n_games=30))
+        cache.put("k", _sample(n_games=10))
+        assert cache.get("k").n_games == 30
+
+    def test_evicts_least_recently_used(self, session_scope):
+        size = len(encode_sample(_sample(seed=0)))
+        cache = DbSampleCache(max_bytes=int(size * 2.5), session_scope=session_scope)
+        cache.put("a", _sample(seed=0))
+        cache.put("b", _sample(seed=1))
+        cache.get("a")
+        cache.put("c", _sample(seed=2))
+        assert cache.evictions == 1
+        with session_scope() as session:
+            keys = set(session.scalars(select(SampleCacheRow.key)))
+        assert keys == {"a", "c"}
@@ -0,0 +1,53 @@
+"""Unit tests for library shuffling modes."""
+
+import random
+
+import numpy as np
+
+from auto_goldfish.engine.shuffle import coupled_order, slot_hashes
+from auto_goldfish.models.card import Card
+
+
+def _cards(*names: str) -> list[Card]:
+    return [Card(name=n, types=["Land"] if n.startswith("Land") else ["Creature"]) for n in names]
+
+
+def _order(cards: list[Card], seed: int) -> list[str]:
+    random.seed(seed)
+    return [cards[i].name for i in coupled_order(slot_hashes(cards))]
+
+
+class TestSlotHashes:
+    def test_copies_get_distinct_stable_hashes(self):
+        hashes = slot_hashes(_cards("A", "A", "B"))
+        assert len(set(hashes.tolist())) == 3
+        np.testing.assert_array_equal(slot_hashes(_cards("A", "B", "A"))[[0, 2, 1]], hashes)
+
+    def test_lands_slotted_by_ordinal(self):
+        # Renaming lands keeps their slots, matching set_lands
+        np.testing.assert_array_equal(
+            slot_hashes(_cards("Land 1", "Land 2")), slot_hashes(_cards("Land 7", "Land 3")),
+        )
+
+
+class TestCoupledOrder:
+    def test_is_seeded_permutation(self):
+        cards = _cards(*(f"C{i}" for i in range(40)))
+        order = _order(cards, 5)
+        assert sorted(order) == sorted(c.name for c in cards)
+        assert order == _order(cards, 5)
+        assert order != _order(cards, 6)
+
+    def test_added_card_keeps_relative_order(self):
+        cards = _cards(*(f"C{i}" for i in range(40)))
+        for seed in range(10):
+            base = _order(cards, seed)
+            with_extra = _order(cards + _cards("Extra"), seed)
+            with_extra.remove("Extra")
+            assert with_extra == base
+
+    def test_positions_are_uniform(self):
+        cards = _cards(*(f"C{i}" for i in range(10)))
+        first = [_order(cards, seed)[0] for seed in range(2000)]
+        counts = [first.count(c.name) for c in cards]
+        assert min(counts) > 140 and max(counts) < 265
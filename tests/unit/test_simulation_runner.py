@@ -1,10 +1,15 @@
 """Tests for the background SimulationRunner."""
 
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
+from auto_goldfish.web.services.job_queue import JobRejected
+from auto_goldfish.web.services.job_store import DiskJobSpill, JobStore
+from auto_goldfish.web.services.result_cache import ResultCache
 from auto_goldfish.web.services.simulation_runner import SimJob, SimulationRunner
 
 
@@ -113,3 +118,232 @@ class TestSimulationRunner:
         assert status["progress"] == 3
         assert status["total"] == 3
         assert len(status["results"]) == 3
+
+    def test_status_reports_queue_position(self):
+        runner = SimulationRunner(max_workers=1)
+        gate = threading.Event()
+        with patch.object(runner, "_run_simulation", side_effect=lambda job: gate.wait(5)):
+            first = runner.submit("test", {"min_lands": 36, "max_lands": 36})
+            for _ in range(50):
+                if runner.scheduler.stats()["running"] == 1:
+                    break
+                time.sleep(0.01)
+            second = runner.submit("test", {"min_lands": 36, "max_lands": 36, "sims": 10})
+            status = runner.get_status(second)
+            assert status["queue_position"] == 1
+            assert status["cost"] == 10 * 10
+            assert runner.get_status(first)["queue_position"] is None
+            gate.set()
+
+    def test_oversized_job_rejected(self):
+        runner = SimulationRunner(max_job_cost=100)
+        with pytest.raises(JobRejected):
+            runner.submit("test", {"min_lands": 36, "max_lands": 36, "sims": 1000})
+        assert runner.scheduler.stats()["queued"] == 0
+
+    def test_job_workers_capped_by_processes_per_job(self):
+        runner = SimulationRunner(processes_per_job=2)
+        with patch("auto_goldfish.web.services.simulation_runner.load_decklist"), \
+                patch("auto_goldfish.web.services.simulation_runner.Goldfisher") as cls, \
+                patch("auto_goldfish.web.services.simulation_runner.result_to_dict"):
+            cls.return_value.land_count = 36
+            job_id = runner.submit("test", {"min_lands": 36, "max_lands": 36, "workers": 8})
+            for _ in range(50):
+                if runner.get_status(job_id)["status"] in ("completed", "failed"):
+                    break
+                time.sleep(0.05)
+        assert cls.call_args.kwargs["workers"] == 2
+        assert cls.call_args.kwargs["in_process"] is False
+
+    @patch("auto_goldfish.web.services.simulation_runner.load_decklist")
+    @patch("auto_goldfish.web.services.simulation_runner.Goldfisher")
+    @patch("auto_goldfish.web.services.simulation_runner.result_to_dict")
+    def test_finished_job_reloaded_after_eviction(
+        self, mock_to_dict, mock_goldfisher_cls, mock_load, tmp_path,
+    ):
+        store = JobStore(SimJob.from_dict, ttl_s=0, spill=DiskJobSpill(str(tmp_path)))
+        runner = SimulationRunner(job_store=store)
+        mock_goldfisher_cls.return_value.land_count = 36
+        mock_to_dict.return_value = {"land_count": 36, "mean_mana": 10.0}
+
+        job_id = runner.submit("test", {"min_lands": 36, "max_lands": 36, "sims": 10})
+        for _ in range(50):
+            if runner.stats()["jobs"]["evictions"] + runner.stats()["jobs"]["expirations"]:
+                break
+            time.sleep(0.05)
+
+        status = runner.get_status(job_id)
+        assert status["status"] == "completed"
+        assert status["results"] == [{"land_count": 36, "mean_mana": 10.0}]
+        stats = runner.stats()["jobs"]
+        assert stats["expirations"] == 1
+        assert stats["reloads"] == 1
+
+    def test_get_status_since(self, runner):
+        job = SimJob(job_id="abc", deck_name="test", config={}, results=[{"i": 0}, {"i": 1}])
+        runner._jobs.add(job)
+        status = runner.get_status("abc", since=1)
+        assert status["results"] == [{"i": 1}]
+        assert status["n_results"] == 2
+        assert "config" not in status
+        assert runner.get_status("abc", since=5)["results"] == []
+        assert runner.get_status("abc")["config"] == {}
+
+    def test_wait_for_update(self, runner):
+        job = SimJob(job_id="abc", deck_name="test", config={}, status="running")
+        runner._jobs.add(job)
+        assert runner.wait_for_update("abc", 0, timeout=0.01) == 0
+
+        def change():
+            with runner._lock:
+                job.progress = 1
+                runner._touch(job)
+
+        threading.Timer(0.05, change).start()
+        assert runner.wait_for_update("abc", 0, timeout=5) == 1
+        assert runner.wait_for_update("nonexistent", 0) is None
+
+    def test_wait_for_update_returns_for_finished_job(self, runner):
+        runner._jobs.add(SimJob(job_id="abc", deck_name="test", config={}, status="completed"))
+        assert runner.wait_for_update("abc", 0) == 0
+
+    @patch("auto_goldfish.web.services.simulation_runner.load_decklist")
+    @patch("auto_goldfish.web.services.simulation_runner.Goldfisher")
+    @patch("auto_goldfish.web.services.simulation_runner.result_to_dict")
+    def test_seeded_repeat_served_from_result_cache(
+        self, mock_to_dict, mock_goldfisher_cls, mock_load,
+    ):
+        runner = SimulationRunner(result_cache=ResultCache())
+        mock_load.return_value = [{"name": "Island", "types": ["Land"]}]
+        mock_goldfisher_cls.return_value.land_count = 36
+        mock_to_dict.return_value = {"land_count": 36, "mean_mana": 10.0}
+        config = {"min_lands": 36, "max_lands": 36, "sims": 10, "seed": 1}
+
+        first = runner.submit("test", dict(config))
+        for _ in range(50):
+            if runner.get_status(first)["status"] == "completed":
+                break
+            time.sleep(0.05)
+        assert runner.get_status(first)["cached"] is False
+
+        second = runner.submit("test", dict(config))
+        status = runner.get_status(second)
+        assert status["status"] == "completed"
+        assert status["cached"] is True
+        assert status["results"] == [{"land_count": 36, "mean_mana": 10.0}]
+        assert status["progress"] == status["total"] == 1
+        assert mock_goldfisher_cls.call_count == 1
+        assert runner.stats()["result_cache"]["hits"] == 1
+
+        runner.submit("test", {**config, "seed": 2})
+        assert runner.result_cache.stats()["misses"] == 2
+
+    def test_stats(self, runner):
+        stats = runner.stats()
+        assert stats["scheduler"]["workers"] == runner.scheduler.max_workers
+        assert stats["jobs"]["jobs"] == 0
+        assert stats["jobs"]["bytes"] == 0
+
+    def test_cancel_unknown_job(self, runner):
+        assert runner.cancel("nonexistent") is None
+
+    def test_cancel_queued_job(self):
+        runner = SimulationRunner(max_workers=1)
+        gate = threading.Event()
+        ran = []
+
+        def fake_run(job):
+            ran.append(job.job_id)
+            gate.wait(5)
+
+        with patch.object(runner, "_run_simulation", side_effect=fake_run):
+            first = runner.submit("test", {"min_lands": 36, "max_lands": 36})
+            for _ in range(50):
+                if runner.scheduler.stats()["running"] == 1:
+                    break
+                time.sleep(0.01)
+            second = runner.submit("test", {"min_lands": 36, "max_lands": 36})
+            assert runner.cancel(second) == "cancelled"
+            assert runner.get_status(second)["status"] == "cancelled"
+            assert runner.scheduler.stats()["queued"] == 0
+            gate.set()
+            for _ in range(50):
+                if runner.scheduler.stats()["running"] == 0:
+                    break
+                time.sleep(0.01)
+        assert ran == [first]
+
+    @patch("auto_goldfish.web.services.simulation_runner.load_decklist")
+    @patch("auto_goldfish.web.services.simulation_runner.Goldfisher")
+    def test_cancel_running_job(self, mock_goldfisher_cls, mock_load):
+        from auto_goldfish.engine.cancellation import SimulationCancelled
+
+        runner = SimulationRunner(max_workers=1)
+        started = threading.Event()
+
+        def simulate(cancel=None, **kwargs):
+            started.set()
+            for _ in range(500):
+                if cancel.cancelled:
+                    raise SimulationCancelled()
+                time.sleep(0.01)
+            raise AssertionError("not cancelled")
+
+        mock_goldfisher = MagicMock()
+        mock_goldfisher.land_count = 36
+        mock_goldfisher.simulate.side_effect = simulate
+        mock_goldfisher_cls.return_value = mock_goldfisher
+
+        job_id = runner.submit("test", {"min_lands": 36, "max_lands": 36})
+        assert started.wait(5)
+        assert runner.cancel(job_id) in ("running", "cancelled")
+        for _ in range(100):
+            if runner.get_status(job_id)["status"] != "running":
+                break
+            time.sleep(0.01)
+        assert runner.get_status(job_id)["status"] == "cancelled"
+        assert runner.scheduler.stats()["running"] == 0
+        # A finished job cannot be cancelled again
+        assert runner.cancel(job_id) == "cancelled"
+
+
+class TestSurrogate:
+    def _model(self):
+        from auto_goldfish.optimization.surrogate import FEATURE_NAMES, fit_surrogate
+
+        X = np.arange(3 * len(FEATURE_NAMES), dtype=float).reshape(3, -1)
+        results = [{"mean_mana": v, "consistency": 0.5, "threshold_mana": v} for v in (1, 2, 3)]
+        return fit_surrogate(X, results)
+
+    def test_make_surrogate_from_env(self, tmp_path, monkeypatch):
+        from auto_goldfish.web.services.simulation_runner import make_surrogate
+
+        monkeypatch.delenv("SURROGATE_MODEL", raising=False)
+        assert make_surrogate() is None
+        monkeypatch.setenv("SURROGATE_MODEL", str(tmp_path / "missing.json"))
+        assert make_surrogate() is None
+        model = self._model()
+        model.save(str(tmp_path / "surrogate.json"))
+        monkeypatch.setenv("SURROGATE_MODEL", str(tmp_path / "surrogate.json"))
+        assert make_surrogate().digest() == model.digest()
+
+    def test_racing_jobs_prescreen_and_key_on_model(self):
+        model = self._model()
+        runner = SimulationRunner(max_workers=1, surrogate=model)
+        racing = {"optimization_enabled": True, "seed": 1}
+        assert runner._cache_config(racing)["surrogate"] == model.digest()
+        assert "surrogate" not in runner._cache_config({**racing, "algorithm": "hyperband"})
+        assert "surrogate" not in runner._cache_config({"seed": 1})
+
+        with patch("auto_goldfish.web.services.simulation_runner.load_decklist"), \
+                patch("auto_goldfish.web.services.simulation_runner.Goldfisher") as cls, \
+                patch("auto_goldfish.optimization.fast_optimizer.FastDeckOptimizer") as opt:
+            cls.return_value.land_count = 36
+            cls.return_value.sims = 100
+            opt.return_value.run.return_value = []
+            job_id = runner.submit("test", {**racing, "sims": 100})
+            for _ in range(50):
+                if runner.get_status(job_id)["status"] in ("completed", "failed"):
+                    break
+                time.sleep(0.05)
+        assert opt.call_args.kwargs["surrogate"] is model
@@ -0,0 +1,196 @@
+"""Tests for the learned surrogate deck-score model."""
+
+import json
+
+import numpy as np
+import pytest
+
+from auto_goldfish.engine.goldfisher import Goldfisher
+from auto_goldfish.optimization.candidate_cards import ALL_CANDIDATES
+from auto_goldfish.optimization.deck_config import DeckConfig, enumerate_configs
+from auto_goldfish.optimization.fast_optimizer import FastDeckOptimizer
+from auto_goldfish.optimization.surrogate import (
+    FEATURE_NAMES,
+    SURROGATE_TARGETS,
+    SurrogateModel,
+    calibration_report,
+    collect_training_data,
+    deck_features,
+    fit_surrogate,
+    training_data_from_rows,
+)
+from auto_goldfish.pyodide_runner import predict_scores
+
+
+def _deck(num_lands: int = 37, num_spells: int = 62) -> list[dict]:
+    deck = [{"name": "Test Commander", "cmc": 4, "cost": "{2}{U}{B}", "text": "",
+             "types": ["Creature"], "commander": True}]
+    deck += [{"name": f"Island {i}", "cmc": 0, "cost": "", "text": "",
+              "types": ["Land"], "commander": False} for i in range(num_lands)]
+    for i in range(num_spells):
+        cmc = (i % 8) + 1
+        deck.append({"name": f"Creature {i}", "cmc": cmc, "cost": f"{{{cmc}}}",
+                     "text": "", "types": ["Creature"], "commander": False})
+    return deck
+
+
+def _synthetic(n: int = 60, seed: int = 0):
+    """Feature rows with targets that are a known quadratic of land count."""
+    rng = np.random.RandomState(seed)
+    X = np.zeros((n, len(FEATURE_NAMES)))
+    X[:, 0] = rng.randint(30, 45, size=n)
+    X[:, 1] = 99 - X[:, 0]
+    X[:, -1] = 10
+    lands = X[:, 0]
+    results = [
+        {
+            "mean_mana": 20 + 0.8 * (l - 30) - 0.02 * (l - 30) ** 2,
+            "consistency": 0.5 + 0.01 * (l - 30),
+            "threshold_mana": 10 + 0.5 * (l - 30),
+        }
+        for l in lands
+    ]
+    return X, results
+
+
+class TestDeckFeatures:
+    def test_counts(self):
+        gf = Goldfisher(_deck(), turns=8, sims=10)
+        features = dict(zip(FEATURE_NAMES, deck_features(gf)))
+        assert features["land_count"] == 37
+        assert features["spell_count"] == 62
+        assert features["cmc_7_plus"] == sum(1 for i in range(62) if i % 8 >= 6)
+        assert features["ramp_count"] == 0
+        assert features["commander_cmc"] == 4
+        assert features["turns"] == 8
+
+    def test_tracks_land_changes(self):
+        gf = Goldfisher(_deck(), turns=8, sims=10)
+        gf.set_lands(40, cuts=[])
+        assert deck_features(gf)[0] == 40
+
+
+class TestFitAndPredict:
+    def test_recovers_synthetic_targets(self):
+        X, results = _synthetic()
+        model = fit_surrogate(X, results, alpha=1e-3)
+        report = calibration_report(model, X, results)
+        assert set(report) == set(SURROGATE_TARGETS)
+        for stats in report.values():
+            assert stats["r_squared"] > 0.99
+            assert stats["spearman"] > 0.99
+
+    def test_predict_dict(self):
+        X, results = _synthetic()
+        model = fit_surrogate(X, results)
+        pred = model.predict_dict(X[0])
+        assert set(pred) == set(SURROGATE_TARGETS)
+
+    def test_rejects_mismatched_lengths(self):
+        X, results = _synthetic()
+        with pytest.raises(ValueError):
+            fit_surrogate(X, results[:-1])
+
+
+class TestSerialization:
+    def test_round_trip(self, tmp_path):
+        X, results = _synthetic()
+        model = fit_surrogate(X, results)
+        path = tmp_path / "surrogate.json"
+        model.save(str(path))
+        loaded = SurrogateModel.load(str(path))
+        np.testing.assert_allclose(loaded.predict(X), model.predict(X))
+        assert loaded.n_train == len(X)
+
+    def test_feature_mismatch_raises(self):
+        X, results = _synthetic()
+        data = fit_surrogate(X, results).to_dict()
+        data["feature_names"] = data["feature_names"][:-1]
+        with pytest.raises(ValueError, match="feature set"):
+            SurrogateModel.from_dict(data)
+
+
+class TestTrainingAndPrescreen:
+    def test_collect_restores_decklist(self):
+        gf = Goldfisher(_deck(), turns=5, sims=20, seed=1, record_results=None)
+        configs = [DeckConfig(land_delta=d) for d in (-1, 0, 1)]
+        X, results = collect_training_data(gf, configs, {})
+        assert X.shape == (3, len(FEATURE_NAMES))
+        assert X[:, 0].tolist() == [36, 37, 38]
+        assert len(results) == 3
+        assert gf.land_count == 37
+
+    def test_prescreen_shrinks_config_set(self):
+        X, results = _synthetic()
+        model = fit_surrogate(X, results)
+        gf = Goldfisher(_deck(), turns=10, sims=20, seed=1, record_results=None)
+        candidates = {cid: c for cid, c in ALL_CANDIDATES.items() if cid == "draw_2cmc_2"}
+        configs = enumerate_configs(candidates, max_draw=1, max_ramp=0, land_range=3)
+        opt = FastDeckOptimizer(gf, candidates, optimize_for="mean_mana",
+                                surrogate=model, surrogate_keep=0.3)
+        kept = opt._prescreen(configs, top_k=2)
+        assert len(kept) < len(configs)
+        assert DeckConfig() in kept
+        assert len(opt.surrogate_scores) == len(configs)
+        assert gf.land_count == 37
+
+
+class TestStoredResults:
+    def _rows(self):
+        rows = [{"deck_name": "deck", "turns": 8, "sims": 100 * (i + 1), "land_count": lands,
+                 "mean_mana": 20.0 + i, "consistency": 0.8, "threshold_mana": 10.0 + i}
+                for i, lands in enumerate((36, 37, 38))]
+        return rows + [dict(rows[0], deck_name="missing")]
+
+    def _load(self, name):
+        if name != "deck":
+            raise FileNotFoundError(name)
+        return _deck()
+
+    def test_features_at_stored_land_counts(self):
+        X, results, weights = training_data_from_rows(self._rows(), load_deck=self._load)
+        assert X[:, 0].tolist() == [36, 37, 38]
+        assert X[:, FEATURE_NAMES.index("turns")].tolist() == [8, 8, 8]
+        assert [r["mean_mana"] for r in results] == [20.0, 21.0, 22.0]
+        assert weights.tolist() == [100, 200, 300]
+
+    def test_train_cli_writes_model(self, tmp_path, monkeypatch, capsys):
+        from auto_goldfish.cli.main import train_surrogate
+        from auto_goldfish.db.persistence import get_or_create_deck, save_simulation_run
+        from auto_goldfish.db.session import get_session
+
+        monkeypatch.setattr("auto_goldfish.db.session._engine", None)
+        monkeypatch.setattr("auto_goldfish.db.session._SessionFactory", None)
+        monkeypatch.setattr("auto_goldfish.decklist.loader.load_decklist", self._load)
+        url = f"sqlite:///{tmp_path / 'runs.db'}"
+        output = tmp_path / "surrogate.json"
+        assert train_surrogate(["--database_url", url, "--output", str(output)]) == 1
+
+        X, results = _synthetic(n=12)
+        with get_session() as session:
+            deck = get_or_create_deck(session, "deck")
+            for i, result in enumerate(results):
+                save_simulation_run(session, f"job{i}", deck, {"turns": 8, "sims": 100},
+                                    [dict(result, land_count=int(X[i, 0]))])
+        assert train_surrogate(["--database_url", url, "--output", str(output)]) == 0
+        model = SurrogateModel.load(str(output))
+        assert model.n_train == 12
+        assert "Calibration on 2 held-out results" in capsys.readouterr().out
+
+    def test_digest_tracks_model(self):
+        X, results = _synthetic()
+        model = fit_surrogate(X, results)
+        assert model.digest() == SurrogateModel.from_dict(model.to_dict()).digest()
+        assert model.digest() != fit_surrogate(X, results, alpha=2.0).digest()
+
+
+def test_predict_scores_preview():
+    X, results = _synthetic()
+    model = fit_surrogate(X, results)
+    out = json.loads(predict_scores(
+        json.dumps(_deck()),
+        json.dumps({"turns": 10, "min_lands": 35, "max_lands": 38}),
+        json.dumps(model.to_dict()),
+    ))
+    assert [row["land_count"] for row in out] == [35, 36, 37, 38]
+    assert out[-1]["threshold_mana"] > out[0]["threshold_mana"]
@@ -2,6 +2,7 @@
 
 import json
 import os
+import time
 
 import pytest
 
@@ -655,6 +656,232 @@ class TestSaveResultsAPI:
         assert data["ok"] is True
 
 
+class TestJobsAPI:
+    """Server-side job submission, status and cancellation."""
+
+    def _runner(self, app):
+        from auto_goldfish.web.services.simulation_runner import SimulationRunner
+
+        runner = SimulationRunner(max_workers=1)
+        app.extensions["sim_runner"] = runner
+        return runner
+
+    def _mock_deck(self, monkeypatch, tmp_path):
+        root = _create_test_deck(tmp_path)
+        monkeypatch.setattr(
+            "auto_goldfish.web.routes.simulation.get_deckpath",
+            lambda name: os.path.join(root, "decks", name, f"{name}.json"),
+        )
+
+    def test_submit_nonexistent_deck_404(self, client, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "auto_goldfish.web.routes.simulation.get_deckpath",
+            lambda name: str(tmp_path / "nope.json"),
+        )
+        resp = client.post("/sim/api/nope/jobs", json={"config": {}})
+        assert resp.status_code == 404
+
+    def test_status_and_cancel_unknown_job_404(self, client):
+        assert client.get("/sim/api/jobs/nope").status_code == 404
+        assert client.post("/sim/api/jobs/nope/cancel").status_code == 404
+        assert client.delete("/sim/api/jobs/nope").status_code == 404
+
+    def test_stats(self, app, client):
+        self._runner(app)
+        resp = client.get("/sim/api/jobs/stats")
+        assert resp.status_code == 200
+        data = resp.get_json()
+        assert data["scheduler"]["workers"] == 1
+        assert data["jobs"]["jobs"] == 0
+
+    def test_submit_status_cancel(self, app, client, tmp_path, monkeypatch):
+        import threading
+        from unittest.mock import patch
+
+        self._mock_deck(monkeypatch, tmp_path)
+        runner = self._runner(app)
+        gate = threading.Event()
+        with patch.object(runner, "_run_simulation", side_effect=lambda job: gate.wait(5)):
+            first = client.post("/sim/api/testdeck/jobs", json={"config": {"sims": 10}})
+            assert first.status_code == 202
+            second = client.post("/sim/api/testdeck/jobs", json={"config": {"sims": 10}})
+            job_id = second.get_json()["job_id"]
+
+            status = client.get(f"/sim/api/jobs/{job_id}").get_json()
+            assert status["deck_name"] == "testdeck"
+            assert status["status"] == "pending"
+
+            resp = client.post(f"/sim/api/jobs/{job_id}/cancel")
+            assert resp.status_code == 200
+            assert resp.get_json()["status"] == "cancelled"
+            gate.set()
+
+    def _run_sweep(self, app, client, tmp_path, monkeypatch, seed=None):
+        """Submit a 3-land sweep whose games are mocked; returns the job ID."""
+        from unittest.mock import MagicMock
+
+        self._mock_deck(monkeypatch, tmp_path)
+        self._runner(app)
+        goldfisher = MagicMock(land_count=36)
+        module = "auto_goldfish.web.services.simulation_runner"
+        monkeypatch.setattr(f"{module}.load_decklist", lambda name: [])
+        monkeypatch.setattr(f"{module}.Goldfisher", lambda *a, **kw: goldfisher)
+        monkeypatch.setattr(
+            f"{module}.result_to_dict", lambda r: {"land_count": goldfisher.set_lands.call_count},
+        )
+        resp = client.post(
+            "/sim/api/testdeck/jobs",
+            json={"config": {"min_lands": 36, "max_lands": 38, "seed": seed}},
+        )
+        assert resp.headers["X-Result-Cache"] == "miss"
+        return resp.get_json()["job_id"]
+
+    @staticmethod
+    def _events(body: str):
+        events = []
+        for block in body.strip().split("\n\n"):
+            fields = dict(
+                line.split(": ", 1) for line in block.split("\n") if not line.startswith(":")
+            )
+            if fields:
+                events.append((fields["event"], fields.get("id"), json.loads(fields["data"])))
+        return events
+
+    def test_event_stream(self, app, client, tmp_path, monkeypatch):
+        job_id = self._run_sweep(app, client, tmp_path, monkeypatch)
+        resp = client.get(f"/sim/api/jobs/{job_id}/events")
+        assert resp.status_code == 200
+        assert resp.mimetype == "text/event-stream"
+        events = self._events(resp.get_data(as_text=True))
+
+        results = [(i, data) for name, i, data in events if name == "result"]
+        assert results == [("1", {"land_count": 1}), ("2", {"land_count": 2}),
+                           ("3", {"land_count": 3})]
+        assert events[-1] == ("done", None, {
+            "status": "completed", "error": None, "n_results": 3, "cache_stats": None,
+        })
+        assert any(name == "progress" for name, _, _ in events)
+
+    def test_event_stream_resumes_after_last_event_id(self, app, client, tmp_path, monkeypatch):
+        job_id = self._run_sweep(app, client, tmp_path, monkeypatch)
+        client.get(f"/sim/api/jobs/{job_id}/events").get_data()
+        resp = client.get(f"/sim/api/jobs/{job_id}/events", headers={"Last-Event-ID": "2"})
+        events = self._events(resp.get_data(as_text=True))
+        assert [(i, d) for name, i, d in events if name == "result"] == [("3", {"land_count": 3})]
+
+    def test_event_stream_closes_after_max_lifetime(self, app, client, monkeypatch):
+        class _StuckRunner:
+            def get_status(self, job_id, since=None):
+                return {"status": "running", "progress": 0, "total": 1, "queue_position": None,
+                        "eta_s": None, "results": [], "n_results": 0, "leaderboard": None,
+                        "version": 1}
+
+            def wait_for_update(self, job_id, version, timeout):
+                time.sleep(timeout)
+                return version
+
+        monkeypatch.setattr("auto_goldfish.web.routes.simulation.SSE_KEEPALIVE_S", 0.01)
+        monkeypatch.setattr("auto_goldfish.web.routes.simulation.SSE_MAX_STREAM_S", 0.05)
+        app.extensions["sim_runner"] = _StuckRunner()
+        body = client.get("/sim/api/jobs/stuck/events").get_data(as_text=True)
+        assert ": keep-alive" in body
+        assert body.endswith("retry: 1000\n\n")
+        assert "event: done" not in body
+
+    def test_event_stream_unknown_job_404(self, client):
+        assert client.get("/sim/api/jobs/nope/events").status_code == 404
+
+    def test_status_since(self, app, client, tmp_path, monkeypatch):
+        job_id = self._run_sweep(app, client, tmp_path, monkeypatch)
+        client.get(f"/sim/api/jobs/{job_id}/events").get_data()
+
+        full = client.get(f"/sim/api/jobs/{job_id}").get_json()
+        assert len(full["results"]) == 3
+        assert "config" in full
+
+        tail = client.get(f"/sim/api/jobs/{job_id}?since=2").get_json()
+        assert tail["results"] == [{"land_count": 3}]
+        assert tail["n_results"] == 3
+        assert "config" not in tail
+
+        assert client.get(f"/sim/api/jobs/{job_id}?since=x").status_code == 400
+        assert client.get(f"/sim/api/jobs/{job_id}?since=-1").status_code == 400
+
+    def test_seeded_job_served_from_cache(self, app, client, tmp_path, monkeypatch):
+        job_id = self._run_sweep(app, client, tmp_path, monkeypatch, seed=5)
+        client.get(f"/sim/api/jobs/{job_id}/events").get_data()
+
+        config = {"min_lands": 36, "max_lands": 38, "seed": 5, "workers": 2}
+        resp = client.post("/sim/api/testdeck/jobs", json={"config": config})
+        assert resp.status_code == 200
+        assert resp.headers["X-Result-Cache"] == "hit"
+        cached_id = resp.get_json()["job_id"]
+        status = client.get(f"/sim/api/jobs/{cached_id}")
+        assert status.headers["X-Result-Cache"] == "hit"
+        data = status.get_json()
+        assert data["status"] == "completed"
+        assert data["cached"] is True
+        assert data["results"] == [{"land_count": n} for n in (1, 2, 3)]
+
+    def test_client_results_lookup(self, app, client, tmp_path, monkeypatch):
+        self._mock_deck(monkeypatch, tmp_path)
+        monkeypatch.setattr(
+            "auto_goldfish.web.routes.simulation.load_decklist", lambda name: [{"name": "Island"}],
+        )
+        self._runner(app)
+        config = {"turns": 8, "sims": 100, "seed": 3}
+        results = [{"land_count": 37, "mean_mana": 5.5}]
+
+        miss = client.post("/sim/api/testdeck/results/lookup", json={"config": config})
+        assert miss.status_code == 404
+        assert miss.headers["X-Result-Cache"] == "miss"
+
+        client.post("/sim/api/testdeck/results", json={"config": config, "results": results})
+        hit = client.post("/sim/api/testdeck/results/lookup", json={"config": config})
+        assert hit.status_code == 200
+        assert hit.headers["X-Result-Cache"] == "hit"
+        assert hit.get_json()["results"] == results
+
+        other = client.post(
+            "/sim/api/testdeck/results/lookup", json={"config": {**config, "seed": 4}},
+        )
+        assert other.status_code == 404
+
+    def test_client_results_not_shared_between_sessions(self, app, client, tmp_path, monkeypatch):
+        self._mock_deck(monkeypatch, tmp_path)
+        monkeypatch.setattr(
+            "auto_goldfish.web.routes.simulation.load_decklist", lambda name: [{"name": "Island"}],
+        )
+        writes = []
+        runner = self._runner(app)
+        monkeypatch.setattr(runner.result_cache, "_write", lambda key, data: writes.append(key))
+        config = {"turns": 8, "sims": 100, "seed": 3}
+        client.post("/sim/api/testdeck/results", json={"config": config, "results": [{"x": 1}]})
+
+        other = app.test_client().post("/sim/api/testdeck/results/lookup", json={"config": config})
+        assert other.status_code == 404
+        assert client.post("/sim/api/testdeck/results/lookup", json={"config": config}).status_code == 200
+        assert writes == []
+
+    def test_unseeded_client_results_not_cached(self, app, client, tmp_path, monkeypatch):
+        self._mock_deck(monkeypatch, tmp_path)
+        runner = self._runner(app)
+        config = {"turns": 8, "sims": 100}
+        client.post("/sim/api/testdeck/results", json={"config": config, "results": [{}]})
+        resp = client.post("/sim/api/testdeck/results/lookup", json={"config": config})
+        assert resp.status_code == 404
+        assert runner.result_cache.stats()["writes"] == 0
+
+    def test_submit_rejected_429(self, app, client, tmp_path, monkeypatch):
+        from auto_goldfish.web.services.simulation_runner import SimulationRunner
+
+        self._mock_deck(monkeypatch, tmp_path)
+        app.extensions["sim_runner"] = SimulationRunner(max_job_cost=1)
+        resp = client.post("/sim/api/testdeck/jobs", json={"config": {"sims": 10}})
+        assert resp.status_code == 429
+        assert resp.get_json()["ok"] is False
+
+
 class TestImportDeckAPI:
     """Tests for POST /decks/import/api endpoint."""
 
@@ -1082,3 +1309,23 @@ class TestSimulationPOST:
         )
         assert response.status_code == 200
         assert b"SAVED_OVERRIDES" in response.data
+
+
+class TestSurrogateAPI:
+    def test_no_model_404(self, app, client):
+        from auto_goldfish.web.services.simulation_runner import SimulationRunner
+
+        app.extensions["sim_runner"] = SimulationRunner(max_workers=1)
+        assert client.get("/sim/api/surrogate").status_code == 404
+
+    def test_serves_model_and_digest(self, app, client):
+        from auto_goldfish.optimization.surrogate import FEATURE_NAMES, fit_surrogate
+        from auto_goldfish.web.services.simulation_runner import SimulationRunner
+
+        X = [[float(i + j) for j in range(len(FEATURE_NAMES))] for i in range(3)]
+        results = [{"mean_mana": v, "consistency": 0.5, "threshold_mana": v} for v in (1, 2, 3)]
+        model = fit_surrogate(X, results)
+        app.extensions["sim_runner"] = SimulationRunner(max_workers=1, surrogate=model)
+        data = client.get("/sim/api/surrogate").get_json()
+        assert data["digest"] == model.digest()
+        assert data["model"]["n_train"] == 3